@@ -34,7 +34,6 @@ Anantharaman and Melius, J. Phys. Chem. A 2005, 109, 1734-1747
 """
 
 import numpy as np
-import pybel
 
 from rmgpy.molecule import Molecule, Atom, Bond, get_element
 
@@ -123,6 +122,8 @@ def geo_to_mol(coords, nums):
     else:
         xyz = '{}\n\n'.format(len(nums))
         xyz += '\n'.join('{0}  {1[0]: .10f}  {1[1]: .10f}  {1[2]: .10f}'.format(n, c) for n, c in zip(nums, coords))
+        # Open Babel is imported here since it is slow to import and only needed for bond additivity corrections
+        import pybel
         mol = pybel.readstring('xyz', xyz)
         mol = pybel_to_rmg(mol)
     return mol
@@ -133,6 +134,8 @@ def pybel_to_rmg(pybel_mol):
     Convert Pybel molecule to RMG molecule but ignore charge,
     multiplicity, and bond orders.
     """
+    import pybel
+
     mol = Molecule()
     for pybel_atom in pybel_mol:
         element = get_element(pybel_atom.atomicnum)
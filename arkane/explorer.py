@@ -41,7 +41,6 @@ import numpy as np
 import rmgpy
 from rmgpy.data.rmg import get_db
 from rmgpy.exceptions import InputError
-from rmgpy.rmg.main import RMG
 from rmgpy.rmg.model import CoreEdgeReactionModel
 
 ################################################################################
@@ -89,6 +88,10 @@ class ExplorerJob(object):
     def execute(self, output_file, plot, file_format='pdf', print_summary=True, species_list=None,
                 thermo_library=None, kinetics_library=None):
         """Execute an ExplorerJob"""
+        # RMG is imported here since it is slow to import and only needed for exploring networks
+        import rmgpy.rmg.input
+        from rmgpy.rmg.main import RMG
+
         logging.info('Exploring network...')
 
         rmg = RMG()
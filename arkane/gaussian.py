@@ -56,6 +56,11 @@ class GaussianLog(Log):
     arrays.
     """
 
+    section_markers = ('Input orientation:', 'Force constants in Cartesian coordinates:', 'Multiplicity =',
+                       '- Thermochemistry -', 'SCF Done:', 'CBS-QB3 (0 K)', 'G3(0 K)', 'E(ZPE)', '\\ZeroPoint=',
+                       'Zero-point correction=', ' freq ', '# scan', 'Optimization completed',
+                       ' The following ModRedundant input section has been read:', 'Frequencies --')
+
     def __init__(self, path):
         super(GaussianLog, self).__init__(path)
 
@@ -66,7 +71,7 @@ class GaussianLog(Log):
         """
         n_atoms = 0
 
-        with open(self.path, 'r') as f:
+        with self.read_from('Input orientation:') as f:
             line = f.readline()
             while line != '' and n_atoms == 0:
                 # Automatically determine the number of atoms
@@ -95,7 +100,8 @@ class GaussianLog(Log):
         n_atoms = self.get_number_of_atoms()
         n_rows = n_atoms * 3
 
-        with open(self.path, 'r') as f:
+        # Only the last matrix is returned, so start reading from it
+        with self.read_from('Force constants in Cartesian coordinates:', last=True) as f:
             line = f.readline()
             while line != '':
                 # Read force constant matrix
@@ -124,7 +130,8 @@ class GaussianLog(Log):
         """
         number, coord, mass = [], [], []
 
-        with open(self.path, 'r') as f:
+        # Only the last geometry is returned, so start reading from it
+        with self.read_from('Input orientation:', last=True) as f:
             line = f.readline()
             while line != '':
                 # Automatically determine the number of atoms
@@ -174,7 +181,7 @@ class GaussianLog(Log):
                 optical_isomers = _optical_isomers
             if symmetry is None:
                 symmetry = _symmetry
-        with open(self.path, 'r') as f:
+        with self.read_from('Multiplicity =', '- Thermochemistry -') as f:
             line = f.readline()
             while line != '':
 
@@ -263,7 +270,7 @@ class GaussianLog(Log):
         """
         e_elect, e0_composite, scaled_zpe = None, None, None
 
-        with open(self.path, 'r') as f:
+        with self.read_from('SCF Done:', 'CBS-QB3 (0 K)', 'G3(0 K)', 'E(ZPE)', '\\ZeroPoint=') as f:
             line = f.readline()
             while line != '':
 
@@ -305,7 +312,7 @@ class GaussianLog(Log):
         """
         zpe = None
 
-        with open(self.path, 'r') as f:
+        with self.read_from('Zero-point correction=', '\\ZeroPoint=') as f:
             line = f.readline()
             while line != '':
                 # Do NOT read the ZPE from the "E(ZPE)=" line, as this is the scaled version!
@@ -337,7 +344,7 @@ class GaussianLog(Log):
 
         # Parse the Gaussian log file, extracting the energies of each
         # optimized conformer in the scan
-        with open(self.path, 'r') as f:
+        with self.read_from(' freq ', '# scan', 'SCF Done:', 'Optimization completed') as f:
             line = f.readline()
             while line != '':
                 # If the job contains a "freq" then we want to ignore the last energy
@@ -398,7 +405,7 @@ class GaussianLog(Log):
         """
         output = []
         reached_input_spec_section = False
-        with open(self.path, 'r') as f:
+        with self.read_from(' The following ModRedundant input section has been read:') as f:
             line = f.readline()
             while line != '':
                 if reached_input_spec_section:
@@ -454,7 +461,7 @@ class GaussianLog(Log):
         """
         frequency = None
         frequencies = []
-        with open(self.path, 'r') as f:
+        with self.read_from('Frequencies --') as f:
             line = f.readline()
             while line != '':
                 # Read vibrational frequencies
@@ -156,6 +156,30 @@ class GaussianTest(unittest.TestCase):
                 found_rotor = True
         self.assertTrue(found_rotor)
 
+    def test_section_index(self):
+        """
+        Test that a Gaussian log file is indexed in a single pass and shared between log objects
+        """
+        path = os.path.join(os.path.dirname(__file__), 'data', 'ethylene.log')
+        log = GaussianLog(path)
+        with open(path, 'r') as f:
+            lines = f.readlines()
+        self.assertEqual(log.get_lines(), lines)
+        for marker in log.section_markers:
+            self.assertEqual(log.find_lines(marker), [i for i, line in enumerate(lines) if marker in line])
+        self.assertTrue(log.find_lines('SCF Done:'))
+
+        first = min(log.find_lines('SCF Done:') + log.find_lines('Input orientation:'))
+        with log.read_from('SCF Done:', 'Input orientation:') as f:
+            self.assertEqual(f.readline(), lines[first])
+            self.assertEqual(f.readline(), lines[first + 1])
+        with log.read_from('SCF Done:', last=True) as f:
+            self.assertEqual(f.readline(), lines[log.find_lines('SCF Done:')[-1]])
+        with log.read_from('Not in the log file') as f:
+            self.assertEqual(f.readline(), '')
+
+        self.assertIs(GaussianLog(path).get_lines(), log.get_lines())
+
     def test_determine_qm_software(self):
         """
         Ensures that determine_qm_software returns a GaussianLog object
@@ -74,8 +74,9 @@ job_list = list()
 
 
 def database(thermoLibraries=None, transportLibraries=None, reactionLibraries=None, frequenciesLibraries=None,
-             kineticsFamilies='default', kineticsDepositories='default', kineticsEstimator='rate rules'):
-    """Load the RMG database"""
+             kineticsFamilies='default', kineticsDepositories='default', kineticsEstimator='rate rules',
+             cacheDirectory=None):
+    """Load the RMG database, through the database cache in `cacheDirectory` if given"""
     thermo_libraries = as_list(thermoLibraries, default=[])
     transport_libraries = as_list(transportLibraries, default=None)
     reaction_libraries = as_list(reactionLibraries, default=[])
@@ -112,6 +113,7 @@ def database(thermoLibraries=None, transportLibraries=None, reactionLibraries=No
         kinetics_families=kinetics_families,
         kinetics_depositories=kinetics_depositories,
         depository=False,  # Don't bother loading the depository information, as we don't use it
+        cache_directory=cacheDirectory,
     )
 
     for family in rmg_database.kinetics.families.values():  # load training
@@ -326,10 +326,9 @@ class KineticsJob(object):
         else:
             t_list = 1000.0 / np.arange(0.4, 3.35, 0.05)
         klist = np.zeros_like(t_list)
-        klist2 = np.zeros_like(t_list)
         for i in range(len(t_list)):
             klist[i] = self.reaction.calculate_tst_rate_coefficient(t_list[i])
-            klist2[i] = self.reaction.kinetics.get_rate_coefficient(t_list[i])
+        klist2 = self.reaction.kinetics.get_rate_coefficients(np.array(t_list, np.float64))
 
         order = len(self.reaction.reactants)
         klist *= 1e6 ** (order - 1)
@@ -31,8 +31,10 @@
 A general class for parsing quantum mechanical log files
 """
 
+import functools
 import logging
 import os.path
+import re
 import shutil
 
 from rmgpy.qm.qmdata import QMData
@@ -45,11 +47,59 @@ class Log(object):
     """
     Represent a general log file.
     The attribute `path` refers to the location on disk of the log file of interest.
+
+    The log file is read and indexed in a single pass the first time any of its data is requested: the line numbers
+    of all lines containing one of the `section_markers` of the subclass are recorded, so that each load method can
+    go directly to the sections it parses instead of re-reading the whole file. The parsed file is cached and shared
+    between all Log objects of the same file until the file is modified.
     """
 
+    # Substrings identifying the lines which start the sections parsed by the load methods of a subclass
+    section_markers = ()
+
     def __init__(self, path):
         self.path = path
 
+    def get_lines(self):
+        """
+        Return a list of the lines of the log file, including line endings.
+        """
+        return self._get_parsed_log()[0]
+
+    def find_lines(self, marker):
+        """
+        Return a list of the indices of the lines of the log file which contain the string `marker`.
+        The indices of the `section_markers` are available without scanning the file again.
+        """
+        lines, index = self._get_parsed_log()
+        if marker not in index:
+            index[marker] = [i for i, line in enumerate(lines) if marker in line]
+        return index[marker]
+
+    def read_from(self, *markers, last=False):
+        """
+        Return a :class:`LineReader` over the lines of the log file, starting from the first line containing
+        any of the given `markers`, or from the last such line if `last` is ``True``. If none of the markers are
+        found, the reader starts at the end of the file. If no markers are given, the reader starts at the
+        beginning of the file.
+        """
+        lines = self.get_lines()
+        if not markers:
+            return LineReader(lines)
+        indices = [i for marker in markers for i in self.find_lines(marker)]
+        if not indices:
+            return LineReader(lines, len(lines))
+        return LineReader(lines, max(indices) if last else min(indices))
+
+    def _get_parsed_log(self):
+        """
+        Return the lines of the log file and the index of its section markers, parsing the file if it was not
+        already parsed since it was last modified.
+        """
+        path = os.path.abspath(self.path)
+        stat = os.stat(path)
+        return _parse_log(path, stat.st_mtime_ns, stat.st_size, tuple(self.section_markers))
+
     def get_number_of_atoms(self):
         """
         Return the number of atoms in the molecular configuration used in
@@ -188,3 +238,67 @@ class Log(object):
         This method returns the T1 diagnostic for certain quantum jobs
         """
         raise NotImplementedError("get_T1_diagnostic is not implemented for all Log subclasses.")
+
+
+class LineReader(object):
+    """
+    A file-like object for reading the cached lines of a log file, starting from the line with index `start`.
+    Like a file, the :meth:`readline` method returns an empty string at the end of the log.
+    """
+
+    def __init__(self, lines, start=0):
+        self.lines = lines
+        self.position = start
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        line = self.readline()
+        if line == '':
+            raise StopIteration
+        return line
+
+    def readline(self):
+        """
+        Return the next line, or an empty string if the end of the log was reached.
+        """
+        if self.position >= len(self.lines):
+            return ''
+        line = self.lines[self.position]
+        self.position += 1
+        return line
+
+    def readlines(self):
+        """
+        Return a list of the remaining lines.
+        """
+        lines = self.lines[self.position:]
+        self.position = len(self.lines)
+        return lines
+
+
+@functools.lru_cache(maxsize=16)
+def _parse_log(path, modification_time, size, markers):
+    """
+    Read the log file at `path` and index the lines containing each of the `markers` in a single pass.
+    The `modification_time` and `size` of the file are only used to invalidate the cache when the file changes.
+    Returns the list of lines and a dictionary mapping each marker to the list of indices of the lines containing it.
+    """
+    with open(path, 'r') as f:
+        lines = f.readlines()
+    index = {marker: [] for marker in markers}
+    if markers:
+        pattern = re.compile('|'.join(re.escape(marker) for marker in markers))
+        for i, line in enumerate(lines):
+            if pattern.search(line) is not None:
+                for marker in markers:
+                    if marker in line:
+                        index[marker].append(i)
+    return lines, index
@@ -38,15 +38,10 @@ import os
 import os.path
 import sys
 import time
+from multiprocessing import Pool
 
 import numpy as np
 
-try:
-    import matplotlib
-    matplotlib.rc('mathtext', default='regular')
-except ImportError:
-    pass
-
 from rmgpy.chemkin import write_elements_section
 from rmgpy.data.thermo import ThermoLibrary
 from rmgpy.data.base import Entry
@@ -76,6 +71,7 @@ class Arkane(object):
     `input_file`        The path of the input file defining the jobs to execute
     `output_directory`  The directory in which to write the output files
     `verbose`           The level of detail in the generated logging messages
+    `procnum`           The number of worker processes used to run independent jobs
     =================== ========================================================
     
     The output directory defaults to the same directory as the input file if
@@ -88,11 +84,12 @@ class Arkane(object):
     :meth:`parse_command_line_arguments()` method before running :meth:`execute()`.
     """
 
-    def __init__(self, input_file=None, output_directory=None, verbose=logging.INFO):
+    def __init__(self, input_file=None, output_directory=None, verbose=logging.INFO, procnum=1):
         self.job_list = []
         self.input_file = input_file
         self.output_directory = output_directory
         self.verbose = verbose
+        self.procnum = procnum
 
     def parse_command_line_arguments(self):
         """
@@ -127,6 +124,10 @@ class Arkane(object):
         parser.add_argument('-p', '--no-plot', action='store_false', default=True,
                             help='prevent generating plots', dest='plot')
 
+        # Add options for running independent jobs in parallel
+        parser.add_argument('-n', '--procnum', type=int, default=1, metavar='N',
+                            help='use up to N worker processes for independent jobs')
+
         args = parser.parse_args()
 
         # Extract the input file
@@ -138,6 +139,11 @@ class Arkane(object):
         # Extract the plot settings
         self.plot = args.plot
 
+        # Extract the number of worker processes
+        if args.procnum < 1:
+            raise InputError('The number of worker processes must be at least 1, got {0}.'.format(args.procnum))
+        self.procnum = args.procnum
+
         # Determine the output directory
         # By default the directory containing the input file is used, unless an
         # alternate directory is specified using the -o flag
@@ -159,14 +165,24 @@ class Arkane(object):
 
     def execute(self):
         """
-        Execute, in order, the jobs found in input file specified by the
-        `input_file` attribute.
+        Execute the jobs found in input file specified by the `input_file`
+        attribute. Statmech jobs are run first, since the thermo, kinetics and
+        pressure-dependent jobs use their results. If `procnum` is greater than
+        one, the statmech and kinetics calculations are distributed over worker
+        processes; all output is still written in the order of the input file.
         """
 
         # Initialize the logging system (both to the console and to a file in the
         # output directory)
         initialize_log(self.verbose, os.path.join(self.output_directory, 'arkane.log'))
 
+        # Matplotlib is only imported when running jobs, which may generate plots, since it is slow to import
+        try:
+            import matplotlib
+            matplotlib.rc('mathtext', default='regular')
+        except ImportError:
+            pass
+
         # Print some information to the beginning of the log
         log_header()
 
@@ -198,14 +214,19 @@ class Arkane(object):
             f.write('THERM ALL\n')
             f.write('    300.000  1000.000  5000.000\n\n')
 
-        # run thermo and statmech jobs (also writes thermo blocks to Chemkin file)
+        # load all statmech jobs before any of the jobs depending on them
+        self.run_statmech_jobs()
+
+        # run thermo and save statmech jobs (also writes thermo blocks to Chemkin file)
         supporting_info = []
         hindered_rotor_info = []
         for job in self.job_list:
             if isinstance(job, ThermoJob):
                 job.execute(output_directory=self.output_directory, plot=self.plot)
             if isinstance(job, StatMechJob):
-                job.execute(output_directory=self.output_directory, plot=self.plot, pdep=is_pdep(self.job_list))
+                job.save_results(output_directory=self.output_directory, plot=self.plot)
+                logging.debug('Finished statmech job for species {0}.'.format(job.species))
+                logging.debug(repr(job.species))
                 if hasattr(job, 'supporting_info'):
                     supporting_info.append(job.supporting_info)
                 if hasattr(job, 'raw_hindered_rotor_data'):
@@ -258,6 +279,9 @@ class Arkane(object):
                 for row in hindered_rotor_info:
                     writer.writerow([row[0], row[1], row[2], row[3][1] * 180 / np.pi,
                                      row[5], row[6]] + [a for a in row[4]])
+        # fit the kinetics of all kinetics jobs, then save them in order below
+        self.run_kinetics_jobs()
+
         # run kinetics and pdep jobs (also writes reaction blocks to Chemkin file)
         for job in self.job_list:
             if isinstance(job, KineticsJob):
@@ -281,6 +305,46 @@ class Arkane(object):
         # Print some information to the end of the log
         log_footer()
 
+    def run_statmech_jobs(self):
+        """
+        Load the statistical mechanics data of all statmech jobs, using up to
+        `procnum` worker processes. The jobs are independent of one another;
+        the results computed by the workers are copied back onto the original
+        jobs and species, which are shared with the other jobs.
+        """
+        jobs = [job for job in self.job_list if isinstance(job, StatMechJob)]
+        pdep = is_pdep(self.job_list)
+        procnum = min(self.procnum, len(jobs))
+        if procnum > 1:
+            logging.info('Loading {0} statmech jobs using {1} processes...'.format(len(jobs), procnum))
+            p = Pool(processes=procnum)
+            loaded_jobs = p.map(_load_statmech_job, [(job, pdep, self.plot) for job in jobs])
+            p.close()
+            p.join()
+            for job, loaded_job in zip(jobs, loaded_jobs):
+                _update_statmech_job(job, loaded_job)
+        else:
+            for job in jobs:
+                job.load(pdep, self.plot)
+
+    def run_kinetics_jobs(self):
+        """
+        Generate the kinetics of all kinetics jobs, using up to `procnum`
+        worker processes. This must be called after :meth:`run_statmech_jobs()`.
+        Only the high-pressure-limit fit is done here; the output is written
+        when each job is executed, at which point the fit is not repeated.
+        """
+        jobs = [job for job in self.job_list if isinstance(job, KineticsJob)]
+        procnum = min(self.procnum, len(jobs))
+        if procnum > 1:
+            logging.info('Generating {0} kinetics jobs using {1} processes...'.format(len(jobs), procnum))
+            p = Pool(processes=procnum)
+            loaded_jobs = p.map(_generate_kinetics_job, jobs)
+            p.close()
+            p.join()
+            for job, loaded_job in zip(jobs, loaded_jobs):
+                _update_kinetics_job(job, loaded_job)
+
     def get_libraries(self):
         """Get RMG kinetics and thermo libraries"""
         name = 'kineticsjobs'
@@ -413,3 +477,44 @@ def log_footer(level=logging.INFO):
     """
     logging.log(level, '')
     logging.log(level, 'Arkane execution terminated at {0}'.format(time.asctime()))
+
+
+def _load_statmech_job(args):
+    """
+    Load a statmech job in a worker process and return it. `args` is a tuple
+    of the job and the `pdep` and `plot` arguments of :meth:`StatMechJob.load()`.
+    """
+    job, pdep, plot = args
+    job.load(pdep, plot)
+    return job
+
+
+def _update_statmech_job(job, loaded_job):
+    """
+    Copy the results of a statmech job loaded in a worker process onto the
+    original `job` and its species (or transition state).
+    """
+    for attr in ['conformer', 'frequency', 'molecule', 'props', 'transport_data', 'energy_transfer_model']:
+        if hasattr(job.species, attr) and hasattr(loaded_job.species, attr):
+            setattr(job.species, attr, getattr(loaded_job.species, attr))
+    job.__dict__.update({key: value for key, value in loaded_job.__dict__.items() if key != 'species'})
+
+
+def _generate_kinetics_job(job):
+    """
+    Generate the kinetics of a kinetics job in a worker process and return it.
+    """
+    job.generate_kinetics()
+    return job
+
+
+def _update_kinetics_job(job, loaded_job):
+    """
+    Copy the results of a kinetics job generated in a worker process onto the
+    original `job` and its reaction.
+    """
+    job.reaction.kinetics = loaded_job.reaction.kinetics
+    job.reaction.elementary_high_p = loaded_job.reaction.elementary_high_p
+    if job.reaction.transition_state is not None:
+        job.reaction.transition_state.tunneling = loaded_job.reaction.transition_state.tunneling
+    job.__dict__.update({key: value for key, value in loaded_job.__dict__.items() if key != 'reaction'})
@@ -34,6 +34,9 @@ This module contains unit tests of the :mod:`arkane.main` module.
 import logging
 import os
 import shutil
+import subprocess
+import sys
+import tempfile
 import unittest
 import zipfile
 
@@ -42,6 +45,10 @@ from nose.plugins.attrib import attr
 import rmgpy
 
 from arkane import Arkane
+from arkane.main import _update_statmech_job
+from arkane.statmech import StatMechJob
+from rmgpy.molecule import Molecule
+from rmgpy.species import Species
 
 ################################################################################
 
@@ -106,7 +113,92 @@ class TestArkaneExamples(unittest.TestCase):
                         shutil.rmtree(item_path)
 
 
+@attr('functional')
+class TestArkaneParallel(unittest.TestCase):
+    """
+    Contains functional tests for running Arkane jobs with several worker processes
+    """
+
+    def setUp(self):
+        """A function that is run before each unit test in this class."""
+        base_path = os.path.join(os.path.dirname(os.path.dirname(rmgpy.__file__)), 'examples', 'arkane')
+        example_path = os.path.join(base_path, 'reactions', 'H+C2H4=C2H5')
+        self.tmp_dir = tempfile.mkdtemp()
+        # the example refers to the species files relative to its own directory
+        shutil.copytree(os.path.join(base_path, 'species'), os.path.join(self.tmp_dir, 'species'))
+        self.paths = []
+        for name in ['serial', 'parallel']:
+            path = os.path.join(self.tmp_dir, 'reactions', name)
+            shutil.copytree(example_path, path)
+            self.paths.append(path)
+
+    def test_parallel_output_matches_serial(self):
+        """Test that running the jobs in parallel gives the same output, in the same order"""
+        for path, procnum in zip(self.paths, [1, 2]):
+            arkane = Arkane(input_file=os.path.join(path, 'input.py'), output_directory=path, procnum=procnum)
+            arkane.plot = False
+            arkane.execute()
+        for name in ['chem.inp', 'supporting_information.csv']:
+            with open(os.path.join(self.paths[0], name), 'r') as f:
+                serial = f.read()
+            with open(os.path.join(self.paths[1], name), 'r') as f:
+                parallel = f.read()
+            self.assertEqual(serial, parallel)
+
+    def tearDown(self):
+        """A function that is run after each unit test in this class."""
+        shutil.rmtree(self.tmp_dir)
+
+
+class TestArkaneImportTime(unittest.TestCase):
+    """
+    Contains a check that importing Arkane stays fast, since short jobs pay the import time
+    """
+
+    # Modules which any job needs anyway; the time for importing them is not counted
+    core_modules = ['rmgpy.data.rmg', 'rmgpy.reaction', 'rmgpy.species']
+
+    # Maximum time in seconds for importing Arkane in a new interpreter after the core modules
+    import_time_budget = 1.5
+
+    # Slow optional subsystems which should only be imported when they are used
+    lazy_modules = ['cantera', 'chemprop', 'matplotlib', 'pybel', 'rmgpy.rmg.main', 'rmgpy.qm.main']
+
+    def test_import_arkane(self):
+        """Test that importing arkane does not import slow optional subsystems"""
+        code = ('import sys, time\n'
+                'import {0}\n'
+                'start = time.time()\n'
+                'import arkane\n'
+                'print(time.time() - start)\n'
+                'print(",".join(m for m in {1!r} if m in sys.modules))'.format(', '.join(self.core_modules),
+                                                                             self.lazy_modules))
+        output = subprocess.check_output([sys.executable, '-c', code], universal_newlines=True).splitlines()
+        self.assertEqual(output[-1], '')
+        self.assertLess(float(output[-2]), self.import_time_budget)
+
+
 ################################################################################
 
+class TestUpdateStatmechJob(unittest.TestCase):
+    """
+    Contains unit tests for copying the results of statmech jobs loaded in worker processes
+    """
+
+    def test_update_statmech_job(self):
+        """Test that the species properties set while loading are copied onto the original species"""
+        job = StatMechJob(Species(label='C2H4'), 'C2H4.py')
+        loaded_job = StatMechJob(Species(label='C2H4'), 'C2H4.py')
+        loaded_job.species.props['element_counts'] = {'C': 2, 'H': 4}
+        loaded_job.species.molecule = [Molecule(smiles='C=C')]
+        loaded_job.modelChemistry = 'b3lyp/6-31g(d,p)'
+        species = job.species
+        _update_statmech_job(job, loaded_job)
+        self.assertIs(job.species, species)
+        self.assertEqual(species.props['element_counts'], {'C': 2, 'H': 4})
+        self.assertTrue(species.molecule[0].is_isomorphic(loaded_job.species.molecule[0]))
+        self.assertEqual(job.modelChemistry, 'b3lyp/6-31g(d,p)')
+
+
 if __name__ == '__main__':
     unittest.main(testRunner=unittest.TextTestRunner(verbosity=2))
@@ -54,6 +54,10 @@ class MolproLog(Log):
     to extract a variety of information into Arkane classes and/or NumPy arrays.
     """
 
+    section_markers = ('ATOMIC COORDINATES', 'Force Constants (Second Derivatives of the Energy) in [a.u.]',
+                       'Current geometry', 'spin', 'SPIN SYMMETRY', 'THERMODYNAMICAL', 'Electronic Energy at 0 [K]:',
+                       'Normal Modes of imaginary frequencies', 'T1 diagnostic:  ', 'D1 diagnostic:  ')
+
     def __init__(self, path):
         super(MolproLog, self).__init__(path)
 
@@ -63,8 +67,7 @@ class MolproLog(Log):
         the MolPro log file.
         """
         n_atoms = 0
-        # Open Molpro log file for parsing
-        with open(self.path, 'r') as f:
+        with self.read_from('ATOMIC COORDINATES') as f:
             line = f.readline()
             while line != '' and n_atoms == 0:
                 # Automatically determine the number of atoms
@@ -87,7 +90,8 @@ class MolproLog(Log):
         n_atoms = self.get_number_of_atoms()
         n_rows = n_atoms * 3
 
-        with open(self.path, 'r') as f:
+        # Only the last matrix is returned, so start reading from it
+        with self.read_from('Force Constants (Second Derivatives of the Energy) in [a.u.]', last=True) as f:
             line = f.readline()
             while line != '':
                 # Read force constant matrix
@@ -117,7 +121,7 @@ class MolproLog(Log):
 
         symbol, coord, mass, number = [], [], [], []
 
-        with open(self.path, 'r') as f:
+        with self.read_from('Current geometry') as f:
             line = f.readline()
             while line != '':
                 # Automatically determine the number of atoms
@@ -137,7 +141,7 @@ class MolproLog(Log):
         # If no optimized coordinates were found, uses the input geometry
         # (for example if reading the geometry from a frequency file)
         if not coord:
-            with open(self.path, 'r') as f:
+            with self.read_from() as f:
                 line = f.readline()
                 while line != '':
                     if 'atomic coordinates' in line.lower():
@@ -179,7 +183,7 @@ class MolproLog(Log):
                 optical_isomers = _optical_isomers
             if symmetry is None:
                 symmetry = _symmetry
-        with open(self.path, 'r') as f:
+        with self.read_from('spin', 'SPIN SYMMETRY', 'THERMODYNAMICAL') as f:
             line = f.readline()
             while line != '':
 
@@ -276,7 +280,7 @@ class MolproLog(Log):
         a better approximation, but for higher basis sets f12b is a better approximation.
         """
         e_elect = None
-        with open(self.path, 'r') as f:
+        with self.read_from() as f:
             lines = f.readlines()
             # Determine whether the sp method is f12,
             # if so whether we should parse f12a or f12b according to the basis set.
@@ -352,7 +356,7 @@ class MolproLog(Log):
 
         zpe = None
 
-        with open(self.path, 'r') as f:
+        with self.read_from('Electronic Energy at 0 [K]:') as f:
             line = f.readline()
             while line != '':
                 # Do NOT read the ZPE from the "E(ZPE)=" line, as this is the scaled version!
@@ -376,7 +380,7 @@ class MolproLog(Log):
         Return the negative frequency from a transition state frequency calculation in cm^-1.
         """
         frequency = None
-        with open(self.path, 'r') as f:
+        with self.read_from('Normal Modes of imaginary frequencies') as f:
             line = f.readline()
             while line != '':
                 # Read vibrational frequencies
@@ -402,13 +406,10 @@ class MolproLog(Log):
         Returns the T1 diagnostic from output log.
         If multiple occurrences exist, returns the last occurrence
         """
-        with open(self.path) as f:
-            log = f.readlines()
-
-        for line in reversed(log):
-            if 'T1 diagnostic:  ' in line:
-                items = line.split()
-                return float(items[-1])
+        lines = self.get_lines()
+        indices = self.find_lines('T1 diagnostic:  ')
+        if indices:
+            return float(lines[indices[-1]].split()[-1])
         raise LogError('Unable to find T1 diagnostic in energy file: {0}'.format(self.path))
 
     def get_D1_diagnostic(self):
@@ -416,13 +417,10 @@ class MolproLog(Log):
         Returns the D1 diagnostic from output log.
         If multiple occurrences exist, returns the last occurrence
         """
-        with open(self.path) as f:
-            log = f.readlines()
-
-        for line in reversed(log):
-            if 'D1 diagnostic:  ' in line:
-                items = line.split()
-                return float(items[-1])
+        lines = self.get_lines()
+        indices = self.find_lines('D1 diagnostic:  ')
+        if indices:
+            return float(lines[indices[-1]].split()[-1])
         raise LogError('Unable to find D1 diagnostic in energy file: {0}'.format(self.path))
 
     def load_scan_pivot_atoms(self):
@@ -578,9 +578,7 @@ class PressureDependenceJob(object):
 
                 K2 = np.zeros((Tcount, Pcount))
                 if reaction.kinetics is not None:
-                    for t in range(Tcount):
-                        for p in range(Pcount):
-                            K2[t, p] = reaction.kinetics.get_rate_coefficient(Tlist[t], Plist[p])
+                    K2 = reaction.kinetics.get_rate_coefficients(Tlist[:, np.newaxis], Plist[np.newaxis, :])
 
                 K = self.K[:, :, prod, reac].copy()
                 order = len(reaction.reactants)
@@ -56,6 +56,11 @@ class QChemLog(Log):
     arrays.
     """
 
+    section_markers = ('Standard Nuclear Orientation', 'Final Hessian.', 'Hessian of the SCF Energy',
+                       'Total job time:', '$molecule', 'VIBRATIONAL ANALYSIS', 'Final energy is',
+                       'Total energy in the final basis set', 'Zero point vibrational energy',
+                       'Summary of potential scan:', 'SCF failed to converge', ' Frequency:')
+
     def __init__(self, path):
         super(QChemLog, self).__init__(path)
 
@@ -66,7 +71,7 @@ class QChemLog(Log):
         """
         n_atoms = 0
 
-        with open(self.path, 'r') as f:
+        with self.read_from('Standard Nuclear Orientation') as f:
             line = f.readline()
             while line != '' and n_atoms == 0:
                 # Automatically determine the number of atoms
@@ -92,7 +97,8 @@ class QChemLog(Log):
 
         n_atoms = self.get_number_of_atoms()
         n_rows = n_atoms * 3
-        with open(self.path, 'r') as f:
+        # Only the last matrix is returned, so start reading from it
+        with self.read_from('Final Hessian.', 'Hessian of the SCF Energy', last=True) as f:
             line = f.readline()
             while line != '':
                 # Read force constant matrix
@@ -122,38 +128,29 @@ class QChemLog(Log):
         """
         atom, coord, number, mass = [], [], [], []
 
-        with open(self.path) as f:
-            log = f.read().splitlines()
+        log = self.get_lines()
 
         # First check that the QChem job file (not necessarily a geometry optimization)
         # has successfully completed, if not an error is thrown
-        completed_job = False
-        for line in reversed(log):
-            if 'Total job time:' in line:
-                logging.debug('Found a successfully completed QChem Job')
-                completed_job = True
-                break
-
-        if not completed_job:
+        if not self.find_lines('Total job time:'):
             raise LogError('Could not find a successfully completed QChem job '
                            'in QChem output file {0}'.format(self.path))
+        logging.debug('Found a successfully completed QChem Job')
 
         # Now look for the geometry.
         # Will return the final geometry in the file under Standard Nuclear Orientation.
         geometry_flag = False
-        for i in reversed(range(len(log))):
-            line = log[i]
-            if 'Standard Nuclear Orientation' in line:
-                for line in log[(i + 3):]:
-                    if '------------' not in line:
-                        data = line.split()
-                        atom.append(data[1])
-                        coord.append([float(c) for c in data[2:]])
-                        geometry_flag = True
-                    else:
-                        break
-                if geometry_flag:
+        for i in reversed(self.find_lines('Standard Nuclear Orientation')):
+            for line in log[(i + 3):]:
+                if '------------' not in line:
+                    data = line.split()
+                    atom.append(data[1])
+                    coord.append([float(c) for c in data[2:]])
+                    geometry_flag = True
+                else:
                     break
+            if geometry_flag:
+                break
 
         # Assign appropriate mass to each atom in the molecule
         for atom1 in atom:
@@ -188,7 +185,7 @@ class QChemLog(Log):
                 optical_isomers = _optical_isomers
             if symmetry is None:
                 symmetry = _symmetry
-        with open(self.path, 'r') as f:
+        with self.read_from('$molecule', 'VIBRATIONAL ANALYSIS') as f:
             line = f.readline()
             while line != '':
                 # Read spin multiplicity if not explicitly given
@@ -276,7 +273,7 @@ class QChemLog(Log):
         the returned value.
         """
         e_elect = None
-        with open(self.path, 'r') as f:
+        with self.read_from('Final energy is', 'Total energy in the final basis set') as f:
             a = b = 0
             for line in f:
                 if 'Final energy is' in line:
@@ -293,7 +290,7 @@ class QChemLog(Log):
         Load the unscaled zero-point energy in J/mol from a QChem output file.
         """
         zpe = None
-        with open(self.path, 'r') as f:
+        with self.read_from('Zero point vibrational energy') as f:
             for line in f:
                 if 'Zero point vibrational energy' in line:
                     zpe = float(line.split()[4]) * 4184  # QChem's ZPE is in kcal/mol, convert to J/mol
@@ -311,7 +308,7 @@ class QChemLog(Log):
         v_list = []
         angle = []
         read = False
-        with open(self.path, 'r') as f:
+        with self.read_from('Summary of potential scan:', 'SCF failed to converge') as f:
             for line in f:
                 if '-----------------' in line:
                     read = False
@@ -344,7 +341,7 @@ class QChemLog(Log):
         calculation in cm^-1.
         """
         frequency = 0
-        with open(self.path, 'r') as f:
+        with self.read_from(' Frequency:') as f:
             for line in f:
                 # Read imaginary frequency
                 if ' Frequency:' in line:
@@ -37,7 +37,6 @@ import logging
 import math
 import os.path
 
-import matplotlib.pyplot as plt
 import numpy as np
 
 import rmgpy.constants as constants
@@ -205,22 +204,30 @@ class StatMechJob(object):
         """
         self.load(pdep, plot)
         if output_directory is not None:
+            self.save_results(output_directory, plot)
+        logging.debug('Finished statmech job for species {0}.'.format(self.species))
+        logging.debug(repr(self.species))
+
+    def save_results(self, output_directory, plot=False):
+        """
+        Save the results of an already loaded statmech job within the
+        `output_directory`. This is separated from :meth:`execute()` so that
+        the loading step can be done in a worker process.
+        """
+        try:
+            self.write_output(output_directory)
+        except Exception as e:
+            logging.warning("Could not write statmech output file due to error: "
+                            "{0} in species {1}".format(e, self.species.label))
+        if plot:
+            hr_dir = os.path.join(output_directory, 'plots')
+            if not os.path.exists(hr_dir):
+                os.mkdir(hr_dir)
             try:
-                self.write_output(output_directory)
+                self.save_hindered_rotor_figures(hr_dir)
             except Exception as e:
-                logging.warning("Could not write statmech output file due to error: "
+                logging.warning("Could not save hindered rotor scans due to error: "
                                 "{0} in species {1}".format(e, self.species.label))
-            if plot:
-                hr_dir = os.path.join(output_directory, 'plots')
-                if not os.path.exists(hr_dir):
-                    os.mkdir(hr_dir)
-                try:
-                    self.save_hindered_rotor_figures(hr_dir)
-                except Exception as e:
-                    logging.warning("Could not save hindered rotor scans due to error: "
-                                    "{0} in species {1}".format(e, self.species.label))
-        logging.debug('Finished statmech job for species {0}.'.format(self.species))
-        logging.debug(repr(self.species))
 
     def load(self, pdep=False, plot=False):
         """
@@ -714,6 +721,8 @@ class StatMechJob(object):
         Plot the potential for the rotor, along with its cosine and Fourier
         series potential fits, and save it in the `hindered_rotor_plots` attribute.
         """
+        import matplotlib.pyplot as plt
+
         phi = np.arange(0, 6.3, 0.02, np.float64)
         Vlist_cosine = np.zeros_like(phi)
         Vlist_fourier = np.zeros_like(phi)
@@ -0,0 +1,452 @@
+#!/usr/bin/env python3
+
+###############################################################################
+#                                                                             #
+# RMG - Reaction Mechanism Generator                                          #
+#                                                                             #
+# Copyright (c) 2002-2019 Prof. William H. Green (whgreen@mit.edu),           #
+# Prof. Richard H. West (r.west@neu.edu) and the RMG Team (rmg_dev@mit.edu)   #
+#                                                                             #
+# Permission is hereby granted, free of charge, to any person obtaining a     #
+# copy of this software and associated documentation files (the 'Software'),  #
+# to deal in the Software without restriction, including without limitation   #
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,    #
+# and/or sell copies of the Software, and to permit persons to whom the       #
+# Software is furnished to do so, subject to the following conditions:        #
+#                                                                             #
+# The above copyright notice and this permission notice shall be included in  #
+# all copies or substantial portions of the Software.                         #
+#                                                                             #
+# THE SOFTWARE IS PROVIDED 'AS IS', WITHOUT WARRANTY OF ANY KIND, EXPRESS OR  #
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,    #
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE #
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER      #
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING     #
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER         #
+# DEALINGS IN THE SOFTWARE.                                                   #
+#                                                                             #
+###############################################################################
+
+
+"""
+Benchmark suite for the performance critical parts of RMG-Py.
+
+Each benchmark uses fixed inputs bundled with RMG-Py (the testing database,
+the test Chemkin mechanisms and the Arkane examples), so the suite runs
+offline and measures the same work on every run. The time per call of each
+benchmark is measured `repeat` times, and the statistics are saved as JSON.
+If a baseline saved by a previous run is given, each benchmark is compared
+against it and the script exits with a nonzero status if any benchmark is
+slower than the baseline by more than the threshold. The syntax is as follows:
+
+python benchmarkSuite.py --output results.json
+python benchmarkSuite.py --output new.json --baseline results.json --threshold 0.2
+python benchmarkSuite.py --only isomorphism resonance
+
+Timings are only comparable between runs on the same machine.
+"""
+
+import argparse
+import atexit
+import itertools
+import json
+import logging
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from collections import OrderedDict
+
+import numpy as np
+
+import rmgpy
+from rmgpy import settings
+
+################################################################################
+
+TESTING_DATABASE = os.path.join(settings['test_data.directory'], 'testing_database')
+CHEMKIN_DIRECTORY = os.path.join(settings['test_data.directory'], 'chemkin', 'chemkin_py', 'NC')
+
+# Pairs of SMILES of the same molecule with different atom orders
+ISOMORPHISM_SMILES = [
+    ('CCCCO', 'OCCCC'),
+    ('CC(C)(C)CC(C)C', 'CC(C)CC(C)(C)C'),
+    ('c1ccc2ccccc2c1', 'c1ccc2c(c1)cccc2'),
+    ('C=CC(=O)OC', 'COC(=O)C=C'),
+    ('[CH2]C=CC=C', 'C=CC=C[CH2]'),
+    ('OC1CCC(CC1)C(=O)O', 'OC(=O)C1CCC(O)CC1'),
+]
+
+# Structures cycled through to build the species of the generated Chemkin mechanism
+CHEMKIN_STRUCTURES = ['C', 'CC', 'CCC', 'CCCC', 'CC(C)C', 'C=C', 'C=CC', 'CO', 'CCO', 'C=O', 'CC=O', 'OO', 'C1CC1',
+                      'C#C']
+
+SUBGRAPH_GROUP = """
+1 *1 C u0 {2,S} {3,S}
+2 *2 H u0 {1,S}
+3    C ux {1,S}
+"""
+
+RESONANCE_SMILES = ['c1ccc2ccccc2c1', 'c1ccc2cc3ccccc3cc2c1', '[CH2]C=CC=CC=C', 'C=C[CH]C=CC=C',
+                    '[O]N=O', 'C=CC(=O)[O]', 'c1ccccc1[CH2]']
+
+THERMO_SMILES = ['CCCCCCCC', 'CC(C)CC(C)(C)C', 'C=CC=CC=C', 'OCCO', 'CC(=O)OC', 'C1CCCCC1', 'c1ccccc1C',
+                 '[CH2]CCC', 'CC[CH]C', 'C=C[CH2]', 'CO[O]', 'C1=CCCC1']
+
+REACTION_SMILES = [('CCCC', '[H]'), ('CCCC', '[CH3]'), ('C=CC=C', '[OH]'), ('CC=CC', '[CH3]'),
+                   ('[CH2]CCCC',), ('CCO', '[O]O')]
+
+KINETICS_FAMILIES = ['R_Recombination', 'Disproportionation', 'R_Addition_MultipleBond', 'H_Abstraction',
+                     'intra_H_migration']
+
+
+def setup_isomorphism():
+    """Return a function testing the isomorphism of pairs of equivalent molecules."""
+    from rmgpy.molecule import Molecule
+    pairs = [(Molecule(smiles=smiles1), Molecule(smiles=smiles2)) for smiles1, smiles2 in ISOMORPHISM_SMILES]
+
+    def run():
+        for mol1, mol2 in pairs:
+            assert mol1.is_isomorphic(mol2)
+
+    return run
+
+
+def setup_subgraph_isomorphism():
+    """Return a function finding the subgraph isomorphisms of a group in several molecules."""
+    from rmgpy.molecule import Group, Molecule
+    group = Group().from_adjacency_list(SUBGRAPH_GROUP)
+    molecules = [Molecule(smiles=smiles) for pair in ISOMORPHISM_SMILES for smiles in pair]
+
+    def run():
+        for mol in molecules:
+            mol.find_subgraph_isomorphisms(group)
+
+    return run
+
+
+def setup_resonance():
+    """Return a function generating the resonance structures of several molecules."""
+    from rmgpy.molecule import Molecule
+    molecules = [Molecule(smiles=smiles) for smiles in RESONANCE_SMILES]
+
+    def run():
+        for mol in molecules:
+            mol.generate_resonance_structures()
+
+    return run
+
+
+def setup_thermo():
+    """Return a function estimating the thermo of several species by group additivity."""
+    from rmgpy.data.thermo import ThermoDatabase
+    from rmgpy.species import Species
+    database = ThermoDatabase()
+    database.load(os.path.join(TESTING_DATABASE, 'thermo'), libraries=[], depository=False)
+    species = []
+    for smiles in THERMO_SMILES:
+        spc = Species().from_smiles(smiles)
+        spc.generate_resonance_structures()
+        species.append(spc)
+
+    def run():
+        for spc in species:
+            database.get_thermo_data(spc)
+
+    return run
+
+
+def setup_reaction_generation():
+    """Return a function generating the reactions of several sets of reactants from the kinetics families."""
+    from rmgpy.data.base import ForbiddenStructures
+    from rmgpy.data.rmg import RMGDatabase
+    from rmgpy.species import Species
+    database = RMGDatabase()
+    database.load(
+        path=TESTING_DATABASE,
+        thermo_libraries=['primaryThermoLibrary'],
+        reaction_libraries=[],
+        kinetics_families=KINETICS_FAMILIES,
+        testing=True,
+        depository=False,
+        solvation=False,
+    )
+    for family in database.kinetics.families.values():
+        family.forbidden = ForbiddenStructures()
+    database.forbidden_structures = ForbiddenStructures()
+    reactants = []
+    for smiles in REACTION_SMILES:
+        spcs = [Species().from_smiles(s) for s in smiles]
+        for spc in spcs:
+            spc.generate_resonance_structures()
+        reactants.append(spcs)
+
+    def run():
+        for spcs in reactants:
+            database.kinetics.generate_reactions_from_families(spcs)
+
+    return run
+
+
+def setup_simulation():
+    """Return a function simulating a combustion mechanism in a SimpleReactor."""
+    from rmgpy.chemkin import load_chemkin_file
+    from rmgpy.solver.simple import SimpleReactor
+    species, reactions = load_chemkin_file(os.path.join(CHEMKIN_DIRECTORY, 'chem.inp'),
+                                           os.path.join(CHEMKIN_DIRECTORY, 'species_dictionary.txt'))
+    species_dict = dict((spc.label, spc) for spc in species)
+    initial_mole_fractions = {species_dict['NC']: 0.05, species_dict['O2']: 0.15, species_dict['Ar']: 0.8}
+
+    def run():
+        reactor = SimpleReactor(1500.0, 1.0e5, initial_mole_fractions=initial_mole_fractions, n_sims=1,
+                                termination=None)
+        reactor.initialize_model(species, reactions, [], [])
+        reactor.advance(1.0e-3)
+
+    return run
+
+
+def setup_pdep():
+    """Return a function calculating the phenomenological rate coefficients of the n-butanol network."""
+    from arkane.input import load_input_file
+    from arkane.pdep import PressureDependenceJob
+    path = os.path.join(os.path.dirname(rmgpy.get_path()), 'examples', 'arkane', 'networks', 'n-butanol', 'input.py')
+    job_list = load_input_file(path)[0]
+    job = [job for job in job_list if isinstance(job, PressureDependenceJob)][0]
+    job.initialize()
+
+    def run():
+        job.network.calculate_rate_coefficients(job.Tlist.value_si, job.Plist.value_si, job.method)
+
+    return run
+
+
+def setup_chemkin():
+    """Return a function loading and saving a Chemkin mechanism."""
+    from rmgpy.chemkin import load_chemkin_file, save_chemkin_file
+
+    def run():
+        directory = tempfile.mkdtemp()
+        try:
+            species, reactions = load_chemkin_file(os.path.join(CHEMKIN_DIRECTORY, 'chem.inp'),
+                                                   os.path.join(CHEMKIN_DIRECTORY, 'species_dictionary.txt'))
+            save_chemkin_file(os.path.join(directory, 'chem.inp'), species, reactions)
+        finally:
+            shutil.rmtree(directory)
+
+    return run
+
+
+def generate_chemkin_mechanism(num_species, num_reactions, num_extra_species):
+    """
+    Return lists of `num_species` species and `num_reactions` reactions forming a
+    synthetic mechanism, and of `num_extra_species` species that are only written
+    to the species dictionary. One in ten reactions is a third body reaction and
+    one in ten a Troe falloff reaction, and each reaction has a distinct pair of
+    reactants, so the mechanism has no duplicates.
+    """
+    from rmgpy.kinetics import Arrhenius, ThirdBody, Troe
+    from rmgpy.reaction import Reaction
+    from rmgpy.species import Species
+    from rmgpy.thermo import NASA, NASAPolynomial
+
+    thermo = NASA(
+        polynomials=[
+            NASAPolynomial(coeffs=[3.5, 1e-3, 1e-6, -1e-9, 1e-13, -1e4, 5.0], Tmin=(300, 'K'), Tmax=(1000, 'K')),
+            NASAPolynomial(coeffs=[3.0, 2e-3, -5e-7, 6e-11, -3e-15, -1e4, 6.0], Tmin=(1000, 'K'), Tmax=(5000, 'K')),
+        ],
+        Tmin=(300, 'K'),
+        Tmax=(5000, 'K'),
+    )
+    species = []
+    for index in range(num_species + num_extra_species):
+        smiles = CHEMKIN_STRUCTURES[index % len(CHEMKIN_STRUCTURES)]
+        species.append(Species(index=index + 1, label='S', thermo=thermo).from_smiles(smiles))
+    species, extra_species = species[:num_species], species[num_species:]
+
+    reactions = []
+    pairs = itertools.combinations(range(num_species), 2)
+    for index, (i, j) in enumerate(itertools.islice(pairs, num_reactions)):
+        reactants = [species[i], species[j]]
+        if index % 10 == 0:
+            products = [species[(i + j) % num_species]]
+            kinetics = ThirdBody(arrheniusLow=Arrhenius(A=(1e15, 'cm^6/(mol^2*s)'), n=-1.0, Ea=(0., 'kcal/mol'),
+                                                        T0=(1, 'K')))
+        elif index % 10 == 5:
+            products = [species[(i + j) % num_species]]
+            kinetics = Troe(
+                arrheniusHigh=Arrhenius(A=(1e13, 'cm^3/(mol*s)'), n=0.0, Ea=(1., 'kcal/mol'), T0=(1, 'K')),
+                arrheniusLow=Arrhenius(A=(1e18, 'cm^6/(mol^2*s)'), n=-1.5, Ea=(0., 'kcal/mol'), T0=(1, 'K')),
+                alpha=0.5, T3=(100, 'K'), T1=(1000, 'K'),
+            )
+        else:
+            products = [species[(i + 1) % num_species], species[(j + 1) % num_species]]
+            kinetics = Arrhenius(A=(1e13, 'cm^3/(mol*s)'), n=0.5, Ea=(10., 'kcal/mol'), T0=(1, 'K'))
+        reactions.append(Reaction(index=index + 1, reactants=reactants, products=products, kinetics=kinetics))
+    return species, reactions, extra_species
+
+
+def setup_chemkin_large():
+    """
+    Return a function loading a generated Chemkin mechanism with 500 species and
+    10000 reactions, whose species dictionary has 250 undeclared species.
+    """
+    from rmgpy.chemkin import load_chemkin_file, save_chemkin_file, save_species_dictionary
+
+    directory = tempfile.mkdtemp()
+    atexit.register(shutil.rmtree, directory, ignore_errors=True)
+    chemkin_path = os.path.join(directory, 'chem.inp')
+    dictionary_path = os.path.join(directory, 'species_dictionary.txt')
+    species, reactions, extra_species = generate_chemkin_mechanism(500, 10000, 250)
+    save_chemkin_file(chemkin_path, species, reactions, verbose=True, check_for_duplicates=False)
+    save_species_dictionary(dictionary_path, species + extra_species)
+
+    def run():
+        load_chemkin_file(chemkin_path, dictionary_path)
+
+    return run
+
+
+BENCHMARKS = OrderedDict([
+    ('isomorphism', setup_isomorphism),
+    ('subgraph_isomorphism', setup_subgraph_isomorphism),
+    ('resonance', setup_resonance),
+    ('thermo', setup_thermo),
+    ('reaction_generation', setup_reaction_generation),
+    ('simulation', setup_simulation),
+    ('pdep', setup_pdep),
+    ('chemkin', setup_chemkin),
+    ('chemkin_large', setup_chemkin_large),
+])
+
+
+def time_function(func, repeat=5, min_time=0.2):
+    """
+    Return a list of `repeat` measurements of the time per call of `func` in
+    seconds. Each measurement calls `func` enough times to take at least
+    `min_time` seconds, as determined by a first untimed warm-up call.
+    """
+    start = time.perf_counter()
+    func()
+    number = max(1, int(np.ceil(min_time / max(time.perf_counter() - start, 1e-9))))
+
+    times = []
+    for i in range(repeat):
+        start = time.perf_counter()
+        for j in range(number):
+            func()
+        times.append((time.perf_counter() - start) / number)
+    return times
+
+
+def get_metadata():
+    """
+    Return a dictionary describing the machine and the version of RMG-Py used.
+    """
+    try:
+        commit = subprocess.check_output(['git', 'rev-parse', 'HEAD'], cwd=os.path.dirname(rmgpy.get_path()),
+                                         stderr=subprocess.DEVNULL).decode().strip()
+    except (subprocess.CalledProcessError, OSError):
+        commit = ''
+    return {
+        'rmgpy_version': rmgpy.__version__,
+        'commit': commit,
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'machine': platform.machine(),
+        'processor': platform.processor(),
+        'platform': platform.platform(),
+        'time': time.strftime('%Y-%m-%dT%H:%M:%S'),
+    }
+
+
+def run(names=None, repeat=5, min_time=0.2):
+    """
+    Run the benchmarks in `names`, or all of them if it is ``None``, and return
+    a dictionary of the machine metadata and the timing statistics in seconds
+    of each benchmark.
+    """
+    names = names or list(BENCHMARKS.keys())
+    results = OrderedDict()
+    for name in names:
+        logging.info('Running benchmark {0}...'.format(name))
+        func = BENCHMARKS[name]()
+        times = time_function(func, repeat=repeat, min_time=min_time)
+        results[name] = OrderedDict([
+            ('min', min(times)),
+            ('median', float(np.median(times))),
+            ('mean', float(np.mean(times))),
+            ('stdev', float(np.std(times))),
+            ('repeat', repeat),
+        ])
+    return {'metadata': get_metadata(), 'benchmarks': results}
+
+
+def compare(results, baseline, threshold=0.1):
+    """
+    Compare the median times of the benchmarks in `results` with those in
+    `baseline`. Returns a list of (name, baseline time, time, ratio, status)
+    tuples, where the status is ``'regression'`` if the ratio exceeds
+    1 + `threshold`, ``'improvement'`` if it is below 1 / (1 + `threshold`),
+    and ``'unchanged'`` otherwise.
+    """
+    comparison = []
+    for name, stats in results['benchmarks'].items():
+        if name not in baseline['benchmarks']:
+            continue
+        old = baseline['benchmarks'][name]['median']
+        new = stats['median']
+        ratio = new / old
+        if ratio > 1.0 + threshold:
+            status = 'regression'
+        elif ratio < 1.0 / (1.0 + threshold):
+            status = 'improvement'
+        else:
+            status = 'unchanged'
+        comparison.append((name, old, new, ratio, status))
+    return comparison
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the performance critical parts of RMG-Py.')
+    parser.add_argument('--only', type=str, nargs='+', choices=list(BENCHMARKS.keys()), metavar='NAME',
+                        help='only run these benchmarks: {0}'.format(', '.join(BENCHMARKS.keys())))
+    parser.add_argument('--repeat', type=int, default=5, help='number of measurements of each benchmark')
+    parser.add_argument('--min-time', type=float, default=0.2,
+                        help='minimum time in seconds of each measurement')
+    parser.add_argument('--output', type=str, help='save the results as JSON to this file')
+    parser.add_argument('--baseline', type=str, help='compare the results with those saved in this file')
+    parser.add_argument('--threshold', type=float, default=0.1,
+                        help='fraction by which a benchmark must be slower than the baseline to fail')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+
+    results = run(args.only, repeat=args.repeat, min_time=args.min_time)
+
+    print('{0:<22} {1:>12} {2:>12}'.format('Benchmark', 'Median (ms)', 'Stdev (ms)'))
+    for name, stats in results['benchmarks'].items():
+        print('{0:<22} {1:>12.3f} {2:>12.3f}'.format(name, stats['median'] * 1000, stats['stdev'] * 1000))
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, 'r') as f:
+            baseline = json.load(f)
+        comparison = compare(results, baseline, threshold=args.threshold)
+        print('')
+        print('{0:<22} {1:>14} {2:>12} {3:>8}  {4}'.format('Benchmark', 'Baseline (ms)', 'Time (ms)', 'Ratio',
+                                                           'Status'))
+        for name, old, new, ratio, status in comparison:
+            print('{0:<22} {1:>14.3f} {2:>12.3f} {3:>8.2f}  {4}'.format(name, old * 1000, new * 1000, ratio, status))
+        if any(status == 'regression' for name, old, new, ratio, status in comparison):
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -74,7 +74,8 @@ def main():
         'restart': args.restart,
         'walltime': args.walltime,
         'maxproc': args.maxproc,
-        'kineticsdatastore': args.kineticsdatastore
+        'kineticsdatastore': args.kineticsdatastore,
+        'trace': args.trace,
     }
 
     if args.profile:
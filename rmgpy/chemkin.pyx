@@ -36,6 +36,7 @@ import re
 import shutil
 import textwrap
 import warnings
+from multiprocessing import Pool
 
 import numpy as np
 
@@ -285,6 +286,9 @@ def read_kinetics_entry(entry, species_dict, Aunits, Eunits):
     return reaction
 
 
+_collider_pattern = re.compile(r'\(\+[^\)]+\)')
+
+
 def _read_kinetics_reaction(line, species_dict, Aunits, Eunits):
     """
     Parse the first line of of a Chemkin reaction entry.
@@ -331,10 +335,10 @@ def _read_kinetics_reaction(line, species_dict, Aunits, Eunits):
     specific_collider = None
     # search for a third body collider, e.g., '(+M)', '(+m)', or a specific species like '(+N2)',
     #     matching `(+anything_other_than_ending_parenthesis)`:
-    collider = re.search(r'\(\+[^\)]+\)', reactants)
+    collider = _collider_pattern.search(reactants) if '(+' in reactants else None
     if collider is not None:
         collider = collider.group(0)  # save string value rather than the object
-        if collider != re.search(r'\(\+[^\)]+\)', products).group(0):
+        if collider != _collider_pattern.search(products).group(0):
             raise ChemkinError(
                 'Third body colliders in reactants and products of reaction {0} are not identical!'.format(reaction))
         extra_parenthesis = collider.count('(') - 1
@@ -559,28 +563,39 @@ def _read_kinetics_line(line, reaction, species_dict, Eunits, kunits, klow_units
     return kinetics
 
 
+_new_statement_indicators = ['Reaction index', 'Template reaction', 'Library reaction',
+                             'PDep reaction', 'Flux pairs', 'BM rule fitted to',
+                             'Uncertainty in Total Std:',
+                             'Estimated using', 'Exact match found', 'Average of ',
+                             'Euclidian distance', 'Matched node ', 'Matched reaction ',
+                             'Multiplied by reaction path degeneracy ',
+                             'Kinetics were estimated in this direction',
+                             'dGrxn(298 K) = ', 'Both directions are estimates',
+                             'Other direction matched ', 'Both directions matched ',
+                             'This direction matched an entry in ', 'From training reaction',
+                             'This reaction matched rate rule', 'family: ', 'Warning:',
+                             'Chemkin file stated explicit reverse rate:', 'Ea raised from',
+                             ]
+_new_statement_pattern = re.compile(' (' + '|'.join(re.escape(indicator)
+                                                    for indicator in _new_statement_indicators) + ')')
+
+
 def _remove_line_breaks(comments):
     """
     This method removes any extra line breaks in reaction comments, so they
-    can be parsed by read_reaction_comments.
-    """
-    comments = comments.replace('\n', ' ')
-    new_statement_indicators = ['Reaction index', 'Template reaction', 'Library reaction',
-                                'PDep reaction', 'Flux pairs', 'BM rule fitted to',
-                                'Uncertainty in Total Std:',
-                                'Estimated using', 'Exact match found', 'Average of ',
-                                'Euclidian distance', 'Matched node ', 'Matched reaction ',
-                                'Multiplied by reaction path degeneracy ',
-                                'Kinetics were estimated in this direction',
-                                'dGrxn(298 K) = ', 'Both directions are estimates',
-                                'Other direction matched ', 'Both directions matched ',
-                                'This direction matched an entry in ', 'From training reaction',
-                                'This reaction matched rate rule', 'family: ', 'Warning:',
-                                'Chemkin file stated explicit reverse rate:', 'Ea raised from',
-                                ]
-    for indicator in new_statement_indicators:
-        comments = comments.replace(' ' + indicator, '\n' + indicator, 1)
-    return comments
+    can be parsed by read_reaction_comments. Only the first occurrence of
+    each new statement indicator starts a new line.
+    """
+    found = set()
+
+    def start_new_line(match):
+        indicator = match.group(1)
+        if indicator in found:
+            return match.group(0)
+        found.add(indicator)
+        return '\n' + indicator
+
+    return _new_statement_pattern.sub(start_new_line, comments.replace('\n', ' '))
 
 
 def read_reaction_comments(reaction, comments, read=True):
@@ -777,51 +792,97 @@ def read_reaction_comments(reaction, comments, read=True):
 ################################################################################
 
 
-def load_species_dictionary(path):
+def load_species_dictionary(path, procnum=1, labels=None):
     """
     Load an RMG dictionary - containing species identifiers and the associated
     adjacency lists - from the file located at `path` on disk. Returns a dict
     mapping the species identifiers to the loaded species. Resonance isomers
     for each species are automatically generated.
-    """
-    species_dict = {}
 
-    inerts = [Species().from_smiles(inert) for inert in ('[He]', '[Ne]', 'N#N', '[Ar]')]
+    The adjacency lists are converted to species using `procnum` processes.
+    If a collection of `labels` is given, the labeled entries with other
+    labels are skipped without being converted.
+    """
     with open(path, 'r') as f:
-        adjlist = ''
-        for line in f:
-            if line.strip() == '' and adjlist.strip() != '':
-                # Finish this adjacency list
-                species = Species().from_adjacency_list(adjlist)
-                species.generate_resonance_structures()
-                label = species.label
-                for inert in inerts:
-                    if inert.is_isomorphic(species):
-                        species.reactive = False
-                        break
-                species_dict[label] = species
-                adjlist = ''
-            else:
-                if "InChI" in line:
-                    line = line.split()[0] + '\n'
-                if '//' in line:
-                    index = line.index('//')
-                    line = line[0:index]
-                adjlist += line
-        else:  #reach end of file
-            if adjlist.strip() != '':
-                species = Species().from_adjacency_list(adjlist)
-                species.generate_resonance_structures()
-                label = species.label
-                for inert in inerts:
-                    if inert.is_isomorphic(species):
-                        species.reactive = False
-                        break
-                species_dict[label] = species
+        adjlists = list(_read_adjacency_list_blocks(f))
+
+    if labels is not None:
+        labels = set(labels)
+        labels.add(None)  # Always load the entries without a label
+        adjlists = [adjlist for adjlist in adjlists if _get_adjacency_list_label(adjlist) in labels]
+
+    if procnum > 1 and len(adjlists) > procnum:
+        logging.info('Loading species dictionary using {0} processes.'.format(procnum))
+        p = Pool(processes=procnum)
+        species_list = p.map(_load_species_from_adjacency_list, adjlists,
+                             chunksize=max(1, len(adjlists) // (4 * procnum)))
+        p.close()
+        p.join()
+    else:
+        species_list = [_load_species_from_adjacency_list(adjlist) for adjlist in adjlists]
+
+    species_dict = {}
+    for species in species_list:
+        species_dict[species.label] = species
 
     return species_dict
 
 
+def _read_adjacency_list_blocks(f):
+    """
+    Generate the adjacency lists in the species dictionary file object `f`,
+    with InChI strings and comments removed.
+    """
+    adjlist = ''
+    for line in f:
+        if line.strip() == '' and adjlist.strip() != '':
+            # Finish this adjacency list
+            yield adjlist
+            adjlist = ''
+        else:
+            if "InChI" in line:
+                line = line.split()[0] + '\n'
+            if '//' in line:
+                index = line.index('//')
+                line = line[0:index]
+            adjlist += line
+    # Reached end of file
+    if adjlist.strip() != '':
+        yield adjlist
+
+
+def _get_adjacency_list_label(adjlist):
+    """
+    Return the label on the first line of the species dictionary entry
+    `adjlist`, or None if the entry is not labeled.
+    """
+    tokens = adjlist.strip().split('\n', 1)[0].split()
+    return tokens[0] if len(tokens) == 1 else None
+
+
+_inert_species = None
+
+
+def _load_species_from_adjacency_list(adjlist):
+    """
+    Return the species described by the species dictionary entry `adjlist`,
+    with resonance structures generated and inert species marked unreactive.
+    """
+    global _inert_species
+    if _inert_species is None:
+        _inert_species = [Species().from_smiles(inert) for inert in ('[He]', '[Ne]', 'N#N', '[Ar]')]
+
+    species = Species().from_adjacency_list(adjlist)
+    species.generate_resonance_structures()
+    # All of the inert species have at most two atoms
+    if len(species.molecule[0].atoms) <= 2:
+        for inert in _inert_species:
+            if inert.is_isomorphic(species):
+                species.reactive = False
+                break
+    return species
+
+
 def remove_comment_from_line(line):
     """
     Remove a comment from a line of a Chemkin file or species dictionary file.
@@ -859,7 +920,12 @@ def load_transport_file(path, species_dict):
                 # This line contains an entry, so parse it
                 label = line[0:16].strip()
                 data = line[16:].split()
-                species = species_dict[label]
+                try:
+                    species = species_dict[label]
+                except KeyError:
+                    logging.info("Ignoring transport data for {0} because it's not in the requested list "
+                                 "of species.".format(label))
+                    continue
                 species.transport_data = TransportData(
                     shapeIndex=int(data[0]),
                     sigma=(float(data[2]), 'angstrom'),
@@ -872,11 +938,13 @@ def load_transport_file(path, species_dict):
 
 
 def load_chemkin_file(path, dictionary_path=None, transport_path=None, read_comments=True, thermo_path=None,
-                      use_chemkin_names=False, check_duplicates=True):
+                      use_chemkin_names=False, check_duplicates=True, procnum=1):
     """
     Load a Chemkin input file located at `path` on disk to `path`, returning lists of the species
     and reactions in the Chemkin file. The 'thermo_path' point to a separate thermo file, or, if 'None' is
-    specified, the function will look for the thermo database within the chemkin mechanism file
+    specified, the function will look for the thermo database within the chemkin mechanism file.
+    Only the species dictionary entries of the species declared in the Chemkin file are loaded,
+    using `procnum` processes.
     """
     species_list = []
     species_dict = {}
@@ -888,7 +956,8 @@ def load_chemkin_file(path, dictionary_path=None, transport_path=None, read_comm
     # as N2, or else the species objects will not store any structures for the final
     # HTML output.
     if dictionary_path:
-        species_dict = load_species_dictionary(dictionary_path)
+        species_dict = load_species_dictionary(dictionary_path, procnum=procnum,
+                                               labels=_read_species_labels(path))
 
     with open(path, 'r') as f:
         previous_line = f.tell()
@@ -969,85 +1038,121 @@ cpdef _process_duplicate_reactions(list reaction_list):
     Check for marked (and unmarked!) duplicate reactions
     Combine marked duplicate reactions into a single reaction using MultiKinetics
     Raise exception for unmarked duplicate reactions
+
+    Reactions are first grouped by their reactants, products and specific collider,
+    so that each reaction is only compared with the other reactions in its group.
     """
-    cdef list duplicate_reactions_to_remove = []
     cdef list duplicate_reactions_to_add = []
+    cdef set duplicate_reactions_to_remove = set()
+    cdef dict groups = {}
+    cdef list group
     cdef int index1, index2
     cdef Reaction reaction, reaction1, reaction2
     cdef KineticsModel kinetics
 
-    for index1 in range(len(reaction_list)):
-        reaction1 = reaction_list[index1]
-        if reaction1 in duplicate_reactions_to_remove:
-            continue
+    for reaction1 in reaction_list:
+        key = (tuple([hash(spc) for spc in reaction1.reactants]), tuple([hash(spc) for spc in reaction1.products]),
+               hash(reaction1.specific_collider))
+        try:
+            groups[key].append(reaction1)
+        except KeyError:
+            groups[key] = [reaction1]
+
+    for group in groups.values():
+        for index1 in range(len(group) - 1):
+            reaction1 = group[index1]
+            if id(reaction1) in duplicate_reactions_to_remove:
+                continue
 
-        for index2 in range(index1 + 1, len(reaction_list)):
-            reaction2 = reaction_list[index2]
-            if (reaction1.reactants == reaction2.reactants
-                    and reaction1.products == reaction2.products
-                    and reaction1.specific_collider == reaction2.specific_collider):
-                if reaction1.duplicate and reaction2.duplicate:
-
-                    if isinstance(reaction1, LibraryReaction) and isinstance(reaction2, LibraryReaction):
-                        if reaction1.library != reaction2.library:
-                            raise ChemkinError("Identical reactions {0} and {1} taken from different libraries: {2}, "
-                                               "{3}".format(reaction1, reaction2, reaction1.library, reaction2.library))
-                        if reaction1 not in duplicate_reactions_to_remove:
-                            # already created duplicate reaction, move on to appending any additional duplicate kinetics
-                            if isinstance(reaction1.kinetics,
-                                          _kinetics.PDepArrhenius):
-                                kinetics = _kinetics.MultiPDepArrhenius()
-                            elif isinstance(reaction1.kinetics,
-                                            _kinetics.Arrhenius):
-                                kinetics = _kinetics.MultiArrhenius()
-                            else:
-                                logging.warning(
-                                    'Unexpected kinetics type {0} for duplicate reaction {1}. '
-                                    'Not combining reactions.'.format(reaction1.kinetics.__class__, reaction1)
+            for index2 in range(index1 + 1, len(group)):
+                reaction2 = group[index2]
+                if (reaction1.reactants == reaction2.reactants
+                        and reaction1.products == reaction2.products
+                        and reaction1.specific_collider == reaction2.specific_collider):
+                    if reaction1.duplicate and reaction2.duplicate:
+
+                        if isinstance(reaction1, LibraryReaction) and isinstance(reaction2, LibraryReaction):
+                            if reaction1.library != reaction2.library:
+                                raise ChemkinError("Identical reactions {0} and {1} taken from different libraries: "
+                                                   "{2}, {3}".format(reaction1, reaction2, reaction1.library,
+                                                                     reaction2.library))
+                            if id(reaction1) not in duplicate_reactions_to_remove:
+                                # already created duplicate reaction, move on to appending any additional duplicate kinetics
+                                if isinstance(reaction1.kinetics,
+                                              _kinetics.PDepArrhenius):
+                                    kinetics = _kinetics.MultiPDepArrhenius()
+                                elif isinstance(reaction1.kinetics,
+                                                _kinetics.Arrhenius):
+                                    kinetics = _kinetics.MultiArrhenius()
+                                else:
+                                    logging.warning(
+                                        'Unexpected kinetics type {0} for duplicate reaction {1}. '
+                                        'Not combining reactions.'.format(reaction1.kinetics.__class__, reaction1)
+                                    )
+                                    continue
+                                reaction = LibraryReaction(
+                                    index=reaction1.index,
+                                    reactants=reaction1.reactants,
+                                    products=reaction1.products,
+                                    specific_collider=reaction1.specific_collider,
+                                    kinetics=kinetics,
+                                    library=reaction1.library,
+                                    duplicate=False,
                                 )
-                                continue
-                            reaction = LibraryReaction(
-                                index=reaction1.index,
-                                reactants=reaction1.reactants,
-                                products=reaction1.products,
-                                specific_collider=reaction1.specific_collider,
-                                kinetics=kinetics,
-                                library=reaction1.library,
-                                duplicate=False,
-                            )
-                            duplicate_reactions_to_add.append(reaction)
-                            kinetics.arrhenius = [reaction1.kinetics]
-                            duplicate_reactions_to_remove.append(reaction1)
+                                duplicate_reactions_to_add.append(reaction)
+                                kinetics.arrhenius = [reaction1.kinetics]
+                                duplicate_reactions_to_remove.add(id(reaction1))
 
-                    else:
-                        # Do not use as duplicate reactions if it's not a library reaction
-                        # Template reactions should be kept separate
-                        continue
-
-                    if (isinstance(reaction.kinetics,
-                                   _kinetics.MultiPDepArrhenius) and
-                            isinstance(reaction2.kinetics,
-                                       _kinetics.PDepArrhenius)):
-                        reaction.kinetics.arrhenius.append(reaction2.kinetics)
-                    elif (isinstance(reaction.kinetics,
-                                     _kinetics.MultiArrhenius) and
-                          isinstance(reaction2.kinetics,
-                                     _kinetics.Arrhenius)):
-                        reaction.kinetics.arrhenius.append(reaction2.kinetics)
-                    else:
-                        raise ChemkinError('Mixed kinetics for duplicate reaction {0}.'.format(reaction))
+                        else:
+                            # Do not use as duplicate reactions if it's not a library reaction
+                            # Template reactions should be kept separate
+                            continue
+
+                        if (isinstance(reaction.kinetics,
+                                       _kinetics.MultiPDepArrhenius) and
+                                isinstance(reaction2.kinetics,
+                                           _kinetics.PDepArrhenius)):
+                            reaction.kinetics.arrhenius.append(reaction2.kinetics)
+                        elif (isinstance(reaction.kinetics,
+                                         _kinetics.MultiArrhenius) and
+                              isinstance(reaction2.kinetics,
+                                         _kinetics.Arrhenius)):
+                            reaction.kinetics.arrhenius.append(reaction2.kinetics)
+                        else:
+                            raise ChemkinError('Mixed kinetics for duplicate reaction {0}.'.format(reaction))
 
-                    duplicate_reactions_to_remove.append(reaction2)
-                elif reaction1.kinetics.is_pressure_dependent() == reaction2.kinetics.is_pressure_dependent():
-                    # If both reactions are pressure-independent or both are pressure-dependent, then they need
-                    # duplicate tags. Chemkin treates pdep and non-pdep reactions as different, so those are okay
-                    raise ChemkinError('Encountered unmarked duplicate reaction {0}.'.format(reaction1))
+                        duplicate_reactions_to_remove.add(id(reaction2))
+                    elif reaction1.kinetics.is_pressure_dependent() == reaction2.kinetics.is_pressure_dependent():
+                        # If both reactions are pressure-independent or both are pressure-dependent, then they need
+                        # duplicate tags. Chemkin treates pdep and non-pdep reactions as different, so those are okay
+                        raise ChemkinError('Encountered unmarked duplicate reaction {0}.'.format(reaction1))
 
-    for reaction in duplicate_reactions_to_remove:
-        reaction_list.remove(reaction)
+    if duplicate_reactions_to_remove:
+        reaction_list[:] = [reaction for reaction in reaction_list if id(reaction) not in duplicate_reactions_to_remove]
     reaction_list.extend(duplicate_reactions_to_add)
 
 
+def _read_species_labels(path):
+    """
+    Return the set of the species identifiers declared in the Species blocks
+    of the Chemkin file located at `path` on disk.
+    """
+    species_dict = {}
+    with open(path, 'r') as f:
+        previous_line = f.tell()
+        line0 = f.readline()
+        while line0 != '':
+            line = remove_comment_from_line(line0)[0]
+            if 'SPECIES' in line.upper():
+                f.seek(previous_line)
+                read_species_block(f, species_dict, {}, [])
+            elif 'REACTIONS' in line.upper():
+                break
+            previous_line = f.tell()
+            line0 = f.readline()
+    return set(species_dict)
+
+
 def read_species_block(f, species_dict, species_aliases, species_list):
     """
     Read a Species block from a chemkin file.
@@ -1916,50 +2021,240 @@ def mark_duplicate_reactions(reactions):
     """
     For a given list of `reactions`, mark all of the duplicate reactions as
     understood by Chemkin.
-    
-    This is pretty slow (quadratic in size of reactions list) so only call it if you're really worried
-    you may have undetected duplicate reactions.
+
+    Reactions can only be duplicates of one another if they are of the same
+    class and have the same reactants, products and specific collider, so the
+    reactions are first grouped using an order-independent key of these
+    attributes. The pairwise checks of :func:`mark_duplicate_reaction` are then
+    only applied within each group, in the original order of `reactions`.
     """
-    for index1 in range(len(reactions)):
-        reaction1 = reactions[index1]
-        remaining_list = reactions[index1 + 1:]
-        mark_duplicate_reaction(reaction1, remaining_list)
+    groups = {}
+    for reaction in reactions:
+        reactants_key = tuple(sorted(hash(spc) for spc in reaction.reactants))
+        products_key = tuple(sorted(hash(spc) for spc in reaction.products))
+        key = (reaction.__class__, frozenset([reactants_key, products_key]), hash(reaction.specific_collider))
+        try:
+            groups[key].append(reaction)
+        except KeyError:
+            groups[key] = [reaction]
+
+    for group in groups.values():
+        for index1 in range(len(group) - 1):
+            mark_duplicate_reaction(group[index1], group[index1 + 1:])
 
 
-def save_species_dictionary(path, species, old_style=False):
+class ChemkinEntryCache(object):
+    """
+    A cache of the formatted Chemkin, species dictionary and transport entries
+    of species and reactions, used to avoid regenerating the text of every
+    entry each time a reaction model is saved.
+
+    Each entry is stored along with a signature of the state of the object it
+    was generated from, and the entry is regenerated whenever the signature
+    changes, e.g. when a species is relabeled or a reaction is given new
+    kinetics. Entries of objects which were not written since the last call to
+    :meth:`prune` are discarded by that method.
+    """
+
+    def __init__(self):
+        self._entries = {}
+        self._used = set()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, kind, obj, signature, writer):
+        """
+        Return the entry of type `kind` for the object `obj`, calling
+        `writer()` to generate it if it is not cached or if `signature` does
+        not match the signature of the cached entry.
+        """
+        key = (kind, id(obj))
+        self._used.add(key)
+        try:
+            cached_obj, cached_signature, entry = self._entries[key]
+        except KeyError:
+            pass
+        else:
+            if cached_obj is obj and cached_signature == signature:
+                self.hits += 1
+                return entry
+        self.misses += 1
+        entry = writer()
+        self._entries[key] = (obj, signature, entry)
+        return entry
+
+    def prune(self):
+        """
+        Discard all entries which were not requested since the last call to
+        this method.
+        """
+        for key in list(self._entries.keys()):
+            if key not in self._used:
+                del self._entries[key]
+        self._used = set()
+
+
+def _species_signature(species):
+    """
+    Return a tuple describing the state of `species` which determines its
+    Chemkin entries.
+    """
+    return (species.label, species.index, species.reactive, id(species.thermo),
+            getattr(species.thermo, 'comment', None), id(species.transport_data))
+
+
+def _reaction_signature(reaction, verbose):
+    """
+    Return a tuple describing the state of `reaction` which determines its
+    Chemkin entry. Verbose entries also depend on the current Chemkin
+    reaction count, the RMG reaction index and the flux pairs, since they are
+    included in the comments.
+    """
+    kinetics = reaction.kinetics
+    collider = reaction.specific_collider
+    signature = (
+        tuple((spec.label, spec.index) for spec in reaction.reactants),
+        tuple((spec.label, spec.index) for spec in reaction.products),
+        (collider.label, collider.index) if collider is not None else None,
+        reaction.reversible,
+        reaction.duplicate,
+        id(kinetics),
+        getattr(getattr(kinetics, 'Ea', None), 'value_si', None),
+    )
+    if verbose:
+        pairs = tuple((get_species_identifier(pair[0]), get_species_identifier(pair[1]))
+                      for pair in reaction.pairs) if reaction.pairs else None
+        signature += (_chemkin_reaction_count, reaction.index, pairs, kinetics.comment)
+    return signature
+
+
+def _collider_identifiers(reaction, species_by_fingerprint):
+    """
+    Return a tuple of the identifiers of the species written with third body
+    efficiencies in the Chemkin entry of `reaction`, i.e. the first species of
+    the species list isomorphic to each collider of the kinetics.
+    `species_by_fingerprint` maps fingerprints to the species of the species
+    list with that fingerprint, in the order of the species list.
+    """
+    efficiencies = getattr(reaction.kinetics, 'efficiencies', None)
+    if not efficiencies:
+        return ()
+    identifiers = []
+    for collider in sorted(efficiencies.keys(), key=id):
+        for species in species_by_fingerprint.get(collider.fingerprint, []):
+            if any([collider.is_isomorphic(molecule) for molecule in species.molecule]):
+                identifiers.append(get_species_identifier(species))
+                break
+    return tuple(identifiers)
+
+
+def _write_counted_kinetics_entry(reaction, species_list, verbose):
+    """
+    Return the Chemkin entry of `reaction` and the number of Chemkin
+    reactions it contains.
+    """
+    start = _chemkin_reaction_count
+    string = write_kinetics_entry(reaction, species_list=species_list, verbose=verbose)
+    return string, _chemkin_reaction_count - start
+
+
+def _write_reaction_entries(f, reactions, species, verbose, cache):
+    """
+    Write the Chemkin entries of `reactions` to the file object `f`, using
+    the :class:`ChemkinEntryCache` `cache` if provided.
+
+    Since the third body efficiencies are only written for colliders in the
+    species list `species`, the entries are cached separately for each set
+    of colliders, e.g. for the core and the core and edge Chemkin files.
+    """
+    global _chemkin_reaction_count
+    species_by_fingerprint = None
+    for rxn in reactions:
+        if cache is None:
+            f.write(write_kinetics_entry(rxn, species_list=species, verbose=verbose))
+        else:
+            colliders = ()
+            if getattr(rxn.kinetics, 'efficiencies', None):
+                if species_by_fingerprint is None:
+                    species_by_fingerprint = {}
+                    for spec in species:
+                        if spec.molecule:
+                            species_by_fingerprint.setdefault(spec.molecule[0].fingerprint, []).append(spec)
+                colliders = _collider_identifiers(rxn, species_by_fingerprint)
+            start = _chemkin_reaction_count
+            string, count = cache.get(('kinetics', verbose, colliders), rxn, _reaction_signature(rxn, verbose),
+                                      lambda: _write_counted_kinetics_entry(rxn, species, verbose))
+            _chemkin_reaction_count = start + count
+            f.write(string)
+        # Don't forget to mark duplicates!
+        f.write('\n')
+
+
+def _write_thermo_entries(f, sorted_species, verbose, cache):
+    """
+    Write the Chemkin thermo entries of `sorted_species` to the file object
+    `f`, using the :class:`ChemkinEntryCache` `cache` if provided.
+    """
+    for spec in sorted_species:
+        if cache is None:
+            f.write(write_thermo_entry(spec, verbose=verbose))
+        else:
+            f.write(cache.get(('thermo', verbose), spec, _species_signature(spec),
+                              lambda: write_thermo_entry(spec, verbose=verbose)))
+        f.write('\n')
+
+
+def write_species_dictionary_entry(spec, old_style=False):
+    """
+    Return the adjacency list of the species `spec` as written to a species
+    dictionary, including the trailing blank line.
+
+    If `old_style==True` then it is returned in the old RMG-Java syntax.
+    """
+    if old_style:
+        try:
+            string = spec.molecule[0].to_adjacency_list(label=get_species_identifier(spec),
+                                                        remove_h=True, old_style=True)
+        except:
+            new_adjlist = spec.molecule[0].to_adjacency_list(label=get_species_identifier(spec), remove_h=False)
+            string = ("// Couldn't save {0} in old RMG-Java syntax, but here it is in "
+                      "newer RMG-Py syntax:".format(get_species_identifier(spec)))
+            string += "\n// " + "\n// ".join(new_adjlist.splitlines()) + '\n'
+    else:
+        try:
+            for mol in spec.molecule:
+                if mol.reactive:
+                    string = mol.to_adjacency_list(label=get_species_identifier(spec), remove_h=False)
+                    break
+            else:
+                raise ValueError('No reactive structures were found for species '
+                                 '{0}.'.format(get_species_identifier(spec)))
+        except:
+            raise ChemkinError('Ran into error saving dictionary for species {0}. '
+                               'Please check your files.'.format(get_species_identifier(spec)))
+    return string + '\n'
+
+
+def save_species_dictionary(path, species, old_style=False, cache=None):
     """
     Save the given list of `species` as adjacency lists in a text file `path` 
     on disk.
     
     If `old_style==True` then it saves it in the old RMG-Java syntax.
+
+    If a :class:`ChemkinEntryCache` is given as `cache`, the adjacency lists
+    of unchanged species are taken from the cache.
     """
     with open(path, 'w') as f:
         for spec in species:
-            if old_style:
-                try:
-                    f.write(spec.molecule[0].to_adjacency_list(label=get_species_identifier(spec),
-                                                               remove_h=True, old_style=True))
-                except:
-                    new_adjlist = spec.molecule[0].to_adjacency_list(label=get_species_identifier(spec), remove_h=False)
-                    f.write("// Couldn't save {0} in old RMG-Java syntax, but here it is in "
-                            "newer RMG-Py syntax:".format(get_species_identifier(spec)))
-                    f.write("\n// " + "\n// ".join(new_adjlist.splitlines()) + '\n')
+            if cache is None:
+                f.write(write_species_dictionary_entry(spec, old_style))
             else:
-                try:
-                    for mol in spec.molecule:
-                        if mol.reactive:
-                            f.write(mol.to_adjacency_list(label=get_species_identifier(spec), remove_h=False))
-                            break
-                    else:
-                        raise ValueError('No reactive structures were found for species '
-                                         '{0}.'.format(get_species_identifier(spec)))
-                except:
-                    raise ChemkinError('Ran into error saving dictionary for species {0}. '
-                                       'Please check your files.'.format(get_species_identifier(spec)))
-            f.write('\n')
+                f.write(cache.get(('dictionary', old_style), spec, _species_signature(spec),
+                                  lambda: write_species_dictionary_entry(spec, old_style)))
 
 
-def save_transport_file(path, species):
+def save_transport_file(path, species, cache=None):
     r"""
     Save a Chemkin transport properties file to `path` on disk containing the
     transport properties of the given list of `species`.
@@ -1980,6 +2275,8 @@ def save_transport_file(path, species):
     6. The rotational relaxation collision number :math:`Z_rot` at 298K.
     7. After the last number, a comment field can be enclosed in parenthesis.
 
+    If a :class:`ChemkinEntryCache` is given as `cache`, the entries of
+    unchanged species are taken from the cache.
     """
 
     with open(path, 'w') as f:
@@ -1988,35 +2285,45 @@ def save_transport_file(path, species):
         f.write("! {0:15} {1:8} {2:9} {3:9} {4:9} {5:9} {6:9} {7:9}\n".format(
             'Name', 'Index', 'epsilon/k_B', 'sigma', 'mu', 'alpha', 'Zrot', 'Source'))
         for spec in species:
-            transport_data = spec.get_transport_data()
-            if not transport_data:
-                missing_data = True
+            if cache is None:
+                f.write(write_transport_entry(spec))
             else:
-                missing_data = False
+                # Make sure the transport data exists before the signature is taken
+                spec.get_transport_data()
+                f.write(cache.get('transport', spec, _species_signature(spec), lambda: write_transport_entry(spec)))
 
-            label = get_species_identifier(spec)
 
-            if missing_data:
-                f.write('! {0:19s} {1!r}\n'.format(label, transport_data))
-            else:
-                f.write('{0:19} {1:d}   {2:9.3f} {3:9.3f} {4:9.3f} {5:9.3f} {6:9.3f}    ! {7:s}\n'.format(
-                    label,
-                    transport_data.shapeIndex,
-                    transport_data.epsilon.value_si / constants.R,
-                    transport_data.sigma.value_si * 1e10,
-                    (transport_data.dipoleMoment.value_si * constants.c * 1e21 if transport_data.dipoleMoment else 0),
-                    (transport_data.polarizability.value_si * 1e30 if transport_data.polarizability else 0),
-                    (transport_data.rotrelaxcollnum if transport_data.rotrelaxcollnum else 0),
-                    transport_data.comment,
-                ))
+def write_transport_entry(spec):
+    """
+    Return the line of a Chemkin transport properties file describing the
+    transport properties of the species `spec`.
+    """
+    transport_data = spec.get_transport_data()
+    label = get_species_identifier(spec)
 
+    if not transport_data:
+        return '! {0:19s} {1!r}\n'.format(label, transport_data)
+    else:
+        return '{0:19} {1:d}   {2:9.3f} {3:9.3f} {4:9.3f} {5:9.3f} {6:9.3f}    ! {7:s}\n'.format(
+            label,
+            transport_data.shapeIndex,
+            transport_data.epsilon.value_si / constants.R,
+            transport_data.sigma.value_si * 1e10,
+            (transport_data.dipoleMoment.value_si * constants.c * 1e21 if transport_data.dipoleMoment else 0),
+            (transport_data.polarizability.value_si * 1e30 if transport_data.polarizability else 0),
+            (transport_data.rotrelaxcollnum if transport_data.rotrelaxcollnum else 0),
+            transport_data.comment,
+        )
 
-def save_chemkin_file(path, species, reactions, verbose=True, check_for_duplicates=True):
+
+def save_chemkin_file(path, species, reactions, verbose=True, check_for_duplicates=True, cache=None):
     """
     Save a Chemkin input file to `path` on disk containing the provided lists
     of `species` and `reactions`.
     If check_for_duplicates is False then we don't check for unlabeled duplicate reactions,
     thus saving time (eg. if you are sure you've already labeled them as duplicate).
+    If a :class:`ChemkinEntryCache` is given as `cache`, the thermo and kinetics entries
+    of unchanged species and reactions are taken from the cache.
     """
     # Check for duplicate
     if check_for_duplicates:
@@ -2042,9 +2349,7 @@ def save_chemkin_file(path, species, reactions, verbose=True, check_for_duplicat
     # Thermodynamics section
     f.write('THERM ALL\n')
     f.write('   300.000  1000.000  5000.000\n\n')
-    for spec in sorted_species:
-        f.write(write_thermo_entry(spec, verbose=verbose))
-        f.write('\n')
+    _write_thermo_entries(f, sorted_species, verbose, cache)
     f.write('END\n\n\n\n')
 
     ## Transport section would go here
@@ -2058,10 +2363,7 @@ def save_chemkin_file(path, species, reactions, verbose=True, check_for_duplicat
     f.write('REACTIONS    KCAL/MOLE   MOLES\n\n')
     global _chemkin_reaction_count
     _chemkin_reaction_count = 0
-    for rxn in reactions:
-        f.write(write_kinetics_entry(rxn, species_list=species, verbose=verbose))
-        # Don't forget to mark duplicates!
-        f.write('\n')
+    _write_reaction_entries(f, reactions, species, verbose, cache)
     f.write('END\n\n')
     f.close()
     logging.info("Chemkin file contains {0} reactions.".format(_chemkin_reaction_count))
@@ -2069,12 +2371,14 @@ def save_chemkin_file(path, species, reactions, verbose=True, check_for_duplicat
 
 
 def save_chemkin_surface_file(path, species, reactions, verbose=True, check_for_duplicates=True,
-                              surface_site_density=None):
+                              surface_site_density=None, cache=None):
     """
     Save a Chemkin *surface* input file to `path` on disk containing the provided lists
     of `species` and `reactions`.
     If check_for_duplicates is False then we don't check for unlabeled duplicate reactions,
     thus saving time (eg. if you are sure you've already labeled them as duplicate).
+    If a :class:`ChemkinEntryCache` is given as `cache`, the thermo and kinetics entries
+    of unchanged species and reactions are taken from the cache.
     """
     # Check for duplicate
     if check_for_duplicates:
@@ -2107,18 +2411,14 @@ def save_chemkin_surface_file(path, species, reactions, verbose=True, check_for_
     # Thermodynamics section
     f.write('THERM ALL\n')
     f.write('    300.000  1000.000  5000.000\n\n')
-    for spec in sorted_species:
-        f.write(write_thermo_entry(spec, verbose=verbose))
-        f.write('\n')
+    _write_thermo_entries(f, sorted_species, verbose, cache)
     f.write('END\n\n\n\n')
 
     # Reactions section
     f.write('REACTIONS    KCAL/MOLE   MOLES\n\n')
     global _chemkin_reaction_count
     _chemkin_reaction_count = 0
-    for rxn in reactions:
-        f.write(write_kinetics_entry(rxn, species_list=species, verbose=verbose))
-        f.write('\n')
+    _write_reaction_entries(f, reactions, species, verbose, cache)
     f.write('END\n\n')
     f.close()
     logging.info("Chemkin file contains {0} reactions.".format(_chemkin_reaction_count))
@@ -2168,12 +2468,14 @@ def save_java_kinetics_library(path, species, reactions):
 
 
 def save_chemkin(reaction_model, path, verbose_path, dictionary_path=None, transport_path=None, 
-                 save_edge_species=False):
+                 save_edge_species=False, cache=None):
     """
     Save a Chemkin file for the current model as well as any desired output
     species and reactions to `path`. If `save_edge_species` is True, then 
     a chemkin file and dictionary file for the core AND edge species and reactions
     will be saved.  It also saves verbose versions of each file.
+    If a :class:`ChemkinEntryCache` is given as `cache`, the entries of unchanged
+    species and reactions are taken from the cache.
     """
     if save_edge_species:
         species_list = reaction_model.core.species + reaction_model.edge.species
@@ -2208,28 +2510,37 @@ def save_chemkin(reaction_model, path, verbose_path, dictionary_path=None, trans
                 gas_rxn_list.append(r)
 
         # We should already have marked everything as duplicates by now so use check_for_duplicates=False
-        save_chemkin_file(gas_path, gas_species_list, gas_rxn_list, verbose=False, check_for_duplicates=False)
+        save_chemkin_file(gas_path, gas_species_list, gas_rxn_list, verbose=False, check_for_duplicates=False,
+                          cache=cache)
         save_chemkin_surface_file(surface_path, surface_species_list, surface_rxn_list, verbose=False,
-                                  check_for_duplicates=False, surface_site_density=reaction_model.surface_site_density)
+                                  check_for_duplicates=False, surface_site_density=reaction_model.surface_site_density,
+                                  cache=cache)
         logging.info('Saving annotated version of Chemkin files...')
-        save_chemkin_file(gas_verbose_path, gas_species_list, gas_rxn_list, verbose=True, check_for_duplicates=False)
+        save_chemkin_file(gas_verbose_path, gas_species_list, gas_rxn_list, verbose=True, check_for_duplicates=False,
+                          cache=cache)
         save_chemkin_surface_file(surface_verbose_path, surface_species_list, surface_rxn_list, verbose=True,
-                                  check_for_duplicates=False, surface_site_density=reaction_model.surface_site_density)
+                                  check_for_duplicates=False, surface_site_density=reaction_model.surface_site_density,
+                                  cache=cache)
 
     else:
         # Gas phase only
-        save_chemkin_file(path, species_list, rxn_list, verbose=False, check_for_duplicates=False)
+        save_chemkin_file(path, species_list, rxn_list, verbose=False, check_for_duplicates=False, cache=cache)
         logging.info('Saving annotated version of Chemkin file...')
-        save_chemkin_file(verbose_path, species_list, rxn_list, verbose=True, check_for_duplicates=False)
+        save_chemkin_file(verbose_path, species_list, rxn_list, verbose=True, check_for_duplicates=False, cache=cache)
     if dictionary_path:
-        save_species_dictionary(dictionary_path, species_list)
+        save_species_dictionary(dictionary_path, species_list, cache=cache)
     if transport_path:
-        save_transport_file(transport_path, species_list)
+        save_transport_file(transport_path, species_list, cache=cache)
 
 
-def save_chemkin_files(rmg):
+def save_chemkin_files(rmg, cache=None, save_snapshots=True):
     """
     Save the current reaction model to a set of Chemkin files.
+
+    If a :class:`ChemkinEntryCache` is given as `cache`, only the entries of
+    species and reactions which changed since the previous call are regenerated.
+    If `save_snapshots` is ``False``, the model is written directly to ``chem.inp``
+    and ``chem_edge.inp`` instead of also keeping a copy for each core size.
     """
 
     # todo: make this an attribute or method of reactionModel
@@ -2243,12 +2554,37 @@ def save_chemkin_files(rmg):
     latest_dictionary_path = os.path.join(rmg.output_directory, 'chemkin', 'species_dictionary.txt')
     latest_transport_path = os.path.join(rmg.output_directory, 'chemkin', 'tran.dat')
     save_chemkin(rmg.reaction_model,
-                 this_chemkin_path,
+                 this_chemkin_path if save_snapshots else latest_chemkin_path,
                  latest_chemkin_verbose_path,
                  latest_dictionary_path,
                  latest_transport_path,
-                 save_edge_species=False)
+                 save_edge_species=False,
+                 cache=cache)
+
+    if save_snapshots:
+        _copy_chemkin_snapshot(this_chemkin_path, latest_chemkin_path, is_surface_model)
+
+    if rmg.save_edge_species:
+        logging.info('Saving current model core and edge to Chemkin file...')
+        this_chemkin_path = os.path.join(rmg.output_directory, 'chemkin',
+                                         'chem_edge{0:04d}.inp'.format(len(rmg.reaction_model.core.species)))
+        latest_chemkin_path = os.path.join(rmg.output_directory, 'chemkin', 'chem_edge.inp')
+        latest_chemkin_verbose_path = os.path.join(rmg.output_directory, 'chemkin', 'chem_edge_annotated.inp')
+        latest_dictionary_path = os.path.join(rmg.output_directory, 'chemkin', 'species_edge_dictionary.txt')
+        latest_transport_path = None
+        save_chemkin(rmg.reaction_model, this_chemkin_path if save_snapshots else latest_chemkin_path,
+                     latest_chemkin_verbose_path, latest_dictionary_path, latest_transport_path,
+                     rmg.save_edge_species, cache=cache)
+
+        if save_snapshots:
+            _copy_chemkin_snapshot(this_chemkin_path, latest_chemkin_path, is_surface_model)
 
+
+def _copy_chemkin_snapshot(this_chemkin_path, latest_chemkin_path, is_surface_model):
+    """
+    Copy the Chemkin file for the current core size at `this_chemkin_path`
+    to `latest_chemkin_path`, or the gas and surface files for surface models.
+    """
     if is_surface_model:
         paths = []
         for phase in ['surface', 'gas']:
@@ -2265,33 +2601,6 @@ def save_chemkin_files(rmg):
             os.unlink(latest_chemkin_path)
         shutil.copy2(this_chemkin_path, latest_chemkin_path)
 
-    if rmg.save_edge_species:
-        logging.info('Saving current model core and edge to Chemkin file...')
-        this_chemkin_path = os.path.join(rmg.output_directory, 'chemkin',
-                                         'chem_edge{0:04d}.inp'.format(len(rmg.reaction_model.core.species)))
-        latest_chemkin_path = os.path.join(rmg.output_directory, 'chemkin', 'chem_edge.inp')
-        latest_chemkin_verbose_path = os.path.join(rmg.output_directory, 'chemkin', 'chem_edge_annotated.inp')
-        latest_dictionary_path = os.path.join(rmg.output_directory, 'chemkin', 'species_edge_dictionary.txt')
-        latest_transport_path = None
-        save_chemkin(rmg.reaction_model, this_chemkin_path, latest_chemkin_verbose_path, latest_dictionary_path,
-                     latest_transport_path, rmg.save_edge_species)
-
-        if is_surface_model:
-            paths = []
-            for phase in ['surface', 'gas']:
-                root, ext = os.path.splitext(this_chemkin_path)
-                path1 = root + '-' + phase + ext
-                root, ext = os.path.splitext(latest_chemkin_path)
-                path2 = root + '-' + phase + ext
-                paths.append((path1, path2))
-        else:
-            paths = [(this_chemkin_path, latest_chemkin_path)]
-
-        for this_chemkin_path, latest_chemkin_path in paths:
-            if os.path.exists(latest_chemkin_path):
-                os.unlink(latest_chemkin_path)
-            shutil.copy2(this_chemkin_path, latest_chemkin_path)
-
 
 def write_elements_section(f):
     """
@@ -2338,11 +2647,19 @@ class ChemkinWriter(object):
     from its subject:
 
     rmg.detach(listener)
+
+    The formatted entries of each species and reaction are cached between
+    updates, so that only entries of new or modified objects are regenerated.
+    If `save_snapshots` is ``False``, the Chemkin files for each core size
+    (``chem####.inp``) are not kept.
     
     """
-    def __init__(self, output_directory=''):
+    def __init__(self, output_directory='', save_snapshots=True):
         super(ChemkinWriter, self).__init__()
         make_output_subdirectory(output_directory, 'chemkin')
+        self.save_snapshots = save_snapshots
+        self.cache = ChemkinEntryCache()
 
     def update(self, rmg):
-        save_chemkin_files(rmg)
+        save_chemkin_files(rmg, cache=self.cache, save_snapshots=self.save_snapshots)
+        self.cache.prune()
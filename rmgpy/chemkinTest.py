@@ -32,16 +32,18 @@ import mock
 import os
 
 import rmgpy
-from rmgpy.chemkin import get_species_identifier, load_chemkin_file, load_transport_file, mark_duplicate_reactions, \
-    read_kinetics_entry, read_reaction_comments, read_thermo_entry, save_chemkin_file, save_species_dictionary, save_transport_file
-from rmgpy.chemkin import _remove_line_breaks, _process_duplicate_reactions
+from rmgpy.chemkin import get_species_identifier, load_chemkin_file, load_transport_file, mark_duplicate_reaction, \
+    mark_duplicate_reactions, load_species_dictionary, read_kinetics_entry, read_reaction_comments, read_thermo_entry, save_chemkin_file, \
+    save_species_dictionary, save_transport_file
+from rmgpy.chemkin import _remove_line_breaks, _process_duplicate_reactions, ChemkinEntryCache
 from rmgpy.data.kinetics import LibraryReaction
 from rmgpy.exceptions import ChemkinError
 from rmgpy.kinetics.arrhenius import Arrhenius, MultiArrhenius
 from rmgpy.kinetics.chebyshev import Chebyshev
+from rmgpy.kinetics.falloff import ThirdBody
 from rmgpy.reaction import Reaction
 from rmgpy.species import Species
-from rmgpy.thermo import NASA
+from rmgpy.thermo import NASA, NASAPolynomial
 from rmgpy.transport import TransportData
 
 
@@ -212,6 +214,143 @@ class ChemkinTest(unittest.TestCase):
         os.remove(chemkin_save_path)
         os.remove(dictionary_save_path)
 
+    def test_load_species_dictionary_in_parallel(self):
+        """
+        Test that loading a species dictionary with several processes gives the same species.
+        """
+        folder = os.path.join(os.path.dirname(rmgpy.__file__), 'test_data/chemkin/chemkin_py')
+        dictionary_path = os.path.join(folder, 'pdd', 'species_dictionary.txt')
+
+        species_dict = load_species_dictionary(dictionary_path)
+        parallel_species_dict = load_species_dictionary(dictionary_path, procnum=2)
+
+        self.assertEqual(sorted(species_dict.keys()), sorted(parallel_species_dict.keys()))
+        for label, species in species_dict.items():
+            self.assertTrue(species.is_isomorphic(parallel_species_dict[label]))
+            self.assertEqual(species.reactive, parallel_species_dict[label].reactive)
+
+    def test_load_chemkin_file_skips_undeclared_species(self):
+        """
+        Test that species dictionary entries and transport data of species that are
+        not declared in the Chemkin file are skipped when loading it.
+        """
+        folder = os.path.join(os.path.dirname(rmgpy.__file__), 'test_data/chemkin/chemkin_py')
+        chemkin_path = os.path.join(folder, 'minimal', 'chem.inp')
+        dictionary_path = os.path.join(folder, 'minimal', 'species_dictionary.txt')
+        temp_dictionary_path = os.path.join(folder, 'minimal', 'species_dictionary_temp.txt')
+        temp_transport_path = os.path.join(folder, 'minimal', 'tran_temp.dat')
+
+        species_dict = load_species_dictionary(dictionary_path, labels=['Ar', 'ethane(1)'])
+        self.assertEqual(sorted(species_dict.keys()), ['Ar', 'ethane(1)'])
+
+        propane = Species(label='propane(99)', transport_data=TransportData(
+            shapeIndex=2, epsilon=(2079.06, 'J/mol'), sigma=(5.07, 'angstrom'), dipoleMoment=(0, 'De'),
+            polarizability=(0, 'angstrom^3'), rotrelaxcollnum=1.0)).from_smiles('CCC')
+        try:
+            with open(dictionary_path, 'r') as f, open(temp_dictionary_path, 'w') as f_temp:
+                f_temp.write(f.read() + '\n' + propane.to_adjacency_list() + '\n')
+            save_transport_file(temp_transport_path, [propane])
+
+            species, reactions = load_chemkin_file(chemkin_path, temp_dictionary_path,
+                                                   transport_path=temp_transport_path)
+            self.assertNotIn('propane', [spc.label for spc in species])
+            self.assertEqual(len(species), 8)
+            self.assertTrue(all(spc.molecule for spc in species))
+        finally:
+            for path in [temp_dictionary_path, temp_transport_path]:
+                if os.path.exists(path):
+                    os.remove(path)
+
+    def test_save_chemkin_file_with_cache(self):
+        """
+        Test that saving a Chemkin file using a ChemkinEntryCache gives identical output,
+        and that cached entries are regenerated when a species or reaction changes.
+        """
+        folder = os.path.join(os.path.dirname(rmgpy.__file__), 'test_data/chemkin/chemkin_py')
+        chemkin_path = os.path.join(folder, 'minimal', 'chem.inp')
+        dictionary_path = os.path.join(folder, 'minimal', 'species_dictionary.txt')
+        species, reactions = load_chemkin_file(chemkin_path, dictionary_path)
+
+        uncached_path = os.path.join(folder, 'minimal', 'chem_uncached.inp')
+        cached_path = os.path.join(folder, 'minimal', 'chem_cached.inp')
+        cached_dictionary_path = os.path.join(folder, 'minimal', 'species_dictionary_cached.txt')
+
+        def read(path):
+            with open(path, 'r') as f:
+                return f.read()
+
+        cache = ChemkinEntryCache()
+        try:
+            for _ in range(2):
+                save_chemkin_file(uncached_path, species, reactions, verbose=True, check_for_duplicates=False)
+                save_chemkin_file(cached_path, species, reactions, verbose=True, check_for_duplicates=False,
+                                  cache=cache)
+                save_species_dictionary(cached_dictionary_path, species, cache=cache)
+                self.assertEqual(read(uncached_path), read(cached_path))
+            self.assertEqual(cache.misses, len(species) * 2 + len(reactions))
+            self.assertEqual(cache.hits, cache.misses)
+
+            # Modifying a species or reaction invalidates its cached entry
+            species[0].label = 'renamed'
+            reactions[0].kinetics.comment = 'changed comment'
+            save_chemkin_file(uncached_path, species, reactions, verbose=True, check_for_duplicates=False)
+            save_chemkin_file(cached_path, species, reactions, verbose=True, check_for_duplicates=False,
+                              cache=cache)
+            self.assertEqual(read(uncached_path), read(cached_path))
+            self.assertIn(get_species_identifier(species[0]), read(cached_path))
+            self.assertIn('changed comment', read(cached_path))
+        finally:
+            for path in [uncached_path, cached_path, cached_dictionary_path]:
+                if os.path.exists(path):
+                    os.remove(path)
+
+    def test_save_core_and_edge_with_cache(self):
+        """
+        Test that cached third body reactions only list the efficiencies of the colliders
+        in the species list of each Chemkin file, e.g. the core and the edge files.
+        """
+        thermo = NASA(polynomials=[NASAPolynomial(coeffs=[2.5, 0, 0, 0, 0, -745.375, 4.37967], Tmin=(200, 'K'),
+                                                  Tmax=(1000, 'K')),
+                                   NASAPolynomial(coeffs=[2.5, 0, 0, 0, 0, -745.375, 4.37967], Tmin=(1000, 'K'),
+                                                  Tmax=(6000, 'K'))],
+                      Tmin=(200, 'K'), Tmax=(6000, 'K'))
+        h, ch3, ch4, ar = [Species(label=label, index=i + 1, thermo=thermo).from_smiles(smiles)
+                           for i, (label, smiles) in enumerate([('H', '[H]'), ('CH3', '[CH3]'), ('CH4', 'C'),
+                                                                ('Ar', '[Ar]')])]
+        reaction = Reaction(index=1, reactants=[h, ch3], products=[ch4],
+                            kinetics=ThirdBody(arrheniusLow=Arrhenius(A=(2.62e+33, 'cm^6/(mol^2*s)'), n=-4.76,
+                                                                      Ea=(10.21, 'kJ/mol'), T0=(1, 'K')),
+                                               efficiencies={'C': 3, '[Ar]': 0.7}))
+        core_species = [h, ch3, ch4]
+        edge_species = [h, ch3, ch4, ar]
+
+        folder = os.path.join(os.path.dirname(rmgpy.__file__), 'test_data/chemkin/chemkin_py')
+        uncached_path = os.path.join(folder, 'chem_uncached.inp')
+        cached_path = os.path.join(folder, 'chem_cached.inp')
+
+        def read(path):
+            with open(path, 'r') as f:
+                return f.read()
+
+        cache = ChemkinEntryCache()
+        try:
+            for _ in range(2):
+                for species in [core_species, edge_species]:
+                    for verbose in [False, True]:
+                        save_chemkin_file(uncached_path, species, [reaction], verbose=verbose,
+                                          check_for_duplicates=False)
+                        save_chemkin_file(cached_path, species, [reaction], verbose=verbose,
+                                          check_for_duplicates=False, cache=cache)
+                        self.assertEqual(read(uncached_path), read(cached_path))
+                        if species is edge_species:
+                            self.assertIn('{0}/0.70/'.format(get_species_identifier(ar)), read(cached_path))
+                        else:
+                            self.assertNotIn('/0.70/', read(cached_path))
+        finally:
+            for path in [uncached_path, cached_path]:
+                if os.path.exists(path):
+                    os.remove(path)
+
     def test_transport_data_read_and_write(self):
         """
         Test that we can write to chemkin and recreate the same transport object
@@ -427,6 +566,36 @@ class ChemkinTest(unittest.TestCase):
 
         self.assertEqual(duplicate_flags, expected_flags)
 
+    def test_mark_duplicate_reactions_matches_pairwise_comparison(self):
+        """Test that grouped duplicate marking gives the same result as comparing every pair of reactions."""
+        s1 = Species().from_smiles('CC')
+        s2 = Species().from_smiles('[CH3]')
+        s3 = Species().from_smiles('[OH]')
+        s4 = Species().from_smiles('C[CH2]')
+        s5 = Species().from_smiles('O')
+
+        def make_reaction_list():
+            return [
+                Reaction(reactants=[s1, s3], products=[s4, s5], duplicate=False, kinetics=Arrhenius()),
+                LibraryReaction(reactants=[s1, s3], products=[s4, s5], duplicate=False, kinetics=Arrhenius()),
+                Reaction(reactants=[s3, s1], products=[s4, s5], duplicate=False, kinetics=Arrhenius()),
+                Reaction(reactants=[s1], products=[s2, s2], duplicate=True, kinetics=Arrhenius()),
+                Reaction(reactants=[s4, s5], products=[s1, s3], duplicate=False, kinetics=Arrhenius()),
+                Reaction(reactants=[s2, s2], products=[s1], duplicate=False, kinetics=Arrhenius(), reversible=False),
+                Reaction(reactants=[s1], products=[s2, s2], duplicate=False, kinetics=Chebyshev()),
+                LibraryReaction(reactants=[s1, s3], products=[s4, s5], duplicate=False, kinetics=Arrhenius()),
+                Reaction(reactants=[s1], products=[s2, s2], duplicate=True, kinetics=Arrhenius()),
+            ]
+
+        reaction_list = make_reaction_list()
+        mark_duplicate_reactions(reaction_list)
+
+        expected_list = make_reaction_list()
+        for index, reaction in enumerate(expected_list):
+            mark_duplicate_reaction(reaction, expected_list[index + 1:])
+
+        self.assertEqual([rxn.duplicate for rxn in reaction_list], [rxn.duplicate for rxn in expected_list])
+
 
 class TestReadReactionComments(unittest.TestCase):
     @classmethod
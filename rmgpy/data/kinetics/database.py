@@ -88,6 +88,7 @@ class KineticsDatabase(object):
         A helper function used when pickling a KineticsDatabase object.
         """
         d = {
+            'recommended_families': self.recommended_families,
             'families': self.families,
             'libraries': self.libraries,
             'library_order': self.library_order,
@@ -98,6 +99,7 @@ class KineticsDatabase(object):
         """
         A helper function used when unpickling a KineticsDatabase object.
         """
+        self.recommended_families = d.get('recommended_families', {})
         self.families = d['families']
         self.libraries = d['libraries']
         self.library_order = d['library_order']
@@ -446,12 +448,13 @@ and immediately used in input files without any additional changes.
         """
         Find all reactions from the specified kinetics library involving the
         provided `reactants`, which can be either :class:`Molecule` objects or
-        :class:`Species` objects.
+        :class:`Species` objects. Only the library entries indexed under the
+        fingerprints of the reactants are checked for isomorphism.
         """
         ensure_species(reactants)
 
         reaction_list = []
-        for entry in library.entries.values():
+        for entry in library.get_entries_with_species(reactants):
             if entry.item.matches_species(reactants, products=products):
                 reaction = LibraryReaction(
                     reactants=entry.item.reactants[:],
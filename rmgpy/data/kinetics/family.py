@@ -450,6 +450,9 @@ class KineticsFamily(Database):
         self.rules = None
         self.depositories = []
 
+        # Reactions matched by each candidate extension during tree generation
+        self.extension_match_cache = {}
+
     def __repr__(self):
         return '<ReactionFamily "{0}">'.format(self.label)
 
@@ -2838,11 +2841,7 @@ class KineticsFamily(Database):
         new_inds = []
 
         for i, rxn in enumerate(rxns):
-            rmol = rxn.reactants[0].molecule[0]
-            for r in rxn.reactants[1:]:
-                rmol = rmol.merge(r.molecule[0])
-
-            rmol.identify_ring_membership()
+            rmol = _merge_reactants(rxn)
 
             if rmol.is_subgraph_isomorphic(newgrp, generate_initial_map=True, save_order=True):
                 new.append(rxn)
@@ -2870,7 +2869,59 @@ class KineticsFamily(Database):
                 ob, boo = get_objective_function(new, old, T=T)
             return ob, True
 
-    def get_extension_edge(self, parent, template_rxn_map, obj, T):
+    def eval_exts(self, parent, grps, template_rxn_map, obj=None, T=1000.0, pool=None, nprocs=1):
+        """
+        evaluates the objective function obj for each of the extension groups
+        grps to the parent entry parent, returning a list of (value, boolean)
+        tuples as for eval_ext
+
+        which reactions under parent each extension matches is memoized in
+        extension_match_cache, so that the extensions are not matched again
+        when the same node is extended in later iterations; the reactions not
+        yet matched are divided between the nprocs worker processes of pool
+        if given
+        """
+        rxns = template_rxn_map[parent.label]
+        cache = self.extension_match_cache.setdefault(parent.label, {})
+
+        keys = [grp.to_adjacency_list() for grp in grps]
+        todo = OrderedDict()  # extensions with reactions that have not been matched yet
+        for key, grp in zip(keys, grps):
+            matches = cache.setdefault(key, {})
+            if key not in todo and any(rxn not in matches for rxn in rxns):
+                todo[key] = grp
+        if todo:
+            unmatched = [rxn for rxn in rxns if any(rxn not in cache[key] for key in todo)]
+            todo_keys = list(todo.keys())
+            todo_grps = list(todo.values())
+            if pool is not None and nprocs > 1 and len(todo_grps) > 1:
+                nchunks = min(len(todo_grps), nprocs)
+                chunks = [todo_grps[i::nchunks] for i in range(nchunks)]
+                results = pool.map(_match_extensions, [(unmatched, chunk) for chunk in chunks])
+                matched = [None] * len(todo_grps)
+                for i, result in enumerate(results):
+                    matched[i::nchunks] = result
+            else:
+                matched = _match_extensions((unmatched, todo_grps))
+            for key, ext_matched in zip(todo_keys, matched):
+                cache[key].update(zip(unmatched, ext_matched))
+
+        out = []
+        for key in keys:
+            matches = cache[key]
+            new = [rxn for rxn in rxns if matches[rxn]]
+            old = [rxn for rxn in rxns if not matches[rxn]]
+            if len(new) == 0:
+                out.append((np.inf, False))
+            elif len(old) == 0:
+                out.append((np.inf, True))
+            elif obj:
+                out.append((get_objective_function(new, old, obj, T=T)[0], True))
+            else:
+                out.append((get_objective_function(new, old, T=T)[0], True))
+        return out
+
+    def get_extension_edge(self, parent, template_rxn_map, obj, T, pool=None, nprocs=1):
         """
         finds the set of all extension groups to parent such that
         1) the extension group divides the set of reactions under parent
@@ -2885,6 +2936,9 @@ class KineticsFamily(Database):
         split at least one of ext1 and ext2 must result in a split
         
         Speed of this algorithm relies heavily on searching non bond creation dimensions once.
+
+        The extensions of each group are evaluated together using eval_exts, in parallel between the nprocs
+        worker processes of pool if given.
         """
         out_exts = [[]]
         grps = [parent.item]
@@ -2900,13 +2954,15 @@ class KineticsFamily(Database):
 
             reg_dict = dict()
             ext_inds = []
+            evals = self.eval_exts(parent, [ext[0] for ext in exts], template_rxn_map, obj, T, pool=pool,
+                                   nprocs=nprocs)
             for i, (grp2, grpc, name, typ, indc) in enumerate(exts):
 
                 if typ != 'intNewBondExt' and typ != 'extNewBondExt' and (typ, indc) not in reg_dict.keys():
                     # first list is all extensions that match at least one reaction
                     # second is extensions that match all reactions
                     reg_dict[(typ, indc)] = ([], [])
-                val, boo = self.eval_ext(parent, grp2, name, template_rxn_map, obj, T)
+                val, boo = evals[i]
 
                 if val != np.inf:
                     out_exts[-1].append(exts[i])  # this extension splits reactions (optimization dim)
@@ -3028,13 +3084,13 @@ class KineticsFamily(Database):
 
         return out
 
-    def extend_node(self, parent, template_rxn_map, obj=None, T=1000.0, ):
+    def extend_node(self, parent, template_rxn_map, obj=None, T=1000.0, pool=None, nprocs=1):
         """
         Constructs an extension to the group parent based on evaluation 
         of the objective function obj
         """
 
-        exts = self.get_extension_edge(parent, template_rxn_map, obj=obj, T=T)
+        exts = self.get_extension_edge(parent, template_rxn_map, obj=obj, T=T, pool=pool, nprocs=nprocs)
 
         if exts == []:  # should only occur when all reactions at this node are identical
             rs = template_rxn_map[parent.label]
@@ -3083,10 +3139,8 @@ class KineticsFamily(Database):
                         return True
             return False
 
-        vals = []
-        for grp, grpc, name, typ, einds in exts:
-            val, boo = self.eval_ext(parent, grp, name, template_rxn_map, obj, T)
-            vals.append(val)
+        # the reactions matched by each extension are cached by get_extension_edge
+        vals = [val for val, boo in self.eval_exts(parent, [ext[0] for ext in exts], template_rxn_map, obj, T)]
 
         min_val = min(vals)
 
@@ -3135,6 +3189,8 @@ class KineticsFamily(Database):
         if complement:
             template_rxn_map[parent.label] = []
             template_rxn_map[cextname] = comp_entries
+            # parent has no reactions left, so its matches will not be needed again
+            self.extension_match_cache.pop(parent.label, None)
         else:
             template_rxn_map[parent.label] = comp_entries
 
@@ -3142,7 +3198,7 @@ class KineticsFamily(Database):
 
     def generate_tree(self, rxns=None, obj=None, thermo_database=None, T=1000.0, nprocs=1, min_splitable_entry_num=2,
                       min_rxns_to_spawn=20, max_batch_size=800, outlier_fraction=0.02, stratum_num=8,
-                      max_rxns_to_reopt_node=100):
+                      max_rxns_to_reopt_node=100, extension_nprocs=1):
         """
         Generate a tree by greedy optimization based on the objective function obj
         the optimization is done by iterating through every group and if the group has
@@ -3170,16 +3226,21 @@ class KineticsFamily(Database):
                 in the first batch
             stratum_num: Number of strata used in stratified sampling scheme
             max_rxns_to_reopt_node: Nodes with more matching reactions than this will not be pruned
+            extension_nprocs: Number of worker processes used to evaluate the candidate extensions of the nodes
+                generated by this process
         """
         if rxns is None:
             rxns = self.get_training_set(thermo_database=thermo_database, remove_degeneracy=True, estimate_thermo=True,
                                          fix_labels=True, get_reverse=True)
 
+        pool = mp.Pool(extension_nprocs) if extension_nprocs > 1 else None
+
         if len(rxns) <= max_batch_size:
             template_rxn_map = self.get_reaction_matches(rxns=rxns, thermo_database=thermo_database, remove_degeneracy=True,
                                                          fix_labels=True, exact_matches_only=True, get_reverse=True)
             self.make_tree_nodes(template_rxn_map=template_rxn_map, obj=obj, T=T, nprocs=nprocs - 1, depth=0,
-                                 min_splitable_entry_num=min_splitable_entry_num, min_rxns_to_spawn=min_rxns_to_spawn)
+                                 min_splitable_entry_num=min_splitable_entry_num, min_rxns_to_spawn=min_rxns_to_spawn,
+                                 pool=pool, extension_nprocs=extension_nprocs)
         else:
             random.seed(1)
             logging.error("dividing into batches")
@@ -3198,7 +3259,12 @@ class KineticsFamily(Database):
                                                              exact_matches_only=True, get_reverse=True)
                 logging.error("building tree with {} rxns".format(len(rxns)))
                 self.make_tree_nodes(template_rxn_map=template_rxn_map, obj=obj, T=T, nprocs=nprocs - 1, depth=0,
-                                     min_splitable_entry_num=min_splitable_entry_num, min_rxns_to_spawn=min_rxns_to_spawn)
+                                     min_splitable_entry_num=min_splitable_entry_num, min_rxns_to_spawn=min_rxns_to_spawn,
+                                     pool=pool, extension_nprocs=extension_nprocs)
+
+        if pool is not None:
+            pool.close()
+            pool.join()
 
     def get_rxn_batches(self, rxns, T=1000.0, max_batch_size=800, outlier_fraction=0.02, stratum_num=8):
         """
@@ -3272,7 +3338,7 @@ class KineticsFamily(Database):
                 parent.item.clear_reg_dims()
 
     def make_tree_nodes(self, template_rxn_map=None, obj=None, T=1000.0, nprocs=0, depth=0, min_splitable_entry_num=2,
-                        min_rxns_to_spawn=20):
+                        min_rxns_to_spawn=20, pool=None, extension_nprocs=1):
 
         if depth > 0:
             root = self.groups.entries[list(template_rxn_map.keys())[0]]
@@ -3345,7 +3411,7 @@ class KineticsFamily(Database):
 
                         splitable_entry_num -= 1
                         continue
-                    boo2 = self.extend_node(entry, template_rxn_map, obj, T)
+                    boo2 = self.extend_node(entry, template_rxn_map, obj, T, pool=pool, nprocs=extension_nprocs)
                     if boo2:  # extended node so restart while loop
                         break
                     else:  # no extensions could be generated since all reactions were identical
@@ -3378,6 +3444,8 @@ class KineticsFamily(Database):
                 entry.parent = self.groups.entries[pname]
                 entry.parent.children.append(entry)
 
+        self.extension_match_cache = {}
+
         return
 
     def _absorb_process(self, p, conn, name):
@@ -3436,11 +3504,13 @@ class KineticsFamily(Database):
 
                 index += 1
 
-    def cross_validate(self, folds=5, template_rxn_map=None, test_rxn_inds=None, T=1000.0, iters=0, random_state=1):
+    def cross_validate(self, folds=5, template_rxn_map=None, test_rxn_inds=None, T=1000.0, iters=0, random_state=1,
+                       nprocs=1):
         """
         Perform K-fold cross validation on an automatically generated tree at temperature T
         after finding an appropriate node for kinetics estimation it will move up the tree
         iters times.  
+        Each node is fit only once per fold and the fits are divided between nprocs processes
         Returns a dictionary mapping {rxn:Ln(k_Est/k_Train)}
         """
 
@@ -3460,8 +3530,10 @@ class KineticsFamily(Database):
 
         errors = {}
         uncertainties = {}
+        fits = []  # test reactions and the (fold, node) whose kinetics estimate them
+        fit_inputs = OrderedDict()  # training reactions for each (fold, node)
 
-        for train_index, test_index in kfsplits:
+        for fold, (train_index, test_index) in enumerate(kfsplits):
 
             if test_rxn_inds is None:
                 rxns_test = rxns[test_index]
@@ -3470,8 +3542,6 @@ class KineticsFamily(Database):
 
             for rxn in rxns_test:
 
-                krxn = rxn.kinetics.get_rate_coefficient(T)
-
                 entry = self.get_root_template()[0]
 
                 boo = True
@@ -3494,15 +3564,28 @@ class KineticsFamily(Database):
 
                 uncertainties[rxn] = self.rules.entries[entry.label][0].data.uncertainty
 
-                L = list(set(template_rxn_map[entry.label]) - set(rxns_test))
+                key = (fold, entry.label)
+                if key not in fit_inputs:
+                    L = list(set(template_rxn_map[entry.label]) - set(rxns_test))
+                    if L == []:
+                        raise ValueError('only one piece of kinetics information in the tree?')
+                    fit_inputs[key] = (L, self.forward_recipe.actions)
+                fits.append((rxn, key))
+
+        if nprocs > 1:
+            pool = mp.Pool(nprocs)
+            fitted = pool.map(_fit_bm_kinetics, list(fit_inputs.values()))
+            pool.close()
+            pool.join()
+        else:
+            fitted = [_fit_bm_kinetics(inp) for inp in fit_inputs.values()]
+        fitted = dict(zip(fit_inputs.keys(), fitted))
 
-                if L != []:
-                    kinetics = ArrheniusBM().fit_to_reactions(L, recipe=self.forward_recipe.actions)
-                    kinetics = kinetics.to_arrhenius(rxn.get_enthalpy_of_reaction(T))
-                    k = kinetics.get_rate_coefficient(T)
-                    errors[rxn] = np.log(k / krxn)
-                else:
-                    raise ValueError('only one piece of kinetics information in the tree?')
+        for rxn, key in fits:
+            krxn = rxn.kinetics.get_rate_coefficient(T)
+            kinetics = fitted[key].to_arrhenius(rxn.get_enthalpy_of_reaction(T))
+            k = kinetics.get_rate_coefficient(T)
+            errors[rxn] = np.log(k / krxn)
 
         return errors, uncertainties
 
@@ -4320,6 +4403,38 @@ def get_objective_function(kinetics1, kinetics2, obj=information_gain, T=1000.0)
     return obj(ks1, ks2), N1 == 0
 
 
+def _merge_reactants(rxn):
+    """
+    merges the reactants of rxn into a single molecule with ring membership
+    identified, for matching against the groups of the tree
+    """
+    rmol = rxn.reactants[0].molecule[0]
+    for r in rxn.reactants[1:]:
+        rmol = rmol.merge(r.molecule[0])
+    rmol.identify_ring_membership()
+    return rmol
+
+
+def _match_extensions(args):
+    """
+    determines which of the reactions rxns match each of the extension groups grps
+    returns a list with a list of booleans for each group
+    """
+    rxns, grps = args
+    rmols = [_merge_reactants(rxn) for rxn in rxns]
+
+    return [[rmol.is_subgraph_isomorphic(grp, generate_initial_map=True, save_order=True) for rmol in rmols]
+            for grp in grps]
+
+
+def _fit_bm_kinetics(args):
+    """
+    fits ArrheniusBM kinetics to the reactions rxns using the recipe
+    """
+    rxns, recipe = args
+    return ArrheniusBM().fit_to_reactions(rxns, recipe=recipe)
+
+
 def _make_rule(rr):
     """
     function for parallelization of rule and uncertainty calculation
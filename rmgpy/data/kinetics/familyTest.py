@@ -29,6 +29,7 @@
 
 import filecmp
 import logging
+import multiprocessing as mp
 import os.path
 import shutil
 import unittest
@@ -816,6 +817,50 @@ class TestTreeGeneration(unittest.TestCase):
         self.family.regularize(thermo_database=self.thermoDatabase, rxns=self.treerxns)
         self.family.check_tree()
 
+    def test_g_eval_exts(self):
+        """
+        test that evaluating extensions together gives the same results as evaluating them one at a time
+        """
+        template_rxn_map = self.family.get_reaction_matches(thermo_database=self.thermoDatabase, remove_degeneracy=True)
+        root = self.family.groups.entries['Root']
+        exts = root.item.get_extensions()
+        grps = [grp for grp, grpc, name, typ, indc in exts]
+
+        self.family.extension_match_cache = {}
+        vals = self.family.eval_exts(root, grps, template_rxn_map)
+        self.assertEqual(len(self.family.extension_match_cache['Root']), len(set(g.to_adjacency_list() for g in grps)))
+        for (grp, grpc, name, typ, indc), (val, boo) in zip(exts, vals):
+            self.assertEqual((val, boo), self.family.eval_ext(root, grp, name, template_rxn_map))
+
+        # cached matches are reused
+        self.assertEqual(self.family.eval_exts(root, grps, template_rxn_map), vals)
+        serial_cache = self.family.extension_match_cache['Root']
+
+        # the extensions are divided between the worker processes in the same order
+        self.family.extension_match_cache = {}
+        pool = mp.Pool(2)
+        try:
+            self.assertEqual(self.family.eval_exts(root, grps, template_rxn_map, pool=pool, nprocs=2), vals)
+        finally:
+            pool.close()
+            pool.join()
+        self.assertEqual(self.family.extension_match_cache['Root'], serial_cache)
+        self.family.extension_match_cache = {}
+
+    def test_h_cross_validate(self):
+        """
+        test that cross validation gives the same errors in parallel
+        """
+        template_rxn_map = self.family.get_reaction_matches(thermo_database=self.thermoDatabase, remove_degeneracy=True,
+                                                            get_reverse=True, fix_labels=True)
+        errors, uncertainties = self.family.cross_validate(folds=2, template_rxn_map=template_rxn_map)
+        errors_par, uncertainties_par = self.family.cross_validate(folds=2, template_rxn_map=template_rxn_map,
+                                                                   nprocs=2)
+        self.assertEqual(len(errors), len(template_rxn_map['Root']))
+        for rxn, error in errors.items():
+            self.assertAlmostEqual(error, errors_par[rxn], 6)
+        self.assertEqual(uncertainties, uncertainties_par)
+
 
 class TestGenerateReactions(unittest.TestCase):
 
@@ -219,6 +219,8 @@ class KineticsLibrary(Database):
     def __init__(self, label='', name='', solvent=None, short_desc='', long_desc='', auto_generated=False):
         Database.__init__(self, label=label, name=name, short_desc=short_desc, long_desc=long_desc)
         self.auto_generated = auto_generated
+        self._reactant_index = None
+        self._reactant_index_size = 0
 
     def __str__(self):
         return 'Kinetics Library {0}'.format(self.label)
@@ -271,6 +273,35 @@ class KineticsLibrary(Database):
 
         return rxns
 
+    def index_entries(self):
+        """
+        Build an index of the entries of this library by an order-independent
+        key of the fingerprints of the species on each side of the reaction.
+        Species that are isomorphic have the same fingerprint, so an entry can
+        only match a set of reactants if it is indexed under their key.
+        """
+        self._reactant_index = {}
+        for entry in self.entries.values():
+            keys = {_get_species_list_key(entry.item.reactants), _get_species_list_key(entry.item.products)}
+            for key in keys:
+                try:
+                    self._reactant_index[key].append(entry)
+                except KeyError:
+                    self._reactant_index[key] = [entry]
+        self._reactant_index_size = len(self.entries)
+
+    def get_entries_with_species(self, reactants):
+        """
+        Return the entries of this library that may have the given list of
+        :class:`Species` `reactants` on either side of the reaction, in the
+        order they appear in the library. The returned entries are candidates
+        for an isomorphism check using :meth:`Reaction.matches_species`.
+        The index is rebuilt if entries were added since it was last built.
+        """
+        if self._reactant_index is None or self._reactant_index_size != len(self.entries):
+            self.index_entries()
+        return self._reactant_index.get(_get_species_list_key(reactants), [])
+
     def mark_valid_duplicates(self, reactions1, reactions2):
         """
         Check for reactions that appear in both lists,
@@ -498,6 +529,8 @@ class KineticsLibrary(Database):
             self.check_for_duplicates()
             self.convert_duplicates_to_multi()
 
+        self.index_entries()
+
     def load_entry(self,
                    index,
                    label,
@@ -804,3 +837,11 @@ class KineticsLibrary(Database):
                     f.write(' DUPLICATE\n')
                 f.write('\n')
         f.close()
+
+
+def _get_species_list_key(species_list):
+    """
+    Return an order-independent key of the fingerprints of the species in
+    `species_list`, which is the same for any two lists of isomorphic species.
+    """
+    return tuple(sorted(str(spc.fingerprint) for spc in species_list))
@@ -33,11 +33,14 @@ import shutil
 import unittest
 
 from rmgpy import settings
+from rmgpy.data.base import Entry
 from rmgpy.data.kinetics.database import KineticsDatabase
 from rmgpy.data.kinetics.family import TemplateReaction
-from rmgpy.data.kinetics.library import LibraryReaction
+from rmgpy.data.kinetics.library import KineticsLibrary, LibraryReaction
 from rmgpy.kinetics import Arrhenius, Troe, PDepArrhenius
 from rmgpy.kinetics.model import PDepKineticsModel
+from rmgpy.reaction import Reaction
+from rmgpy.species import Species
 
 
 ###################################################
@@ -95,6 +98,35 @@ class TestLibrary(unittest.TestCase):
             shutil.rmtree(os.path.join(settings['test_data.directory'],
                                        'testing_database', 'kinetics', 'libraries', 'eth-oxcopy'))
 
+    def test_get_entries_with_species(self):
+        """
+        Test that the indexed lookup of library entries finds the same reactions
+        as checking every entry of the library
+        """
+        library = self.libraries['GRI-Mech3.0']
+        for reactants in [[Species().from_smiles('[H]'), Species().from_smiles('[O][O]')],
+                          [Species().from_smiles('[O][O]'), Species().from_smiles('[H]')],
+                          [Species().from_smiles('[OH]'), Species().from_smiles('C')],
+                          [Species().from_smiles('CC'), Species().from_smiles('[OH]')]]:
+            expected = [entry for entry in library.entries.values() if entry.item.matches_species(reactants)]
+            self.assertTrue(len(expected) > 0)
+            rxns = self.database.generate_reactions_from_library(library, reactants)
+            self.assertEqual([rxn.entry for rxn in rxns], expected)
+
+    def test_get_entries_with_species_after_adding_entries(self):
+        """
+        Test that the index of library entries is updated when entries are added
+        """
+        library = KineticsLibrary()
+        reactants = [Species().from_smiles('[H]'), Species().from_smiles('[O][O]')]
+        products = [Species().from_smiles('O[O]')]
+        self.assertEqual(library.get_entries_with_species(reactants), [])
+        library.entries[1] = Entry(index=1, label='H + O2 <=> HO2',
+                                   item=Reaction(reactants=reactants, products=products),
+                                   data=Arrhenius(A=(1e13, 'cm^3/(mol*s)'), n=0, Ea=(0, 'kJ/mol'), T0=(1, 'K')))
+        self.assertEqual(library.get_entries_with_species(reactants), [library.entries[1]])
+        self.assertEqual(library.get_entries_with_species(products[::-1]), [library.entries[1]])
+
     def test_generate_high_p_limit_kinetics(self):
         """
         Test that a :class:Arrhenius kinetics object representing the high pressure limit rate
@@ -32,8 +32,11 @@ This module contains the :class:`RMGDatabase` class, which is the primary class
 for working with the RMG database.
 """
 
+import hashlib
+import json
 import logging
 import os.path
+import pickle
 
 from rmgpy.data.base import ForbiddenStructures
 from rmgpy.data.kinetics.database import KineticsDatabase
@@ -42,6 +45,7 @@ from rmgpy.data.statmech import StatmechDatabase
 from rmgpy.data.thermo import ThermoDatabase
 from rmgpy.data.transport import TransportDatabase
 from rmgpy.exceptions import DatabaseError
+from rmgpy.version import __version__
 
 # Module-level variable to store the (only) instance of RMGDatabase in use.
 database = None
@@ -80,7 +84,8 @@ class RMGDatabase(object):
              statmech_libraries=None,
              depository=True,
              solvation=True,
-             testing=False):
+             testing=False,
+             cache_directory=None):
         """
         Load the RMG database from the given `path` on disk, where `path`
         points to the top-level folder of the RMG database. If none of the
@@ -89,7 +94,35 @@ class RMGDatabase(object):
         components of the database be loaded.
 
         Argument testing will load a lighter version of the database used for unit-tests
+
+        If `cache_directory` is given, the loaded database is stored there as a
+        pickle keyed by the RMG version, the load arguments, and the hashes of
+        the database files. Subsequent loads with the same key deserialize the
+        cached database, including the group structures and tree links,
+        instead of parsing the database files again. The file hashes are also
+        stored in the cache directory, so that only the files whose size or
+        modification time changed are hashed again.
         """
+        if cache_directory is not None:
+            arguments = (thermo_libraries, transport_libraries, reaction_libraries, seed_mechanisms,
+                         kinetics_families, kinetics_depositories, statmech_libraries, depository,
+                         solvation, testing)
+            file_hashes_path = os.path.join(cache_directory, 'file_hashes_{0}.json'.format(
+                hashlib.sha1(os.path.abspath(path).encode('utf-8')).hexdigest()))
+            file_hashes = load_file_hashes(file_hashes_path)
+            old_file_hashes = dict(file_hashes)
+            cache_path = os.path.join(cache_directory,
+                                      get_database_cache_key(path, arguments, file_hashes) + '.pkl')
+            if file_hashes != old_file_hashes:
+                save_file_hashes(file_hashes_path, file_hashes)
+            if self.load_cache(cache_path):
+                return
+            self.load(path, thermo_libraries, transport_libraries, reaction_libraries, seed_mechanisms,
+                      kinetics_families, kinetics_depositories, statmech_libraries, depository,
+                      solvation, testing)
+            self.save_cache(cache_path)
+            return
+
         self.load_thermo(os.path.join(path, 'thermo'), thermo_libraries, depository)
         if not testing:
             self.load_transport(os.path.join(path, 'transport'), transport_libraries)
@@ -106,6 +139,45 @@ class RMGDatabase(object):
         if solvation:
             self.load_solvation(os.path.join(path, 'solvation'))
 
+    def load_cache(self, path):
+        """
+        Load the database components from the cache file at `path`, as written
+        by :meth:`save_cache`. Returns ``True`` if the cache was loaded, and
+        ``False`` if it does not exist or could not be read.
+        """
+        if not os.path.exists(path):
+            return False
+        try:
+            with open(path, 'rb') as f:
+                components = pickle.load(f)
+        except Exception as e:
+            logging.warning('Unable to read database cache {0}: {1!s}'.format(path, e))
+            return False
+        logging.info('Loading RMG database from cache {0}...'.format(path))
+        for attribute in DATABASE_COMPONENTS:
+            setattr(self, attribute, components[attribute])
+        return True
+
+    def save_cache(self, path):
+        """
+        Save the loaded database components to the cache file at `path`. The
+        file is written to a temporary location first and then moved into
+        place, so that concurrent runs never read a partially written cache.
+        """
+        directory = os.path.dirname(path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+        components = {attribute: getattr(self, attribute) for attribute in DATABASE_COMPONENTS}
+        temp_path = '{0}.{1:d}.tmp'.format(path, os.getpid())
+        try:
+            with open(temp_path, 'wb') as f:
+                pickle.dump(components, f, pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, path)
+        except Exception as e:
+            logging.warning('Unable to write database cache {0}: {1!s}'.format(path, e))
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
     def load_thermo(self, path, thermo_libraries=None, depository=True):
         """
         Load the RMG thermo database from the given `path` on disk, where
@@ -227,6 +299,81 @@ class RMGDatabase(object):
         self.statmech.save_old(path)
 
 
+# The attributes of RMGDatabase which are stored in the database cache
+DATABASE_COMPONENTS = ['thermo', 'transport', 'forbidden_structures', 'kinetics', 'statmech', 'solvation']
+
+
+def get_database_cache_key(path, arguments, file_hashes=None):
+    """
+    Return a hex digest identifying the database at `path` loaded with the
+    given `arguments`. The key changes whenever the RMG version, the load
+    arguments, or the contents, names or number of files under `path` change.
+
+    If a dict `file_hashes` from a previous call is given, the files whose
+    relative path, size and modification time are unchanged are not read
+    again, and the dict is updated with the hashes of the other files.
+    """
+    if file_hashes is None:
+        file_hashes = {}
+    key = hashlib.sha1()
+    key.update(__version__.encode('utf-8'))
+    key.update(repr(arguments).encode('utf-8'))
+    relative_paths = set()
+    for root, dirs, files in os.walk(path):
+        dirs[:] = sorted(d for d in dirs if d != '__pycache__')
+        for name in sorted(files):
+            if name.endswith('.pyc'):
+                continue
+            file_path = os.path.join(root, name)
+            relative_path = os.path.relpath(file_path, path)
+            relative_paths.add(relative_path)
+            stat = os.stat(file_path)
+            signature = [stat.st_size, stat.st_mtime_ns]
+            if file_hashes.get(relative_path, [None, None])[:2] != signature:
+                # Only hash the contents of new or modified files
+                with open(file_path, 'rb') as f:
+                    file_hashes[relative_path] = signature + [hashlib.sha1(f.read()).hexdigest()]
+            key.update(relative_path.encode('utf-8'))
+            key.update(file_hashes[relative_path][2].encode('utf-8'))
+    for relative_path in set(file_hashes) - relative_paths:
+        del file_hashes[relative_path]
+    return key.hexdigest()
+
+
+def load_file_hashes(path):
+    """
+    Return the dict of database file hashes saved at `path` by
+    :func:`save_file_hashes`, or an empty dict if it could not be read.
+    """
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path, 'r') as f:
+            return json.load(f)
+    except Exception as e:
+        logging.warning('Unable to read database file hashes {0}: {1!s}'.format(path, e))
+        return {}
+
+
+def save_file_hashes(path, file_hashes):
+    """
+    Save the dict of database file hashes `file_hashes` to `path`. As for
+    the database cache, the file is written to a temporary location first.
+    """
+    directory = os.path.dirname(path)
+    if directory and not os.path.exists(directory):
+        os.makedirs(directory)
+    temp_path = '{0}.{1:d}.tmp'.format(path, os.getpid())
+    try:
+        with open(temp_path, 'w') as f:
+            json.dump(file_hashes, f)
+        os.replace(temp_path, path)
+    except Exception as e:
+        logging.warning('Unable to write database file hashes {0}: {1!s}'.format(path, e))
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+
 def get_db(name=''):
     """
     Returns the RMG database object that corresponds
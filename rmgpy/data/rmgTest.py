@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+
+###############################################################################
+#                                                                             #
+# RMG - Reaction Mechanism Generator                                          #
+#                                                                             #
+# Copyright (c) 2002-2019 Prof. William H. Green (whgreen@mit.edu),           #
+# Prof. Richard H. West (r.west@neu.edu) and the RMG Team (rmg_dev@mit.edu)   #
+#                                                                             #
+# Permission is hereby granted, free of charge, to any person obtaining a     #
+# copy of this software and associated documentation files (the 'Software'),  #
+# to deal in the Software without restriction, including without limitation   #
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,    #
+# and/or sell copies of the Software, and to permit persons to whom the       #
+# Software is furnished to do so, subject to the following conditions:        #
+#                                                                             #
+# The above copyright notice and this permission notice shall be included in  #
+# all copies or substantial portions of the Software.                         #
+#                                                                             #
+# THE SOFTWARE IS PROVIDED 'AS IS', WITHOUT WARRANTY OF ANY KIND, EXPRESS OR  #
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,    #
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE #
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER      #
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING     #
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER         #
+# DEALINGS IN THE SOFTWARE.                                                   #
+#                                                                             #
+###############################################################################
+
+"""
+This script contains unit tests of the :mod:`rmgpy.data.rmg` module.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+import rmgpy.data.rmg
+from rmgpy import settings
+from rmgpy.data.rmg import RMGDatabase, get_database_cache_key
+
+
+################################################################################
+
+class TestDatabaseCache(unittest.TestCase):
+    """
+    Contains unit tests for loading the RMG database through the on-disk cache.
+    """
+
+    def setUp(self):
+        """
+        A function run before each unit test in this class.
+        """
+        self.database_directory = os.path.join(settings['test_data.directory'], 'testing_database')
+        self.cache_directory = tempfile.mkdtemp()
+        self.load_kwargs = dict(
+            thermo_libraries=['primaryThermoLibrary'],
+            reaction_libraries=['GRI-Mech3.0'],
+            kinetics_families='default',
+            depository=False,
+            testing=True,
+        )
+
+    def tearDown(self):
+        """
+        A function run after each unit test in this class.
+        """
+        shutil.rmtree(self.cache_directory)
+        rmgpy.data.rmg.database = None
+
+    def test_cache_key(self):
+        """
+        Test that the cache key depends on the load arguments and the database files.
+        """
+        key = get_database_cache_key(self.database_directory, ('default',))
+        self.assertEqual(key, get_database_cache_key(self.database_directory, ('default',)))
+        self.assertNotEqual(key, get_database_cache_key(self.database_directory, ('all',)))
+
+        database_directory = os.path.join(self.cache_directory, 'database')
+        os.makedirs(database_directory)
+        with open(os.path.join(database_directory, 'file.py'), 'w') as f:
+            f.write('entry()\n')
+        key = get_database_cache_key(database_directory, ())
+        with open(os.path.join(database_directory, 'file.py'), 'w') as f:
+            f.write('entry(index=1)\n')
+        self.assertNotEqual(key, get_database_cache_key(database_directory, ()))
+
+    def test_cache_key_with_file_hashes(self):
+        """
+        Test that the cache key only hashes the files whose size or modification time changed.
+        """
+        database_directory = os.path.join(self.cache_directory, 'database')
+        os.makedirs(database_directory)
+        file_path = os.path.join(database_directory, 'file.py')
+        with open(file_path, 'w') as f:
+            f.write('entry(index=1)\n')
+        file_hashes = {}
+        key = get_database_cache_key(database_directory, (), file_hashes)
+        self.assertEqual(key, get_database_cache_key(database_directory, ()))
+        self.assertEqual(list(file_hashes.keys()), ['file.py'])
+
+        # A file with the same size and modification time is not read again
+        stat = os.stat(file_path)
+        with open(file_path, 'w') as f:
+            f.write('entry(index=2)\n')
+        os.utime(file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        self.assertEqual(key, get_database_cache_key(database_directory, (), file_hashes))
+
+        # A file with a new modification time is hashed again
+        os.utime(file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000000000))
+        new_key = get_database_cache_key(database_directory, (), file_hashes)
+        self.assertNotEqual(key, new_key)
+        self.assertEqual(new_key, get_database_cache_key(database_directory, ()))
+
+        # Removed files are dropped from the hashes
+        os.remove(file_path)
+        get_database_cache_key(database_directory, (), file_hashes)
+        self.assertEqual(file_hashes, {})
+
+    def test_load_from_cache(self):
+        """
+        Test that a cached database is written on the first load and matches a fresh load.
+        """
+        database = RMGDatabase()
+        database.load(self.database_directory, cache_directory=self.cache_directory, **self.load_kwargs)
+        self.assertEqual(len([name for name in os.listdir(self.cache_directory) if name.endswith('.pkl')]), 1)
+        self.assertEqual(len([name for name in os.listdir(self.cache_directory) if name.endswith('.json')]), 1)
+
+        cached = RMGDatabase()
+        cached.load(self.database_directory, cache_directory=self.cache_directory, **self.load_kwargs)
+        self.assertEqual(sorted(cached.thermo.libraries.keys()), sorted(database.thermo.libraries.keys()))
+        self.assertEqual(sorted(cached.kinetics.families.keys()), sorted(database.kinetics.families.keys()))
+        self.assertEqual(sorted(cached.kinetics.libraries.keys()), sorted(database.kinetics.libraries.keys()))
+        self.assertEqual(cached.kinetics.recommended_families, database.kinetics.recommended_families)
+        for label, family in database.kinetics.families.items():
+            cached_family = cached.kinetics.families[label]
+            self.assertEqual(sorted(cached_family.groups.entries.keys()), sorted(family.groups.entries.keys()))
+            for entry_label, entry in family.groups.entries.items():
+                cached_entry = cached_family.groups.entries[entry_label]
+                self.assertEqual(cached_entry.parent is None, entry.parent is None)
+                if entry.parent is not None:
+                    self.assertIs(cached_family.groups.entries[entry.parent.label], cached_entry.parent)
+
+    def test_invalid_cache_is_ignored(self):
+        """
+        Test that an unreadable cache file is ignored and replaced.
+        """
+        arguments = (self.load_kwargs['thermo_libraries'], None, self.load_kwargs['reaction_libraries'], None,
+                     self.load_kwargs['kinetics_families'], None, None, False, True, True)
+        cache_path = os.path.join(self.cache_directory,
+                                  get_database_cache_key(self.database_directory, arguments) + '.pkl')
+        with open(cache_path, 'wb') as f:
+            f.write(b'not a pickle')
+
+        database = RMGDatabase()
+        database.load(self.database_directory, cache_directory=self.cache_directory, **self.load_kwargs)
+        self.assertTrue(database.kinetics.families)
+        self.assertTrue(database.load_cache(cache_path))
+
+
+################################################################################
+
+if __name__ == '__main__':
+    unittest.main(testRunner=unittest.TextTestRunner(verbosity=2))
@@ -1720,37 +1720,10 @@ class ThermoDatabase(object):
         The entropy is not corrected for the symmetry of the molecule.
         This should be done later by the calling function.
         """
-        molecule = species.molecule[0]
-
-        min_heavy = ml_settings['min_heavy_atoms'] or 1
-        max_heavy = ml_settings['max_heavy_atoms'] or np.inf
-        min_carbon = ml_settings['min_carbon_atoms'] or 0
-        max_carbon = ml_settings['max_carbon_atoms'] or np.inf
-        min_oxygen = ml_settings['min_oxygen_atoms'] or 0
-        max_oxygen = ml_settings['max_oxygen_atoms'] or np.inf
-        min_nitrogen = ml_settings['min_nitrogen_atoms'] or 0
-        max_nitrogen = ml_settings['max_nitrogen_atoms'] or np.inf
-
-        element_count = molecule.get_element_count()
-        n_heavy = sum(count for element, count in element_count.items() if element != 'H')
-
-        if not (min_heavy <= n_heavy <= max_heavy):
-            return None
-        if not (min_carbon <= element_count.get('C', 0) <= max_carbon):
-            return None
-        if not (min_oxygen <= element_count.get('O', 0) <= max_oxygen):
-            return None
-        if not (min_nitrogen <= element_count.get('N', 0) <= max_nitrogen):
-            return None
-        if ml_settings['only_heterocyclics'] and not molecule.is_heterocyclic():
-            return None
-        if ml_settings['only_cyclics'] and not molecule.is_cyclic():
-            return None
-        min_cycle_overlap = ml_settings['min_cycle_overlap']
-        if min_cycle_overlap > 0 and molecule.get_max_cycle_overlap() < min_cycle_overlap:
+        if not self.is_ml_applicable(species.molecule[0], ml_settings):
             return None
 
-        if molecule.is_radical():
+        if species.molecule[0].is_radical():
             thermo = [self.estimate_radical_thermo_via_hbi(mol, ml_estimator.get_thermo_data) for mol in species.molecule]
             H298 = np.array([tdata.H298.value_si for tdata in thermo])
             indices = H298.argsort()
@@ -1774,6 +1747,77 @@ class ThermoDatabase(object):
         else:
             return thermo0
 
+    def prepare_thermo_data_from_ml(self, species_list, ml_estimator, ml_settings):
+        """
+        Predict the thermo of all species in `species_list` that the ML
+        estimator may be used for in a single batch, so that subsequent
+        calls of :meth:`get_thermo_data_from_ml` for these species use the
+        predictions cached by `ml_estimator` instead of each invoking the
+        model. For radicals, the saturated form of each resonance structure
+        is predicted, as needed for the HBI correction.
+
+        Species whose thermo is found in the libraries, either directly or
+        for the saturated form of a radical, are not predicted, since
+        :meth:`get_thermo_data` does not use the ML estimator for them.
+        """
+        molecules = []
+        for species in species_list:
+            if (species.contains_surface_site()
+                    or not all(a.element.number in {1, 6, 7, 8} for a in species.molecule[0].atoms)
+                    or species.molecule[0].get_singlet_carbene_count() > 0
+                    or not self.is_ml_applicable(species.molecule[0], ml_settings)
+                    or self.get_thermo_data_from_libraries(species) is not None):
+                continue
+            if species.molecule[0].is_radical():
+                saturated_structs = []
+                for mol in species.molecule:
+                    saturated_struct = mol.copy(deep=True)
+                    saturated_struct.saturate_radicals()
+                    saturated_structs.append(saturated_struct)
+                if any(self.get_thermo_data_from_libraries(Species(molecule=[saturated_struct])) is not None
+                       for saturated_struct, mol in zip(saturated_structs, species.molecule) if mol.reactive):
+                    continue
+                molecules.extend(saturated_structs)
+            else:
+                molecules.append(species.molecule[0])
+        if molecules:
+            ml_estimator.predict([molecule.smiles for molecule in molecules])
+
+    def is_ml_applicable(self, molecule, ml_settings):
+        """
+        Return ``True`` if the ML estimator may be used for `molecule`
+        according to the size and structure options in `ml_settings`,
+        and ``False`` otherwise.
+        """
+        min_heavy = ml_settings['min_heavy_atoms'] or 1
+        max_heavy = ml_settings['max_heavy_atoms'] or np.inf
+        min_carbon = ml_settings['min_carbon_atoms'] or 0
+        max_carbon = ml_settings['max_carbon_atoms'] or np.inf
+        min_oxygen = ml_settings['min_oxygen_atoms'] or 0
+        max_oxygen = ml_settings['max_oxygen_atoms'] or np.inf
+        min_nitrogen = ml_settings['min_nitrogen_atoms'] or 0
+        max_nitrogen = ml_settings['max_nitrogen_atoms'] or np.inf
+
+        element_count = molecule.get_element_count()
+        n_heavy = sum(count for element, count in element_count.items() if element != 'H')
+
+        if not (min_heavy <= n_heavy <= max_heavy):
+            return False
+        if not (min_carbon <= element_count.get('C', 0) <= max_carbon):
+            return False
+        if not (min_oxygen <= element_count.get('O', 0) <= max_oxygen):
+            return False
+        if not (min_nitrogen <= element_count.get('N', 0) <= max_nitrogen):
+            return False
+        if ml_settings['only_heterocyclics'] and not molecule.is_heterocyclic():
+            return False
+        if ml_settings['only_cyclics'] and not molecule.is_cyclic():
+            return False
+        min_cycle_overlap = ml_settings['min_cycle_overlap']
+        if min_cycle_overlap > 0 and molecule.get_max_cycle_overlap() < min_cycle_overlap:
+            return False
+        return True
+
     def prioritize_thermo(self, species, thermo_data_list):
         """
         Use some metrics to reorder a list of thermo data from best to worst.
@@ -446,6 +446,73 @@ multiplicity 2
         self.assertIsNone(thermo1)
         self.assertIsNone(thermo2)
 
+    def test_prepare_thermo_data_from_ml(self):
+        """Test that the ML predictions for a list of species are made in one batch"""
+        ml_settings = dict(
+            min_heavy_atoms=1,
+            max_heavy_atoms=None,
+            min_carbon_atoms=0,
+            max_carbon_atoms=None,
+            min_oxygen_atoms=0,
+            max_oxygen_atoms=None,
+            min_nitrogen_atoms=0,
+            max_nitrogen_atoms=None,
+            only_cyclics=True,
+            only_heterocyclics=False,
+            min_cycle_overlap=0,
+            uncertainty_cutoffs=dict(
+                H298=Quantity(1e8, 'kcal/mol'),
+                S298=Quantity(1e8, 'cal/(mol*K)'),
+                Cp=Quantity(1e8, 'cal/(mol*K)')
+            ),
+        )
+        spec1 = Species().from_smiles('C[CH]c1ccccc1')
+        spec1.generate_resonance_structures()
+        spec2 = Species().from_smiles('C1CCCC1')
+        spec3 = Species().from_smiles('CCCC')  # not cyclic, so not predicted
+
+        self.ml_estimator.clear_cache()
+        self.database.prepare_thermo_data_from_ml([spec1, spec2, spec3], self.ml_estimator, ml_settings)
+        self.assertIn('C1CCCC1', self.ml_estimator.predictions)
+        self.assertIn('CCc1ccccc1', self.ml_estimator.predictions)
+        self.assertNotIn('CCCC', self.ml_estimator.predictions)
+
+        # The thermo is then estimated using the cached predictions
+        num_predictions = len(self.ml_estimator.predictions)
+        thermo1 = self.database.get_thermo_data_from_ml(spec1, self.ml_estimator, ml_settings)
+        thermo2 = self.database.get_thermo_data_from_ml(spec2, self.ml_estimator, ml_settings)
+        self.assertTrue('ML Estimation' in thermo1.comment)
+        self.assertTrue('ML Estimation' in thermo2.comment)
+        self.assertEqual(len(self.ml_estimator.predictions), num_predictions)
+
+    def test_prepare_thermo_data_from_ml_skips_libraries(self):
+        """Test that no ML predictions are made for species with thermo in the libraries"""
+        ml_settings = dict(
+            min_heavy_atoms=1,
+            max_heavy_atoms=None,
+            min_carbon_atoms=0,
+            max_carbon_atoms=None,
+            min_oxygen_atoms=0,
+            max_oxygen_atoms=None,
+            min_nitrogen_atoms=0,
+            max_nitrogen_atoms=None,
+            only_cyclics=False,
+            only_heterocyclics=False,
+            min_cycle_overlap=0,
+            uncertainty_cutoffs=dict(
+                H298=Quantity(1e8, 'kcal/mol'),
+                S298=Quantity(1e8, 'cal/(mol*K)'),
+                Cp=Quantity(1e8, 'cal/(mol*K)')
+            ),
+        )
+        spec1 = Species().from_smiles('C')  # in primaryThermoLibrary
+        spec2 = Species().from_smiles('[CH3]')  # saturated form in primaryThermoLibrary
+        spec3 = Species().from_smiles('OCC1CCCC1CC=O')
+
+        self.ml_estimator.clear_cache()
+        self.database.prepare_thermo_data_from_ml([spec1, spec2, spec3], self.ml_estimator, ml_settings)
+        self.assertEqual(list(self.ml_estimator.predictions), [spec3.molecule[0].smiles])
+
     def test_thermo_generation_ml_settings(self):
         """Test that thermo generation with ML correctly respects settings"""
 
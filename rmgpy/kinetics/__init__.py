@@ -36,3 +36,4 @@ from rmgpy.kinetics.kineticsdata import KineticsData, PDepKineticsData
 from rmgpy.kinetics.tunneling import Wigner, Eckart
 from rmgpy.kinetics.surface import SurfaceArrhenius, SurfaceArrheniusBEP, \
                      StickingCoefficient, StickingCoefficientBEP
+from rmgpy.kinetics.batch import KineticsBatch
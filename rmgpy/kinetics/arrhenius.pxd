@@ -41,6 +41,8 @@ cdef class Arrhenius(KineticsModel):
     
     cpdef double get_rate_coefficient(self, double T, double P=?) except -1
 
+    cpdef np.ndarray get_rate_coefficients(self, np.ndarray Tlist, np.ndarray Plist=?)
+
     cpdef change_t0(self, double T0)
 
     cpdef fit_to_data(self, np.ndarray Tlist, np.ndarray klist, str kunits, double T0=?, np.ndarray weights=?, bint three_params=?)
@@ -62,6 +64,8 @@ cdef class ArrheniusEP(KineticsModel):
     
     cpdef double get_rate_coefficient(self, double T, double dHrxn=?) except -1
 
+    cpdef np.ndarray get_rate_coefficients(self, np.ndarray Tlist, np.ndarray dHrxn=?)
+
     cpdef double get_activation_energy(self, double dHrxn) except -1
     
     cpdef Arrhenius to_arrhenius(self, double dHrxn)
@@ -97,6 +101,8 @@ cdef class PDepArrhenius(PDepKineticsModel):
     cdef get_adjacent_expressions(self, double P)
     
     cpdef double get_rate_coefficient(self, double T, double P=?) except -1
+
+    cpdef np.ndarray get_rate_coefficients(self, np.ndarray Tlist, np.ndarray Plist=?)
     
     cpdef fit_to_data(self, np.ndarray Tlist, np.ndarray Plist, np.ndarray K, str kunits, double T0=?)
 
@@ -112,6 +118,8 @@ cdef class MultiArrhenius(KineticsModel):
     
     cpdef double get_rate_coefficient(self, double T, double P=?) except -1
 
+    cpdef np.ndarray get_rate_coefficients(self, np.ndarray Tlist, np.ndarray Plist=?)
+
     cpdef bint is_identical_to(self, KineticsModel other_kinetics) except -2
     
     cpdef Arrhenius to_arrhenius(self, double Tmin=?, double Tmax=?)
@@ -126,6 +134,8 @@ cdef class MultiPDepArrhenius(PDepKineticsModel):
     
     cpdef double get_rate_coefficient(self, double T, double P=?) except -1
 
+    cpdef np.ndarray get_rate_coefficients(self, np.ndarray Tlist, np.ndarray Plist=?)
+
     cpdef bint is_identical_to(self, KineticsModel other_kinetics) except -2
     
     cpdef change_rate(self, double factor)
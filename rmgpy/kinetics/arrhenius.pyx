@@ -134,6 +134,23 @@ cdef class Arrhenius(KineticsModel):
         T0 = self._T0.value_si
         return A * (T / T0) ** n * exp(-Ea / (constants.R * T))
 
+    cpdef np.ndarray get_rate_coefficients(self, np.ndarray Tlist, np.ndarray Plist=None):
+        """
+        Return an array of rate coefficients in the appropriate combination of
+        m^3, mol, and s at the temperatures `Tlist` in K. The pressures
+        `Plist`, if given, are only used to broadcast the result.
+        """
+        cdef double A, n, Ea, T0
+        cdef np.ndarray T
+        A = self._A.value_si
+        n = self._n.value_si
+        Ea = self._Ea.value_si
+        T0 = self._T0.value_si
+        T = np.asarray(Tlist, np.float64)
+        if Plist is not None:
+            T = np.broadcast_arrays(T, Plist)[0]
+        return A * (T / T0) ** n * np.exp(-Ea / (constants.R * T))
+
     cpdef change_t0(self, double T0):
         """
         Changes the reference temperature used in the exponent to `T0` in K,
@@ -384,6 +401,25 @@ cdef class ArrheniusEP(KineticsModel):
         n = self._n.value_si
         return A * T ** n * exp(-Ea / (constants.R * T))
 
+    cpdef np.ndarray get_rate_coefficients(self, np.ndarray Tlist, np.ndarray dHrxn=None):
+        """
+        Return an array of rate coefficients in the appropriate combination of
+        m^3, mol, and s at the temperatures `Tlist` in K and enthalpies of
+        reaction `dHrxn` in J/mol, which are broadcast against each other.
+        """
+        cdef double alpha, E0
+        cdef np.ndarray T, H, Ea
+        T, H = np.broadcast_arrays(np.asarray(Tlist, np.float64),
+                                   np.asarray(dHrxn if dHrxn is not None else 0.0, np.float64))
+        alpha = self._alpha.value_si
+        E0 = self._E0.value_si
+        Ea = alpha * H + E0
+        if E0 > 0:
+            # Same bounds on the activation energy as in get_activation_energy()
+            Ea = np.where((H < 0.0) & (Ea < 0.0), 0.0, Ea)
+            Ea = np.where((H > 0.0) & (Ea < H), H, Ea)
+        return self._A.value_si * T ** self._n.value_si * np.exp(-Ea / (constants.R * T))
+
     cpdef double get_activation_energy(self, double dHrxn) except -1:
         """
         Return the activation energy in J/mol corresponding to the given
@@ -786,6 +822,39 @@ cdef class PDepArrhenius(PDepKineticsModel):
             k = klow * 10 ** (log10(P / Plow) / log10(Phigh / Plow) * log10(khigh / klow))
         return k
 
+    cpdef np.ndarray get_rate_coefficients(self, np.ndarray Tlist, np.ndarray Plist=None):
+        """
+        Return an array of rate coefficients in the appropriate combination of
+        m^3, mol, and s at the temperatures `Tlist` in K and pressures `Plist`
+        in Pa, which are broadcast against each other. The Arrhenius
+        expressions are evaluated once for each distinct pressure.
+        """
+        cdef double Plow, Phigh
+        cdef KineticsModel alow, ahigh
+        cdef np.ndarray T, P, k, pressures, indices, mask, klow, khigh, kmask
+        cdef int i
+
+        if Plist is None or np.any(Plist == 0):
+            raise ValueError('No pressure specified to pressure-dependent PDepArrhenius.get_rate_coefficients().')
+
+        T, P = np.broadcast_arrays(np.asarray(Tlist, np.float64), np.asarray(Plist, np.float64))
+        k = np.zeros_like(T)
+        pressures, indices = np.unique(P, return_inverse=True)
+        indices = indices.reshape(np.shape(T))
+        for i in range(pressures.shape[0]):
+            mask = indices == i
+            Plow, Phigh, alow, ahigh = self.get_adjacent_expressions(pressures[i])
+            if Plow == Phigh:
+                k[mask] = alow.get_rate_coefficients(T[mask])
+            else:
+                klow = alow.get_rate_coefficients(T[mask])
+                khigh = ahigh.get_rate_coefficients(T[mask])
+                with np.errstate(divide='ignore', invalid='ignore'):
+                    kmask = klow * 10 ** (log10(pressures[i] / Plow) / log10(Phigh / Plow) * np.log10(khigh / klow))
+                kmask[(klow == 0.0) & (khigh == 0.0)] = 0.0
+                k[mask] = kmask
+        return k
+
     cpdef fit_to_data(self, np.ndarray Tlist, np.ndarray Plist, np.ndarray K, str kunits, double T0=1):
         """
         Fit the pressure-dependent Arrhenius model to a matrix of rate
@@ -902,6 +971,18 @@ cdef class MultiArrhenius(KineticsModel):
             k += arrh.get_rate_coefficient(T)
         return k
 
+    cpdef np.ndarray get_rate_coefficients(self, np.ndarray Tlist, np.ndarray Plist=None):
+        """
+        Return an array of rate coefficients in the appropriate combination of
+        m^3, mol, and s at the temperatures `Tlist` in K.
+        """
+        cdef np.ndarray k
+        cdef Arrhenius arrh
+        k = np.zeros_like(Tlist, np.float64)
+        for arrh in self.arrhenius:
+            k = k + arrh.get_rate_coefficients(Tlist, Plist)
+        return k
+
     cpdef bint is_identical_to(self, KineticsModel other_kinetics) except -2:
         """
         Returns ``True`` if kinetics matches that of another kinetics model.  Each duplicate
@@ -940,7 +1021,7 @@ cdef class MultiArrhenius(KineticsModel):
         if Tmax == -1: Tmax = self.Tmax.value_si
         kunits = str(quantity.pq.Quantity(1.0, self.arrhenius[0].A.units).simplified).split()[-1]  # is this the best way to get the units returned by k??
         Tlist = np.logspace(log10(Tmin), log10(Tmax), num=25)
-        klist = np.array(list(map(self.get_rate_coefficient, Tlist)), np.float64)
+        klist = self.get_rate_coefficients(Tlist)
         arrh = Arrhenius().fit_to_data(Tlist, klist, kunits)
         arrh.comment = "Fitted to Multiple Arrhenius kinetics over range {Tmin}-{Tmax} K. {comment}".format(
             Tmin=Tmin, Tmax=Tmax, comment=self.comment)
@@ -1029,6 +1110,23 @@ cdef class MultiPDepArrhenius(PDepKineticsModel):
 
         return k
 
+    cpdef np.ndarray get_rate_coefficients(self, np.ndarray Tlist, np.ndarray Plist=None):
+        """
+        Return an array of rate coefficients in the appropriate combination of
+        m^3, mol, and s at the temperatures `Tlist` in K and pressures `Plist`
+        in Pa, which are broadcast against each other.
+        """
+        cdef np.ndarray k
+        cdef PDepArrhenius arrh
+
+        if Plist is None:
+            raise ValueError('No pressure specified to pressure-dependent MultiPDepArrhenius.get_rate_coefficients().')
+
+        k = np.zeros_like(Tlist, np.float64)
+        for arrh in self.arrhenius:
+            k = k + arrh.get_rate_coefficients(Tlist, Plist)
+        return k
+
     cpdef bint is_identical_to(self, KineticsModel other_kinetics) except -2:
         """
         Returns ``True`` if kinetics matches that of another kinetics model.  Each duplicate
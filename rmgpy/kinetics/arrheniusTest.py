@@ -131,6 +131,22 @@ class TestArrhenius(unittest.TestCase):
             kact = self.arrhenius.get_rate_coefficient(T)
             self.assertAlmostEqual(kexp, kact, delta=1e-4 * kexp)
 
+    def test_get_rate_coefficients(self):
+        """
+        Test the Arrhenius.get_rate_coefficients() method.
+        """
+        Tlist = np.array([200, 400, 600, 800, 1000, 1200, 1400, 1600, 1800, 2000], np.float64)
+        klist = self.arrhenius.get_rate_coefficients(Tlist)
+        self.assertEqual(klist.shape, Tlist.shape)
+        for T, kact in zip(Tlist, klist):
+            kexp = self.arrhenius.get_rate_coefficient(T)
+            self.assertAlmostEqual(kexp, kact, delta=1e-10 * kexp)
+        # The pressures are only used to broadcast the result
+        K = self.arrhenius.get_rate_coefficients(Tlist[:, np.newaxis], np.array([[1e4, 1e5, 1e6]]))
+        self.assertEqual(K.shape, (10, 3))
+        for p in range(3):
+            self.assertTrue(np.allclose(K[:, p], klist, rtol=1e-10))
+
     def test_change_t0(self):
         """
         Test the Arrhenius.change_t0() method.
@@ -337,6 +353,17 @@ class TestArrheniusEP(unittest.TestCase):
             kact = self.arrhenius.get_rate_coefficient(T, )
             self.assertAlmostEqual(kexp, kact, delta=1e-4 * kexp)
 
+    def test_get_rate_coefficients(self):
+        """
+        Test the ArrheniusEP.get_rate_coefficients() method.
+        """
+        Tlist = np.array([200, 400, 600, 800, 1000, 1200, 1400, 1600, 1800, 2000], np.float64)
+        for dHrxn in [-1e6, -1e4, 0.0, 1e4, 1e6]:
+            klist = self.arrhenius.get_rate_coefficients(Tlist, np.array(dHrxn))
+            for T, kact in zip(Tlist, klist):
+                kexp = self.arrhenius.get_rate_coefficient(T, dHrxn)
+                self.assertAlmostEqual(kexp, kact, delta=1e-10 * kexp)
+
     def test_pickle(self):
         """
         Test that an ArrheniusEP object can be pickled and unpickled with no loss
@@ -518,6 +545,21 @@ class TestPDepArrhenius(unittest.TestCase):
             k1 = math.sqrt(self.arrhenius0.get_rate_coefficient(T) * self.arrhenius1.get_rate_coefficient(T))
             self.assertAlmostEqual(k0, k1, delta=1e-6 * k1)
 
+    def test_get_rate_coefficients(self):
+        """
+        Test the PDepArrhenius.get_rate_coefficients() method.
+        """
+        Tlist = np.array([300, 500, 700, 900, 1100, 1300, 1500], np.float64)
+        Plist = np.array([1e3, 1e4, 3e4, 1e5, 1e6, 1e7], np.float64)
+        K = self.kinetics.get_rate_coefficients(Tlist[:, np.newaxis], Plist[np.newaxis, :])
+        self.assertEqual(K.shape, (Tlist.shape[0], Plist.shape[0]))
+        for t, T in enumerate(Tlist):
+            for p, P in enumerate(Plist):
+                kexp = self.kinetics.get_rate_coefficient(T, P)
+                self.assertAlmostEqual(K[t, p], kexp, delta=1e-10 * kexp)
+        with self.assertRaises(ValueError):
+            self.kinetics.get_rate_coefficients(Tlist)
+
     def test_fit_to_data(self):
         """
         Test the PDepArrhenius.fit_to_data() method.
@@ -703,6 +745,16 @@ class TestMultiArrhenius(unittest.TestCase):
             kact = self.kinetics.get_rate_coefficient(T)
             self.assertAlmostEqual(kexp, kact, delta=1e-4 * kexp)
 
+    def test_get_rate_coefficients(self):
+        """
+        Test the MultiArrhenius.get_rate_coefficients() method.
+        """
+        Tlist = np.array([200, 400, 600, 800, 1000, 1200, 1400, 1600, 1800, 2000], np.float64)
+        klist = self.kinetics.get_rate_coefficients(Tlist)
+        for T, kact in zip(Tlist, klist):
+            kexp = self.kinetics.get_rate_coefficient(T)
+            self.assertAlmostEqual(kexp, kact, delta=1e-10 * kexp)
+
     def test_pickle(self):
         """
         Test that a MultiArrhenius object can be pickled and unpickled with no loss
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+
+###############################################################################
+#                                                                             #
+# RMG - Reaction Mechanism Generator                                          #
+#                                                                             #
+# Copyright (c) 2002-2019 Prof. William H. Green (whgreen@mit.edu),           #
+# Prof. Richard H. West (r.west@neu.edu) and the RMG Team (rmg_dev@mit.edu)   #
+#                                                                             #
+# Permission is hereby granted, free of charge, to any person obtaining a     #
+# copy of this software and associated documentation files (the 'Software'),  #
+# to deal in the Software without restriction, including without limitation   #
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,    #
+# and/or sell copies of the Software, and to permit persons to whom the       #
+# Software is furnished to do so, subject to the following conditions:        #
+#                                                                             #
+# The above copyright notice and this permission notice shall be included in  #
+# all copies or substantial portions of the Software.                         #
+#                                                                             #
+# THE SOFTWARE IS PROVIDED 'AS IS', WITHOUT WARRANTY OF ANY KIND, EXPRESS OR  #
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,    #
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE #
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER      #
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING     #
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER         #
+# DEALINGS IN THE SOFTWARE.                                                   #
+#                                                                             #
+###############################################################################
+
+"""
+This module contains the :class:`KineticsBatch` class, used to evaluate the
+rate coefficients of many kinetics models at once.
+"""
+
+import numpy as np
+
+import rmgpy.constants as constants
+from rmgpy.exceptions import KineticsError
+from rmgpy.kinetics.arrhenius import Arrhenius, MultiArrhenius
+
+################################################################################
+
+
+class KineticsBatch(object):
+    """
+    A set of kinetics models whose rate coefficients are evaluated together.
+    The parameters of all :class:`Arrhenius` expressions, including those of
+    :class:`MultiArrhenius` models, are packed into arrays so the rate
+    coefficients of all of them are computed using a few array operations.
+    Any other kinetics model is evaluated using its own
+    :meth:`get_rate_coefficients()` method. The attributes are:
+
+    =============== ============================================================
+    Attribute       Description
+    =============== ============================================================
+    `kinetics`      The list of kinetics models
+    `A`             The preexponential factors of the packed Arrhenius expressions in SI units
+    `n`             The temperature exponents of the packed Arrhenius expressions
+    `Ea`            The activation energies of the packed Arrhenius expressions in J/mol
+    `T0`            The reference temperatures of the packed Arrhenius expressions in K
+    `indices`       The index in `kinetics` that each packed Arrhenius expression contributes to
+    `others`        The indices in `kinetics` of the models that are not packed
+    =============== ============================================================
+
+    The parameters are copied when the batch is created, so a new batch must
+    be made if any of the kinetics models is changed.
+    """
+
+    def __init__(self, kinetics):
+        self.kinetics = list(kinetics)
+        A, n, Ea, T0, indices = [], [], [], [], []
+        self.others = []
+        for i, model in enumerate(self.kinetics):
+            if model is None:
+                raise KineticsError('Cannot evaluate the rate coefficient of kinetics model {0} '
+                                    'since it is None.'.format(i))
+            if isinstance(model, Arrhenius):
+                expressions = [model]
+            elif isinstance(model, MultiArrhenius) and all([isinstance(arrh, Arrhenius)
+                                                           for arrh in model.arrhenius]):
+                expressions = model.arrhenius
+            else:
+                self.others.append(i)
+                continue
+            for arrh in expressions:
+                A.append(arrh.A.value_si)
+                n.append(arrh.n.value_si)
+                Ea.append(arrh.Ea.value_si)
+                T0.append(arrh.T0.value_si)
+                indices.append(i)
+        self.A = np.array(A, np.float64)
+        self.n = np.array(n, np.float64)
+        self.Ea = np.array(Ea, np.float64)
+        self.T0 = np.array(T0, np.float64)
+        self.indices = np.array(indices, int)
+
+    @classmethod
+    def from_reactions(cls, reactions):
+        """
+        Return a :class:`KineticsBatch` for the kinetics of a list of
+        `reactions`.
+        """
+        return cls([reaction.kinetics for reaction in reactions])
+
+    def __len__(self):
+        return len(self.kinetics)
+
+    def get_rate_coefficients(self, Tlist, Plist=None):
+        """
+        Return the rate coefficients in SI units of all of the kinetics models
+        at the temperatures `Tlist` in K and pressures `Plist` in Pa, which
+        are broadcast against each other. The returned array has one row for
+        each kinetics model, followed by the broadcast shape of the conditions.
+        """
+        T = np.asarray(Tlist, np.float64)
+        P = None
+        if Plist is not None:
+            T, P = np.broadcast_arrays(T, np.asarray(Plist, np.float64))
+            P = P.ravel()
+        shape = np.shape(T)
+        T = T.ravel()
+
+        k = np.zeros((len(self.kinetics), T.shape[0]), np.float64)
+        if self.indices.shape[0] > 0:
+            terms = (self.A[:, np.newaxis] * (T[np.newaxis, :] / self.T0[:, np.newaxis]) ** self.n[:, np.newaxis] *
+                     np.exp(-self.Ea[:, np.newaxis] / (constants.R * T[np.newaxis, :])))
+            np.add.at(k, self.indices, terms)
+        for i in self.others:
+            k[i, :] = self.kinetics[i].get_rate_coefficients(T, P)
+        return k.reshape((len(self.kinetics),) + shape)
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+
+###############################################################################
+#                                                                             #
+# RMG - Reaction Mechanism Generator                                          #
+#                                                                             #
+# Copyright (c) 2002-2019 Prof. William H. Green (whgreen@mit.edu),           #
+# Prof. Richard H. West (r.west@neu.edu) and the RMG Team (rmg_dev@mit.edu)   #
+#                                                                             #
+# Permission is hereby granted, free of charge, to any person obtaining a     #
+# copy of this software and associated documentation files (the 'Software'),  #
+# to deal in the Software without restriction, including without limitation   #
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,    #
+# and/or sell copies of the Software, and to permit persons to whom the       #
+# Software is furnished to do so, subject to the following conditions:        #
+#                                                                             #
+# The above copyright notice and this permission notice shall be included in  #
+# all copies or substantial portions of the Software.                         #
+#                                                                             #
+# THE SOFTWARE IS PROVIDED 'AS IS', WITHOUT WARRANTY OF ANY KIND, EXPRESS OR  #
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,    #
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE #
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER      #
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING     #
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER         #
+# DEALINGS IN THE SOFTWARE.                                                   #
+#                                                                             #
+###############################################################################
+
+"""
+This script contains unit tests of the :mod:`rmgpy.kinetics.batch` module.
+"""
+
+import unittest
+
+import numpy as np
+
+from rmgpy.exceptions import KineticsError
+from rmgpy.kinetics.arrhenius import Arrhenius, ArrheniusEP, MultiArrhenius
+from rmgpy.kinetics.batch import KineticsBatch
+from rmgpy.kinetics.falloff import Troe
+
+
+################################################################################
+
+class TestKineticsBatch(unittest.TestCase):
+    """
+    Contains unit tests of the KineticsBatch class.
+    """
+
+    def setUp(self):
+        """
+        A function run before each unit test in this class.
+        """
+        self.arrhenius = Arrhenius(A=(1.0e12, 'cm^3/(mol*s)'), n=0.5, Ea=(41.84, 'kJ/mol'), T0=(1, 'K'))
+        self.multi_arrhenius = MultiArrhenius(arrhenius=[
+            Arrhenius(A=(9.3e-14, 'cm^3/(molecule*s)'), n=0.0, Ea=(4740 * 8.314472 * 0.001, 'kJ/mol'), T0=(1, 'K')),
+            Arrhenius(A=(1.4e-9, 'cm^3/(molecule*s)'), n=0.0, Ea=(11200 * 8.314472 * 0.001, 'kJ/mol'), T0=(1, 'K')),
+        ])
+        self.arrhenius_ep = ArrheniusEP(A=(1.0e12, 'cm^3/(mol*s)'), n=0.5, alpha=0.5, E0=(41.84, 'kJ/mol'))
+        self.troe = Troe(
+            arrheniusHigh=Arrhenius(A=(1.39e+16, 'cm^3/(mol*s)'), n=-0.534, Ea=(2.243, 'kJ/mol'), T0=(1, 'K')),
+            arrheniusLow=Arrhenius(A=(2.62e+33, 'cm^6/(mol^2*s)'), n=-4.76, Ea=(10.21, 'kJ/mol'), T0=(1, 'K')),
+            alpha=0.783, T3=(74, 'K'), T1=(2941, 'K'), T2=(6964, 'K'),
+        )
+        self.kinetics = [self.arrhenius, self.multi_arrhenius, self.arrhenius_ep, self.troe]
+        self.batch = KineticsBatch(self.kinetics)
+
+    def test_packing(self):
+        """
+        Test that the Arrhenius expressions are packed and the others are not.
+        """
+        self.assertEqual(len(self.batch), 4)
+        self.assertEqual(list(self.batch.indices), [0, 1, 1])
+        self.assertEqual(self.batch.others, [2, 3])
+        self.assertAlmostEqual(self.batch.A[0], self.arrhenius.A.value_si)
+
+    def test_get_rate_coefficients(self):
+        """
+        Test that the batched rate coefficients match those of each kinetics model.
+        """
+        Tlist = np.array([300, 500, 1000, 1500, 2000], np.float64)
+        P = 1e5
+        K = self.batch.get_rate_coefficients(Tlist, np.array(P))
+        self.assertEqual(K.shape, (4, 5))
+        for i, kinetics in enumerate(self.kinetics):
+            for t, T in enumerate(Tlist):
+                kexp = kinetics.get_rate_coefficient(T, P) if i == 3 else kinetics.get_rate_coefficient(T)
+                self.assertAlmostEqual(K[i, t], kexp, delta=1e-10 * kexp)
+
+    def test_get_rate_coefficients_grid(self):
+        """
+        Test that the batched rate coefficients keep the broadcast shape of the conditions.
+        """
+        Tlist = np.array([300, 1000, 2000], np.float64)
+        Plist = np.array([1e4, 1e5], np.float64)
+        K = self.batch.get_rate_coefficients(Tlist[:, np.newaxis], Plist[np.newaxis, :])
+        self.assertEqual(K.shape, (4, 3, 2))
+        self.assertAlmostEqual(K[3, 1, 0], self.troe.get_rate_coefficient(1000, 1e4), delta=1e-10 * K[3, 1, 0])
+
+    def test_none_kinetics(self):
+        """
+        Test that a KineticsError is raised for a missing kinetics model.
+        """
+        with self.assertRaises(KineticsError):
+            KineticsBatch([self.arrhenius, None])
+
+################################################################################
+
+if __name__ == '__main__':
+    unittest.main(testRunner=unittest.TextTestRunner(verbosity=2))
@@ -174,6 +174,29 @@ cdef class Chebyshev(PDepKineticsModel):
                 k += coeffs[t, p] * self.chebyshev(t, Tred) * self.chebyshev(p, Pred)
         return 10.0 ** k
 
+    cpdef np.ndarray get_rate_coefficients(self, np.ndarray Tlist, np.ndarray Plist=None):
+        """
+        Return an array of rate coefficients in the appropriate combination of
+        m^3, mol, and s at the temperatures `Tlist` in K and pressures `Plist`
+        in Pa, which are broadcast against each other, by evaluating the
+        Chebyshev expression.
+        """
+        cdef double Tmin, Tmax, Pmin, Pmax
+        cdef np.ndarray T, P, Tred, Pred
+
+        if Plist is None or np.any(Plist == 0):
+            raise ValueError('No pressure specified to pressure-dependent Chebyshev.get_rate_coefficients().')
+
+        T, P = np.broadcast_arrays(np.asarray(Tlist, np.float64), np.asarray(Plist, np.float64))
+        Tmin = self._Tmin.value_si
+        Tmax = self._Tmax.value_si
+        Pmin = self._Pmin.value_si
+        Pmax = self._Pmax.value_si
+        Tred = (2.0 / T - 1.0 / Tmin - 1.0 / Tmax) / (1.0 / Tmax - 1.0 / Tmin)
+        Pred = (2.0 * np.log10(P) - log10(Pmin) - log10(Pmax)) / (log10(Pmax) - log10(Pmin))
+        return 10.0 ** np.polynomial.chebyshev.chebval2d(Tred, Pred,
+                                                         self._coeffs.value_si[:self.degreeT, :self.degreeP])
+
     cpdef fit_to_data(self, np.ndarray Tlist, np.ndarray Plist, np.ndarray K,
                     str kunits, int degreeT, int degreeP, double Tmin, double Tmax, double Pmin, double Pmax):
         """
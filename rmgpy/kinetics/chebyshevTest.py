@@ -139,6 +139,21 @@ class TestChebyshev(unittest.TestCase):
                 Kact = self.chebyshev.get_rate_coefficient(Tlist[t], Plist[p])
                 self.assertAlmostEqual(Kact / Kexp[t, p], 1.0, 4, '{0} != {1} within 4 places'.format(Kexp[t, p], Kact))
 
+    def test_get_rate_coefficients(self):
+        """
+        Test the Chebyshev.get_rate_coefficients() method.
+        """
+        Tlist = np.array([300, 500, 1000, 1500], np.float64)
+        Plist = np.array([1e4, 1e5, 1e6], np.float64)
+        K = self.chebyshev.get_rate_coefficients(Tlist[:, np.newaxis], Plist[np.newaxis, :])
+        self.assertEqual(K.shape, (4, 3))
+        for t in range(Tlist.shape[0]):
+            for p in range(Plist.shape[0]):
+                Kexp = self.chebyshev.get_rate_coefficient(Tlist[t], Plist[p])
+                self.assertAlmostEqual(K[t, p] / Kexp, 1.0, 10)
+        with self.assertRaises(ValueError):
+            self.chebyshev.get_rate_coefficients(Tlist)
+
     def test_fit_to_data(self):
         """
         Test the Chebyshev.fit_to_data() method.
@@ -25,6 +25,8 @@
 #                                                                             #
 ###############################################################################
 
+cimport numpy as np
+
 from rmgpy.kinetics.model cimport KineticsModel, PDepKineticsModel
 from rmgpy.kinetics.arrhenius cimport Arrhenius
 from rmgpy.quantity cimport ScalarQuantity, ArrayQuantity
@@ -37,6 +39,8 @@ cdef class ThirdBody(PDepKineticsModel):
     
     cpdef double get_rate_coefficient(self, double T, double P=?) except -1
 
+    cpdef np.ndarray get_rate_coefficients(self, np.ndarray Tlist, np.ndarray Plist=?)
+
     cpdef bint is_identical_to(self, KineticsModel other_kinetics) except -2
     
     cpdef change_rate(self, double factor)
@@ -50,6 +54,8 @@ cdef class Lindemann(PDepKineticsModel):
     
     cpdef double get_rate_coefficient(self, double T, double P=?) except -1
 
+    cpdef np.ndarray get_rate_coefficients(self, np.ndarray Tlist, np.ndarray Plist=?)
+
     cpdef bint is_identical_to(self, KineticsModel other_kinetics) except -2
     
     cpdef change_rate(self, double factor)
@@ -65,6 +71,8 @@ cdef class Troe(PDepKineticsModel):
     
     cpdef double get_rate_coefficient(self, double T, double P=?) except -1
 
+    cpdef np.ndarray get_rate_coefficients(self, np.ndarray Tlist, np.ndarray Plist=?)
+
     cpdef bint is_identical_to(self, KineticsModel other_kinetics) except -2
     
     cpdef change_rate(self, double factor)
@@ -32,6 +32,8 @@ This module contains classes representing pressure-dependent kinetics models
 of "standard" falloff.
 """
 
+import numpy as np
+cimport numpy as np
 from libc.math cimport exp, log, log10
 
 cimport rmgpy.constants as constants
@@ -100,6 +102,22 @@ cdef class ThirdBody(PDepKineticsModel):
 
         return k0 * C
 
+    cpdef np.ndarray get_rate_coefficients(self, np.ndarray Tlist, np.ndarray Plist=None):
+        """
+        Return an array of rate coefficients in units of m^3, mol, and s at the
+        temperatures `Tlist` in K and pressures `Plist` in Pa, which are
+        broadcast against each other. As for :meth:`get_rate_coefficient()`,
+        effective pressures should be passed to consider collision efficiencies.
+        """
+        cdef np.ndarray T, P, C, k0
+
+        T, P = np.broadcast_arrays(np.asarray(Tlist, np.float64),
+                                   np.asarray(Plist if Plist is not None else 0.0, np.float64))
+        C = P / constants.R / T  # bath gas concentration in mol/m^3
+        k0 = self.arrheniusLow.get_rate_coefficients(T)
+
+        return k0 * C
+
     cpdef bint is_identical_to(self, KineticsModel other_kinetics) except -2:
         """
         Checks to see if kinetics matches that of other kinetics and returns ``True``
@@ -197,6 +215,24 @@ cdef class Lindemann(PDepKineticsModel):
 
         return kinf * (Pr / (1 + Pr))
 
+    cpdef np.ndarray get_rate_coefficients(self, np.ndarray Tlist, np.ndarray Plist=None):
+        """
+        Return an array of rate coefficients in units of m^3, mol, and s at the
+        temperatures `Tlist` in K and pressures `Plist` in Pa, which are
+        broadcast against each other. As for :meth:`get_rate_coefficient()`,
+        effective pressures should be passed to consider collision efficiencies.
+        """
+        cdef np.ndarray T, P, C, k0, kinf, Pr
+
+        T, P = np.broadcast_arrays(np.asarray(Tlist, np.float64),
+                                   np.asarray(Plist if Plist is not None else 0.0, np.float64))
+        C = P / constants.R / T  # bath gas concentration in mol/m^3
+        k0 = self.arrheniusLow.get_rate_coefficients(T)
+        kinf = self.arrheniusHigh.get_rate_coefficients(T)
+        Pr = k0 * C / kinf
+
+        return kinf * (Pr / (1 + Pr))
+
     cpdef bint is_identical_to(self, KineticsModel other_kinetics) except -2:
         """
         Checks to see if kinetics matches that of other kinetics and returns ``True``
@@ -351,6 +387,41 @@ cdef class Troe(PDepKineticsModel):
 
         return kinf * (Pr / (1 + Pr)) * F
 
+    cpdef np.ndarray get_rate_coefficients(self, np.ndarray Tlist, np.ndarray Plist=None):
+        """
+        Return an array of rate coefficients in units of m^3, mol, and s at the
+        temperatures `Tlist` in K and pressures `Plist` in Pa, which are
+        broadcast against each other. As for :meth:`get_rate_coefficient()`,
+        effective pressures should be passed to consider collision efficiencies.
+        """
+        cdef np.ndarray T, P, C, k0, kinf, Pr
+        cdef np.ndarray n, c, Fcent, F
+        cdef double d, alpha, T1, T2, T3
+
+        T, P = np.broadcast_arrays(np.asarray(Tlist, np.float64),
+                                   np.asarray(Plist if Plist is not None else 0.0, np.float64))
+        C = P / constants.R / T  # bath gas concentration in mol/m^3
+        k0 = self.arrheniusLow.get_rate_coefficients(T)
+        kinf = self.arrheniusHigh.get_rate_coefficients(T)
+        Pr = k0 * C / kinf
+
+        alpha = self.alpha
+        T1 = self._T1.value_si if self._T1 is not None else 0.0
+        T2 = self._T2.value_si if self._T2 is not None else 0.0
+        T3 = self._T3.value_si if self._T3 is not None else 0.0
+
+        if T1 == 0 and T3 == 0:
+            F = np.ones_like(T)
+        else:
+            Fcent = (1 - alpha) * np.exp(-T / T3) + alpha * np.exp(-T / T1)
+            if T2 != 0.0: Fcent += np.exp(-T2 / T)
+            d = 0.14
+            n = 0.75 - 1.27 * np.log10(Fcent)
+            c = -0.4 - 0.67 * np.log10(Fcent)
+            F = 10.0 ** (np.log10(Fcent) / (1 + ((np.log10(Pr) + c) / (n - d * (np.log10(Pr)))) ** 2))
+
+        return kinf * (Pr / (1 + Pr)) * F
+
     cpdef bint is_identical_to(self, KineticsModel other_kinetics) except -2:
         """
         Checks to see if kinetics matches that of other kinetics and returns ``True``
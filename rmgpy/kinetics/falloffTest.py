@@ -394,6 +394,19 @@ class TestLindemann(unittest.TestCase):
                 Kact = self.lindemann.get_rate_coefficient(Tlist[t], Plist[p])
                 self.assertAlmostEqual(Kact, Kexp[t, p], delta=1e-4 * Kexp[t, p])
 
+    def test_get_rate_coefficients(self):
+        """
+        Test the Lindemann.get_rate_coefficients() method.
+        """
+        Tlist = np.array([300, 500, 1000, 1500], np.float64)
+        Plist = np.array([1e4, 1e5, 1e6], np.float64)
+        K = self.lindemann.get_rate_coefficients(Tlist[:, np.newaxis], Plist[np.newaxis, :])
+        self.assertEqual(K.shape, (4, 3))
+        for t in range(Tlist.shape[0]):
+            for p in range(Plist.shape[0]):
+                Kexp = self.lindemann.get_rate_coefficient(Tlist[t], Plist[p])
+                self.assertAlmostEqual(K[t, p], Kexp, delta=1e-10 * Kexp)
+
     def test_pickle(self):
         """
         Test that a Lindemann object can be pickled and unpickled with no loss
@@ -625,6 +638,19 @@ class TestTroe(unittest.TestCase):
                 Kact = self.troe.get_rate_coefficient(Tlist[t], Plist[p])
                 self.assertAlmostEqual(Kact, Kexp[t, p], delta=1e-4 * Kexp[t, p])
 
+    def test_get_rate_coefficients(self):
+        """
+        Test the Troe.get_rate_coefficients() method.
+        """
+        Tlist = np.array([300, 500, 1000, 1500], np.float64)
+        Plist = np.array([1e4, 1e5, 1e6], np.float64)
+        K = self.troe.get_rate_coefficients(Tlist[:, np.newaxis], Plist[np.newaxis, :])
+        self.assertEqual(K.shape, (4, 3))
+        for t in range(Tlist.shape[0]):
+            for p in range(Plist.shape[0]):
+                Kexp = self.troe.get_rate_coefficient(Tlist[t], Plist[p])
+                self.assertAlmostEqual(K[t, p], Kexp, delta=1e-10 * Kexp)
+
     def test_pickle(self):
         """
         Test that a Troe object can be pickled and unpickled with no loss of
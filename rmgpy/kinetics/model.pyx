@@ -183,6 +183,26 @@ cdef class KineticsModel:
         raise NotImplementedError('Unexpected call to KineticsModel.get_rate_coefficient(); '
                                   'you should be using a class derived from KineticsModel.')
 
+    cpdef np.ndarray get_rate_coefficients(self, np.ndarray Tlist, np.ndarray Plist=None):
+        """
+        Return an array of rate coefficients in units of m^3, mol, and s at the
+        temperatures `Tlist` in K and pressures `Plist` in Pa. The two arrays
+        are broadcast against each other. This implementation evaluates
+        :meth:`get_rate_coefficient()` at each point; derived classes override
+        it with a vectorized version where possible.
+        """
+        cdef np.ndarray[np.float64_t, ndim=1] T, P, k
+        cdef int i
+
+        Tlist, Plist = np.broadcast_arrays(np.asarray(Tlist, np.float64),
+                                           np.asarray(Plist if Plist is not None else 0.0, np.float64))
+        T = Tlist.ravel()
+        P = Plist.ravel()
+        k = np.zeros(T.shape[0], np.float64)
+        for i in range(T.shape[0]):
+            k[i] = self.get_rate_coefficient(T[i], P[i])
+        return k.reshape(np.shape(Tlist))
+
     cpdef to_html(self):
         """
         Return an HTML rendering.
@@ -30,13 +30,9 @@
 import contextlib
 import os
 from argparse import Namespace
-from typing import Callable, Union
+from collections import OrderedDict
+from typing import Callable, Dict, List, Sequence, Tuple, Union
 
-try:
-    import chemprop
-except ImportError as e:
-    chemprop = None
-    chemprop_exception = e
 import numpy as np
 
 from rmgpy.molecule import Molecule
@@ -56,16 +52,26 @@ class MLEstimator:
     `hf298_estimator`    :class:`Predictor`      Hf298 estimator
     `s298_cp_estimator`  :class:`Predictor`      S298 and Cp estimator
     `temps`              ``list``                Cp temperatures
+    `max_cache_size`     ``int``                 Maximum number of cached predictions
+    `predictions`        ``OrderedDict``         Cached predictions by SMILES
     ==================== ======================= =======================
+
+    Predictions are cached by SMILES, so that the molecules estimated
+    in a single batch using :meth:`get_thermo_data_batch` are not
+    predicted again when they are requested one at a time. Once the
+    cache holds `max_cache_size` predictions, the least recently used
+    ones are discarded.
     """
 
     # These should correspond to the temperatures that the ML model was
     # trained on for Cp.
     temps = [300.0, 400.0, 500.0, 600.0, 800.0, 1000.0, 1500.0]
 
-    def __init__(self, hf298_path: str, s298_cp_path: str):
+    def __init__(self, hf298_path: str, s298_cp_path: str, max_cache_size: int = 10000):
         self.hf298_estimator = load_estimator(hf298_path)
         self.s298_cp_estimator = load_estimator(s298_cp_path)
+        self.max_cache_size = max_cache_size
+        self.predictions: Dict[str, Tuple[float, np.ndarray]] = OrderedDict()
 
     def get_thermo_data(self, molecule: Union[Molecule, str]) -> ThermoData:
         """
@@ -74,10 +80,55 @@ class MLEstimator:
 
         Returns: ThermoData
         """
-        molecule = Molecule(smiles=molecule) if isinstance(molecule, str) else molecule
+        return self.get_thermo_data_batch([molecule])[0]
+
+    def get_thermo_data_batch(self, molecules: Sequence[Union[Molecule, str]]) -> List[ThermoData]:
+        """
+        Return thermodynamic parameters corresponding to each of the
+        given :class:`Molecule` objects or SMILES strings in `molecules`.
+        All molecules without a cached prediction are featurized and
+        predicted together in a single call of each estimator.
+
+        Returns: list of ThermoData
+        """
+        molecules = [Molecule(smiles=molecule) if isinstance(molecule, str) else molecule
+                     for molecule in molecules]
+        predictions = self.predict([molecule.smiles for molecule in molecules])
+        return [self._make_thermo_data(molecule, *prediction) for molecule, prediction in zip(molecules, predictions)]
+
+    def predict(self, smiles: Sequence[str]) -> List[Tuple[float, np.ndarray]]:
+        """
+        Predict Hf298, S298 and Cp for each SMILES string in `smiles`
+        which is not already in `predictions`, and store the results there.
 
-        hf298 = self.hf298_estimator(molecule.smiles)[0][0]
-        s298_cp = self.s298_cp_estimator(molecule.smiles)[0]
+        Returns: list of (Hf298, [S298, Cp...]) tuples in the order of `smiles`
+        """
+        results = {}
+        for smi in smiles:
+            if smi in self.predictions:
+                self.predictions.move_to_end(smi)
+                results[smi] = self.predictions[smi]
+        new_smiles = list(dict.fromkeys(smi for smi in smiles if smi not in results))
+        if new_smiles:
+            hf298 = self.hf298_estimator(new_smiles)[:, 0]
+            s298_cp = self.s298_cp_estimator(new_smiles)
+            for smi, hf, s_cp in zip(new_smiles, hf298, s298_cp):
+                results[smi] = self.predictions[smi] = (hf, s_cp)
+            while len(self.predictions) > self.max_cache_size:
+                self.predictions.popitem(last=False)
+        return [results[smi] for smi in smiles]
+
+    def clear_cache(self):
+        """
+        Remove all cached predictions.
+        """
+        self.predictions.clear()
+
+    def _make_thermo_data(self, molecule: Molecule, hf298: float, s298_cp: np.ndarray) -> ThermoData:
+        """
+        Return a new :class:`ThermoData` object for `molecule` from the
+        predicted values of Hf298 in kcal/mol and S298 and Cp in cal/(mol*K).
+        """
         s298, cp = s298_cp[0], s298_cp[1:]
 
         cp0 = molecule.calculate_cp0()
@@ -110,15 +161,24 @@ class MLEstimator:
         """
         return self.get_thermo_data(species.molecule[0])
 
+    def get_thermo_data_for_species_batch(self, species_list: Sequence[Species]) -> List[ThermoData]:
+        """
+        Return the sets of thermodynamic parameters corresponding to
+        each :class:`Species` object in `species_list`, predicted in a
+        single batch.
+
+        Returns: list of ThermoData
+        """
+        return self.get_thermo_data_batch([species.molecule[0] for species in species_list])
+
 
 def load_estimator(model_dir: str) -> Callable[[str], np.ndarray]:
     """
     Load chemprop model and return function for evaluating it.
     """
-    if chemprop is None:
-        # Delay chemprop ImportError until we actually try to use it
-        # so that RMG can load successfully without chemprop.
-        raise chemprop_exception
+    # Delay importing chemprop until we actually try to use it
+    # so that RMG can load quickly and successfully without chemprop.
+    import chemprop
 
     args = Namespace()  # Simple class to hold attributes
 
@@ -142,10 +202,12 @@ def load_estimator(model_dir: str) -> Callable[[str], np.ndarray]:
         models.append(chemprop.utils.load_checkpoint(checkpoint_path, cuda=args.cuda))
 
     # Set up estimator
-    def estimator(smi: str):
-        # Make dataset
+    def estimator(smiles: Union[str, Sequence[str]]):
+        # Make dataset with one datapoint for each SMILES string
+        if isinstance(smiles, str):
+            smiles = [smiles]
         data = chemprop.data.MoleculeDataset(
-            [chemprop.data.MoleculeDatapoint(line=[smi], args=args)]
+            [chemprop.data.MoleculeDatapoint(line=[smi], args=args) for smi in smiles]
         )
 
         # Normalize features
@@ -161,7 +223,7 @@ def load_estimator(model_dir: str) -> Callable[[str], np.ndarray]:
                 model_preds = chemprop.train.predict(
                     model=model,
                     data=data,
-                    batch_size=1,  # We'll only predict one molecule at a time
+                    batch_size=len(data),  # Predict all molecules in one forward pass
                     scaler=scaler
                 )
                 sum_preds += np.array(model_preds)
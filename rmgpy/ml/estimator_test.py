@@ -60,3 +60,38 @@ class TestMLEstimator(unittest.TestCase):
         self.assertAlmostEqual(thermo.Cp0.value_si, 33.3, 1)
         self.assertAlmostEqual(thermo.CpInf.value_si, 232.8, 1)
         self.assertEqual(len(thermo.Cpdata.value_si), 7)
+
+    def test_get_thermo_data_batch(self):
+        """
+        Test that predictions made in a batch match individual predictions.
+        """
+        smiles = ['C1C2C1C2', 'CCO', 'C=CC=O', 'CCO']
+        thermo_batch = self.ml_estimator.get_thermo_data_batch(smiles)
+        self.assertEqual(len(thermo_batch), 4)
+        self.assertEqual(len(self.ml_estimator.predictions), 3)
+        # Each call returns new objects, since callers modify the thermo
+        self.assertIsNot(thermo_batch[1], thermo_batch[3])
+
+        self.ml_estimator.clear_cache()
+        for smi, thermo in zip(smiles, thermo_batch):
+            thermo_single = self.ml_estimator.get_thermo_data(smi)
+            self.assertAlmostEqual(thermo.H298.value_si, thermo_single.H298.value_si, 3)
+            self.assertAlmostEqual(thermo.S298.value_si, thermo_single.S298.value_si, 3)
+            for cp1, cp2 in zip(thermo.Cpdata.value_si, thermo_single.Cpdata.value_si):
+                self.assertAlmostEqual(cp1, cp2, 3)
+
+    def test_cache_size(self):
+        """
+        Test that the least recently used predictions are discarded once
+        the cache is full.
+        """
+        self.ml_estimator.max_cache_size = 2
+        self.ml_estimator.get_thermo_data_batch(['CCO', 'C=CC=O'])
+        self.ml_estimator.get_thermo_data('CCO')
+        self.ml_estimator.get_thermo_data('CC')
+        self.assertEqual(list(self.ml_estimator.predictions), ['CCO', 'CC'])
+
+        # Batches larger than the cache are still predicted in full
+        thermo_batch = self.ml_estimator.get_thermo_data_batch(['C1C2C1C2', 'CCO', 'C=CC=O'])
+        self.assertEqual(len(thermo_batch), 3)
+        self.assertEqual(len(self.ml_estimator.predictions), 2)
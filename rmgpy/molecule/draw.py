@@ -61,7 +61,6 @@ import numpy as np
 from rdkit.Chem import AllChem
 
 from rmgpy.molecule.molecule import Molecule
-from rmgpy.qm.molecule import Geometry
 from rmgpy.species import Species
 
 
@@ -412,6 +411,7 @@ class MoleculeDrawer(object):
             # Generate the RDkit molecule from the RDkit molecule, use geometry
             # in order to match the atoms in the rdmol with the atoms in the
             # RMG molecule (which is required to extract coordinates).
+            from rmgpy.qm.molecule import Geometry
             self.geometry = Geometry(None, None, self.molecule, None)
 
             rdmol, rd_atom_idx = self.geometry.rd_build()
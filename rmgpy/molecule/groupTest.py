@@ -352,6 +352,7 @@ class TestGroupAtom(unittest.TestCase):
         unpickled with no loss of information.
         """
         import pickle
+        self.atom.props['inRing'] = True
         atom = pickle.loads(pickle.dumps(self.atom))
         self.assertEqual(len(self.atom.atomtype), len(atom.atomtype))
         self.assertEqual(self.atom.atomtype[0].label, atom.atomtype[0].label)
@@ -359,6 +360,7 @@ class TestGroupAtom(unittest.TestCase):
         self.assertEqual(self.atom.charge, atom.charge)
         self.assertEqual(self.atom.label, atom.label)
         self.assertEqual(self.atom.lone_pairs, atom.lone_pairs)
+        self.assertEqual(self.atom.props, atom.props)
 
     def test_count_bonds(self):
         """
@@ -138,19 +138,43 @@ cdef class SingleExponentialDown(RMGObject):
         :math:`\\matrix{M}_\\mathrm{coll} / \\omega = \\matrix{P} - \\matrix{I}`
         corresponding to this collision model for a given set of energies
         `e_list` in J/mol, temperature `T` in K, and isomer density of states
-        `dens_states`.
+        `dens_states`. The matrix is returned as a dense four-dimensional
+        array, which is very large for the two-dimensional master equation;
+        use :meth:`generate_collision_factors` to avoid storing it.
+        """
+        p0, phi, bandwidth = self.generate_collision_factors(T, dens_states, e_list, j_list)
+        n_j = np.shape(phi)[1]
+        return np.repeat((p0[:, np.newaxis, :] * phi[:, :, np.newaxis])[:, :, :, np.newaxis], n_j, axis=3)
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    def generate_collision_factors(self, double T,
+                                   np.ndarray[np.float64_t,ndim=2] dens_states,
+                                   np.ndarray[np.float64_t,ndim=1] e_list,
+                                   np.ndarray[np.int_t,ndim=1] j_list=None,
+                                   double tol=0.0):
+        """
+        Generate and return the factors of the collision matrix returned by
+        :meth:`generate_collision_matrix`, which uses the strong collision
+        approximation in J to write its elements as :math:`p_0(E,E') \\phi(E,J)`,
+        where :math:`p_0` is the collision matrix of the one-dimensional
+        master equation. Returns a tuple of the
+        `n_grains` x `n_grains` matrix :math:`p_0`, the `n_grains` x `n_j`
+        matrix :math:`\\phi` of the J distribution after a collision into
+        each energy grain, and the half-bandwidth of :math:`p_0`. If `tol` is
+        positive, pairs of entries of :math:`p_0` further from the diagonal
+        than any entry larger than `tol` times its diagonal element are set to
+        zero, so that the matrix is banded.
         """
 
         cdef double alpha, beta
         cdef double c, left, right
-        cdef int n_grains, start, i, r, s, u, v
+        cdef int n_grains, n_j, start, bandwidth, r, s
         cdef np.ndarray[np.float64_t,ndim=1] rho
         cdef np.ndarray[np.float64_t,ndim=2] phi, p0
-        cdef np.ndarray[np.float64_t,ndim=4] p
 
         n_grains = e_list.shape[0]
         n_j = j_list.shape[0] if j_list is not None else 1
-        p = np.zeros((n_grains, n_j, n_grains, n_j), np.float64)
         p0 = np.zeros((n_grains, n_grains), np.float64)
 
         alpha = 1.0 / self.get_alpha(T)
@@ -213,7 +237,21 @@ cdef class SingleExponentialDown(RMGObject):
         #         p0[s,r] *= c
         #     p0[r,r] = p0[r,r] * c - 1
 
-        # If solving the 2D master equation, compute P(E,J,E',J') from P(E,E')
+        # Truncate the negligible transfer far from the diagonal, keeping
+        # pairs of entries together to preserve detailed balance
+        bandwidth = n_grains - 1
+        if tol > 0:
+            bandwidth = 0
+            for r in range(start, n_grains):
+                for s in range(n_grains - 1, r + bandwidth, -1):
+                    if (abs(p0[s, r]) > tol * abs(p0[r, r]) or abs(p0[r, s]) > tol * abs(p0[s, s])):
+                        bandwidth = s - r
+                        break
+            for r in range(n_grains):
+                p0[r, r + bandwidth + 1:] = 0
+                p0[r + bandwidth + 1:, r] = 0
+
+        # If solving the 2D master equation, P(E,J,E',J') is computed from P(E,E')
         # by assuming that the J distribution after the collision is independent
         # of that before the collision (the strong collision approximation in J)
         if n_j > 1:
@@ -222,15 +260,10 @@ cdef class SingleExponentialDown(RMGObject):
                 phi[:,s] = (2 * j_list[s] + 1) * dens_states[:, s]
             for r in range(start, n_grains):
                 phi[r,:] /= rho[r]
-            for r in range(start, n_grains):
-                for s in range(n_j):
-                    for u in range(start, n_grains):
-                        for v in range(n_j):
-                            p[r, s, u, v] = p0[r, u] * phi[r, s]
         else:
-            p[:,0,:,0] = p0
+            phi = np.ones((n_grains, 1), np.float64)
             
-        return p
+        return p0, phi, bandwidth
 
     def calculate_collision_efficiency(self,
                                        double T,
@@ -32,6 +32,9 @@ This module contains unit tests of the :mod:`rmgpy.pdep.collision` module.
 """
 import unittest
 
+import numpy as np
+
+import rmgpy.constants as constants
 from rmgpy.pdep.collision import SingleExponentialDown
 
 
@@ -107,3 +110,74 @@ class TestSingleExponentialDown(unittest.TestCase):
         self.assertAlmostEqual(self.singleExponentialDown.T0.value, singleExponentialDown.T0.value, 6)
         self.assertEqual(self.singleExponentialDown.T0.units, singleExponentialDown.T0.units)
         self.assertAlmostEqual(self.singleExponentialDown.n, singleExponentialDown.n, 4)
+
+    def test_generate_collision_matrix(self):
+        """
+        Test that the collision matrix of a small network matches reference
+        values computed by the former dense implementation, which filled the
+        four-dimensional matrix element by element.
+        """
+        e_list = np.arange(0.0, 4000.0, 1000.0)
+        j_list = np.arange(0, 2, dtype=np.int_)
+        dens_states = np.array([np.exp(e_list / 2000.0), 0.5 * (1 + e_list / 1000.0)]).T
+        # The reference values of p[r, s, u, v], which do not depend on v
+        p_ref = np.array([
+            [[-0.2508034112, 0.07271198385, 0.03543668551, 0.01727031245],
+             [-0.3762051168, 0.1090679758, 0.05315502826, 0.02590546867]],
+            [[0.1062966735, -0.2159485083, 0.06760260613, 0.03294659513],
+             [0.1934165745, -0.3929381736, 0.1230091599, 0.05994936024]],
+            [[0.0757321792, 0.09882734277, -0.2097993261, 0.08128314394],
+             [0.1253714029, 0.1636044643, -0.3473138648, 0.1345607891]],
+            [[0.05395618487, 0.07041057624, 0.1188267374, -0.1504697],
+             [0.07223551303, 0.09426433891, 0.1590829737, -0.2014459695]],
+        ])
+        p = self.singleExponentialDown.generate_collision_matrix(1000., dens_states, e_list, j_list)
+        p0, phi, bandwidth = self.singleExponentialDown.generate_collision_factors(1000., dens_states, e_list, j_list)
+        self.assertEqual(p.shape, (4, 2, 4, 2))
+        for v in range(len(j_list)):
+            self.assertTrue(np.allclose(p[:, :, :, v], p_ref, rtol=1e-9, atol=0))
+        self.assertTrue(np.allclose(p0[:, np.newaxis, :] * phi[:, :, np.newaxis], p_ref, rtol=1e-9, atol=0))
+
+    def test_generate_collision_factors(self):
+        """
+        Test that the factors of the collision matrix reproduce the full
+        collision matrix, and that truncating them gives a banded matrix
+        that still conserves probability and the equilibrium distribution
+        within the tolerance.
+        """
+        e_list = np.arange(0.0, 100000.0, 1000.0)
+        j_list = np.arange(0, 5, dtype=np.int_)
+        dens_states = np.outer(np.exp(e_list / 20000.0), np.ones(len(j_list)))
+        T = 1000.
+        tol = 1e-12
+        p = self.singleExponentialDown.generate_collision_matrix(T, dens_states, e_list, j_list)
+        p0, phi, bandwidth = self.singleExponentialDown.generate_collision_factors(T, dens_states, e_list, j_list)
+        self.assertEqual(p.shape, (len(e_list), len(j_list), len(e_list), len(j_list)))
+        self.assertEqual(bandwidth, len(e_list) - 1)
+        for r in range(len(e_list)):
+            for s in range(len(j_list)):
+                for u in range(len(e_list)):
+                    self.assertAlmostEqual(p[r, s, u, 0], p0[r, u] * phi[r, s], 12)
+
+        p0_band, phi_band, bandwidth = self.singleExponentialDown.generate_collision_factors(
+            T, dens_states, e_list, j_list, tol=tol)
+        self.assertLess(bandwidth, len(e_list) - 1)
+        self.assertTrue(np.array_equal(phi_band, phi))
+        diagonal = np.abs(np.diag(p0))
+        for r in range(len(e_list)):
+            for u in range(len(e_list)):
+                if abs(r - u) > bandwidth:
+                    self.assertEqual(p0_band[r, u], 0)
+                    # Only entries below the tolerance relative to the diagonal are dropped
+                    self.assertLessEqual(abs(p0[r, u]), tol * max(diagonal[r], diagonal[u]))
+                else:
+                    self.assertEqual(p0_band[r, u], p0[r, u])
+
+        # The columns of M_coll / omega still sum to zero, and the equilibrium
+        # distribution is still a steady state, to within the tolerance
+        rho = np.sum((2 * j_list + 1) * dens_states, axis=1)
+        equilibrium = rho * np.exp(-e_list / (constants.R * T))
+        equilibrium /= np.sum(equilibrium)
+        self.assertTrue(np.all(np.abs(np.sum(p0_band, axis=0)) <= len(e_list) * tol * diagonal + 1e-15))
+        self.assertLess(np.max(np.abs(p0_band.dot(equilibrium))),
+                        len(e_list) * tol * np.max(diagonal * equilibrium) + 1e-15)
@@ -217,6 +217,21 @@ cdef class Configuration(object):
         assert self.species[0].energy_transfer_model is not None
         return self.species[0].energy_transfer_model.generate_collision_matrix(T, dens_states, e_list, j_list)
 
+    cpdef tuple generate_collision_factors(self, double T, np.ndarray dens_states, np.ndarray e_list,
+                                           np.ndarray j_list=None, double tol=0.0):
+        """
+        Return the factors of the collisional energy transfer probabilities
+        matrix for the configuration at the given temperature `T` in K as
+        returned by :meth:`SingleExponentialDown.generate_collision_factors`,
+        using the given energies `e_list` in kJ/mol, total angular momentum
+        quantum numbers `j_list` and density of states `dens_states` in
+        mol/kJ. Transfer negligible compared to `tol` is truncated.
+        """
+        assert self.is_unimolecular()
+        assert self.species[0].energy_transfer_model is not None
+        return self.species[0].energy_transfer_model.generate_collision_factors(T, dens_states, e_list, j_list,
+                                                                                 tol)
+
     cpdef calculate_density_of_states(self, np.ndarray e_list, bint active_j_rotor=True, bint active_k_rotor=True,
                                       bint rmgmode=False):
         """
@@ -36,11 +36,17 @@ import logging
 import numpy as np
 cimport numpy as np
 import scipy.linalg
+import scipy.sparse
+import scipy.sparse.linalg
 from libc.math cimport exp, sqrt
 
 import rmgpy.constants as constants
 from rmgpy.exceptions import ChemicallySignificantEigenvaluesError
-from rmgpy.pdep.me import generate_full_me_matrix
+from rmgpy.pdep.me import generate_sparse_me_matrix
+
+# The number of rows of the master equation matrix above which only the
+# chemically significant eigenpairs are found using a sparse eigensolver
+SPARSE_EIGENSOLVER_MIN_ROWS = 2000
 
 ################################################################################
 
@@ -50,7 +56,7 @@ def apply_chemically_significant_eigenvalues_method(network, list lumping_order=
     cdef np.ndarray[np.int_t,ndim=1] j_list
     cdef np.ndarray[np.int_t,ndim=3] indices
     cdef np.ndarray[np.float64_t,ndim=1] e_list, s_mat, s_mat_inv, omega0, omega, eq_ratios
-    cdef np.ndarray[np.float64_t,ndim=2] me_mat, k, eigen_vectors0, eigen_vectors, z_mat, z_mat_inv, y, x
+    cdef np.ndarray[np.float64_t,ndim=2] k, eigen_vectors0, eigen_vectors, z_mat, z_mat_inv, y, x
     cdef np.ndarray[np.float64_t,ndim=3] dens_states
     cdef np.ndarray[np.float64_t,ndim=4] g_nj, pa
     cdef list lumping, unlumping
@@ -64,7 +70,7 @@ def apply_chemically_significant_eigenvalues_method(network, list lumping_order=
     j_list = network.j_list
     dens_states = network.dens_states
     g_nj = network.Gnj
-    eq_ratios = network.eq_ratios
+    eq_ratios = network.eqRatios
     n_isom = network.n_isom
     n_reac = network.n_reac
     n_prod = network.n_prod
@@ -77,9 +83,8 @@ def apply_chemically_significant_eigenvalues_method(network, list lumping_order=
     ym_b = 1.0e-6 * pressure / constants.R / temperature
     
     # Generate the full master equation matrix
-    me_mat, indices = generate_full_me_matrix(network, products=False)
+    me_mat, indices = generate_sparse_me_matrix(network, products=False)
     n_rows = me_mat.shape[0]
-    me_mat[:, n_rows-n_reac:] *= ym_b
     
     # Generate symmetrization matrix and its inverse
     s_mat = np.zeros(n_rows, np.float64)
@@ -99,29 +104,36 @@ def apply_chemically_significant_eigenvalues_method(network, list lumping_order=
 
     # Symmetrize master equation matrix: me_mat = s_mat * Msymm * s_mat_inv
     # Since s_mat and s_mat_inv are diagonal we can do this very efficiently
-    for r in range(n_rows):
-        for s in range(n_rows):
-            me_mat[r, s] = s_mat_inv[r] * me_mat[r, s] * s_mat[s]
+    # The reactant columns are also scaled by the bath gas concentration here
+    s_mat_scaled = s_mat.copy()
+    s_mat_scaled[n_rows - n_reac:] *= ym_b
+    me_mat = (scipy.sparse.diags(s_mat_inv) * me_mat * scipy.sparse.diags(s_mat_scaled)).tocsr()
 
     # DEBUG: Check that the matrix has been properly symmetrized
-    properly_symmetrized = True
-    for r in range(n_rows):
-        for s in range(r):
-            if me_mat[r, s] != 0:
-                if abs(me_mat[r, s] - me_mat[s,r]) > 0.01 * me_mat[r, s]:
-                    if me_mat[r, s] > 1e-200 or me_mat[s,r] > 1e-200:
-                        print(r, s, me_mat[r, s], me_mat[s,r])
-                        properly_symmetrized = False
-    if not properly_symmetrized:
+    lower = scipy.sparse.tril(me_mat, k=-1).tocoo()
+    lower_vals = lower.data
+    upper_vals = np.asarray(me_mat[lower.col, lower.row]).ravel()
+    asymmetric = np.logical_and(np.abs(lower_vals - upper_vals) > 0.01 * lower_vals,
+                                np.logical_or(lower_vals > 1e-200, upper_vals > 1e-200))
+    asymmetric = np.logical_and(asymmetric, lower_vals != 0)
+    if np.any(asymmetric):
+        for r, s, m_rs, m_sr in zip(lower.row[asymmetric], lower.col[asymmetric],
+                                    lower_vals[asymmetric], upper_vals[asymmetric]):
+            print(r, s, m_rs, m_sr)
         raise ChemicallySignificantEigenvaluesError('Master equation matrix not properly symmetrized.')
 
     # Get eigenvalues and eigenvectors
-    # We only need the slowest n_chem + 1 eigenmodes, so only compute those
+    # We only need the slowest n_chem + 1 eigenmodes, so for large matrices
+    # only compute those, using shift-invert mode about a small positive shift
+    # so that the eigenvalues closest to zero converge first
     try:
-        # omega0, eigen_vectors0 = scipy.linalg.eigh(me_mat, eigvals=(n_rows-n_chem-1,n_rows-1),
-        #                                            overwrite_a=True, overwrite_b=True)
-        omega0, eigen_vectors0 = scipy.linalg.eigh(me_mat, overwrite_a=True, overwrite_b=True)
-    except np.linalg.LinAlgError:
+        if n_rows >= SPARSE_EIGENSOLVER_MIN_ROWS and n_chem + 1 < n_rows - 1:
+            sigma = 1e-8 * np.max(np.abs(me_mat.diagonal()))
+            omega0, eigen_vectors0 = scipy.sparse.linalg.eigsh(me_mat.tocsc(), k=n_chem + 1, sigma=sigma,
+                                                               which='LM')
+        else:
+            omega0, eigen_vectors0 = scipy.linalg.eigh(me_mat.toarray(), overwrite_a=True, overwrite_b=True)
+    except (np.linalg.LinAlgError, scipy.sparse.linalg.ArpackError):
         raise ChemicallySignificantEigenvaluesError('Eigenvalue calculation failed to converge.')
 
     # We can't assume that eigh returns them in sorted order
@@ -155,7 +167,7 @@ def apply_chemically_significant_eigenvalues_method(network, list lumping_order=
     #        omega0[ind[-1]], omega0[ind[-2]], omega0[ind[-1]] / omega0[ind[-2]]))
     else:
         lumping = []
-        unlumping = range(n_chem)
+        unlumping = list(range(n_chem))
 
     # Extract the chemically-significant eigenvalues and eigenvectors
     omega = omega0.take(ind[-n_cse:])
@@ -32,6 +32,7 @@ pressure-dependent reaction network.
 
 import numpy as np
 cimport numpy as np
+import scipy.sparse
 from libc.math cimport exp
 
 import rmgpy.constants as constants
@@ -41,19 +42,34 @@ import rmgpy.constants as constants
 
 cpdef generate_full_me_matrix(network, bint products=True):
     """
-    Generate the full master equation matrix for the network.
+    Generate the full master equation matrix for the network as a dense array.
+    Returns the matrix and the accounting matrix `indices` relating isomer,
+    energy grain, and J indices to rows of the master equation matrix.
+    """
+    me_mat, indices = generate_sparse_me_matrix(network, products=products)
+    return me_mat.toarray(), indices
+
+
+cpdef generate_sparse_me_matrix(network, bint products=True):
+    """
+    Generate the full master equation matrix for the network in compressed
+    sparse row format. Only the banded collision blocks of each isomer and the
+    reaction terms coupling grains of the same energy are stored, so the
+    number of nonzero elements grows linearly with the number of grains.
+    Returns the matrix and the accounting matrix `indices` relating isomer,
+    energy grain, and J indices to rows of the master equation matrix.
     """
     
     cdef np.ndarray[np.int_t,ndim=1] j_list
     cdef np.ndarray[np.int_t,ndim=3] indices
     cdef np.ndarray[np.float64_t,ndim=1] e_list
-    cdef np.ndarray[np.float64_t,ndim=2] me_mat
-    cdef np.ndarray[np.float64_t,ndim=3] dens_states
+    cdef np.ndarray[np.int_t,ndim=1] bandwidth, rows, cols
+    cdef np.ndarray[np.float64_t,ndim=1] vals
+    cdef np.ndarray[np.float64_t,ndim=3] dens_states, m_coll, j_dist
     cdef np.ndarray[np.float64_t,ndim=4] k_ij, g_nj, f_im
-    cdef np.ndarray[np.float64_t,ndim=5] m_coll
     cdef double temperature, pressure, beta, val
-    cdef int n_isom, n_reac, n_prod, n_grains, n_j
-    cdef int i, n, r, s, u, v
+    cdef int n_isom, n_reac, n_prod, n_grains, n_j, n_rows, n_states
+    cdef int i, j, n, r, s, u, v, row, col, nnz
 
     temperature = network.T
     # pressure = network.P  # not used in this module
@@ -61,6 +77,8 @@ cpdef generate_full_me_matrix(network, bint products=True):
     j_list = network.j_list
     dens_states = network.dens_states
     m_coll = network.Mcoll
+    j_dist = network.coll_j_dist
+    bandwidth = network.coll_bandwidth
     k_ij = network.Kij
     f_im = network.Fim
     g_nj = network.Gnj
@@ -81,52 +99,72 @@ cpdef generate_full_me_matrix(network, bint products=True):
                 if dens_states[i, r, s] > 0:
                     indices[i, r, s] = n_rows
                     n_rows += 1
+    n_states = n_rows
     n_rows += n_reac
     if products:
         n_rows += n_prod
-    
-    # Construct full ME matrix
-    me_mat = np.zeros([n_rows,n_rows], np.float64)
+
+    # Allocate enough space for the nonzero elements in coordinate format
+    nnz = 0
+    for i in range(n_isom):
+        nnz += n_grains * n_j * min(n_grains, 2 * bandwidth[i] + 1) * n_j
+    nnz += 4 * n_states * (n_isom + n_reac + n_prod)
+    rows = np.zeros(nnz, np.int)
+    cols = np.zeros(nnz, np.int)
+    vals = np.zeros(nnz, np.float64)
+    nnz = 0
     
     # Collision terms
+    # The transfer from grain (u, v) to grain (r, s) is m_coll[i, r, u] * j_dist[i, r, s],
+    # and is negligible if u is more than the bandwidth of m_coll from r
     for i in range(n_isom):
         for r in range(n_grains):
             for s in range(n_j):
-                if indices[i, r, s] > -1:
-                    for u in range(r, n_grains):
-                        for v in range(s, n_j):
-                            me_mat[indices[i, r, s], indices[i,u,v]] = m_coll[i, r, s, u, v]
-                            me_mat[indices[i, u, v], indices[i,r,s]] = m_coll[i, u, v, r, s]
+                row = indices[i, r, s]
+                if row > -1:
+                    for u in range(max(0, r - bandwidth[i]), min(n_grains, r + bandwidth[i] + 1)):
+                        for v in range(n_j):
+                            col = indices[i, u, v]
+                            if col > -1 and m_coll[i, r, u] != 0:
+                                rows[nnz], cols[nnz], vals[nnz] = row, col, m_coll[i, r, u] * j_dist[i, r, s]
+                                nnz += 1
     
     # Isomerization terms
+    # Elements with the same row and column are summed on conversion
     for i in range(n_isom):
         for j in range(i):
             if k_ij[i, j, n_grains - 1,0] > 0 or k_ij[j, i, n_grains - 1,0] > 0:
                 for r in range(n_grains):
                     for s in range(n_j):
-                        u, v = indices[i, r, s], v = indices[j,r,s]
+                        u, v = indices[i, r, s], indices[j, r, s]
                         if u > -1 and v > -1:
-                            me_mat[u, v] = k_ij[j, i, r, s]
-                            me_mat[u, u] -= k_ij[j, i, r, s]
-                            me_mat[u, v] = k_ij[i, j, r, s]
-                            me_mat[v, v] -= k_ij[i, j, r, s]
+                            rows[nnz], cols[nnz], vals[nnz] = v, u, k_ij[j, i, r, s]
+                            rows[nnz + 1], cols[nnz + 1], vals[nnz + 1] = u, u, -k_ij[j, i, r, s]
+                            rows[nnz + 2], cols[nnz + 2], vals[nnz + 2] = u, v, k_ij[i, j, r, s]
+                            rows[nnz + 3], cols[nnz + 3], vals[nnz + 3] = v, v, -k_ij[i, j, r, s]
+                            nnz += 4
     
     # Association/dissociation terms
     for i in range(n_isom):
         for n in range(n_reac + n_prod):
             if g_nj[n, i, n_grains - 1,0] > 0:
+                v = n_rows - n_reac - n_prod + n if products else n_rows - n_reac + n
                 for r in range(n_grains):
                     for s in range(n_j):
                         u = indices[i, r, s]
-                        v = n_rows - n_reac - n_prod + n if products else n_rows - n_reac + n
                         if u > -1:
-                            me_mat[u, u] -= g_nj[n, i, r, s]
+                            rows[nnz], cols[nnz], vals[nnz] = u, u, -g_nj[n, i, r, s]
+                            nnz += 1
                             if n < n_reac or products:
-                                me_mat[u, v] = g_nj[n, i, r, s]
+                                rows[nnz], cols[nnz], vals[nnz] = v, u, g_nj[n, i, r, s]
+                                nnz += 1
                             if n < n_reac:
                                 val = f_im[i, n, r, s] * dens_states[n + n_isom, r, s] \
                                       * (2 * j_list[s] + 1) * exp(-e_list[r] * beta)
-                                me_mat[u,v] = val
-                                me_mat[v,v] -= val
+                                rows[nnz], cols[nnz], vals[nnz] = u, v, val
+                                rows[nnz + 1], cols[nnz + 1], vals[nnz + 1] = v, v, -val
+                                nnz += 2
+
+    me_mat = scipy.sparse.csr_matrix((vals[:nnz], (rows[:nnz], cols[:nnz])), shape=(n_rows, n_rows))
 
     return me_mat, indices
@@ -77,7 +77,9 @@ class Network(object):
     ----------------------- ----------------------------------------------------
     `eqRatios`              An array containing concentration of each isomer and reactant channel present at equilibrium
     `coll_freq`              An array of the frequency of collision between
-    `Mcoll`                 Matrix of first-order rate coefficients for collisional population transfer between grains for each isomer
+    `Mcoll`                 Matrix of first-order rate coefficients for collisional population transfer between energy grains for each isomer
+    `coll_j_dist`           The distribution of J after a collision into each energy grain for each isomer
+    `coll_bandwidth`        The half-bandwidth of the collision matrix of each isomer
     `dens_states`           3D np array of stable configurations, number of grains, and number of J
     ======================= ====================================================
     
@@ -838,6 +840,13 @@ class Network(object):
         Calculate the matrix of first-order rate coefficients for collisional
         population transfer between grains for each isomer, including the
         corresponding collision frequencies.
+
+        The strong collision approximation in J is used to store the transfer
+        from grain (E', J') to grain (E, J) as the product of ``Mcoll[i, E, E']``
+        and ``coll_j_dist[i, E, J]``, instead of a dense matrix over (E, J)
+        pairs. Transfer that is negligible compared to the transfer into each
+        grain is truncated, leaving ``Mcoll[i]`` banded with half-bandwidth
+        ``coll_bandwidth[i]``.
         """
         n_isom = len(self.isomers)
         n_grains = len(self.e_list)
@@ -845,7 +854,9 @@ class Network(object):
 
         try:
             coll_freq = np.zeros(n_isom, np.float64)
-            m_coll = np.zeros((n_isom, n_grains, n_j, n_grains, n_j), np.float64)
+            m_coll = np.zeros((n_isom, n_grains, n_grains), np.float64)
+            j_dist = np.zeros((n_isom, n_grains, n_j), np.float64)
+            bandwidth = np.zeros(n_isom, np.int)
         except MemoryError:
             logging.warning('Collision matrix too large to manage')
             new_n_grains = int(n_grains / 2.0)
@@ -855,11 +866,15 @@ class Network(object):
 
         for i, isomer in enumerate(self.isomers):
             coll_freq[i] = isomer.calculate_collision_frequency(self.T, self.P, self.bath_gas)
-            m_coll[i, :, :, :, :] = coll_freq[i] * isomer.generate_collision_matrix(self.T, self.dens_states[i, :, :],
-                                                                                    self.e_list, self.j_list)
+            p0, j_dist[i, :, :], bandwidth[i] = isomer.generate_collision_factors(self.T, self.dens_states[i, :, :],
+                                                                                   self.e_list, self.j_list,
+                                                                                   tol=1e-12)
+            m_coll[i, :, :] = coll_freq[i] * p0
 
         self.coll_freq = coll_freq
         self.Mcoll = m_coll
+        self.coll_j_dist = j_dist
+        self.coll_bandwidth = bandwidth
 
         return m_coll
 
@@ -901,7 +916,11 @@ class Network(object):
         import rmgpy.pdep.me as me
         return me.generate_full_me_matrix(self, products=products)
 
-    def solve_full_me(self, tlist, x0):
+    def generate_sparse_me_matrix(self, products=True):
+        import rmgpy.pdep.me as me
+        return me.generate_sparse_me_matrix(self, products=products)
+
+    def solve_full_me(self, tlist, x0, sparse=False):
         """
         Directly solve the full master equation using a stiff ODE solver. Pass the
         reaction `network` to solve, the temperature `T` in K and pressure `P` in
@@ -910,10 +929,16 @@ class Network(object):
         equation matrix `M`, the accounting matrix `indices` relating isomer and
         energy grain indices to indices of the master equation matrix, and the
         densities of states `dens_states` in mol/J of each isomer.
+        By default the dense master equation matrix is integrated with VODE. If
+        `sparse` is ``True``, the matrix is instead stored in sparse format and
+        passed as the Jacobian to the BDF solver of :func:`scipy.integrate.solve_ivp`,
+        so the cost of each step scales with the number of nonzero elements rather
+        than the square of the number of grains.
         Returns the times in s, population distributions for each isomer, and total
         population profiles for each configuration.
         """
         import scipy.integrate
+        import scipy.sparse
 
         e_list = self.e_list
         j_list = self.j_list
@@ -926,24 +951,26 @@ class Network(object):
         n_j = len(j_list)
         n_time = len(tlist)
 
-        def residual(t, y, K):
-            return np.dot(K, y)
-
-        def jacobian(t, y, K):
-            return K
-
         ymB = self.P / constants.R / self.T
-        M, indices = self.generate_full_me_matrix()
+        if sparse:
+            M, indices = self.generate_sparse_me_matrix()
+        else:
+            M, indices = self.generate_full_me_matrix()
         n_rows = M.shape[0]
-        M[:, n_rows - n_reac - n_prod:] *= ymB
+        scale = np.ones(n_rows, np.float64)
+        scale[n_rows - n_reac - n_prod:] *= ymB
 
         if self.ymB is not None:
             if isinstance(self.ymB, float):
                 assert n_reac <= 1
-                M[:, n_rows - n_reac - n_prod:] *= self.ymB
+                scale[n_rows - n_reac - n_prod:] *= self.ymB
             else:
                 for n in range(n_reac + n_prod):
-                    M[:, n_rows - n_reac - n_prod + n] *= self.ymB[n]
+                    scale[n_rows - n_reac - n_prod + n] *= self.ymB[n]
+        if sparse:
+            M = (M * scipy.sparse.diags(scale)).tocsc()
+        else:
+            M *= scale
 
         # Get equilibrium distributions
         eq_dist = np.zeros_like(dens_states)
@@ -963,27 +990,41 @@ class Network(object):
         for i in range(n_reac + n_prod):
             p0[-n_reac - n_prod + i] = x0[i + n_isom]
 
-        # Set up ODEs
-        ode = scipy.integrate.ode(residual, jacobian).set_integrator('vode', method='bdf', with_jacobian=True,
-                                                                     atol=1e-16, rtol=1e-8)
-        ode.set_initial_value(p0, 0.0).set_f_params(M).set_jac_params(M)
+        # Solve ODEs
+        if sparse:
+            # The BDF solver uses a sparse LU decomposition when given a sparse Jacobian
+            sol = scipy.integrate.solve_ivp(lambda t, y: M.dot(y), (0.0, tlist[-1]), p0, method='BDF',
+                                            t_eval=tlist, jac=M, atol=1e-16, rtol=1e-8)
+            if not sol.success:
+                raise NetworkError('Integration of the full master equation failed: {0}'.format(sol.message))
+            t_sol, y_sol = sol.t, sol.y.T
+        else:
+            ode = scipy.integrate.ode(lambda t, y: np.dot(M, y), lambda t, y: M)
+            ode.set_integrator('vode', method='bdf', with_jacobian=True, atol=1e-16, rtol=1e-8)
+            ode.set_initial_value(p0, 0.0)
+            t_sol = np.zeros([n_time], float)
+            y_sol = np.zeros([n_time, n_rows], float)
+            for m in range(n_time):
+                ode.integrate(tlist[m])
+                t_sol[m] = ode.t
+                y_sol[m, :] = ode.y
 
         # Generate solution
         t = np.zeros([n_time], float)
         p = np.zeros([n_time, n_isom, n_grains, n_j], float)
         x = np.zeros([n_time, n_isom + n_reac + n_prod], float)
         for m in range(n_time):
-            ode.integrate(tlist[m])
-            t[m] = ode.t
+            y = y_sol[m, :]
+            t[m] = t_sol[m]
             for r in range(n_grains):
                 for s in range(n_j):
                     for i in range(0, n_isom):
                         index = indices[i, r, s]
                         if index > 0:
-                            p[m, i, r, s] += ode.y[index]
-                            x[m, i] += ode.y[index]
+                            p[m, i, r, s] += y[index]
+                            x[m, i] += y[index]
             for n in range(n_isom, n_isom + n_reac + n_prod):
-                x[m, n] = ode.y[-(n_isom + n_reac + n_prod) + n]
+                x[m, n] = y[-(n_isom + n_reac + n_prod) + n]
 
         return t, p, x
 
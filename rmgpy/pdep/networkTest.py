@@ -33,6 +33,11 @@ This script contains unit tests of the :mod:`rmgpy.pdep.network` module.
 
 import unittest
 
+import numpy as np
+import scipy.sparse
+
+import rmgpy.constants as constants
+import rmgpy.pdep.cse as cse
 from rmgpy.pdep.collision import SingleExponentialDown
 from rmgpy.pdep.configuration import Configuration
 from rmgpy.pdep.network import Network
@@ -253,6 +258,126 @@ class TestNetwork(unittest.TestCase):
         for label in attributes:
             self.assertNotIn(label, output)
 
+    def set_master_equation_conditions(self, T=1500., P=1.0e5):
+        """
+        Turn the network into the reversible isomerization n-C4H10O <=> n-C4H8 + H2O and
+        set the master equation conditions to the temperature `T` in K and pressure `P` in Pa.
+        """
+        self.network.reactants, self.network.products = self.network.products, []
+        self.network.initialize(Tmin=300., Tmax=2000., Pmin=1.0e3, Pmax=1.0e7, minimum_grain_count=100)
+        self.network.set_conditions(T, P)
+
+    def test_sparse_me_matrix(self):
+        """
+        Test that the sparse master equation matrix matches the one assembled element by element.
+        """
+        self.set_master_equation_conditions()
+        network = self.network
+        me_mat, indices = network.generate_sparse_me_matrix()
+        self.assertTrue(scipy.sparse.isspmatrix_csr(me_mat))
+
+        n_isom, n_reac, n_prod = network.n_isom, network.n_reac, network.n_prod
+        n_grains, n_j = network.n_grains, network.n_j
+        n_rows = me_mat.shape[0]
+        beta = 1. / (constants.R * network.T)
+        expected = np.zeros((n_rows, n_rows), np.float64)
+        for i in range(n_isom):
+            for r in range(n_grains):
+                for s in range(n_j):
+                    if indices[i, r, s] > -1:
+                        for u in range(n_grains):
+                            for v in range(n_j):
+                                if indices[i, u, v] > -1:
+                                    expected[indices[i, r, s], indices[i, u, v]] += \
+                                        network.Mcoll[i, r, u] * network.coll_j_dist[i, r, s]
+        for i in range(n_isom):
+            for n in range(n_reac + n_prod):
+                v = n_rows - n_reac - n_prod + n
+                for r in range(n_grains):
+                    for s in range(n_j):
+                        u = indices[i, r, s]
+                        if u > -1:
+                            expected[u, u] -= network.Gnj[n, i, r, s]
+                            expected[v, u] += network.Gnj[n, i, r, s]
+                            if n < n_reac:
+                                val = network.Fim[i, n, r, s] * network.dens_states[n + n_isom, r, s] \
+                                      * (2 * network.j_list[s] + 1) * np.exp(-network.e_list[r] * beta)
+                                expected[u, v] += val
+                                expected[v, v] -= val
+
+        self.assertGreater(np.count_nonzero(expected[:-n_reac, -n_reac:]), 0)
+        np.testing.assert_allclose(me_mat.toarray(), expected, rtol=1e-12, atol=0)
+        np.testing.assert_array_equal(network.generate_full_me_matrix()[0], me_mat.toarray())
+
+    def test_cse_sparse_eigensolver(self):
+        """
+        Test that the sparse eigensolver of the chemically-significant eigenvalues method
+        gives the same k(T,P) values as the dense one.
+        """
+        self.set_master_equation_conditions()
+        self.assertLess(self.network.generate_sparse_me_matrix()[0].shape[0], cse.SPARSE_EIGENSOLVER_MIN_ROWS)
+        k_dense, p0_dense = self.network.apply_chemically_significant_eigenvalues_method()
+
+        min_rows = cse.SPARSE_EIGENSOLVER_MIN_ROWS
+        cse.SPARSE_EIGENSOLVER_MIN_ROWS = 0
+        try:
+            k_sparse, p0_sparse = self.network.apply_chemically_significant_eigenvalues_method()
+        finally:
+            cse.SPARSE_EIGENSOLVER_MIN_ROWS = min_rows
+
+        self.assertAlmostEqual(k_sparse[1, 0] / k_dense[1, 0], 1.0, 3)
+        self.assertAlmostEqual(k_sparse[0, 1] / k_dense[0, 1], 1.0, 3)
+
+    def test_cse_rate_coefficients(self):
+        """
+        Test the k(T,P) values of the chemically-significant eigenvalues method.
+        """
+        self.set_master_equation_conditions()
+        k, p0 = self.network.apply_chemically_significant_eigenvalues_method()
+        # n-C4H10O -> n-C4H8 + H2O in s^-1
+        self.assertAlmostEqual(k[1, 0] / 8.652e-5, 1.0, 2)
+        # n-C4H8 + H2O -> n-C4H10O in m^3/(mol*s)
+        self.assertAlmostEqual(k[0, 1] / 1.658e-11, 1.0, 2)
+
+    def test_solve_full_me(self):
+        """
+        Test that directly solving the full master equation gives the rate of dissociation
+        of the isomer to the bimolecular products predicted by the k(T,P) values.
+        """
+        self.set_master_equation_conditions()
+        k, p0 = self.network.apply_chemically_significant_eigenvalues_method()
+
+        tlist = np.array([1e-8, 3e-8, 1e-7])
+        t, p, x = self.network.solve_full_me(tlist, [1.0, 0.0])
+
+        np.testing.assert_allclose(t, tlist)
+        self.assertEqual(p.shape, (3, 1, self.network.n_grains, self.network.n_j))
+        np.testing.assert_allclose(np.sum(p, axis=(1, 2, 3)), x[:, 0])
+        np.testing.assert_allclose(np.sum(x, axis=1), 1.0)
+        np.testing.assert_allclose(x[:, 1] / t, k[1, 0], rtol=1e-2)
+
+    def test_solve_full_me_sparse(self):
+        """
+        Test that solving the full master equation with the sparse BDF solver gives the same
+        populations as the default VODE solver, and the initial rate of formation of the
+        isomer from the bimolecular reactants predicted by the k(T,P) values, which is too
+        small for the VODE solver to resolve.
+        """
+        self.set_master_equation_conditions()
+        k, p0 = self.network.apply_chemically_significant_eigenvalues_method()
+
+        tlist = np.array([1e-8, 3e-8, 1e-7])
+        t, p, x = self.network.solve_full_me(tlist, [1.0, 0.0])
+        t_sparse, p_sparse, x_sparse = self.network.solve_full_me(tlist, [1.0, 0.0], sparse=True)
+        np.testing.assert_allclose(t_sparse, t)
+        np.testing.assert_allclose(x_sparse, x, rtol=1e-6)
+        np.testing.assert_allclose(np.sum(p_sparse, axis=(1, 2, 3)), x_sparse[:, 0])
+
+        t, p, x = self.network.solve_full_me(tlist, [0.0, 1.0], sparse=True)
+        np.testing.assert_allclose(np.sum(x, axis=1), 1.0)
+        rate = k[0, 1] * self.network.P / constants.R / self.network.T
+        np.testing.assert_allclose(x[:, 0] / t, rate, rtol=1e-2)
+
     def test_collision_matrix_memory_handling(self):
         net = Network()
         net.e_list = [1] * 10000
@@ -48,9 +48,8 @@ cpdef apply_reservoir_state_method(network):
     cdef np.ndarray[np.int_t,ndim=3] indices
     cdef np.ndarray[np.float64_t,ndim=1] e_list
     cdef np.ndarray[np.float64_t,ndim=2] active_state_mat, source_vectors, pss_active_state, k
-    cdef np.ndarray[np.float64_t,ndim=3] dens_states, eq_dist
+    cdef np.ndarray[np.float64_t,ndim=3] dens_states, eq_dist, m_coll, j_dist
     cdef np.ndarray[np.float64_t,ndim=4] k_ij, g_nj, f_im, pa
-    cdef np.ndarray[np.float64_t,ndim=5] m_coll
     cdef list ind
     cdef double temperature, tol, y, beta
     cdef int n_isom, n_reac, n_prod, n_grains, n_j, bandwidth, halfbandwidth, width, width0
@@ -60,7 +59,10 @@ cpdef apply_reservoir_state_method(network):
     e_list = network.e_list
     j_list = network.j_list
     dens_states = network.dens_states
+    # The collisional transfer from grain (s, v) to grain (r, u) of isomer i
+    # is m_coll[i, r, s] * j_dist[i, r, u]
     m_coll = network.Mcoll
+    j_dist = network.coll_j_dist
     k_ij = network.Kij
     f_im = network.Fim
     g_nj = network.Gnj
@@ -112,8 +114,8 @@ cpdef apply_reservoir_state_method(network):
     for i in range(n_isom):
         for s in range(n_j):
             r = n_res[i, s]
-            if m_coll[i, r, s, r, s] == 0: continue
-            ratio = np.abs(m_coll[i, :, s, r, s] / m_coll[i, r, s, r, s])
+            if m_coll[i, r, r] * j_dist[i, r, s] == 0: continue
+            ratio = np.abs(m_coll[i, :, r] * j_dist[i, :, s] / (m_coll[i, r, r] * j_dist[i, r, s]))
             ind = [j for j,y in enumerate(ratio) if y > tol]
             if len(ind) > 0:
                 width0 = max(r - min(ind), max(ind) - r)
@@ -135,9 +137,9 @@ cpdef apply_reservoir_state_method(network):
                 for r in range(n_res[i, u], n_grains):
                     for s in range(max(n_res[i, v], r - width), min(n_grains, r + width + 1)):
                         active_state_mat[halfbandwidth + indices[i, r, u] - indices[i, s, v], indices[i, s, v]] = \
-                            m_coll[i, r, u, s, v]
-                    source_vectors[indices[i, r, u], i] = np.sum(m_coll[i, r, u, 0: n_res[i, u], v] *
-                                                                 eq_dist[i, 0: n_res[i, u], v])
+                            m_coll[i, r, s] * j_dist[i, r, u]
+                    source_vectors[indices[i, r, u], i] = j_dist[i, r, u] * np.sum(m_coll[i, r, 0: n_res[i, u]] *
+                                                                                   eq_dist[i, 0: n_res[i, u], v])
 
     # Isomerization terms
     for i in range(n_isom):
@@ -194,15 +196,18 @@ cpdef apply_reservoir_state_method(network):
         for u in range(n_j):
             for v in range(n_j):
                 # Collisional rearrangement within the reservoir of isomer i
-                k[i, i] = k[i, i] + np.sum(np.dot(m_coll[i, 0: n_res[i, u], u, 0: n_res[i, v], v],
+                k[i, i] = k[i, i] + np.sum(j_dist[i, 0: n_res[i, u], u] *
+                                           np.dot(m_coll[i, 0: n_res[i, u], 0: n_res[i, v]],
                                                   eq_dist[i, 0: n_res[i, v], v]))
                 # Isomerization from isomer j to isomer i
                 for j in range(n_isom):
-                    k[i, j] = k[i, j] + np.sum(np.dot(m_coll[i, 0: n_res[i, u], u, n_res[i, v]: n_grains, v],
+                    k[i, j] = k[i, j] + np.sum(j_dist[i, 0: n_res[i, u], u] *
+                                               np.dot(m_coll[i, 0: n_res[i, u], n_res[i, v]: n_grains],
                                                       pa[i, j, n_res[i, v]: n_grains, v]))
                 # Association from reactant n to isomer i
                 for n in range(n_isom, n_isom + n_reac):
-                    k[i, n] = k[i, n] + np.sum(np.dot(m_coll[i, 0: n_res[i, u], u, n_res[i, v]: n_grains, v],
+                    k[i, n] = k[i, n] + np.sum(j_dist[i, 0: n_res[i, u], u] *
+                                               np.dot(m_coll[i, 0: n_res[i, u], n_res[i, v]: n_grains],
                                                       pa[i, n, n_res[i, v]: n_grains, v]))
     # Rows relating to reactants
     for n in range(n_reac):
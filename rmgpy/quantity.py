@@ -699,6 +699,9 @@ class UnitType(object):
         if extra_dimensionality:
             for unit, factor in extra_dimensionality.items():
                 self.extra_dimensionality[pq.Quantity(1.0, unit).simplified.dimensionality] = factor
+        # Cache of the factors for converting each set of units checked so far to this unit type,
+        # with None for units of the same dimensionality that are kept as they are
+        self.conversion_factors = {}
 
     def __call__(self, *args, **kwargs):
         # Make a ScalarQuantity or ArrayQuantity object out of the given parameter
@@ -713,17 +716,22 @@ class UnitType(object):
         if units == self.units or units in self.common_units:
             return quantity
 
-        # Check that the units are consistent with this unit type
-        # This uses the quantities package (slow!)
-        units = pq.Quantity(1.0, units)
-        dimensionality = units.simplified.dimensionality
-        if dimensionality == self.dimensionality:
-            pass
-        elif dimensionality in self.extra_dimensionality:
-            quantity.value_si *= self.extra_dimensionality[dimensionality]
+        try:
+            factor = self.conversion_factors[units]
+        except KeyError:
+            # Check that the units are consistent with this unit type
+            # This uses the quantities package (slow!)
+            dimensionality = pq.Quantity(1.0, units).simplified.dimensionality
+            if dimensionality == self.dimensionality:
+                factor = None
+            elif dimensionality in self.extra_dimensionality:
+                factor = self.extra_dimensionality[dimensionality]
+            else:
+                raise QuantityError('Invalid units {0!r}. Try common units: {1}'.format(units, self.common_units))
+            self.conversion_factors[units] = factor
+        if factor is not None:
+            quantity.value_si *= factor
             quantity.units = self.units
-        else:
-            raise QuantityError('Invalid units {0!r}. Try common units: {1}'.format(quantity.units, self.common_units))
 
         # Return the Quantity or ArrayQuantity object object
         return quantity
@@ -808,6 +816,8 @@ RATECOEFFICIENT_CONVERSION_FACTORS = {
     (pq.m ** 9 / (pq.mol ** 3 * pq.s)).dimensionality: 1.0,
 }
 RATECOEFFICIENT_COMMON_UNITS = ['s^-1', 'm^3/(mol*s)', 'cm^3/(mol*s)', 'm^3/(molecule*s)', 'cm^3/(molecule*s)']
+# Cache of the conversion factors of the other units checked so far, such as those of third-order reactions
+RATECOEFFICIENT_UNITS_CONVERSION_FACTORS = {}
 
 
 def RateCoefficient(*args, **kwargs):
@@ -823,13 +833,17 @@ def RateCoefficient(*args, **kwargs):
     if units in RATECOEFFICIENT_COMMON_UNITS:
         return quantity
 
-    dimensionality = pq.Quantity(1.0, quantity.units).simplified.dimensionality
     try:
-        factor = RATECOEFFICIENT_CONVERSION_FACTORS[dimensionality]
-        quantity.value_si *= factor
+        factor = RATECOEFFICIENT_UNITS_CONVERSION_FACTORS[units]
     except KeyError:
-        raise QuantityError('Invalid units {0!r}. Common units: {1}'
-                            ''.format(quantity.units, RATECOEFFICIENT_COMMON_UNITS))
+        dimensionality = pq.Quantity(1.0, units).simplified.dimensionality
+        try:
+            factor = RATECOEFFICIENT_CONVERSION_FACTORS[dimensionality]
+        except KeyError:
+            raise QuantityError('Invalid units {0!r}. Common units: {1}'
+                                ''.format(quantity.units, RATECOEFFICIENT_COMMON_UNITS))
+        RATECOEFFICIENT_UNITS_CONVERSION_FACTORS[units] = factor
+    quantity.value_si *= factor
 
     # Return the Quantity or ArrayQuantity object object
     return quantity
@@ -859,6 +873,8 @@ SURFACERATECOEFFICIENT_COMMON_UNITS = [
     'm^5/(mol^2*s)', 'cm^5/(mol^2*s)', 'm^5/(molecule^2*s)', 'cm^5/(molecule^2*s)',  # dissociative adsorption
     'm^4/(mol^2*s)', 'cm^4/(mol^2*s)', 'm^4/(molecule^2*s)', 'cm^4/(molecule^2*s)',  # Surface_Bidentate_Dissociation
 ]
+# Cache of the conversion factors of the other units checked so far
+SURFACERATECOEFFICIENT_UNITS_CONVERSION_FACTORS = {}
 
 
 def SurfaceRateCoefficient(*args, **kwargs):
@@ -874,12 +890,16 @@ def SurfaceRateCoefficient(*args, **kwargs):
     if units in SURFACERATECOEFFICIENT_COMMON_UNITS:
         return quantity
 
-    dimensionality = pq.Quantity(1.0, quantity.units).simplified.dimensionality
     try:
-        factor = SURFACERATECOEFFICIENT_CONVERSION_FACTORS[dimensionality]
-        quantity.value_si *= factor
+        factor = SURFACERATECOEFFICIENT_UNITS_CONVERSION_FACTORS[units]
     except KeyError:
-        raise QuantityError('Invalid units {0!r}.'.format(quantity.units))
+        dimensionality = pq.Quantity(1.0, units).simplified.dimensionality
+        try:
+            factor = SURFACERATECOEFFICIENT_CONVERSION_FACTORS[dimensionality]
+        except KeyError:
+            raise QuantityError('Invalid units {0!r}.'.format(quantity.units))
+        SURFACERATECOEFFICIENT_UNITS_CONVERSION_FACTORS[units] = factor
+    quantity.value_si *= factor
 
     # Return the Quantity or ArrayQuantity object object
     return quantity
@@ -217,6 +217,20 @@ class TestEnergy(unittest.TestCase):
         self.assertAlmostEqual(q.value, 10 * 8.314472, delta=1e-6)
         self.assertEqual(q.units, "J/mol")
 
+    def test_repeated_conversion(self):
+        """
+        Test that repeatedly creating energy quantities with uncommon units,
+        whose conversion factors are cached, gives the same results.
+        """
+        for i in range(3):
+            q = quantity.Energy(10.0, "K")
+            self.assertAlmostEqual(q.value, 10 * 8.314472, delta=1e-6)
+            self.assertEqual(q.units, "J/mol")
+            q = quantity.Energy(1000.0, "J/kmol")
+            self.assertAlmostEqual(q.value_si, 1.0, delta=1e-6)
+            self.assertEqual(q.units, "J/kmol")
+            self.assertRaises(quantity.QuantityError, quantity.Energy, 1.0, "kcal")
+
 
 ################################################################################
 
@@ -808,6 +822,19 @@ class TestRateCoefficient(unittest.TestCase):
         self.assertAlmostEqual(q.get_conversion_factor_from_si_to_cm_mol_s(), 1e18,
                                delta=1e3)  # 1 m9/mole3/s  =  1e18 cm9/mol3/s
 
+    def test_repeated_conversion(self):
+        """
+        Test that repeatedly creating rate coefficient quantities with uncommon
+        units, whose conversion factors are cached, gives the same results.
+        """
+        for i in range(3):
+            q = quantity.RateCoefficient(1.0, "cm^6/(mol^2*s)")
+            self.assertAlmostEqual(q.value_si * 1e6 ** 2, 1.0, delta=1e-6)
+            self.assertEqual(q.units, "cm^6/(mol^2*s)")
+            q = quantity.RateCoefficient([1.0, 2.0], "cm^6/(molecule^2*s)")
+            self.assertAlmostEqual(q.value_si[1] * (1e6 / constants.Na) ** 2, 2.0, delta=1e-6)
+            self.assertRaises(quantity.QuantityError, quantity.RateCoefficient, 1.0, "cm^6/(mol^2*K)")
+
 
 ################################################################################
 
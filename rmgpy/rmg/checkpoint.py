@@ -0,0 +1,300 @@
+#!/usr/bin/env python3
+
+###############################################################################
+#                                                                             #
+# RMG - Reaction Mechanism Generator                                          #
+#                                                                             #
+# Copyright (c) 2002-2019 Prof. William H. Green (whgreen@mit.edu),           #
+# Prof. Richard H. West (r.west@neu.edu) and the RMG Team (rmg_dev@mit.edu)   #
+#                                                                             #
+# Permission is hereby granted, free of charge, to any person obtaining a     #
+# copy of this software and associated documentation files (the 'Software'),  #
+# to deal in the Software without restriction, including without limitation   #
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,    #
+# and/or sell copies of the Software, and to permit persons to whom the       #
+# Software is furnished to do so, subject to the following conditions:        #
+#                                                                             #
+# The above copyright notice and this permission notice shall be included in  #
+# all copies or substantial portions of the Software.                         #
+#                                                                             #
+# THE SOFTWARE IS PROVIDED 'AS IS', WITHOUT WARRANTY OF ANY KIND, EXPRESS OR  #
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,    #
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE #
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER      #
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING     #
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER         #
+# DEALINGS IN THE SOFTWARE.                                                   #
+#                                                                             #
+###############################################################################
+
+
+"""
+This module contains functionality for saving and restoring binary checkpoints
+of a :class:`CoreEdgeReactionModel`. A checkpoint is a directory containing
+
+* ``manifest.yml``: the checkpoint format version, RMG version and an index
+  of the numeric arrays stored alongside the model
+* ``model.pkl``: a pickle of the core, edge and surface species and reactions,
+  the ``species_dict`` and ``reaction_dict`` lookup tables and the
+  pressure-dependent networks
+* ``<name>.npy``: one file per reaction filter tensor, which is memory-mapped
+  when the checkpoint is loaded
+
+Unlike restarting from a seed mechanism, restoring a checkpoint does not need
+to regenerate resonance structures, thermo or kinetics for any species or
+reaction, so large jobs can be restarted in seconds.
+"""
+
+import logging
+import os
+import pickle
+import shutil
+
+import numpy as np
+import yaml
+
+from rmgpy.exceptions import InputError
+from rmgpy.version import __version__
+
+################################################################################
+
+CHECKPOINT_VERSION = 1
+
+# The attributes of a CoreEdgeReactionModel which describe the state of the
+# model, as opposed to settings which are loaded from the input file
+MODEL_STATE_ATTRIBUTES = [
+    'core',
+    'edge',
+    'surface',
+    'network_dict',
+    'network_list',
+    'network_count',
+    'species_dict',
+    'reaction_dict',
+    'species_counter',
+    'reaction_counter',
+    'index_species_dict',
+    'iteration_num',
+]
+
+# Species attributes which are not retained by Species.__reduce__
+SPECIES_STATE_ATTRIBUTES = [
+    'creation_iteration',
+    'explicitly_allowed',
+    'is_solvent',
+    'symmetry_number',
+]
+
+FILTER_ARRAYS = [
+    'unimolecular_threshold',
+    'bimolecular_threshold',
+    'trimolecular_threshold',
+]
+
+
+def save_checkpoint(rmg, path):
+    """
+    Save a binary checkpoint of the reaction model of the :class:`RMG` job
+    `rmg` to the directory `path`.
+
+    The checkpoint is first written to a temporary directory which then
+    replaces the existing checkpoint, so that an interrupted write never
+    leaves a partial checkpoint behind.
+    """
+    path = os.path.abspath(path)
+    temp_path = path + '_tmp'
+    old_path = path + '_old'
+
+    if os.path.exists(temp_path):
+        shutil.rmtree(temp_path)
+    os.mkdir(temp_path)
+
+    reaction_model = rmg.reaction_model
+    all_species = reaction_model.core.species + reaction_model.edge.species
+    payload = {
+        'model': {attr: getattr(reaction_model, attr) for attr in MODEL_STATE_ATTRIBUTES},
+        'species_state': [(spc, [getattr(spc, attr) for attr in SPECIES_STATE_ATTRIBUTES]) for spc in all_species],
+    }
+    with open(os.path.join(temp_path, 'model.pkl'), 'wb') as f:
+        pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    arrays = {}
+    for name in FILTER_ARRAYS:
+        array = getattr(rmg, name)
+        if array is not None:
+            np.save(os.path.join(temp_path, name + '.npy'), np.ascontiguousarray(array))
+            arrays[name] = list(array.shape)
+
+    manifest = {
+        'checkpoint_version': CHECKPOINT_VERSION,
+        'rmg_version': __version__,
+        'iteration': reaction_model.iteration_num,
+        'num_core_species': len(reaction_model.core.species),
+        'num_core_reactions': len(reaction_model.core.reactions),
+        'num_edge_species': len(reaction_model.edge.species),
+        'num_edge_reactions': len(reaction_model.edge.reactions),
+        'arrays': arrays,
+    }
+    with open(os.path.join(temp_path, 'manifest.yml'), 'w') as f:
+        yaml.safe_dump(manifest, f, default_flow_style=False)
+
+    # Swap the new checkpoint into place
+    if os.path.exists(old_path):
+        shutil.rmtree(old_path)
+    if os.path.exists(path):
+        os.rename(path, old_path)
+    os.rename(temp_path, path)
+    if os.path.exists(old_path):
+        shutil.rmtree(old_path)
+
+
+def read_checkpoint_manifest(path):
+    """
+    Read and validate the manifest of the checkpoint in the directory `path`.
+    If the checkpoint was interrupted while being replaced, the previous
+    checkpoint is used instead. Returns the checkpoint directory and the
+    manifest as a dictionary.
+    """
+    path = os.path.abspath(path)
+    if not os.path.exists(os.path.join(path, 'manifest.yml')) and \
+            os.path.exists(os.path.join(path + '_old', 'manifest.yml')):
+        logging.warning('Checkpoint {0} is incomplete; using the previous checkpoint instead.'.format(path))
+        path = path + '_old'
+
+    try:
+        with open(os.path.join(path, 'manifest.yml'), 'r') as f:
+            manifest = yaml.safe_load(f)
+    except IOError:
+        raise InputError('Unable to find a valid RMG checkpoint at {0}.'.format(path))
+
+    version = manifest.get('checkpoint_version')
+    if version != CHECKPOINT_VERSION:
+        raise InputError('Checkpoint {0} has format version {1}, but this version of RMG can only read format '
+                         'version {2}.'.format(path, version, CHECKPOINT_VERSION))
+    if manifest.get('rmg_version') != __version__:
+        logging.warning('Checkpoint {0} was written by RMG-Py {1}, but this is RMG-Py {2}.'.format(
+            path, manifest.get('rmg_version'), __version__))
+
+    return path, manifest
+
+
+def load_checkpoint(path):
+    """
+    Load the checkpoint in the directory `path`. Returns a dictionary of the
+    reaction model state attributes and a dictionary of the reaction filter
+    tensors. The filter tensors are memory-mapped copy-on-write, so they can
+    be modified in place without altering the checkpoint on disk.
+    """
+    path, manifest = read_checkpoint_manifest(path)
+
+    with open(os.path.join(path, 'model.pkl'), 'rb') as f:
+        payload = pickle.load(f)
+
+    for spc, values in payload['species_state']:
+        for attr, value in zip(SPECIES_STATE_ATTRIBUTES, values):
+            setattr(spc, attr, value)
+
+    arrays = {}
+    for name in manifest['arrays']:
+        arrays[name] = np.load(os.path.join(path, name + '.npy'), mmap_mode='c')
+
+    logging.info('Loaded checkpoint from iteration {0} with {1} core species and {2} edge species.'.format(
+        manifest['iteration'], manifest['num_core_species'], manifest['num_edge_species']))
+
+    return payload['model'], arrays
+
+
+def restore_checkpoint(rmg, path):
+    """
+    Restore the reaction model state of the :class:`RMG` job `rmg` from the
+    checkpoint in the directory `path`. Model settings such as the kinetics
+    estimator or pressure dependence settings are not stored in the checkpoint
+    and are retained from the current job.
+
+    The input species and the species referenced by the reaction systems are
+    replaced by the matching species in the restored model. Input species
+    which were not found in the checkpoint are registered with the restored
+    model and are returned as a list.
+    """
+    model_state, arrays = load_checkpoint(path)
+
+    # Species created while reading the input file belong to the model being replaced
+    input_species = rmg.initial_species
+    for attr, value in model_state.items():
+        setattr(rmg.reaction_model, attr, value)
+    rmg.reaction_model.species_cache = [None for _ in range(4)]
+
+    species_map = {}
+    new_species = []
+    for spc in input_species:
+        match = rmg.reaction_model.check_for_existing_species(spc.molecule[0])
+        if match is None:
+            # Species not present in the checkpoint must be added to the restored model
+            rmg.reaction_model.species_counter += 1
+            spc.index = rmg.reaction_model.species_counter if spc.reactive else -1
+            formula = spc.molecule[0].get_formula()
+            rmg.reaction_model.species_dict.setdefault(formula, []).append(spc)
+            if spc.reactive:
+                rmg.reaction_model.index_species_dict[spc.index] = spc
+            new_species.append(spc)
+        else:
+            species_map[spc] = match
+    rmg.initial_species = [species_map.get(spc, spc) for spc in input_species]
+    for reaction_system in rmg.reaction_systems:
+        remap_reaction_system_species(reaction_system, species_map)
+
+    for name in FILTER_ARRAYS:
+        setattr(rmg, name, arrays.get(name))
+
+    return new_species
+
+
+def remap_reaction_system_species(reaction_system, species_map):
+    """
+    Replace the species objects referenced by `reaction_system` according to
+    the dictionary `species_map`.
+    """
+    for attr in ['initial_mole_fractions', 'initial_concentrations',
+                 'initial_gas_mole_fractions', 'initial_surface_coverages']:
+        values = getattr(reaction_system, attr, None)
+        if values:
+            setattr(reaction_system, attr, {species_map.get(spc, spc): value for spc, value in values.items()})
+
+    if reaction_system.sensitive_species:
+        reaction_system.sensitive_species = [species_map.get(spc, spc) for spc in reaction_system.sensitive_species]
+
+    for term in reaction_system.termination:
+        species = getattr(term, 'species', None)
+        if species is not None:
+            term.species = species_map.get(species, species)
+
+
+class CheckpointWriter(object):
+    """
+    This class listens to a RMG subject
+    and writes a binary checkpoint of the current state of the RMG model
+    to a checkpoint subfolder.
+
+    A new instance of the class can be appended to a subject as follows:
+
+    rmg = ...
+    listener = CheckpointWriter(outputDirectory)
+    rmg.attach(listener)
+
+    Whenever the subject calls the .notify() method, the
+    .update() method of the listener will be called.
+
+    To stop listening to the subject, the class can be detached
+    from its subject:
+
+    rmg.detach(listener)
+
+    """
+
+    def __init__(self, output_directory=''):
+        super(CheckpointWriter, self).__init__()
+        self.path = os.path.join(output_directory, 'checkpoint')
+
+    def update(self, rmg):
+        logging.info('Saving checkpoint...')
+        save_checkpoint(rmg, self.path)
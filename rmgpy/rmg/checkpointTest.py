@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+
+###############################################################################
+#                                                                             #
+# RMG - Reaction Mechanism Generator                                          #
+#                                                                             #
+# Copyright (c) 2002-2019 Prof. William H. Green (whgreen@mit.edu),           #
+# Prof. Richard H. West (r.west@neu.edu) and the RMG Team (rmg_dev@mit.edu)   #
+#                                                                             #
+# Permission is hereby granted, free of charge, to any person obtaining a     #
+# copy of this software and associated documentation files (the 'Software'),  #
+# to deal in the Software without restriction, including without limitation   #
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,    #
+# and/or sell copies of the Software, and to permit persons to whom the       #
+# Software is furnished to do so, subject to the following conditions:        #
+#                                                                             #
+# The above copyright notice and this permission notice shall be included in  #
+# all copies or substantial portions of the Software.                         #
+#                                                                             #
+# THE SOFTWARE IS PROVIDED 'AS IS', WITHOUT WARRANTY OF ANY KIND, EXPRESS OR  #
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,    #
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE #
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER      #
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING     #
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER         #
+# DEALINGS IN THE SOFTWARE.                                                   #
+#                                                                             #
+###############################################################################
+
+
+"""
+This module contains unit tests of the rmgpy.rmg.checkpoint module.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+import yaml
+
+from rmgpy.exceptions import InputError
+from rmgpy.kinetics import Arrhenius
+from rmgpy.reaction import Reaction
+from rmgpy.rmg.checkpoint import save_checkpoint, load_checkpoint, restore_checkpoint
+from rmgpy.rmg.main import RMG
+from rmgpy.rmg.model import CoreEdgeReactionModel
+from rmgpy.species import Species
+
+################################################################################
+
+
+class TestCheckpoint(unittest.TestCase):
+    """
+    Contains unit tests for saving and restoring reaction model checkpoints.
+    """
+
+    def setUp(self):
+        """
+        A function run before each unit test in this class.
+        """
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'checkpoint')
+
+        self.rmg = RMG(output_directory=self.directory)
+        self.rmg.reaction_model = CoreEdgeReactionModel()
+        self.rmg.reaction_systems = []
+
+        model = self.rmg.reaction_model
+        self.ch4, _ = model.make_new_species(Species().from_smiles('C'), label='CH4', generate_thermo=False)
+        self.ch3, _ = model.make_new_species(Species().from_smiles('[CH3]'), label='CH3', generate_thermo=False)
+        self.h, _ = model.make_new_species(Species().from_smiles('[H]'), label='H', generate_thermo=False)
+        self.h.creation_iteration = 3
+        model.core.species = [self.ch4, self.h]
+        model.edge.species = [self.ch3]
+
+        rxn = Reaction(reactants=[self.ch4], products=[self.ch3, self.h],
+                       kinetics=Arrhenius(A=(1e13, 's^-1'), n=0, Ea=(100, 'kcal/mol'), T0=(1, 'K')))
+        rxn.family = 'test'
+        model.edge.reactions = [rxn]
+        model.register_reaction(rxn)
+        model.iteration_num = 5
+
+        self.rmg.unimolecular_threshold = np.array([True, False])
+        self.rmg.bimolecular_threshold = np.array([[True, False], [False, False]])
+
+    def tearDown(self):
+        """
+        A function run after each unit test in this class.
+        """
+        shutil.rmtree(self.directory)
+
+    def test_save_and_load_checkpoint(self):
+        """
+        Test that a saved checkpoint can be loaded again
+        """
+        save_checkpoint(self.rmg, self.path)
+        self.assertTrue(os.path.exists(os.path.join(self.path, 'manifest.yml')))
+        self.assertFalse(os.path.exists(self.path + '_tmp'))
+
+        model_state, arrays = load_checkpoint(self.path)
+        self.assertEqual(model_state['iteration_num'], 5)
+        self.assertEqual([spc.label for spc in model_state['core'].species], ['CH4', 'H'])
+        self.assertEqual([spc.label for spc in model_state['edge'].species], ['CH3'])
+        self.assertEqual(model_state['core'].species[1].creation_iteration, 3)
+
+        # References between reactions, species and the reaction dictionary are retained
+        rxn = model_state['edge'].reactions[0]
+        self.assertIs(rxn.reactants[0], model_state['core'].species[0])
+        self.assertIs(rxn.products[0], model_state['edge'].species[0])
+        self.assertIs(model_state['reaction_dict']['test']['CH4'][None][0], rxn)
+        self.assertAlmostEqual(rxn.kinetics.A.value_si, 1e13)
+
+        # Filter tensors are memory-mapped copy-on-write
+        self.assertTrue(np.array_equal(arrays['unimolecular_threshold'], [True, False]))
+        self.assertTrue(np.array_equal(arrays['bimolecular_threshold'], [[True, False], [False, False]]))
+        self.assertNotIn('trimolecular_threshold', arrays)
+        arrays['unimolecular_threshold'][1] = True
+        _, arrays = load_checkpoint(self.path)
+        self.assertFalse(arrays['unimolecular_threshold'][1])
+
+    def test_overwrite_checkpoint(self):
+        """
+        Test that saving a checkpoint replaces the previous one
+        """
+        save_checkpoint(self.rmg, self.path)
+        self.rmg.reaction_model.iteration_num = 6
+        save_checkpoint(self.rmg, self.path)
+        self.assertFalse(os.path.exists(self.path + '_old'))
+        model_state, _ = load_checkpoint(self.path)
+        self.assertEqual(model_state['iteration_num'], 6)
+
+    def test_load_checkpoint_with_wrong_version(self):
+        """
+        Test that loading a checkpoint with an unsupported format version raises an InputError
+        """
+        save_checkpoint(self.rmg, self.path)
+        manifest_path = os.path.join(self.path, 'manifest.yml')
+        with open(manifest_path, 'r') as f:
+            manifest = yaml.safe_load(f)
+        manifest['checkpoint_version'] = -1
+        with open(manifest_path, 'w') as f:
+            yaml.safe_dump(manifest, f)
+        with self.assertRaises(InputError):
+            load_checkpoint(self.path)
+
+    def test_restore_checkpoint(self):
+        """
+        Test that input species are mapped onto the species in the restored model
+        """
+        save_checkpoint(self.rmg, self.path)
+
+        rmg = RMG(output_directory=self.directory)
+        rmg.reaction_model = CoreEdgeReactionModel()
+        rmg.reaction_systems = []
+        ch4, _ = rmg.reaction_model.make_new_species(Species().from_smiles('C'), label='CH4', generate_thermo=False)
+        c2h6, _ = rmg.reaction_model.make_new_species(Species().from_smiles('CC'), label='C2H6', generate_thermo=False)
+        rmg.initial_species = [ch4, c2h6]
+
+        new_species = restore_checkpoint(rmg, self.path)
+
+        self.assertEqual(new_species, [c2h6])
+        self.assertIs(rmg.initial_species[0], rmg.reaction_model.core.species[0])
+        self.assertIs(rmg.initial_species[1], c2h6)
+        self.assertEqual(c2h6.index, 4)
+        self.assertEqual(rmg.reaction_model.iteration_num, 5)
+        self.assertTrue(np.array_equal(rmg.unimolecular_threshold, [True, False]))
+        self.assertIsNone(rmg.trimolecular_threshold)
+
+
+################################################################################
+
+if __name__ == '__main__':
+    unittest.main(testRunner=unittest.TextTestRunner(verbosity=2))
@@ -61,6 +61,7 @@ def database(
         kineticsFamilies='default',
         kineticsDepositories='default',
         kineticsEstimator='rate rules',
+        cacheDirectory=None,
 ):
     # This function just stores the information about the database to be loaded
     # We don't actually load the database until after we're finished reading
@@ -76,6 +77,7 @@ def database(
     rmg.seed_mechanisms = as_list(seedMechanisms, default=[])
     rmg.statmech_libraries = as_list(frequenciesLibraries, default=[])
     rmg.kinetics_estimator = kineticsEstimator
+    rmg.database_cache_directory = cacheDirectory
 
     if kineticsDepositories == 'default':
         rmg.kinetics_depositories = ['training']
@@ -189,6 +191,8 @@ def simple_reactor(temperature,
                    sensitivityTemperature=None,
                    sensitivityPressure=None,
                    sensitivityMoleFractions=None,
+                   sensitivityMethod='forward',
+                   sensitivityTimes=None,
                    constantSpecies=None):
     logging.debug('Found SimpleReactor reaction system')
 
@@ -270,6 +274,7 @@ def simple_reactor(temperature,
         sens_conditions['P'] = Quantity(sensitivityPressure).value_si
 
     system = SimpleReactor(T, P, initialMoleFractions, nSims, termination, sensitive_species, sensitivityThreshold, sens_conditions, constantSpecies)
+    set_sensitivity_method(system, sensitivityMethod, sensitivityTimes)
     rmg.reaction_systems.append(system)
 
     assert balanceSpecies is None or isinstance(balanceSpecies, str), 'balanceSpecies should be the string corresponding to a single species'
@@ -301,6 +306,8 @@ def liquid_reactor(temperature,
                    sensitivityThreshold=1e-3,
                    sensitivityTemperature=None,
                    sensitivityConcentrations=None,
+                   sensitivityMethod='forward',
+                   sensitivityTimes=None,
                    constantSpecies=None):
     logging.debug('Found LiquidReactor reaction system')
 
@@ -363,9 +370,25 @@ def liquid_reactor(temperature,
 
     system = LiquidReactor(T, initialConcentrations, nSims, termination, sensitive_species, sensitivityThreshold,
                            sens_conditions, constantSpecies)
+    set_sensitivity_method(system, sensitivityMethod, sensitivityTimes)
     rmg.reaction_systems.append(system)
 
 
+def set_sensitivity_method(system, method, times=None):
+    """
+    Set the sensitivity analysis `method` of the reaction `system`, either
+    'forward' or 'adjoint'. For the adjoint method, sensitivities are reported
+    at the given `times`, each given as (value, units), or at the final time.
+    """
+    if method not in ('forward', 'adjoint'):
+        raise InputError("sensitivityMethod should be either 'forward' or 'adjoint', not {0!r}.".format(method))
+    if times is not None and method != 'adjoint':
+        raise InputError('sensitivityTimes can only be specified with the adjoint sensitivity method.')
+    system.sensitivity_method = method
+    if times is not None:
+        system.sensitivity_times = [Quantity(time).value_si for time in times]
+
+
 # Reaction systems
 def surface_reactor(temperature,
                     initialPressure,
@@ -723,7 +746,8 @@ def pressure_dependence(
 
 def options(name='Seed', generateSeedEachIteration=True, saveSeedToDatabase=False, units='si', saveRestartPeriod=None,
             generateOutputHTML=False, generatePlots=False, saveSimulationProfiles=False, verboseComments=False,
-            saveEdgeSpecies=False, keepIrreversible=False, trimolecularProductReversible=True, wallTime='00:00:00:00'):
+            saveEdgeSpecies=False, keepIrreversible=False, trimolecularProductReversible=True, wallTime='00:00:00:00',
+            saveCheckpoint=False, saveChemkinSnapshots=True, simulationProfileFormat='csv'):
     if saveRestartPeriod:
         logging.warning("`saveRestartPeriod` flag was set in the input file, but this feature has been removed. Please "
                         "remove this line from the input file. This will throw an error after RMG-Py 3.1. For "
@@ -739,6 +763,10 @@ def options(name='Seed', generateSeedEachIteration=True, saveSeedToDatabase=Fals
     rmg.generate_output_html = generateOutputHTML
     rmg.generate_plots = generatePlots
     rmg.save_simulation_profiles = saveSimulationProfiles
+    if simulationProfileFormat not in ('csv', 'binary'):
+        raise InputError("simulationProfileFormat should be either 'csv' or 'binary', not {0!r}.".format(
+            simulationProfileFormat))
+    rmg.simulation_profile_format = simulationProfileFormat
     rmg.verbose_comments = verboseComments
     if saveEdgeSpecies:
         logging.warning(
@@ -747,6 +775,8 @@ def options(name='Seed', generateSeedEachIteration=True, saveSeedToDatabase=Fals
     rmg.keep_irreversible = keepIrreversible
     rmg.trimolecular_product_reversible = trimolecularProductReversible
     rmg.walltime = wallTime
+    rmg.save_checkpoint = saveCheckpoint
+    rmg.save_chemkin_snapshots = saveChemkinSnapshots
 
 
 def generated_species_constraints(**kwargs):
@@ -803,6 +833,10 @@ def uncertainty(localAnalysis=False, globalAnalysis=False, uncorrelated=True, co
 
 
 def restart_from_seed(path=None, coreSeed=None, edgeSeed=None, filters=None, speciesMap=None):
+    if rmg.checkpoint_path:
+        raise InputError('An RMG job can be restarted either from a seed mechanism or from a checkpoint, but not '
+                         'both. Please remove either `restartFromSeed` or `restartFromCheckpoint` from the input '
+                         'file.')
     parent_dir = os.path.dirname(rmg.input_file)
     rmg.restart = True
     doc_link = 'http://reactionmechanismgenerator.github.io/RMG-Py/users/rmg/input.html#restarting-from-a-seed-mechanism.'
@@ -847,6 +881,21 @@ def restart_from_seed(path=None, coreSeed=None, edgeSeed=None, filters=None, spe
                                                                                                             doc_link))
 
 
+def restart_from_checkpoint(path):
+    if rmg.restart:
+        raise InputError('An RMG job can be restarted either from a seed mechanism or from a checkpoint, but not '
+                         'both. Please remove either `restartFromSeed` or `restartFromCheckpoint` from the input '
+                         'file.')
+
+    if not os.path.isabs(path):
+        path = os.path.join(os.path.dirname(rmg.input_file), path)
+
+    if not os.path.exists(path) and not os.path.exists(path + '_old'):
+        raise InputError('Unable to find the checkpoint to restart from. {0} does not exist'.format(path))
+
+    rmg.checkpoint_path = path
+
+
 ################################################################################
 
 def set_global_rmg(rmg0):
@@ -910,6 +959,7 @@ def read_input_file(path, rmg0):
         'thermoCentralDatabase': thermo_central_database,
         'uncertainty': uncertainty,
         'restartFromSeed': restart_from_seed,
+        'restartFromCheckpoint': restart_from_checkpoint,
     }
 
     try:
@@ -1012,6 +1062,8 @@ def save_input_file(path, rmg):
     f.write('    kinetics_depositories = {0!r},\n'.format(rmg.kinetics_depositories))
     f.write('    kineticsFamilies = {0!r},\n'.format(rmg.kinetics_families))
     f.write('    kineticsEstimator = {0!r},\n'.format(rmg.kinetics_estimator))
+    if rmg.database_cache_directory:
+        f.write('    cacheDirectory = {0!r},\n'.format(rmg.database_cache_directory))
     f.write(')\n\n')
 
     if rmg.surfaceSiteDenisty or rmg.binding_energies:
@@ -1154,11 +1206,14 @@ def save_input_file(path, rmg):
     f.write('    generateOutputHTML = {0},\n'.format(rmg.generate_output_html))
     f.write('    generatePlots = {0},\n'.format(rmg.generate_plots))
     f.write('    saveSimulationProfiles = {0},\n'.format(rmg.save_simulation_profiles))
+    f.write('    simulationProfileFormat = {0!r},\n'.format(rmg.simulation_profile_format))
     f.write('    saveEdgeSpecies = {0},\n'.format(rmg.save_edge_species))
     f.write('    keepIrreversible = {0},\n'.format(rmg.keep_irreversible))
     f.write('    trimolecularProductReversible = {0},\n'.format(rmg.trimolecular_product_reversible))
     f.write('    verboseComments = {0},\n'.format(rmg.verbose_comments))
     f.write('    wallTime = {0},\n'.format(rmg.walltime))
+    f.write('    saveCheckpoint = {0},\n'.format(rmg.save_checkpoint))
+    f.write('    saveChemkinSnapshots = {0},\n'.format(rmg.save_chemkin_snapshots))
     f.write(')\n\n')
 
     f.close()
@@ -28,10 +28,14 @@
 ###############################################################################
 
 import csv
+import json
 import os
+import struct
+import tempfile
+
+import numpy as np
 
 from rmgpy.chemkin import get_species_identifier
-from rmgpy.tools.plot import SimulationPlot
 
 
 class SimulationProfileWriter(object):
@@ -40,6 +44,14 @@ class SimulationProfileWriter(object):
     and writes the species mole numbers as a function of the reaction time
     to a csv file.
 
+    If `binary` is ``True``, the profiles are instead written to a binary
+    ``.dat`` file (see :func:`load_simulation_profile` for the format). Only
+    the snapshots which were not written by a previous update of the same
+    simulation are appended to the file, so adding the listener to the
+    ``snapshot_listeners`` of the reaction system as well writes the profile
+    in chunks while the simulation runs. Each simulation still starts a new
+    file, named after the number of core species. A binary profile can be
+    converted to the csv format using :func:`convert_simulation_profile_to_csv`.
 
     A new instance of the class can be appended to a subject as follows:
     
@@ -57,12 +69,19 @@ class SimulationProfileWriter(object):
 
     """
 
-    def __init__(self, output_directory, reaction_sys_index, core_species):
+    def __init__(self, output_directory, reaction_sys_index, core_species, binary=False):
         super(SimulationProfileWriter, self).__init__()
 
         self.output_directory = output_directory
         self.reaction_sys_index = reaction_sys_index
         self.core_species = core_species
+        self.binary = binary
+
+        # The snapshot list and file which were last written in binary mode,
+        # and the number of snapshots already written to that file
+        self._snapshots = None
+        self._filename = None
+        self._num_written = 0
 
     def update(self, reaction_system):
         """
@@ -78,8 +97,8 @@ class SimulationProfileWriter(object):
         filename = os.path.join(
             self.output_directory,
             'solver',
-            'simulation_{0}_{1:d}.csv'.format(
-                self.reaction_sys_index + 1, len(self.core_species)
+            'simulation_{0}_{1:d}.{2}'.format(
+                self.reaction_sys_index + 1, len(self.core_species), 'dat' if self.binary else 'csv'
             )
         )
 
@@ -87,6 +106,10 @@ class SimulationProfileWriter(object):
         for spc in self.core_species:
             header.append(get_species_identifier(spc))
 
+        if self.binary:
+            self.append_binary(filename, header, reaction_system.snapshots)
+            return
+
         with open(filename, 'w') as csvfile:
             worksheet = csv.writer(csvfile)
 
@@ -96,6 +119,72 @@ class SimulationProfileWriter(object):
             # add mole fractions:
             worksheet.writerows(reaction_system.snapshots)
 
+    def append_binary(self, filename, header, snapshots):
+        """
+        Write the `snapshots` to the binary file `filename`. If the file was
+        last written from the same list of snapshots, only the snapshots
+        added since then are appended; otherwise the file is started anew
+        with the given `header`.
+        """
+        if filename != self._filename or snapshots is not self._snapshots or len(snapshots) < self._num_written:
+            write_simulation_profile_header(filename, header)
+            self._filename = filename
+            self._snapshots = snapshots
+            self._num_written = 0
+
+        new_snapshots = snapshots[self._num_written:]
+        if new_snapshots:
+            with open(filename, 'ab') as f:
+                np.array(new_snapshots, dtype='<f8').tofile(f)
+            self._num_written = len(snapshots)
+
+
+def write_simulation_profile_header(path, header):
+    """
+    Start a new binary simulation profile at `path` with the column names
+    given in `header`, removing any existing data in the file.
+    """
+    header = json.dumps({'version': 1, 'columns': header}).encode('utf-8')
+    with open(path, 'wb') as f:
+        f.write(struct.pack('<Q', len(header)))
+        f.write(header)
+
+
+def load_simulation_profile(path):
+    """
+    Load a binary simulation profile written by :class:`SimulationProfileWriter`.
+    The file starts with the length of the header as a little-endian 64-bit
+    unsigned integer, followed by the header as UTF-8 encoded JSON containing
+    the column names, followed by the snapshots as rows of little-endian
+    64-bit floats. Returns the list of column names and a 2D array with one
+    row per snapshot.
+    """
+    with open(path, 'rb') as f:
+        header_length = struct.unpack('<Q', f.read(8))[0]
+        header = json.loads(f.read(header_length).decode('utf-8'))
+        data = np.fromfile(f, dtype='<f8')
+    columns = header['columns']
+    # Discard a trailing partial row, which can be left behind by an interrupted write
+    num_rows = data.size // len(columns)
+    return columns, data[:num_rows * len(columns)].reshape((num_rows, len(columns)))
+
+
+def convert_simulation_profile_to_csv(path, csv_path=None):
+    """
+    Convert the binary simulation profile at `path` to the csv format written
+    by :class:`SimulationProfileWriter`. The csv file is saved to `csv_path`,
+    which defaults to `path` with a ``.csv`` extension. Returns the path of
+    the csv file.
+    """
+    if csv_path is None:
+        csv_path = os.path.splitext(path)[0] + '.csv'
+    columns, data = load_simulation_profile(path)
+    with open(csv_path, 'w') as csvfile:
+        worksheet = csv.writer(csvfile)
+        worksheet.writerow(columns)
+        worksheet.writerows(data.tolist())
+    return csv_path
+
 
 class SimulationProfilePlotter(object):
     """
@@ -115,14 +204,18 @@ class SimulationProfilePlotter(object):
     from its subject:
 
     reaction_system.detach(listener)
+
+    If `binary` is ``True``, the profile is read from the binary ``.dat``
+    file written by a binary :class:`SimulationProfileWriter`.
     """
 
-    def __init__(self, output_directory, reaction_sys_index, core_species):
+    def __init__(self, output_directory, reaction_sys_index, core_species, binary=False):
         super(SimulationProfilePlotter, self).__init__()
 
         self.output_directory = output_directory
         self.reaction_sys_index = reaction_sys_index
         self.core_species = core_species
+        self.binary = binary
 
     def update(self, reaction_system):
         """
@@ -131,11 +224,11 @@ class SimulationProfilePlotter(object):
             - number of core species
         """
 
-        csv_file = os.path.join(
+        profile_file = os.path.join(
             self.output_directory,
             'solver',
-            'simulation_{0}_{1:d}.csv'.format(
-                self.reaction_sys_index + 1, len(self.core_species)
+            'simulation_{0}_{1:d}.{2}'.format(
+                self.reaction_sys_index + 1, len(self.core_species), 'dat' if self.binary else 'csv'
             )
         )
 
@@ -147,4 +240,12 @@ class SimulationProfilePlotter(object):
             )
         )
 
-        SimulationPlot(csv_file=csv_file, num_species=10, ylabel='Moles').plot(png_file)
+        from rmgpy.tools.plot import SimulationPlot
+        if not self.binary:
+            SimulationPlot(csv_file=profile_file, num_species=10, ylabel='Moles').plot(png_file)
+            return
+
+        # The plot is made from a temporary csv copy of the binary profile
+        with tempfile.TemporaryDirectory() as temp_dir:
+            csv_file = convert_simulation_profile_to_csv(profile_file, os.path.join(temp_dir, 'simulation.csv'))
+            SimulationPlot(csv_file=csv_file, num_species=10, ylabel='Moles').plot(png_file)
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+
+###############################################################################
+#                                                                             #
+# RMG - Reaction Mechanism Generator                                          #
+#                                                                             #
+# Copyright (c) 2002-2019 Prof. William H. Green (whgreen@mit.edu),           #
+# Prof. Richard H. West (r.west@neu.edu) and the RMG Team (rmg_dev@mit.edu)   #
+#                                                                             #
+# Permission is hereby granted, free of charge, to any person obtaining a     #
+# copy of this software and associated documentation files (the 'Software'),  #
+# to deal in the Software without restriction, including without limitation   #
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,    #
+# and/or sell copies of the Software, and to permit persons to whom the       #
+# Software is furnished to do so, subject to the following conditions:        #
+#                                                                             #
+# The above copyright notice and this permission notice shall be included in  #
+# all copies or substantial portions of the Software.                         #
+#                                                                             #
+# THE SOFTWARE IS PROVIDED 'AS IS', WITHOUT WARRANTY OF ANY KIND, EXPRESS OR  #
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,    #
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE #
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER      #
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING     #
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER         #
+# DEALINGS IN THE SOFTWARE.                                                   #
+#                                                                             #
+###############################################################################
+
+"""
+This module contains unit tests of the :mod:`rmgpy.rmg.listener` module.
+"""
+
+import csv
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+
+from rmgpy.chemkin import get_species_identifier
+from rmgpy.rmg.listener import SimulationProfilePlotter, SimulationProfileWriter, \
+    convert_simulation_profile_to_csv, load_simulation_profile
+from rmgpy.species import Species
+
+
+class ReactionSystemStub(object):
+    """A reaction system providing only the simulation snapshots."""
+
+    def __init__(self):
+        self.snapshots = []
+
+
+class TestSimulationProfileWriter(unittest.TestCase):
+    """
+    Contains unit tests of the SimulationProfileWriter class.
+    """
+
+    def setUp(self):
+        self.output_directory = tempfile.mkdtemp()
+        os.makedirs(os.path.join(self.output_directory, 'solver'))
+        self.core_species = [Species(label='Ar', index=1), Species(label='CH4', index=2)]
+        self.reaction_system = ReactionSystemStub()
+
+    def tearDown(self):
+        shutil.rmtree(self.output_directory)
+
+    def test_binary_append(self):
+        """
+        Test that binary profiles only append new snapshots and match the csv output.
+        """
+        writer = SimulationProfileWriter(self.output_directory, 0, self.core_species, binary=True)
+        path = os.path.join(self.output_directory, 'solver', 'simulation_1_2.dat')
+
+        self.reaction_system.snapshots.append([0.0, 1.0, 0.5, 0.5])
+        writer.update(self.reaction_system)
+        size = os.path.getsize(path)
+        self.reaction_system.snapshots.append([1e-3, 1.0, 0.6, 0.4])
+        writer.update(self.reaction_system)
+        self.assertEqual(os.path.getsize(path), size + 4 * 8)
+
+        columns, data = load_simulation_profile(path)
+        self.assertEqual(columns, ['Time (s)', 'Volume (m^3)'] + [get_species_identifier(spc) for spc in self.core_species])
+        np.testing.assert_array_equal(data, np.array(self.reaction_system.snapshots))
+
+        # A new simulation starts a new list of snapshots, which replaces the file contents
+        self.reaction_system.snapshots = [[0.0, 2.0, 0.1, 0.9]]
+        writer.update(self.reaction_system)
+        columns, data = load_simulation_profile(path)
+        np.testing.assert_array_equal(data, np.array([[0.0, 2.0, 0.1, 0.9]]))
+
+    def test_convert_to_csv(self):
+        """
+        Test that a converted binary profile matches the csv written directly.
+        """
+        self.reaction_system.snapshots = [[0.0, 1.0, 0.5, 0.5], [1e-3, 1.0, 0.6, 0.4]]
+        SimulationProfileWriter(self.output_directory, 0, self.core_species, binary=True).update(self.reaction_system)
+        SimulationProfileWriter(self.output_directory, 0, self.core_species).update(self.reaction_system)
+
+        csv_path = convert_simulation_profile_to_csv(
+            os.path.join(self.output_directory, 'solver', 'simulation_1_2.dat'),
+            os.path.join(self.output_directory, 'converted.csv'))
+        with open(csv_path) as f:
+            converted = list(csv.reader(f))
+        with open(os.path.join(self.output_directory, 'solver', 'simulation_1_2.csv')) as f:
+            expected = list(csv.reader(f))
+        self.assertEqual(converted[0], expected[0])
+        np.testing.assert_array_equal(np.array(converted[1:], float), np.array(expected[1:], float))
+
+    def test_plot_binary(self):
+        """
+        Test that the plotter can plot a binary profile.
+        """
+        self.reaction_system.snapshots = [[0.0, 1.0, 0.5, 0.5], [1e-3, 1.0, 0.6, 0.4]]
+        SimulationProfileWriter(self.output_directory, 0, self.core_species, binary=True).update(self.reaction_system)
+        SimulationProfilePlotter(self.output_directory, 0, self.core_species, binary=True).update(self.reaction_system)
+
+        self.assertTrue(os.path.exists(os.path.join(self.output_directory, 'solver', 'simulation_1_2.png')))
+        self.assertFalse(os.path.exists(os.path.join(self.output_directory, 'solver', 'simulation_1_2.csv')))
+
+
+if __name__ == '__main__':
+    unittest.main(testRunner=unittest.TextTestRunner(verbosity=2))
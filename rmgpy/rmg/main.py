@@ -43,14 +43,12 @@ import time
 import warnings
 from copy import deepcopy
 
-import h5py
 import numpy as np
 import psutil
 import yaml
-from cantera import ck2cti
-from scipy.optimize import brute
 
 import rmgpy.util as util
+from rmgpy.rmg.checkpoint import CheckpointWriter, restore_checkpoint
 from rmgpy.rmg.model import Species, CoreEdgeReactionModel
 from rmgpy.rmg.pdep import PDepNetwork
 from rmgpy import settings
@@ -63,18 +61,14 @@ from rmgpy.data.rmg import RMGDatabase
 from rmgpy.exceptions import ForbiddenStructureException, DatabaseError, CoreError
 from rmgpy.kinetics.diffusionLimited import diffusion_limiter
 from rmgpy.molecule import Molecule
-from rmgpy.qm.main import QMDatabaseWriter
 from rmgpy.reaction import Reaction
-from rmgpy.rmg.listener import SimulationProfileWriter, SimulationProfilePlotter
 from rmgpy.rmg.output import OutputHTMLWriter
 from rmgpy.rmg.pdep import PDepReaction
 from rmgpy.rmg.settings import ModelSettings
+from rmgpy.rmg.tracing import PhaseTracer, get_tracer, set_tracer
 from rmgpy.solver.base import TerminationTime, TerminationConversion
 from rmgpy.solver.simple import SimpleReactor
-from rmgpy.stats import ExecutionStatsWriter
 from rmgpy.thermo.thermoengine import submit
-from rmgpy.tools.plot import plot_sensitivity
-from rmgpy.tools.uncertainty import Uncertainty, process_local_results
 from rmgpy.yml import RMSWriter
 
 ################################################################################
@@ -101,6 +95,7 @@ class RMG(util.Subject):
     `input_file`                        The path to the input file
     ----------------------------------- ------------------------------------------------
     `database_directory`                The directory containing the RMG database
+    `database_cache_directory`          The directory in which to cache the loaded RMG database, if any
     `thermo_libraries`                  The thermodynamics libraries to load
     `reaction_libraries`                The kinetics libraries to load
     `statmech_libraries`                The statistical mechanics libraries to load
@@ -141,6 +136,11 @@ class RMG(util.Subject):
     `ml_settings`                       Settings for ML estimation
     `walltime`                          The maximum amount of CPU time in the form DD:HH:MM:SS to expend on this job; used to stop gracefully so we can still get profiling information
     `kinetics_datastore`                ``True`` if storing details of each kinetic database entry in text file, ``False`` otherwise
+    `save_chemkin_snapshots`            ``True`` to keep a copy of the Chemkin file for each core size, ``False`` to only save the latest one
+    `simulation_profile_format`         The format of saved simulation profiles: ``'csv'`` or the append-only ``'binary'``
+    `save_checkpoint`                   ``True`` to save a binary checkpoint of the reaction model after each iteration, ``False`` otherwise
+    `checkpoint_path`                   The path to a binary checkpoint to restart the job from, or ``None`` otherwise
+    `trace`                             ``True`` to record the time and memory spent in each phase of each iteration, ``False`` otherwise
     ----------------------------------- ------------------------------------------------
     `initialization_time`               The time at which the job was initiated, in seconds since the epoch (i.e. from time.time())
     `done`                              Whether the job has completed (there is nothing new to add)
@@ -165,6 +165,7 @@ class RMG(util.Subject):
         Clear all loaded information about the job (except the file paths).
         """
         self.database_directory = None
+        self.database_cache_directory = None
         self.thermo_libraries = None
         self.transport_libraries = None
         self.reaction_libraries = None
@@ -203,8 +204,11 @@ class RMG(util.Subject):
         self.generate_output_html = None
         self.generate_plots = None
         self.save_simulation_profiles = None
+        self.simulation_profile_format = 'csv'
+        self.trace = False
         self.verbose_comments = None
         self.save_edge_species = None
+        self.save_chemkin_snapshots = True
         self.keep_irreversible = None
         self.trimolecular_product_reversible = None
         self.pressure_dependence = None
@@ -220,6 +224,8 @@ class RMG(util.Subject):
         self.edge_seed_path = None
         self.filters_path = None
         self.species_map_path = None
+        self.save_checkpoint = False
+        self.checkpoint_path = None
 
         self.name = 'Seed'
         self.generate_seed_each_iteration = True
@@ -361,6 +367,7 @@ class RMG(util.Subject):
             kinetics_depositories=self.kinetics_depositories,
             # frequenciesLibraries = self.statmech_libraries,
             depository=False,  # Don't bother loading the depository information, as we don't use it
+            cache_directory=self.database_cache_directory,
         )
 
         # Turn off reversibility for families with three products if desired
@@ -469,6 +476,10 @@ class RMG(util.Subject):
         except KeyError:
             self.kinetics_datastore = False
 
+        # Record the time and memory spent in each phase of the job if requested
+        self.trace = kwargs.get('trace', False)
+        set_tracer(PhaseTracer(enabled=self.trace))
+
         global maxproc
         try:
             maxproc = kwargs['maxproc']
@@ -502,6 +513,12 @@ class RMG(util.Subject):
             self.seed_mechanisms.append('restart')
             self.reaction_libraries.append(('restart_edge', False))
 
+        # Load the reaction model from a binary checkpoint (if specified)
+        if self.checkpoint_path:
+            logging.info('Restoring reaction model from checkpoint {0}...'.format(self.checkpoint_path))
+            restore_checkpoint(self, self.checkpoint_path)
+            num_restored_core_species = len(self.reaction_model.core.species)
+
         # Set trimolecular reactant flags of reaction systems
         if self.trimolecular:
             for reaction_system in self.reaction_systems:
@@ -529,15 +546,17 @@ class RMG(util.Subject):
 
         # Initialize reaction model
 
-        # Seed mechanisms: add species and reactions from seed mechanism
-        # DON'T generate any more reactions for the seed species at this time
-        for seed_mechanism in self.seed_mechanisms:
-            self.reaction_model.add_seed_mechanism_to_core(seed_mechanism, react=False)
+        # Seed mechanisms and reaction libraries are already included in a restored checkpoint
+        if not self.checkpoint_path:
+            # Seed mechanisms: add species and reactions from seed mechanism
+            # DON'T generate any more reactions for the seed species at this time
+            for seed_mechanism in self.seed_mechanisms:
+                self.reaction_model.add_seed_mechanism_to_core(seed_mechanism, react=False)
 
-        # Reaction libraries: add species and reactions from reaction library to the edge so
-        # that RMG can find them if their rates are large enough
-        for library, option in self.reaction_libraries:
-            self.reaction_model.add_reaction_library_to_edge(library)
+            # Reaction libraries: add species and reactions from reaction library to the edge so
+            # that RMG can find them if their rates are large enough
+            for library, option in self.reaction_libraries:
+                self.reaction_model.add_reaction_library_to_edge(library)
 
         # Also always add in a few bath gases (since RMG-Java does)
         for label, smiles in [('Ar', '[Ar]'), ('He', '[He]'), ('Ne', '[Ne]'), ('N2', 'N#N')]:
@@ -592,15 +611,22 @@ class RMG(util.Subject):
                                                       "inside of the Species Constraints block in your input file."
                                                       .format(spec.label))
 
-        for spec in self.initial_species:
+        # Species restored from a checkpoint into the core do not need to be processed again
+        if self.checkpoint_path:
+            restored_core_species = set(self.reaction_model.core.species)
+            new_initial_species = [spec for spec in self.initial_species if spec not in restored_core_species]
+        else:
+            new_initial_species = self.initial_species
+
+        for spec in new_initial_species:
             submit(spec, self.solvent)
 
         # Add nonreactive species (e.g. bath gases) to core first
         # This is necessary so that the PDep algorithm can identify the bath gas
-        for spec in self.initial_species:
+        for spec in new_initial_species:
             if not spec.reactive:
                 self.reaction_model.enlarge(spec)
-        for spec in self.initial_species:
+        for spec in new_initial_species:
             if spec.reactive:
                 self.reaction_model.enlarge(spec)
 
@@ -612,7 +638,10 @@ class RMG(util.Subject):
                     reaction_system.get_const_spc_indices(
                         self.reaction_model.core.species)  # call the function to identify indices in the solver
 
-        self.initialize_reaction_threshold_and_react_flags()
+        if self.checkpoint_path:
+            self.restore_reaction_threshold_and_react_flags(num_restored_core_species)
+        else:
+            self.initialize_reaction_threshold_and_react_flags()
         self.reaction_model.initialize_index_species_dict()
 
     def register_listeners(self):
@@ -620,8 +649,12 @@ class RMG(util.Subject):
         Attaches listener classes depending on the options 
         found in the RMG input file.
         """
+        # The plotting and QM listeners are imported here since they are slow to import
+        from rmgpy.qm.main import QMDatabaseWriter
+        from rmgpy.rmg.listener import SimulationProfileWriter, SimulationProfilePlotter
+        from rmgpy.stats import ExecutionStatsWriter
 
-        self.attach(ChemkinWriter(self.output_directory))
+        self.attach(ChemkinWriter(self.output_directory, save_snapshots=self.save_chemkin_snapshots))
         self.attach(RMSWriter(self.output_directory))
 
         if self.generate_output_html:
@@ -632,13 +665,22 @@ class RMG(util.Subject):
 
         self.attach(ExecutionStatsWriter(self.output_directory))
 
+        if self.save_checkpoint:
+            self.attach(CheckpointWriter(self.output_directory))
+
         if self.save_simulation_profiles:
 
             for index, reaction_system in enumerate(self.reaction_systems):
-                reaction_system.attach(SimulationProfileWriter(
-                    self.output_directory, index, self.reaction_model.core.species))
+                binary = self.simulation_profile_format == 'binary'
+                writer = SimulationProfileWriter(
+                    self.output_directory, index, self.reaction_model.core.species, binary=binary)
+                reaction_system.attach(writer)
+                if binary:
+                    # Also write the binary profile in chunks during the simulation
+                    reaction_system.snapshot_listeners.append(writer)
+                # The plotter reads the profile written by the profile writer
                 reaction_system.attach(SimulationProfilePlotter(
-                    self.output_directory, index, self.reaction_model.core.species))
+                    self.output_directory, index, self.reaction_model.core.species, binary=binary))
 
     def execute(self, **kwargs):
         """
@@ -664,6 +706,7 @@ class RMG(util.Subject):
             pass
 
         self.rmg_memories = []
+        tracer = get_tracer()
 
         logging.info('Initialization complete. Starting model generation.\n')
 
@@ -748,6 +791,7 @@ class RMG(util.Subject):
                     self.make_seed_mech()
 
                 self.reaction_model.iteration_num += 1
+                tracer.start_iteration(self.reaction_model.iteration_num)
                 self.done = True
 
                 all_terminated = True
@@ -777,19 +821,20 @@ class RMG(util.Subject):
                             prune = False
 
                         try:
-                            terminated, resurrected, obj, new_surface_species, new_surface_reactions, t, x = reaction_system.simulate(
-                                core_species=self.reaction_model.core.species,
-                                core_reactions=self.reaction_model.core.reactions,
-                                edge_species=self.reaction_model.edge.species,
-                                edge_reactions=self.reaction_model.edge.reactions,
-                                surface_species=self.reaction_model.surface.species,
-                                surface_reactions=self.reaction_model.surface.reactions,
-                                pdep_networks=self.reaction_model.network_list,
-                                prune=prune,
-                                model_settings=model_settings,
-                                simulator_settings=simulator_settings,
-                                conditions=self.rmg_memories[index].get_cond()
-                            )
+                            with tracer.phase('simulation', reaction_system=index + 1):
+                                terminated, resurrected, obj, new_surface_species, new_surface_reactions, t, x = reaction_system.simulate(
+                                    core_species=self.reaction_model.core.species,
+                                    core_reactions=self.reaction_model.core.reactions,
+                                    edge_species=self.reaction_model.edge.species,
+                                    edge_reactions=self.reaction_model.edge.reactions,
+                                    surface_species=self.reaction_model.surface.species,
+                                    surface_reactions=self.reaction_model.surface.reactions,
+                                    pdep_networks=self.reaction_model.network_list,
+                                    prune=prune,
+                                    model_settings=model_settings,
+                                    simulator_settings=simulator_settings,
+                                    conditions=self.rmg_memories[index].get_cond()
+                                )
                         except:
                             logging.error("Model core reactions:")
                             if len(self.reaction_model.core.reactions) > 5:
@@ -834,18 +879,19 @@ class RMG(util.Subject):
                             temp_model_settings.tol_keep_in_edge = 0
                             if not resurrected:
                                 try:
-                                    reaction_system.simulate(
-                                        core_species=self.reaction_model.core.species,
-                                        core_reactions=self.reaction_model.core.reactions,
-                                        edge_species=[],
-                                        edge_reactions=[],
-                                        surface_species=self.reaction_model.surface.species,
-                                        surface_reactions=self.reaction_model.surface.reactions,
-                                        pdep_networks=self.reaction_model.network_list,
-                                        model_settings=temp_model_settings,
-                                        simulator_settings=simulator_settings,
-                                        conditions=self.rmg_memories[index].get_cond()
-                                    )
+                                    with tracer.phase('simulation', reaction_system=index + 1):
+                                        reaction_system.simulate(
+                                            core_species=self.reaction_model.core.species,
+                                            core_reactions=self.reaction_model.core.reactions,
+                                            edge_species=[],
+                                            edge_reactions=[],
+                                            surface_species=self.reaction_model.surface.species,
+                                            surface_reactions=self.reaction_model.surface.reactions,
+                                            pdep_networks=self.reaction_model.network_list,
+                                            model_settings=temp_model_settings,
+                                            simulator_settings=simulator_settings,
+                                            conditions=self.rmg_memories[index].get_cond()
+                                        )
                                 except:
                                     self.update_reaction_threshold_and_react_flags(
                                         rxn_sys_unimol_threshold=reaction_system.unimolecular_threshold,
@@ -917,12 +963,13 @@ class RMG(util.Subject):
                     # species from the edge
                     if all_terminated and model_settings.tol_keep_in_edge > 0.0:
                         logging.info('Attempting to prune...')
-                        self.reaction_model.prune(self.reaction_systems, model_settings.tol_keep_in_edge,
-                                                  model_settings.tol_move_to_core,
-                                                  model_settings.maximum_edge_species,
-                                                  model_settings.min_species_exist_iterations_for_prune)
-                        # Perform garbage collection after pruning
-                        collected = gc.collect()
+                        with tracer.phase('pruning'):
+                            self.reaction_model.prune(self.reaction_systems, model_settings.tol_keep_in_edge,
+                                                      model_settings.tol_move_to_core,
+                                                      model_settings.maximum_edge_species,
+                                                      model_settings.min_species_exist_iterations_for_prune)
+                            # Perform garbage collection after pruning
+                            collected = gc.collect()
                         logging.info('Garbage collector: collected %d objects.' % collected)
 
                 # Consider stopping gracefully if the next iteration might take us
@@ -958,16 +1005,17 @@ class RMG(util.Subject):
 
         # generate Cantera files chem.cti & chem_annotated.cti in a designated `cantera` output folder
         try:
-            if any([s.contains_surface_site() for s in self.reaction_model.core.species]):
-                self.generate_cantera_files(os.path.join(self.output_directory, 'chemkin', 'chem-gas.inp'),
-                                            surfaceFile=(
-                                              os.path.join(self.output_directory, 'chemkin', 'chem-surface.inp')))
-                self.generate_cantera_files(os.path.join(self.output_directory, 'chemkin', 'chem_annotated-gas.inp'),
-                                            surfaceFile=(os.path.join(self.output_directory, 'chemkin',
-                                                                    'chem_annotated-surface.inp')))
-            else:  # gas phase only
-                self.generate_cantera_files(os.path.join(self.output_directory, 'chemkin', 'chem.inp'))
-                self.generate_cantera_files(os.path.join(self.output_directory, 'chemkin', 'chem_annotated.inp'))
+            with tracer.phase('output'):
+                if any([s.contains_surface_site() for s in self.reaction_model.core.species]):
+                    self.generate_cantera_files(os.path.join(self.output_directory, 'chemkin', 'chem-gas.inp'),
+                                                surfaceFile=(
+                                                  os.path.join(self.output_directory, 'chemkin', 'chem-surface.inp')))
+                    self.generate_cantera_files(os.path.join(self.output_directory, 'chemkin', 'chem_annotated-gas.inp'),
+                                                surfaceFile=(os.path.join(self.output_directory, 'chemkin',
+                                                                        'chem_annotated-surface.inp')))
+                else:  # gas phase only
+                    self.generate_cantera_files(os.path.join(self.output_directory, 'chemkin', 'chem.inp'))
+                    self.generate_cantera_files(os.path.join(self.output_directory, 'chemkin', 'chem_annotated.inp'))
         except EnvironmentError:
             logging.exception('Could not generate Cantera files due to EnvironmentError. Check read\write privileges '
                               'in output directory.')
@@ -983,6 +1031,10 @@ class RMG(util.Subject):
         logging.info('The final model core has %s species and %s reactions' % (core_spec, core_reac))
         logging.info('The final model edge has %s species and %s reactions' % (edge_spec, edge_reac))
 
+        if self.trace:
+            self.save_trace()
+            tracer.log_summary()
+
         self.finish()
 
     def run_model_analysis(self, number=10):
@@ -1019,6 +1071,7 @@ class RMG(util.Subject):
                     conditions=reaction_system.sens_conditions,
                 )
 
+                from rmgpy.tools.plot import plot_sensitivity
                 plot_sensitivity(self.output_directory, index, reaction_system.sensitive_species, number=number)
 
         self.run_uncertainty_analysis()
@@ -1044,6 +1097,8 @@ class RMG(util.Subject):
             if self.uncertainty['uncorrelated']: correlation.append(False)
             if self.uncertainty['correlated']: correlation.append(True)
 
+            from rmgpy.tools.uncertainty import Uncertainty, process_local_results
+
             # Set up Uncertainty object
             uncertainty = Uncertainty(output_directory=self.output_directory)
             uncertainty.database = self.database
@@ -1351,6 +1406,7 @@ class RMG(util.Subject):
             edge_kinetics_library.save_dictionary(os.path.join(seed_dir, 'seed_edge', 'dictionary.txt'))
 
             # Save the filter tensors
+            import h5py
             if not os.path.exists(filter_dir):
                 os.mkdir(filter_dir)
             with h5py.File(os.path.join(filter_dir, 'filters.h5'), 'w') as f:
@@ -1496,6 +1552,8 @@ class RMG(util.Subject):
                 raise
         if os.path.exists(out_name):
             os.remove(out_name)
+        from cantera import ck2cti
+
         parser = ck2cti.Parser()
         try:
             parser.convertMech(chemkin_file, transportFile=transport_file, outName=out_name, quiet=True, permissive=True,
@@ -1529,6 +1587,7 @@ class RMG(util.Subject):
                 restart_species_list = [Species().from_adjacency_list(adj_list) for adj_list in restart_species_list]
 
                 # Load in the restart filter tensors
+                import h5py
                 with h5py.File(self.filters_path, 'r') as f:
                     try:
                         unimolecular_threshold_restart = f.get('unimolecular_threshold').value
@@ -1622,6 +1681,30 @@ class RMG(util.Subject):
                         if self.trimolecular:
                             self.trimolecular_react[:num_restart_spcs, :num_restart_spcs, :num_restart_spcs] = False
 
+    def restore_reaction_threshold_and_react_flags(self, num_restored_core_species):
+        """
+        Initialize the react flags after restoring the model from a checkpoint. The first
+        `num_restored_core_species` core species come from the checkpoint and have already been
+        reacted, so only core species added since then are flagged to react.
+        """
+        num_core_species = num_restored_core_species
+        self.unimolecular_react = np.zeros(num_core_species, bool)
+        self.bimolecular_react = np.zeros((num_core_species, num_core_species), bool)
+        if self.trimolecular:
+            self.trimolecular_react = np.zeros((num_core_species, num_core_species, num_core_species), bool)
+
+        if self.filter_reactions:
+            # If the checkpoint was written without filtering, assume all restored species have reacted
+            if self.unimolecular_threshold is None:
+                self.unimolecular_threshold = np.ones(num_core_species, bool)
+            if self.bimolecular_threshold is None:
+                self.bimolecular_threshold = np.ones((num_core_species, num_core_species), bool)
+            if self.trimolecular and self.trimolecular_threshold is None:
+                self.trimolecular_threshold = np.ones((num_core_species, num_core_species, num_core_species), bool)
+
+        # Extend the flags to any input species which were not in the checkpoint
+        self.update_reaction_threshold_and_react_flags(skip_update=True)
+
     def update_reaction_threshold_and_react_flags(self,
                                                   rxn_sys_unimol_threshold=None,
                                                   rxn_sys_bimol_threshold=None,
@@ -1709,18 +1792,34 @@ class RMG(util.Subject):
         # an additional output species and reaction list which is written to the ouput HTML
         # file as well as the chemkin file
 
-        if self.reaction_libraries:
-            # First initialize the output_reaction_list and output_species_list to empty
-            self.reaction_model.output_species_list = []
-            self.reaction_model.output_reaction_list = []
-            for library, option in self.reaction_libraries:
-                if option:
-                    self.reaction_model.add_reaction_library_to_output(library)
+        tracer = get_tracer()
+        with tracer.phase('output'):
+            if self.reaction_libraries:
+                # First initialize the output_reaction_list and output_species_list to empty
+                self.reaction_model.output_species_list = []
+                self.reaction_model.output_reaction_list = []
+                for library, option in self.reaction_libraries:
+                    if option:
+                        self.reaction_model.add_reaction_library_to_output(library)
 
-        self.exec_time.append(time.time() - self.initialization_time)
+            self.exec_time.append(time.time() - self.initialization_time)
 
-        # Notify registered listeners:
-        self.notify()
+            # Notify registered listeners:
+            self.notify()
+
+        if self.trace:
+            self.save_trace()
+            tracer.log_summary(iterations=[tracer.iteration])
+
+    def save_trace(self):
+        """
+        Save the phases recorded so far to the Chrome trace ``trace.json``
+        and the per-iteration summary ``trace_summary.csv`` in the output
+        directory.
+        """
+        tracer = get_tracer()
+        tracer.save_chrome_trace(os.path.join(self.output_directory, 'trace.json'))
+        tracer.save_summary(os.path.join(self.output_directory, 'trace_summary.csv'))
 
     def finish(self):
         """
@@ -2136,6 +2235,8 @@ class RMG_Memory(object):
         then a random step of length 1/(2*Ns) is taken from that point to give a final condition point
         if this process were to impact runtime under some conditions you could decrease the value of Ns to speed it up
         """
+        from scipy.optimize import brute
+
         bounds = tuple((0.0, 1.0) for k in range(Ndims))
         x0, fval, grid, Jout = brute(obj, bounds, Ns=Ns, full_output=True,
                                      finish=None)  # run brute just to easily get the evaluations at each grid point (we don't care about the optimal value)
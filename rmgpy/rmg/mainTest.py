@@ -29,6 +29,8 @@
 
 import os
 import shutil
+import subprocess
+import sys
 import unittest
 
 from nose.plugins.attrib import attr
@@ -347,3 +349,32 @@ CH3(4)              2     144.001     3.800     0.000     0.000     0.000    ! G
             # clean up
             os.chdir(originalPath)
             shutil.rmtree(self.dir_name)
+
+
+class TestImportTime(unittest.TestCase):
+    """
+    Contains a check that importing RMG stays fast, since short jobs such as the scripts pay the import time
+    """
+
+    # Modules which any job needs anyway; the time for importing them is not counted
+    core_modules = ['rmgpy.data.rmg', 'rmgpy.reaction', 'rmgpy.species']
+
+    # Maximum time in seconds for importing the module in a new interpreter after the core modules
+    import_time_budget = 1.5
+
+    # Slow optional subsystems which should only be imported when they are used
+    lazy_modules = ['cantera', 'chemprop', 'h5py', 'matplotlib', 'rmgpy.qm.main', 'rmgpy.tools.plot',
+                    'rmgpy.tools.uncertainty']
+
+    def test_import_rmg_main(self):
+        """Test that importing rmgpy.rmg.main does not import slow optional subsystems"""
+        code = ('import sys, time\n'
+                'import {0}\n'
+                'start = time.time()\n'
+                'import rmgpy.rmg.main\n'
+                'print(time.time() - start)\n'
+                'print(",".join(m for m in {1!r} if m in sys.modules))'.format(', '.join(self.core_modules),
+                                                                             self.lazy_modules))
+        output = subprocess.check_output([sys.executable, '-c', code], universal_newlines=True).splitlines()
+        self.assertEqual(output[-1], '')
+        self.assertLess(float(output[-2]), self.import_time_budget)
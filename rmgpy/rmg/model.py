@@ -52,6 +52,7 @@ from rmgpy.quantity import Quantity
 from rmgpy.reaction import Reaction
 from rmgpy.rmg.pdep import PDepReaction, PDepNetwork
 from rmgpy.rmg.react import react_all
+from rmgpy.rmg.tracing import get_tracer
 from rmgpy.species import Species
 from rmgpy.thermo.thermoengine import submit
 
@@ -90,10 +91,15 @@ class ReactionModel:
         final_model.reactions.extend(self.reactions)
 
         # Determine which species in other are already in self
+        # Isomorphic species have the same fingerprint, so each species only
+        # needs to be compared to the species of self with its fingerprint
+        species_dict = {}
+        for spec0 in final_model.species:
+            species_dict.setdefault(get_isomorphism_key(spec0), []).append(spec0)
         common_species = {}
         unique_species = []
         for spec in other.species:
-            for spec0 in final_model.species:
+            for spec0 in species_dict.get(get_isomorphism_key(spec), []):
                 if spec.is_isomorphic(spec0):
                     common_species[spec] = spec0
                     if spec0.label not in ['Ar', 'N2', 'Ne', 'He']:
@@ -105,10 +111,15 @@ class ReactionModel:
                 unique_species.append(spec)
 
         # Determine which reactions in other are already in self
+        # Reactions are likewise only compared if their reactants and products
+        # have the same fingerprints in either direction
+        reaction_dict = {}
+        for rxn0 in final_model.reactions:
+            reaction_dict.setdefault(generate_isomorphism_reaction_key(rxn0), []).append(rxn0)
         common_reactions = {}
         unique_reactions = []
         for rxn in other.reactions:
-            for rxn0 in final_model.reactions:
+            for rxn0 in reaction_dict.get(generate_isomorphism_reaction_key(rxn), []):
                 if rxn.is_isomorphic(rxn0, either_direction=True):
                     common_reactions[rxn] = rxn0
                     if not rxn0.kinetics.is_identical_to(rxn.kinetics):
@@ -524,124 +535,129 @@ class CoreEdgeReactionModel:
         from rmgpy.rmg.main import determine_procnum_from_ram
         procnum = determine_procnum_from_ram()
 
-        if react_edge is False:
-            # We are adding core species 
-            new_reactions = []
-            pdep_network = None
-            object_was_in_edge = False
+        tracer = get_tracer()
+        with tracer.phase('reaction generation'):
+            if react_edge is False:
+                # We are adding core species 
+                new_reactions = []
+                pdep_network = None
+                object_was_in_edge = False
 
-            if isinstance(new_object, Species):
+                if isinstance(new_object, Species):
 
-                new_species = new_object
+                    new_species = new_object
 
-                object_was_in_edge = new_species in self.edge.species
+                    object_was_in_edge = new_species in self.edge.species
 
-                if not new_species.reactive:
-                    logging.info('NOT generating reactions for unreactive species {0}'.format(new_species))
-                else:
-                    logging.info('Adding species {0} to model core'.format(new_species))
-                    display(new_species)  # if running in IPython --pylab mode, draws the picture!
+                    if not new_species.reactive:
+                        logging.info('NOT generating reactions for unreactive species {0}'.format(new_species))
+                    else:
+                        logging.info('Adding species {0} to model core'.format(new_species))
+                        display(new_species)  # if running in IPython --pylab mode, draws the picture!
 
-                # Add new species
-                reactions_moved_from_edge = self.add_species_to_core(new_species)
+                    # Add new species
+                    reactions_moved_from_edge = self.add_species_to_core(new_species)
 
-            elif isinstance(new_object, tuple) and isinstance(new_object[0], PDepNetwork) and self.pressure_dependence:
+                elif isinstance(new_object, tuple) and isinstance(new_object[0], PDepNetwork) and self.pressure_dependence:
 
-                pdep_network, new_species = new_object
-                new_reactions.extend(pdep_network.explore_isomer(new_species))
+                    pdep_network, new_species = new_object
+                    new_reactions.extend(pdep_network.explore_isomer(new_species))
 
-                self.process_new_reactions(new_reactions, new_species, pdep_network, generate_thermo=False)
+                    self.process_new_reactions(new_reactions, new_species, pdep_network, generate_thermo=False)
 
-            else:
-                raise TypeError('Unable to use object {0} to enlarge reaction model; expecting an object of class '
-                                'rmg.model.Species or rmg.model.PDepNetwork, not {1}'.format(new_object,
-                                                                                             new_object.__class__))
+                else:
+                    raise TypeError('Unable to use object {0} to enlarge reaction model; expecting an object of class '
+                                    'rmg.model.Species or rmg.model.PDepNetwork, not {1}'.format(new_object,
+                                                                                                 new_object.__class__))
 
-            # If there are any core species among the unimolecular product channels
-            # of any existing network, they need to be made included
-            for network in self.network_list:
-                network.update_configurations(self)
-                index = 0
-                isomers = [isomer.species[0] for isomer in network.isomers]
-                while index < len(self.core.species):
-                    species = self.core.species[index]
-                    if species in isomers and species not in network.explored:
-                        network.explored.append(species)
-                        continue
-                    for products in network.products:
-                        products = products.species
-                        if len(products) == 1 and products[0] == species:
-                            new_reactions = network.explore_isomer(species)
-
-                            self.process_new_reactions(new_reactions, species, network, generate_thermo=False)
-                            network.update_configurations(self)
-                            index = 0
-                            break
-                    else:
-                        index += 1
+                # If there are any core species among the unimolecular product channels
+                # of any existing network, they need to be made included
+                for network in self.network_list:
+                    network.update_configurations(self)
+                    index = 0
+                    isomers = [isomer.species[0] for isomer in network.isomers]
+                    while index < len(self.core.species):
+                        species = self.core.species[index]
+                        if species in isomers and species not in network.explored:
+                            network.explored.append(species)
+                            continue
+                        for products in network.products:
+                            products = products.species
+                            if len(products) == 1 and products[0] == species:
+                                new_reactions = network.explore_isomer(species)
+
+                                self.process_new_reactions(new_reactions, species, network, generate_thermo=False)
+                                network.update_configurations(self)
+                                index = 0
+                                break
+                        else:
+                            index += 1
 
-            if isinstance(new_object, Species) and object_was_in_edge:
-                # moved one species from edge to core
-                num_old_edge_species -= 1
-                # moved these reactions from edge to core
-                num_old_edge_reactions -= len(reactions_moved_from_edge)
+                if isinstance(new_object, Species) and object_was_in_edge:
+                    # moved one species from edge to core
+                    num_old_edge_species -= 1
+                    # moved these reactions from edge to core
+                    num_old_edge_reactions -= len(reactions_moved_from_edge)
 
-        else:
-            # Generate reactions between all core species which have not been
-            # reacted yet and exceed the reaction filter thresholds
-            rxn_lists, spcs_tuples = react_all(self.core.species, num_old_core_species,
-                                             unimolecular_react, bimolecular_react,
-                                             trimolecular_react=trimolecular_react,
-                                             procnum=procnum)
-
-            for rxnList, spcTuple in zip(rxn_lists, spcs_tuples):
-                if rxnList:
-                    # Identify a core species which was used to generate the reaction
-                    # This is only used to determine the reaction direction for processing
-                    spc = spcTuple[0]
-                    self.process_new_reactions(rxnList, spc, generate_thermo=False)
+            else:
+                # Generate reactions between all core species which have not been
+                # reacted yet and exceed the reaction filter thresholds
+                rxn_lists, spcs_tuples = react_all(self.core.species, num_old_core_species,
+                                                 unimolecular_react, bimolecular_react,
+                                                 trimolecular_react=trimolecular_react,
+                                                 procnum=procnum)
+
+                for rxnList, spcTuple in zip(rxn_lists, spcs_tuples):
+                    if rxnList:
+                        # Identify a core species which was used to generate the reaction
+                        # This is only used to determine the reaction direction for processing
+                        spc = spcTuple[0]
+                        self.process_new_reactions(rxnList, spc, generate_thermo=False)
 
         ################################################################
         # Begin processing the new species and reactions
 
-        # Generate thermo for new species
-        if self.new_species_list:
-            logging.info('Generating thermo for new species...')
-            self.apply_thermo_to_species(procnum)
-
-        # Do thermodynamic filtering
-        if not np.isinf(self.thermo_tol_keep_spc_in_edge) and self.new_species_list != []:
-            self.thermo_filter_species(self.new_species_list)
-
-        # Generate kinetics of new reactions
-        if self.new_reaction_list:
-            logging.info('Generating kinetics for new reactions...')
-        for reaction in self.new_reaction_list:
-            # If the reaction already has kinetics (e.g. from a library),
-            # assume the kinetics are satisfactory
-            if reaction.kinetics is None:
-                self.apply_kinetics_to_reaction(reaction)
-
-        # For new reactions, convert ArrheniusEP to Arrhenius, and fix barrier heights.
-        # self.new_reaction_list only contains *actually* new reactions, all in the forward direction.
-        for reaction in self.new_reaction_list:
-            # convert KineticsData to Arrhenius forms
-            if isinstance(reaction.kinetics, KineticsData):
-                reaction.kinetics = reaction.kinetics.to_arrhenius()
-            #  correct barrier heights of estimated kinetics
-            if isinstance(reaction, TemplateReaction) or isinstance(reaction,
-                                                                    DepositoryReaction):  # i.e. not LibraryReaction
-                reaction.fix_barrier_height()  # also converts ArrheniusEP to Arrhenius.
-
-            if self.pressure_dependence and reaction.is_unimolecular():
-                # If this is going to be run through pressure dependence code,
-                # we need to make sure the barrier is positive.
-                reaction.fix_barrier_height(force_positive=True)
+        with tracer.phase('thermo', species=len(self.new_species_list)):
+            # Generate thermo for new species
+            if self.new_species_list:
+                logging.info('Generating thermo for new species...')
+                self.apply_thermo_to_species(procnum)
+
+            # Do thermodynamic filtering
+            if not np.isinf(self.thermo_tol_keep_spc_in_edge) and self.new_species_list != []:
+                self.thermo_filter_species(self.new_species_list)
+
+        with tracer.phase('kinetics', reactions=len(self.new_reaction_list)):
+            # Generate kinetics of new reactions
+            if self.new_reaction_list:
+                logging.info('Generating kinetics for new reactions...')
+            for reaction in self.new_reaction_list:
+                # If the reaction already has kinetics (e.g. from a library),
+                # assume the kinetics are satisfactory
+                if reaction.kinetics is None:
+                    self.apply_kinetics_to_reaction(reaction)
+
+            # For new reactions, convert ArrheniusEP to Arrhenius, and fix barrier heights.
+            # self.new_reaction_list only contains *actually* new reactions, all in the forward direction.
+            for reaction in self.new_reaction_list:
+                # convert KineticsData to Arrhenius forms
+                if isinstance(reaction.kinetics, KineticsData):
+                    reaction.kinetics = reaction.kinetics.to_arrhenius()
+                #  correct barrier heights of estimated kinetics
+                if isinstance(reaction, TemplateReaction) or isinstance(reaction,
+                                                                        DepositoryReaction):  # i.e. not LibraryReaction
+                    reaction.fix_barrier_height()  # also converts ArrheniusEP to Arrhenius.
+
+                if self.pressure_dependence and reaction.is_unimolecular():
+                    # If this is going to be run through pressure dependence code,
+                    # we need to make sure the barrier is positive.
+                    reaction.fix_barrier_height(force_positive=True)
 
         # Update unimolecular (pressure dependent) reaction networks
         if self.pressure_dependence:
             # Recalculate k(T,P) values for modified networks
-            self.update_unimolecular_reaction_networks()
+            with tracer.phase('pdep'):
+                self.update_unimolecular_reaction_networks()
             logging.info('')
 
         # Check new core and edge reactions for Chemkin duplicates
@@ -815,6 +831,12 @@ class CoreEdgeReactionModel:
         if quantum_mechanics:
             quantum_mechanics.run_jobs(self.new_species_list, procnum=procnum)
 
+        # Predict the thermo of all new species with the ML estimator at once
+        ml_estimator, ml_settings = get_input('ml_estimator')
+        if ml_estimator is not None:
+            get_db('thermo').prepare_thermo_data_from_ml([spc for spc in self.new_species_list if not spc.thermo],
+                                                         ml_estimator, ml_settings)
+
         # Serial thermo calculation for other methods
         for spc in self.new_species_list:
             self.generate_thermo(spc, rename=True)
@@ -1987,6 +2009,28 @@ def get_key(spc):
     return spc.label
 
 
+def get_isomorphism_key(spc):
+    """
+    Returns a string of the species that is the same for isomorphic species,
+    and can therefore be used to narrow down the species to check for isomorphism.
+    """
+
+    return str(spc.fingerprint)
+
+
+def generate_isomorphism_reaction_key(rxn):
+    """
+    Returns a key of the reaction that is the same for reactions that are
+    isomorphic in either direction, built from the isomorphism keys of the
+    reactants and products.
+    """
+
+    reactants = tuple(sorted([get_isomorphism_key(reactant) for reactant in rxn.reactants]))
+    products = tuple(sorted([get_isomorphism_key(product) for product in rxn.products]))
+
+    return frozenset([reactants, products])
+
+
 def are_identical_species_references(rxn1, rxn2):
     """
     Checks if the references of the reactants and products of the two reactions
@@ -162,6 +162,8 @@ class PDepNetwork(rmgpy.pdep.network.Network):
         self.dens_states = None
         self.coll_freq = None
         self.Mcoll = None
+        self.coll_j_dist = None
+        self.coll_bandwidth = None
         self.Kij = None
         self.Fim = None
         self.Gnj = None
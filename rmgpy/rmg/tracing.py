@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+
+###############################################################################
+#                                                                             #
+# RMG - Reaction Mechanism Generator                                          #
+#                                                                             #
+# Copyright (c) 2002-2019 Prof. William H. Green (whgreen@mit.edu),           #
+# Prof. Richard H. West (r.west@neu.edu) and the RMG Team (rmg_dev@mit.edu)   #
+#                                                                             #
+# Permission is hereby granted, free of charge, to any person obtaining a     #
+# copy of this software and associated documentation files (the 'Software'),  #
+# to deal in the Software without restriction, including without limitation   #
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,    #
+# and/or sell copies of the Software, and to permit persons to whom the       #
+# Software is furnished to do so, subject to the following conditions:        #
+#                                                                             #
+# The above copyright notice and this permission notice shall be included in  #
+# all copies or substantial portions of the Software.                         #
+#                                                                             #
+# THE SOFTWARE IS PROVIDED 'AS IS', WITHOUT WARRANTY OF ANY KIND, EXPRESS OR  #
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,    #
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE #
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER      #
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING     #
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER         #
+# DEALINGS IN THE SOFTWARE.                                                   #
+#                                                                             #
+###############################################################################
+
+"""
+Contains the :class:`PhaseTracer` class for timing the phases of each
+model enlargement iteration of an RMG job.
+"""
+
+import csv
+import json
+import logging
+import os
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+
+import psutil
+
+
+class PhaseTracer(object):
+    """
+    A class for recording the wall time and memory use of the phases of an RMG
+    job, such as reaction generation, thermo and kinetics estimation, pressure
+    dependence, simulation, output and pruning. The attributes are:
+
+    =================== ========================================================
+    Attribute           Description
+    =================== ========================================================
+    `enabled`           ``True`` to record phases, ``False`` to ignore them
+    `iteration`         The index of the current model enlargement iteration
+    `events`            A list of the completed phases as dictionaries
+    `iteration_starts`  A dictionary of the start time of each iteration
+    =================== ========================================================
+
+    Phases are recorded using the :meth:`phase` context manager::
+
+        with tracer.phase('thermo'):
+            ...
+
+    and may be nested. Times are in seconds since the tracer was created and
+    memory use is the resident set size of the process in MB. When the tracer
+    is disabled, :meth:`phase` does nothing, so it can be left in place
+    without a measurable cost.
+    """
+
+    def __init__(self, enabled=True):
+        self.enabled = enabled
+        self.iteration = 0
+        self.events = []
+        self.iteration_starts = OrderedDict()
+        self._depth = 0
+        self._process = psutil.Process(os.getpid()) if enabled else None
+        self._t0 = time.time()
+
+    def get_memory_use(self):
+        """
+        Return the resident set size of this process in MB.
+        """
+        return self._process.memory_info().rss / 1.0e6
+
+    def start_iteration(self, iteration):
+        """
+        Mark the start of the model enlargement iteration `iteration`.
+        """
+        if not self.enabled:
+            return
+        self.iteration = iteration
+        self.iteration_starts[iteration] = time.time() - self._t0
+
+    @contextmanager
+    def phase(self, name, **kwargs):
+        """
+        Record the time and memory spent in the enclosed block as the phase
+        `name`. Any keyword arguments are saved with the phase, and are shown
+        for it in the Chrome trace.
+        """
+        if not self.enabled:
+            yield
+            return
+        if not self.iteration_starts:
+            self.start_iteration(self.iteration)
+        memory_start = self.get_memory_use()
+        depth = self._depth
+        self._depth += 1
+        start = time.time()
+        try:
+            yield
+        finally:
+            end = time.time()
+            self._depth -= 1
+            self.events.append({
+                'name': name,
+                'iteration': self.iteration,
+                'depth': depth,
+                'start': start - self._t0,
+                'duration': end - start,
+                'memory_start': memory_start,
+                'memory_end': self.get_memory_use(),
+                'args': kwargs,
+            })
+
+    def get_phase_names(self):
+        """
+        Return a list of the names of the recorded phases in the order in
+        which they were first recorded.
+        """
+        events = sorted(self.events, key=lambda event: event['start'])
+        return list(OrderedDict.fromkeys(event['name'] for event in events))
+
+    def get_summary(self):
+        """
+        Return an ordered dictionary mapping each iteration to an ordered
+        dictionary of the total time spent in each phase during the iteration,
+        along with the ``'total'`` wall time of the iteration, the ``'other'``
+        time not spent in any outermost phase, and the ``'peak memory'`` use
+        at the end of any of its phases. An iteration lasts until the next
+        one starts, or until the end of its last phase for the final iteration.
+        """
+        names = self.get_phase_names()
+        summary = OrderedDict()
+        for iteration in self.iteration_starts:
+            summary[iteration] = OrderedDict((name, 0.0) for name in names)
+            summary[iteration]['peak memory'] = 0.0
+        ends = {}
+        for event in self.events:
+            row = summary[event['iteration']]
+            row[event['name']] += event['duration']
+            row['peak memory'] = max(row['peak memory'], event['memory_start'], event['memory_end'])
+            ends[event['iteration']] = max(ends.get(event['iteration'], 0.0), event['start'] + event['duration'])
+
+        iterations = list(self.iteration_starts.keys())
+        for i, iteration in enumerate(iterations):
+            start = self.iteration_starts[iteration]
+            if i + 1 < len(iterations):
+                end = self.iteration_starts[iterations[i + 1]]
+            else:
+                end = ends.get(iteration, start)
+            traced = sum(event['duration'] for event in self.events
+                         if event['iteration'] == iteration and event['depth'] == 0)
+            summary[iteration]['total'] = end - start
+            summary[iteration]['other'] = max(end - start - traced, 0.0)
+        return summary
+
+    def log_summary(self, iterations=None, level=logging.INFO):
+        """
+        Log a table of the time spent in each phase of each iteration in
+        `iterations`, or of every iteration if it is ``None``.
+        """
+        summary = self.get_summary()
+        if not summary:
+            return
+        names = self.get_phase_names() + ['other', 'total']
+        widths = [max(len(name), 9) for name in names]
+        logging.log(level, 'Time spent in each phase (s):')
+        logging.log(level, '{0:>9}  {1}  {2:>11}'.format(
+            'Iteration', '  '.join('{0:>{1}}'.format(name, w) for name, w in zip(names, widths)), 'Memory (MB)'))
+        for iteration, row in summary.items():
+            if iterations is not None and iteration not in iterations:
+                continue
+            logging.log(level, '{0:>9d}  {1}  {2:>11.1f}'.format(
+                iteration, '  '.join('{0:>{1}.2f}'.format(row[name], w) for name, w in zip(names, widths)),
+                row['peak memory']))
+        logging.log(level, '')
+
+    def save_chrome_trace(self, path):
+        """
+        Save the recorded phases to `path` in the Chrome trace event format,
+        which can be viewed in chrome://tracing or Perfetto. Each phase is a
+        complete event, and the memory use is saved as a counter.
+        """
+        pid = os.getpid()
+        trace_events = []
+        for event in self.events:
+            args = {'iteration': event['iteration'],
+                    'memory start (MB)': event['memory_start'],
+                    'memory end (MB)': event['memory_end']}
+            args.update(event['args'])
+            trace_events.append({
+                'name': event['name'],
+                'cat': 'rmg',
+                'ph': 'X',
+                'ts': event['start'] * 1.0e6,
+                'dur': event['duration'] * 1.0e6,
+                'pid': pid,
+                'tid': 0,
+                'args': args,
+            })
+            for ts, memory in [(event['start'], event['memory_start']),
+                               (event['start'] + event['duration'], event['memory_end'])]:
+                trace_events.append({'name': 'memory', 'ph': 'C', 'ts': ts * 1.0e6, 'pid': pid,
+                                     'args': {'RSS (MB)': memory}})
+        for iteration, start in self.iteration_starts.items():
+            trace_events.append({'name': 'iteration {0:d}'.format(iteration), 'cat': 'rmg', 'ph': 'i', 's': 'p',
+                                 'ts': start * 1.0e6, 'pid': pid, 'tid': 0})
+        trace_events.sort(key=lambda e: e['ts'])
+
+        with open(path, 'w') as f:
+            json.dump({'traceEvents': trace_events, 'displayTimeUnit': 'ms'}, f)
+
+    def save_summary(self, path):
+        """
+        Save the summary given by :meth:`get_summary` to `path` as a csv file
+        with one row per iteration.
+        """
+        names = self.get_phase_names() + ['other', 'total']
+        with open(path, 'w') as csvfile:
+            worksheet = csv.writer(csvfile)
+            worksheet.writerow(['Iteration'] + ['{0} (s)'.format(name) for name in names] + ['Peak memory (MB)'])
+            for iteration, row in self.get_summary().items():
+                worksheet.writerow([iteration] + [row[name] for name in names] + [row['peak memory']])
+
+
+_tracer = PhaseTracer(enabled=False)
+
+
+def get_tracer():
+    """
+    Return the :class:`PhaseTracer` used to record the phases of the
+    current RMG job. It is disabled unless tracing was requested.
+    """
+    return _tracer
+
+
+def set_tracer(tracer):
+    """
+    Use `tracer` to record the phases of the current RMG job.
+    """
+    global _tracer
+    _tracer = tracer
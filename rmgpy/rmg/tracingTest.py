@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+
+###############################################################################
+#                                                                             #
+# RMG - Reaction Mechanism Generator                                          #
+#                                                                             #
+# Copyright (c) 2002-2019 Prof. William H. Green (whgreen@mit.edu),           #
+# Prof. Richard H. West (r.west@neu.edu) and the RMG Team (rmg_dev@mit.edu)   #
+#                                                                             #
+# Permission is hereby granted, free of charge, to any person obtaining a     #
+# copy of this software and associated documentation files (the 'Software'),  #
+# to deal in the Software without restriction, including without limitation   #
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,    #
+# and/or sell copies of the Software, and to permit persons to whom the       #
+# Software is furnished to do so, subject to the following conditions:        #
+#                                                                             #
+# The above copyright notice and this permission notice shall be included in  #
+# all copies or substantial portions of the Software.                         #
+#                                                                             #
+# THE SOFTWARE IS PROVIDED 'AS IS', WITHOUT WARRANTY OF ANY KIND, EXPRESS OR  #
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,    #
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE #
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER      #
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING     #
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER         #
+# DEALINGS IN THE SOFTWARE.                                                   #
+#                                                                             #
+###############################################################################
+
+"""
+This module contains unit tests of the :mod:`rmgpy.rmg.tracing` module.
+"""
+
+import csv
+import json
+import os
+import shutil
+import tempfile
+import time
+import unittest
+
+from rmgpy.rmg.tracing import PhaseTracer
+
+
+class TestPhaseTracer(unittest.TestCase):
+    """
+    Contains unit tests of the PhaseTracer class.
+    """
+
+    def setUp(self):
+        self.output_directory = tempfile.mkdtemp()
+        self.tracer = PhaseTracer()
+        self.tracer.start_iteration(0)
+        with self.tracer.phase('reaction generation'):
+            time.sleep(0.01)
+        self.tracer.start_iteration(1)
+        with self.tracer.phase('simulation', reaction_system=1):
+            with self.tracer.phase('pdep'):
+                time.sleep(0.01)
+        with self.tracer.phase('simulation', reaction_system=2):
+            time.sleep(0.01)
+
+    def tearDown(self):
+        shutil.rmtree(self.output_directory)
+
+    def test_disabled(self):
+        """
+        Test that a disabled tracer does not record anything.
+        """
+        tracer = PhaseTracer(enabled=False)
+        tracer.start_iteration(1)
+        with tracer.phase('thermo'):
+            pass
+        self.assertEqual(tracer.events, [])
+        self.assertEqual(tracer.get_summary(), {})
+
+    def test_summary(self):
+        """
+        Test that the time spent in each phase is summed for each iteration.
+        """
+        summary = self.tracer.get_summary()
+        self.assertEqual(list(summary.keys()), [0, 1])
+        self.assertEqual(self.tracer.get_phase_names(), ['reaction generation', 'simulation', 'pdep'])
+        self.assertGreaterEqual(summary[0]['reaction generation'], 0.01)
+        self.assertEqual(summary[0]['simulation'], 0.0)
+        self.assertGreaterEqual(summary[1]['simulation'], 0.02)
+        self.assertGreaterEqual(summary[1]['simulation'], summary[1]['pdep'] + 0.01)
+        # nested phases are not counted twice
+        self.assertAlmostEqual(summary[1]['total'], summary[1]['simulation'] + summary[1]['other'], 6)
+        self.assertGreater(summary[1]['peak memory'], 0.0)
+
+    def test_save_chrome_trace(self):
+        """
+        Test that the phases are saved as complete events in the Chrome trace format.
+        """
+        path = os.path.join(self.output_directory, 'trace.json')
+        self.tracer.save_chrome_trace(path)
+        with open(path, 'r') as f:
+            trace = json.load(f)
+        events = [event for event in trace['traceEvents'] if event['ph'] == 'X']
+        self.assertEqual([event['name'] for event in events], ['reaction generation', 'simulation', 'pdep',
+                                                               'simulation'])
+        self.assertEqual(events[1]['args']['reaction_system'], 1)
+        self.assertEqual(events[1]['args']['iteration'], 1)
+        # the nested phase lies within its parent
+        self.assertGreaterEqual(events[2]['ts'], events[1]['ts'])
+        self.assertLessEqual(events[2]['ts'] + events[2]['dur'], events[1]['ts'] + events[1]['dur'])
+        self.assertTrue(any(event['ph'] == 'C' for event in trace['traceEvents']))
+
+    def test_save_summary(self):
+        """
+        Test that the summary is saved with one row per iteration.
+        """
+        path = os.path.join(self.output_directory, 'trace_summary.csv')
+        self.tracer.save_summary(path)
+        with open(path, 'r') as f:
+            rows = list(csv.reader(f))
+        self.assertEqual(rows[0], ['Iteration', 'reaction generation (s)', 'simulation (s)', 'pdep (s)', 'other (s)',
+                                   'total (s)', 'Peak memory (MB)'])
+        self.assertEqual([row[0] for row in rows[1:]], ['0', '1'])
+
+
+if __name__ == '__main__':
+    unittest.main(testRunner=unittest.TextTestRunner(verbosity=2))
@@ -96,6 +96,8 @@ cdef class ReactionSystem(DASx):
     cdef public np.ndarray sensitivity_coefficients
     cdef public list sensitive_species
     cdef public double sensitivity_threshold
+    cdef public str sensitivity_method
+    cdef public list sensitivity_times
     # cdef public np.ndarray senpar
 
     # tolerance settings
@@ -103,6 +105,8 @@ cdef class ReactionSystem(DASx):
     cdef public np.ndarray rtol_array
     
     cdef public list snapshots
+    cdef public list snapshot_listeners
+    cdef public int snapshot_flush_interval
 
     cdef public list termination
     
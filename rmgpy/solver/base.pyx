@@ -158,6 +158,10 @@ cdef class ReactionSystem(DASx):
         self.sensitivity_coefficients = None
         self.sensitive_species = sensitive_species
         self.sensitivity_threshold = sensitivity_threshold
+        # 'forward' integrates the full sensitivity system with the solver, 'adjoint' only the species and then
+        # computes the sensitivities of the sensitive species at the `sensitivity_times` (in s) in a backward sweep
+        self.sensitivity_method = 'forward'
+        self.sensitivity_times = None
         self.senpar = None
 
         # tolerance settings
@@ -172,6 +176,11 @@ cdef class ReactionSystem(DASx):
 
         self.termination = termination or []
 
+        # Listeners whose update() method is also called every `snapshot_flush_interval` snapshots
+        # during the integration, e.g. to write the simulation profile incrementally
+        self.snapshot_listeners = []
+        self.snapshot_flush_interval = 1000
+
         # Flag to indicate whether or not reactions with 3 reactants are present 
         self.trimolecular = False
 
@@ -385,6 +394,7 @@ cdef class ReactionSystem(DASx):
             self.senpar = np.zeros(self.num_core_reactions + self.num_core_species, np.float64)
 
         else:
+            self.sensitivity = False
             self.neq = self.num_core_species
 
             self.atol_array = np.ones(self.neq, np.float64) * atol
@@ -581,6 +591,12 @@ cdef class ReactionSystem(DASx):
         the model to be invalid is returned. If the simulation completes to
         the desired termination criteria and the model remains valid throughout,
         ``None`` is returned.
+
+        If `sensitivity` is ``True`` and the `sensitivity_method` of the
+        reaction system is ``'adjoint'``, only the species are integrated and
+        the sensitivities are computed afterwards by
+        :meth:`compute_adjoint_sensitivities` at the `sensitivity_times`
+        (default: the final time) instead of at every time step.
         """
         cdef double tol_keep_in_edge, tol_move_to_core, tol_move_edge_reaction_to_core, tol_interrupt_simulation
         cdef double tol_move_edge_reaction_to_core_interrupt, tol_move_edge_reaction_to_surface
@@ -615,6 +631,8 @@ cdef class ReactionSystem(DASx):
         cdef np.ndarray[np.int_t, ndim=1] sens_species_indices, reactant_side, product_side
         cdef np.ndarray[np.float64_t, ndim=1] mole_sens, dVdk, norm_sens
         cdef list time_array, norm_sens_array, new_surface_reactions, new_surface_reaction_inds, new_objects, new_object_inds
+        cdef list trajectory_times, trajectory_states
+        cdef bint adjoint
 
         zero_production = False
         zero_consumption = False
@@ -665,10 +683,13 @@ cdef class ReactionSystem(DASx):
         for index, spec in enumerate(core_species):
             species_index[spec] = index
 
+        # In adjoint mode the solver only integrates the species
+        adjoint = sensitivity and self.sensitivity_method == 'adjoint'
+
         self.initialize_model(core_species, core_reactions,
                               edge_species, edge_reactions,
                               surface_species, surface_reactions,
-                              pdep_networks, atol, rtol, sensitivity,
+                              pdep_networks, atol, rtol, sensitivity and not adjoint,
                               sens_atol, sens_rtol,
                               filter_reactions, conditions)
 
@@ -717,6 +738,8 @@ cdef class ReactionSystem(DASx):
             # identify sensitive species indices
             sens_species_indices = np.array([species_index[spec] for spec in self.sensitive_species],
                                                np.int)  # index within core_species list of the sensitive species
+            trajectory_times = []
+            trajectory_states = []
 
         step_time = 1e-12
         prev_time = self.t
@@ -782,7 +805,10 @@ cdef class ReactionSystem(DASx):
 
             y_core_species = self.y[:num_core_species]
             total_moles = np.sum(y_core_species)
-            if sensitivity:
+            if adjoint:
+                trajectory_times.append(self.t)
+                trajectory_states.append(y_core_species.copy())
+            elif sensitivity:
                 time_array.append(self.t)
                 mole_sens = self.y[num_core_species:]
                 volume = self.V
@@ -805,6 +831,9 @@ cdef class ReactionSystem(DASx):
             snapshot = [self.t, self.V]
             snapshot.extend(y_core_species)
             self.snapshots.append(snapshot)
+            if self.snapshot_listeners and len(self.snapshots) % self.snapshot_flush_interval == 0:
+                for listener in self.snapshot_listeners:
+                    listener.update(self)
 
             # Get the characteristic flux
             char_rate = sqrt(np.sum(self.core_species_rates * self.core_species_rates))
@@ -1254,6 +1283,11 @@ cdef class ReactionSystem(DASx):
         # notify reaction system listeners
         self.notify()
 
+        if adjoint:
+            time_array = self.get_sensitivity_times(trajectory_times)
+            norm_sens_array = self.compute_adjoint_sensitivities(trajectory_times, trajectory_states,
+                                                                 list(sens_species_indices), time_array)
+
         if sensitivity:
             for i in range(len(self.sensitive_species)):
                 with open(sens_worksheet[i], 'w') as outfile:
@@ -1314,6 +1348,133 @@ cdef class ReactionSystem(DASx):
                 X = 1 - (self.y[index] / y0[index])
                 logging.info('    {0} conversion: {1:<10.4g}'.format(term.species, X))
 
+    def get_sensitivity_times(self, list times):
+        """
+        Return the times at which adjoint sensitivities are reported for a
+        simulation with time points `times`: the `sensitivity_times`, or the
+        final time point if none are given.
+        """
+        cdef list output_times
+
+        if not self.sensitivity_times:
+            return [times[-1]]
+        output_times = []
+        for time in sorted(self.sensitivity_times):
+            if time > times[-1]:
+                logging.warning('Sensitivity time {0:g} s is after the end of the simulation at {1:g} s; '
+                                'reporting sensitivities at the final time instead.'.format(time, times[-1]))
+                time = times[-1]
+            if time not in output_times:
+                output_times.append(time)
+        return output_times
+
+    def interpolate_state(self, list times, list states, double time):
+        """
+        Return the core species mole numbers at `time` from the time points
+        `times` and mole numbers `states` of a completed simulation, using
+        cubic Hermite interpolation with the species rates at the enclosing
+        time points.
+        """
+        cdef int k
+        cdef double h, s
+        cdef np.ndarray[np.float64_t, ndim=1] dydt, f0, f1
+
+        k = int(np.searchsorted(times, time))
+        if times[k] == time:
+            return states[k]
+        h = times[k] - times[k - 1]
+        s = (time - times[k - 1]) / h
+        dydt = np.zeros(len(states[k]), np.float64)
+        f0 = self.residual(times[k - 1], states[k - 1], dydt, self.senpar)[0]
+        f1 = self.residual(times[k], states[k], dydt, self.senpar)[0]
+        return ((2 * s ** 3 - 3 * s ** 2 + 1) * states[k - 1] + (s ** 3 - 2 * s ** 2 + s) * h * f0
+                + (3 * s ** 2 - 2 * s ** 3) * states[k] + (s ** 3 - s ** 2) * h * f1)
+
+    def compute_adjoint_sensitivities(self, list times, list states, list species_indices, list output_times):
+        """
+        Compute the normalized sensitivities of the concentrations of the
+        core species with the given `species_indices` with respect to the
+        core reaction rate coefficients and species Gibbs free energies,
+        using the adjoint of the sensitivity equations.
+
+        `times` and `states` contain the time points and core species mole
+        numbers of a completed simulation. For an observable c_i at time T,
+        the adjoint vector satisfies dλ/dt = -J^T λ backwards from T, and
+        dc_i(T)/dp = ∫ λ^T (df/dp) dt. All observables are integrated
+        together in a single backward sweep with the implicit Euler method,
+        so the cost scales with the number of observables rather than the
+        number of parameters. The sweep uses the simulation time points up to
+        the last of the `output_times`, with the output times that are not
+        simulation time points inserted using :meth:`interpolate_state`.
+
+        Returns a list with an entry for each sensitive species, each
+        containing an array of the normalized sensitivities (as in forward
+        mode: dln c/dln k and dln c/dG in mol/kcal) at each of the
+        `output_times`.
+        """
+        cdef int num_core_species, num_core_reactions, num_params, num_outputs, num_observables, k, m, i
+        cdef double h, c, RTP
+        cdef list grid_times, grid_states
+        cdef np.ndarray[np.float64_t, ndim=1] dydt, scale
+        cdef np.ndarray[np.float64_t, ndim=2] adjoint, sens, scales, jacobian, rate_deriv, identity
+        cdef dict grid_indices, observables_at_time
+
+        num_core_species = self.num_core_species
+        num_core_reactions = self.num_core_reactions
+        num_params = num_core_reactions + num_core_species
+        num_outputs = len(output_times)
+        num_observables = len(species_indices) * num_outputs
+        RTP = 0.0 if self.constant_volume else constants.R * self.T.value_si / self.P.value_si
+
+        grid_times = sorted(set([time for time in times if time < max(output_times)] + output_times))
+        grid_states = [self.interpolate_state(times, states, time) for time in grid_times]
+        grid_indices = {time: k for k, time in enumerate(grid_times)}
+
+        # Observable m corresponds to species species_indices[m // num_outputs] at time output_times[m % num_outputs]
+        observables_at_time = {}
+        for m in range(num_observables):
+            observables_at_time.setdefault(grid_indices[output_times[m % num_outputs]], []).append(m)
+
+        adjoint = np.zeros((num_core_species, num_observables), np.float64)
+        sens = np.zeros((num_observables, num_params), np.float64)
+        scales = np.zeros((num_observables, num_params), np.float64)
+        identity = np.identity(num_core_species, np.float64)
+        dydt = np.zeros(num_core_species, np.float64)
+
+        for k in range(len(grid_times) - 1, -1, -1):
+            # Evaluate the Jacobian and parameter derivatives at this time point
+            self.residual(grid_times[k], grid_states[k], dydt, self.senpar)
+            jacobian = self.jacobian(grid_times[k], grid_states[k], dydt, 0.0, self.senpar)
+            rate_deriv = ReactionSystem.compute_rate_derivative(self)
+
+            # Integrate the adjoint vectors back over the interval [t_k, t_k+1]
+            if k < len(grid_times) - 1:
+                h = grid_times[k + 1] - grid_times[k]
+                adjoint = np.linalg.solve(identity - h * jacobian.T, adjoint)
+                sens += h * np.dot(adjoint.T, rate_deriv)
+
+            # Start the adjoint vectors of the observables at this time point
+            for m in observables_at_time.get(k, []):
+                i = species_indices[m // num_outputs]
+                c = self.core_species_concentrations[i]
+                if c == 0:
+                    continue
+                adjoint[i, m] = 1.0 / self.V
+                if not self.constant_volume:
+                    # Account for the change in volume of the ideal gas
+                    adjoint[:, m] -= c * RTP / self.V
+                scale = np.empty(num_params, np.float64)
+                scale[:num_core_reactions] = self.kf[:num_core_reactions] / c
+                # No normalization against dG, conversion to kcal/mol units
+                scale[num_core_reactions:] = 4184 / c
+                scales[m, :] = scale
+
+        # Restore the state of the reaction system at the end of the simulation
+        self.residual(times[-1], states[-1], dydt, self.senpar)
+
+        sens *= scales
+        return [sens[i * num_outputs:(i + 1) * num_outputs, :] for i in range(len(species_indices))]
+
     @cython.boundscheck(False)
     def compute_rate_derivative(self):
         """
@@ -181,6 +181,30 @@ class ReactionSystemTest(unittest.TestCase):
 
         self.assertNotEqual(self.listener.data, [])
 
+    def test_snapshot_listeners(self):
+        """
+        Test that snapshot listeners are updated with the snapshots during the simulation.
+        """
+        reaction_system = self.rmg.reaction_systems[0]
+        reaction_system.snapshot_listeners.append(self.listener)
+        reaction_system.snapshot_flush_interval = 2
+        snapshot_counts = []
+        self.listener.update = lambda subject: snapshot_counts.append(len(subject.snapshots))
+
+        reaction_model = self.rmg.reaction_model
+        reaction_system.simulate(
+            core_species=reaction_model.core.species,
+            core_reactions=reaction_model.core.reactions,
+            edge_species=reaction_model.edge.species,
+            edge_reactions=reaction_model.edge.reactions,
+            surface_species=[],
+            surface_reactions=[],
+            model_settings=ModelSettings(tol_move_to_core=1, tol_keep_in_edge=0, tol_interrupt_simulation=1),
+            simulator_settings=SimulatorSettings(),
+        )
+
+        self.assertEqual(snapshot_counts, list(range(2, len(reaction_system.snapshots) + 1, 2)))
+
     def test_pickle(self):
         """
         Test that a ReactionSystem object can be un/pickled.
@@ -27,7 +27,10 @@
 #                                                                             #
 ###############################################################################
 
+import csv
 import os
+import shutil
+import tempfile
 import unittest
 
 import numpy as np
@@ -284,6 +287,98 @@ class SimpleReactorCheck(unittest.TestCase):
         # fig.subplots_adjust(left=0.12, bottom=0.10, right=0.95, top=0.95, wspace=0.20, hspace=0.35)
         # pylab.show()
 
+    def simulate_sensitivity(self, method, sensitivity_times=None):
+        """
+        Simulate a small methyl/ethane model with the given sensitivity `method`,
+        and return the header and the rows of the sensitivity worksheet of ethane.
+        """
+        ch4 = Species(
+            molecule=[Molecule().from_smiles("C")],
+            thermo=ThermoData(Tdata=([300, 400, 500, 600, 800, 1000, 1500], "K"),
+                              Cpdata=([8.615, 9.687, 10.963, 12.301, 14.841, 16.976, 20.528], "cal/(mol*K)"),
+                              H298=(-17.714, "kcal/mol"), S298=(44.472, "cal/(mol*K)"))
+        )
+        ch3 = Species(
+            molecule=[Molecule().from_smiles("[CH3]")],
+            thermo=ThermoData(Tdata=([300, 400, 500, 600, 800, 1000, 1500], "K"),
+                              Cpdata=([9.397, 10.123, 10.856, 11.571, 12.899, 14.055, 16.195], "cal/(mol*K)"),
+                              H298=(9.357, "kcal/mol"), S298=(45.174, "cal/(mol*K)"))
+        )
+        c2h6 = Species(
+            molecule=[Molecule().from_smiles("CC")],
+            thermo=ThermoData(Tdata=([300, 400, 500, 600, 800, 1000, 1500], "K"),
+                              Cpdata=([12.684, 15.506, 18.326, 20.971, 25.500, 29.016, 34.595], "cal/(mol*K)"),
+                              H298=(-19.521, "kcal/mol"), S298=(54.799, "cal/(mol*K)"))
+        )
+        c2h5 = Species(
+            molecule=[Molecule().from_smiles("C[CH2]")],
+            thermo=ThermoData(Tdata=([300, 400, 500, 600, 800, 1000, 1500], "K"),
+                              Cpdata=([11.635, 13.744, 16.085, 18.246, 21.885, 24.676, 29.107], "cal/(mol*K)"),
+                              H298=(29.496, "kcal/mol"), S298=(56.687, "cal/(mol*K)"))
+        )
+        core_species = [ch4, ch3, c2h6, c2h5]
+        core_reactions = [
+            Reaction(reactants=[c2h6, ch3], products=[c2h5, ch4],
+                     kinetics=Arrhenius(A=(686.375 * 6, 'm^3/(mol*s)'), n=4.40721, Ea=(7.82799, 'kcal/mol'),
+                                        T0=(298.15, 'K'))),
+            Reaction(reactants=[c2h6], products=[ch3, ch3],
+                     kinetics=Arrhenius(A=(686.375e6, '1/s'), n=4.40721, Ea=(7.82799, 'kcal/mol'),
+                                        T0=(298.15, 'K'))),
+        ]
+
+        rxn_system = SimpleReactor(1000, 1.0e5,
+                                   initial_mole_fractions={c2h5: 0.1, ch3: 0.1, ch4: 0.4, c2h6: 0.4},
+                                   n_sims=1, termination=[TerminationTime((1e-5, 's'))],
+                                   sensitive_species=[c2h6], sensitivity_threshold=1e-6)
+        rxn_system.sensitivity_method = method
+        rxn_system.sensitivity_times = sensitivity_times
+        folder = tempfile.mkdtemp()
+        try:
+            path = os.path.join(folder, 'sensitivity_{0}.csv'.format(method))
+            model_settings = ModelSettings(tol_keep_in_edge=0, tol_move_to_core=1, tol_interrupt_simulation=0)
+            rxn_system.simulate(core_species, core_reactions, [], [], [], [], sensitivity=True,
+                                sens_worksheet=[path], model_settings=model_settings,
+                                simulator_settings=SimulatorSettings())
+            with open(path) as f:
+                rows = list(csv.reader(f))
+        finally:
+            shutil.rmtree(folder)
+        return rows[0], rows[1:]
+
+    def test_adjoint_sensitivity(self):
+        """
+        Test that the adjoint sensitivities match the forward sensitivities at the final time.
+        """
+        forward_header, forward_rows = self.simulate_sensitivity('forward')
+        adjoint_header, adjoint_rows = self.simulate_sensitivity('adjoint')
+        self.assertEqual(len(adjoint_rows), 1)
+        self.assertAlmostEqual(float(adjoint_rows[0][0]), float(forward_rows[-1][0]))
+        # The adjoint file only contains the final time, so it may have fewer columns above the threshold
+        forward_values = dict(zip(forward_header[1:], forward_rows[-1][1:]))
+        self.assertTrue(len(adjoint_header) > 1)
+        for label, adjoint_value in zip(adjoint_header[1:], adjoint_rows[0][1:]):
+            forward_value = float(forward_values[label])
+            self.assertAlmostEqual(float(adjoint_value), forward_value, delta=0.05 * abs(forward_value))
+
+    def test_adjoint_sensitivity_between_steps(self):
+        """
+        Test that the adjoint sensitivities are reported at a requested time between solver steps,
+        and match the forward sensitivities interpolated to that time.
+        """
+        time = 3.7e-6
+        forward_header, forward_rows = self.simulate_sensitivity('forward')
+        adjoint_header, adjoint_rows = self.simulate_sensitivity('adjoint', sensitivity_times=[time])
+        self.assertEqual(len(adjoint_rows), 1)
+        self.assertEqual(float(adjoint_rows[0][0]), time)
+
+        forward_times = np.array([float(row[0]) for row in forward_rows])
+        self.assertNotIn(time, forward_times)
+        self.assertTrue(len(adjoint_header) > 1)
+        for label, adjoint_value in zip(adjoint_header[1:], adjoint_rows[0][1:]):
+            j = forward_header.index(label)
+            forward_value = np.interp(time, forward_times, [float(row[j]) for row in forward_rows])
+            self.assertAlmostEqual(float(adjoint_value), forward_value, delta=0.05 * abs(forward_value))
+
     def test_collider_model(self):
         """
         Test the solver's ability to simulate a model with collision efficiencies.
@@ -30,7 +30,6 @@
 import logging
 import os.path
 
-import matplotlib.pyplot as plt
 try:
     import xlwt
 except ImportError:
@@ -174,6 +173,8 @@ class ExecutionStatsWriter(object):
         folder.
         """
 
+        import matplotlib.pyplot as plt
+
         logging.info('Generating plots of execution statistics...')
 
         fig = plt.figure()
@@ -27,6 +27,7 @@
 #                                                                             #
 ###############################################################################
 
+import multiprocessing
 import os.path
 
 import cantera as ct
@@ -365,153 +366,227 @@ class Cantera(object):
                                         num_reactions=top_sensitive_reactions).barplot(
                     os.path.join(self.output_directory, '{0}_{1}_sensitivity.png'.format(i + 1, species.to_chemkin())))
 
-    def simulate(self):
+    def simulate(self, nprocs=1, output_species=None):
         """
         Run all the conditions as a cantera simulation.
         Returns the data as a list of tuples containing: (time, [list of temperature, pressure, and species data]) 
             for each reactor condition
+
+        If `nprocs` is larger than one, the conditions are divided between that many worker processes, each of which
+        simulates with its own copy of the loaded cantera model. The data is returned in the order of the conditions.
+        If `output_species` is given as a list of RMG species objects, only the data of those species is kept, which
+        reduces the data transferred from the workers. Temperature, pressure and sensitivity data are always kept.
+        """
+        if output_species is None:
+            species_indices = list(range(len(self.species_list)))
+        else:
+            species_indices = [self.species_list.index(species) for species in output_species]
+
+        if nprocs > 1 and len(self.conditions) > 1:
+            # The workers are forked so that each inherits a copy of this job, including the loaded cantera model,
+            # which cannot be pickled
+            global _cantera_job
+            _cantera_job = self
+            try:
+                p = multiprocessing.get_context('fork').Pool(processes=min(nprocs, len(self.conditions)))
+                results = p.map(_simulate_condition, [(i, species_indices) for i in range(len(self.conditions))])
+                p.close()
+                p.join()
+            finally:
+                _cantera_job = None
+        else:
+            results = [self.simulate_condition(condition, species_indices) for condition in self.conditions]
+
+        return [self.process_condition_data(result, species_indices) for result in results]
+
+    def simulate_condition(self, condition, species_indices=None):
+        """
+        Run a single `condition` as a cantera simulation.
+        Returns a tuple of the lists of times, temperatures and pressures and the arrays of mole fractions and reaction
+        sensitivities, with the mole fractions only of the species in `species_indices` if given. Use `process_condition_data` to convert
+        them into the format returned by `simulate`.
         """
         # Get all the cantera names for the species
         species_names_list = [get_species_identifier(species) for species in self.species_list]
         inert_index_list = [self.species_list.index(species) for species in self.species_list if species.index == -1]
 
-        all_data = []
-        for condition in self.conditions:
+        # First translate the mol_frac from species objects to species names
+        new_mol_frac = {}
+        for key, value in condition.mol_frac.items():
+            newkey = get_species_identifier(key)
+            new_mol_frac[newkey] = value
+
+        # Set Cantera simulation conditions
+        if condition.V0 is None:
+            self.model.TPX = condition.T0.value_si, condition.P0.value_si, new_mol_frac
+        elif condition.P0 is None:
+            self.model.TDX = condition.T0.value_si, 1.0 / condition.V0.value_si, new_mol_frac
+        else:
+            raise Exception(
+                "Cantera conditions in which T0 and P0 or T0 and V0 are not the specified state variables are not yet implemented.")
+
+        # Choose reactor
+        if condition.reactor_type == 'IdealGasReactor':
+            cantera_reactor = ct.IdealGasReactor(self.model)
+        elif condition.reactor_type == 'IdealGasConstPressureReactor':
+            cantera_reactor = ct.IdealGasConstPressureReactor(contents=self.model)
+        elif condition.reactor_type == 'IdealGasConstPressureTemperatureReactor':
+            cantera_reactor = ct.IdealGasConstPressureReactor(contents=self.model, energy='off')
+        else:
+            raise Exception('Other types of reactor conditions are currently not supported')
 
-            # First translate the mol_frac from species objects to species names
-            new_mol_frac = {}
-            for key, value in condition.mol_frac.items():
-                newkey = get_species_identifier(key)
-                new_mol_frac[newkey] = value
+        # Run this individual condition as a simulation
+        cantera_simulation = ct.ReactorNet([cantera_reactor])
 
-            # Set Cantera simulation conditions
-            if condition.V0 is None:
-                self.model.TPX = condition.T0.value_si, condition.P0.value_si, new_mol_frac
-            elif condition.P0 is None:
-                self.model.TDX = condition.T0.value_si, 1.0 / condition.V0.value_si, new_mol_frac
-            else:
-                raise Exception(
-                    "Cantera conditions in which T0 and P0 or T0 and V0 are not the specified state variables are not yet implemented.")
-
-            # Choose reactor
-            if condition.reactor_type == 'IdealGasReactor':
-                cantera_reactor = ct.IdealGasReactor(self.model)
-            elif condition.reactor_type == 'IdealGasConstPressureReactor':
-                cantera_reactor = ct.IdealGasConstPressureReactor(contents=self.model)
-            elif condition.reactor_type == 'IdealGasConstPressureTemperatureReactor':
-                cantera_reactor = ct.IdealGasConstPressureReactor(contents=self.model, energy='off')
+        num_ct_reactions = len(self.model.reactions())
+        if self.sensitive_species:
+            if ct.__version__ == '2.2.1':
+                print('Warning: Cantera version 2.2.1 may not support sensitivity analysis unless SUNDIALS was used during compilation.')
+                print('Warning: Upgrade to newer of Cantera in anaconda using the command "conda update -c rmg cantera"')
+            # Add all the reactions as part of the analysis
+            for i in range(num_ct_reactions):
+                cantera_reactor.add_sensitivity_reaction(i)
+            # Set the tolerances for the sensitivity coefficients
+            cantera_simulation.rtol_sensitivity = 1e-4
+            cantera_simulation.atol_sensitivity = 1e-6
+
+        # Initialize the variables to be saved
+        times = []
+        temperature = []
+        pressure = []
+        species_data = []
+        sensitivity_data = []
+
+        # Begin integration
+        # Run the simulation over 100 time points
+        while cantera_simulation.time < condition.reaction_time.value_si:
+
+            # Advance the state of the reactor network in time from the current time to time t [s], taking as many integrator timesteps as necessary.
+            cantera_simulation.step()
+            times.append(cantera_simulation.time)
+            temperature.append(cantera_reactor.T)
+            pressure.append(cantera_reactor.thermo.P)
+            species_data.append(cantera_reactor.thermo[species_names_list].X)
+
+            if self.sensitive_species:
+                # Cantera returns mass-based sensitivities rather than molar concentration or mole fraction based sensitivities.
+                # The equation for converting between them is:
+                # 
+                # d ln xi = d ln wi - sum_(species i) (dln wi) (xi)
+                # 
+                # where xi is the mole fraction of species i and wi is the mass fraction of species i
+
+                mass_frac_sensitivity_array = cantera_simulation.sensitivities()
+                if condition.reactor_type == 'IdealGasReactor':
+                    # Row 0: mass, Row 1: volume, Row 2: internal energy or temperature, Row 3+: mass fractions of species
+                    mass_frac_sensitivity_array = mass_frac_sensitivity_array[3:, :]
+                elif condition.reactor_type == 'IdealGasConstPressureReactor' or condition.reactor_type == 'IdealGasConstPressureTemperatureReactor':
+                    # Row 0: mass, Row 1: enthalpy or temperature, Row 2+: mass fractions of the species
+                    mass_frac_sensitivity_array = mass_frac_sensitivity_array[2:, :]
+                else:
+                    raise Exception('Other types of reactor conditions are currently not supported')
+
+                for i in range(len(mass_frac_sensitivity_array)):
+                    mass_frac_sensitivity_array[i] *= species_data[-1][i]
+
+                sensitivity_array = np.zeros(len(self.sensitive_species) * len(self.model.reactions()))
+                for index, species in enumerate(self.sensitive_species):
+                    for j in range(num_ct_reactions):
+                        sensitivity_array[num_ct_reactions * index + j] = cantera_simulation.sensitivity(
+                            species.to_chemkin(), j)
+
+                        for i in range(len(mass_frac_sensitivity_array)):
+                            if i not in inert_index_list:
+                                # massFracSensitivity for inerts are returned as nan in Cantera, so we must not include them here
+                                sensitivity_array[num_ct_reactions * index + j] -= mass_frac_sensitivity_array[i][j]
+                sensitivity_data.append(sensitivity_array)
+
+        # Convert species_data and sensitivity_data to a numpy array
+        species_data = np.array(species_data)
+        sensitivity_data = np.array(sensitivity_data)
+        if species_indices is not None:
+            species_data = species_data[:, species_indices]
+
+        return times, temperature, pressure, species_data, sensitivity_data
+
+    def process_condition_data(self, condition_result, species_indices=None):
+        """
+        Convert the data returned by `simulate_condition` into a tuple containing
+        (time, [list of temperature, pressure, and species data], [list of reaction sensitivity data]),
+        where `species_indices` are the indices of the species whose data was kept, if not all of them.
+        """
+        times, temperature, pressure, species_data, sensitivity_data = condition_result
+        if species_indices is None:
+            species_indices = list(range(len(self.species_list)))
+        num_ct_reactions = len(self.model.reactions())
+
+        # Resave data into generic data objects
+        time = GenericData(label='Time',
+                           data=times,
+                           units='s')
+        temperature = GenericData(label='Temperature',
+                                  data=temperature,
+                                  units='K')
+        pressure = GenericData(label='Pressure',
+                               data=pressure,
+                               units='Pa')
+        condition_data = []
+        condition_data.append(temperature)
+        condition_data.append(pressure)
+
+        for column, index in enumerate(species_indices):
+            species = self.species_list[index]
+            # Create generic data object that saves the species object into the species object.  To allow easier manipulate later.
+            species_generic_data = GenericData(label=get_species_identifier(species),
+                                               species=species,
+                                               data=species_data[:, column],
+                                               index=species.index
+                                               )
+            condition_data.append(species_generic_data)
+
+        reaction_sensitivity_data = []
+        for index, species in enumerate(self.sensitive_species):
+            for j in range(num_ct_reactions):
+                reaction_sensitivity_generic_data = GenericData(
+                    label='dln[{0}]/dln[k{1}]: {2}'.format(species.to_chemkin(), j + 1, self.model.reactions()[j]),
+                    species=species,
+                    reaction=self.model.reactions()[j],
+                    data=sensitivity_data[:, num_ct_reactions * index + j],
+                    index=j + 1,
+                    )
+                reaction_sensitivity_data.append(reaction_sensitivity_generic_data)
+
+        return time, condition_data, reaction_sensitivity_data
+
+    def simulate_ignition_delays(self, metric='maxDerivative', species=None, nprocs=1):
+        """
+        Run all the conditions and return a list of their ignition delays in s, found using `find_ignition_delay`
+        with the given `metric`. The ignition delay is found from the pressure profile unless a list of RMG `species`
+        is given, in which case only the data of those species is kept and used.
+        """
+        data = self.simulate(nprocs=nprocs, output_species=species or [])
+        ignition_delays = []
+        for time, condition_data, reaction_sensitivity_data in data:
+            if species:
+                y_var = [species_data.data for species_data in condition_data[2:]]
+                if metric != 'maxSpeciesConcentrations':
+                    y_var = y_var[0]
             else:
-                raise Exception('Other types of reactor conditions are currently not supported')
+                y_var = np.array(condition_data[1].data)
+            ignition_delays.append(find_ignition_delay(np.array(time.data), y_var, metric))
+        return ignition_delays
 
-            # Run this individual condition as a simulation
-            cantera_simulation = ct.ReactorNet([cantera_reactor])
 
-            num_ct_reactions = len(self.model.reactions())
-            if self.sensitive_species:
-                if ct.__version__ == '2.2.1':
-                    print('Warning: Cantera version 2.2.1 may not support sensitivity analysis unless SUNDIALS was used during compilation.')
-                    print('Warning: Upgrade to newer of Cantera in anaconda using the command "conda update -c rmg cantera"')
-                # Add all the reactions as part of the analysis
-                for i in range(num_ct_reactions):
-                    cantera_reactor.add_sensitivity_reaction(i)
-                # Set the tolerances for the sensitivity coefficients
-                cantera_simulation.rtol_sensitivity = 1e-4
-                cantera_simulation.atol_sensitivity = 1e-6
-
-            # Initialize the variables to be saved
-            times = []
-            temperature = []
-            pressure = []
-            species_data = []
-            sensitivity_data = []
-
-            # Begin integration
-            time = 0.0
-            # Run the simulation over 100 time points
-            while cantera_simulation.time < condition.reaction_time.value_si:
-
-                # Advance the state of the reactor network in time from the current time to time t [s], taking as many integrator timesteps as necessary.
-                cantera_simulation.step()
-                times.append(cantera_simulation.time)
-                temperature.append(cantera_reactor.T)
-                pressure.append(cantera_reactor.thermo.P)
-                species_data.append(cantera_reactor.thermo[species_names_list].X)
-
-                if self.sensitive_species:
-                    # Cantera returns mass-based sensitivities rather than molar concentration or mole fraction based sensitivities.
-                    # The equation for converting between them is:
-                    # 
-                    # d ln xi = d ln wi - sum_(species i) (dln wi) (xi)
-                    # 
-                    # where xi is the mole fraction of species i and wi is the mass fraction of species i
-
-                    mass_frac_sensitivity_array = cantera_simulation.sensitivities()
-                    if condition.reactor_type == 'IdealGasReactor':
-                        # Row 0: mass, Row 1: volume, Row 2: internal energy or temperature, Row 3+: mass fractions of species
-                        mass_frac_sensitivity_array = mass_frac_sensitivity_array[3:, :]
-                    elif condition.reactor_type == 'IdealGasConstPressureReactor' or condition.reactor_type == 'IdealGasConstPressureTemperatureReactor':
-                        # Row 0: mass, Row 1: enthalpy or temperature, Row 2+: mass fractions of the species
-                        mass_frac_sensitivity_array = mass_frac_sensitivity_array[2:, :]
-                    else:
-                        raise Exception('Other types of reactor conditions are currently not supported')
-
-                    for i in range(len(mass_frac_sensitivity_array)):
-                        mass_frac_sensitivity_array[i] *= species_data[-1][i]
-
-                    sensitivity_array = np.zeros(len(self.sensitive_species) * len(self.model.reactions()))
-                    for index, species in enumerate(self.sensitive_species):
-                        for j in range(num_ct_reactions):
-                            sensitivity_array[num_ct_reactions * index + j] = cantera_simulation.sensitivity(
-                                species.to_chemkin(), j)
-
-                            for i in range(len(mass_frac_sensitivity_array)):
-                                if i not in inert_index_list:
-                                    # massFracSensitivity for inerts are returned as nan in Cantera, so we must not include them here
-                                    sensitivity_array[num_ct_reactions * index + j] -= mass_frac_sensitivity_array[i][j]
-                    sensitivity_data.append(sensitivity_array)
-
-            # Convert species_data and sensitivity_data to a numpy array
-            species_data = np.array(species_data)
-            sensitivity_data = np.array(sensitivity_data)
-
-            # Resave data into generic data objects
-            time = GenericData(label='Time',
-                               data=times,
-                               units='s')
-            temperature = GenericData(label='Temperature',
-                                      data=temperature,
-                                      units='K')
-            pressure = GenericData(label='Pressure',
-                                   data=pressure,
-                                   units='Pa')
-            condition_data = []
-            condition_data.append(temperature)
-            condition_data.append(pressure)
-
-            for index, species in enumerate(self.species_list):
-                # Create generic data object that saves the species object into the species object.  To allow easier manipulate later.
-                species_generic_data = GenericData(label=species_names_list[index],
-                                                   species=species,
-                                                   data=species_data[:, index],
-                                                   index=species.index
-                                                   )
-                condition_data.append(species_generic_data)
-
-            reaction_sensitivity_data = []
-            for index, species in enumerate(self.sensitive_species):
-                for j in range(num_ct_reactions):
-                    reaction_sensitivity_generic_data = GenericData(
-                        label='dln[{0}]/dln[k{1}]: {2}'.format(species.to_chemkin(), j + 1, self.model.reactions()[j]),
-                        species=species,
-                        reaction=self.model.reactions()[j],
-                        data=sensitivity_data[:, num_ct_reactions * index + j],
-                        index=j + 1,
-                        )
-                    reaction_sensitivity_data.append(reaction_sensitivity_generic_data)
-
-            all_data.append((time, condition_data, reaction_sensitivity_data))
-
-        return all_data
+def _simulate_condition(args):
+    """
+    Simulate the condition with the given index of the cantera job inherited by a worker process, for use with map.
+    """
+    index, species_indices = args
+    return _cantera_job.simulate_condition(_cantera_job.conditions[index], species_indices)
+
+
+# The cantera job whose conditions are being simulated by worker processes
+_cantera_job = None
 
 
 def get_rmg_species_from_user_species(user_list, rmg_list):
@@ -79,6 +79,40 @@ class CanteraTest(unittest.TestCase):
         self.assertEqual(repr_condition.V0, None)
         self.assertEqual(repr_condition.mol_frac, mol_frac)
 
+    def test_parallel_simulate(self):
+        """
+        Test that simulating the conditions in parallel gives the same data in the same order as in serial,
+        and that only the requested species are kept in the reduced output.
+        """
+        from rmgpy.chemkin import load_chemkin_file
+        folder = os.path.join(os.path.dirname(rmgpy.__file__), 'tools/data/various_kinetics')
+        species, reactions = load_chemkin_file(os.path.join(folder, 'chem_annotated.inp'),
+                                               os.path.join(folder, 'species_dictionary.txt'))
+        ethane = [spc for spc in species if spc.label == 'ethane'][0]
+        argon = [spc for spc in species if spc.label == 'Ar'][0]
+
+        job = Cantera(species_list=species, reaction_list=reactions, output_directory=folder)
+        job.load_model()
+        job.generate_conditions(['IdealGasConstPressureTemperatureReactor'], ([1e-4], 's'), [{ethane: 0.05, argon: 0.95}],
+                                Tlist=([1200, 1400, 1600], 'K'), Plist=([1], 'atm'))
+
+        serial_data = job.simulate()
+        parallel_data = job.simulate(nprocs=2)
+        self.assertEqual(len(serial_data), 3)
+        self.assertEqual(len(parallel_data), 3)
+        for (time1, data1, sens1), (time2, data2, sens2) in zip(serial_data, parallel_data):
+            self.assertTrue(np.array_equal(time1.data, time2.data))
+            self.assertEqual(len(data1), len(species) + 2)
+            self.assertEqual([data.label for data in data1], [data.label for data in data2])
+            for series1, series2 in zip(data1, data2):
+                self.assertTrue(np.array_equal(series1.data, series2.data))
+
+        reduced_data = job.simulate(nprocs=2, output_species=[ethane])
+        for (time1, data1, sens1), (time2, data2, sens2) in zip(serial_data, reduced_data):
+            self.assertEqual(len(data2), 3)
+            self.assertIs(data2[2].species, ethane)
+            self.assertTrue(np.array_equal(data1[species.index(ethane) + 2].data, data2[2].data))
+
 
 class RMGToCanteraTest(unittest.TestCase):
     """
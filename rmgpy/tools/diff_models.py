@@ -49,6 +49,8 @@ Flag                    Description
 ======================= ====================================================================================
 --diffOnly              Only show species and reactions which are unique or have different values
 --commonDiffOnly        Only show species and reactions present in BOTH models which have different values
+--nprocs                Number of processes used to load the species dictionaries and to check candidate
+                        species and reactions for isomorphism
 ======================= ====================================================================================
 """
 
@@ -56,29 +58,82 @@ import argparse
 import logging
 import math
 import os
-
-import matplotlib.pyplot as plt
+from multiprocessing import Pool
 
 from rmgpy.chemkin import load_chemkin_file
-from rmgpy.rmg.model import ReactionModel
+from rmgpy.rmg.model import ReactionModel, get_isomorphism_key, generate_isomorphism_reaction_key
 from rmgpy.rmg.output import save_diff_html
 
 
 ################################################################################
 
-def compare_model_kinetics(model1, model2):
+def match_isomorphic(list1, list2, key, nprocs=1):
+    """
+    Pair each item of `list1` with the first item of `list2`, in order, that
+    is isomorphic to it and has not been paired yet. Items are only compared
+    if they have the same `key`, which must be the same for isomorphic items,
+    such as :func:`get_isomorphism_key` for species. If `nprocs` is larger than
+    one, the candidate pairs are checked for isomorphism in that many processes.
+
+    Returns a list of the matched pairs, in the order of `list1`.
+    """
+    buckets1, buckets2 = {}, {}
+    for item in list1:
+        buckets1.setdefault(key(item), []).append(item)
+    for item in list2:
+        buckets2.setdefault(key(item), []).append(item)
+    shared_keys = [k for k in buckets1 if k in buckets2]
+
+    # The full isomorphism matrix of each bucket is only worth computing
+    # up front if it can be divided between processes
+    matrices = {}
+    if nprocs > 1 and shared_keys:
+        p = Pool(processes=nprocs)
+        results = p.map(_check_isomorphism, [(buckets1[k], buckets2[k]) for k in shared_keys])
+        p.close()
+        p.join()
+        matrices = dict(zip(shared_keys, results))
+
+    pairs = []
+    for k in shared_keys:
+        candidates = list(range(len(buckets2[k])))
+        for index1, item1 in enumerate(buckets1[k]):
+            for index2 in candidates:
+                if k in matrices:
+                    match = matrices[k][index1][index2]
+                else:
+                    match = item1.is_isomorphic(buckets2[k][index2])
+                if match:
+                    pairs.append((item1, buckets2[k][index2]))
+                    candidates.remove(index2)
+                    break
+
+    order = {id(item): index for index, item in enumerate(list1)}
+    pairs.sort(key=lambda pair: order[id(pair[0])])
+    return pairs
+
+
+def _check_isomorphism(args):
+    """
+    Return the matrix of isomorphism checks between the two lists of items
+    in `args`, for use with map.
+    """
+    items1, items2 = args
+    return [[item1.is_isomorphic(item2) for item2 in items2] for item1 in items1]
+
+
+def compare_model_kinetics(model1, model2, nprocs=1):
     """
     Compare the kinetics of :class:`ReactionModel` objects `model1` and 
     `model2`, printing the results to stdout.
     """
+    import matplotlib.pyplot as plt
+
     # Determine reactions that both models have in common
-    common_reactions = {}
-    for rxn1 in model1.reactions:
-        for rxn2 in model2.reactions:
-            if rxn1.is_isomorphic(rxn2):
-                common_reactions[rxn1] = rxn2
-                model2.reactions.remove(rxn2)
-                break
+    common_reactions = dict(match_isomorphic(model1.reactions, model2.reactions,
+                                             generate_isomorphism_reaction_key, nprocs=nprocs))
+    matched = set(id(rxn2) for rxn2 in common_reactions.values())
+    model2.reactions[:] = [rxn2 for rxn2 in model2.reactions if id(rxn2) not in matched]
     unique_reactions1 = [rxn for rxn in model1.reactions if rxn not in list(common_reactions.keys())]
     unique_reactions2 = model2.reactions
 
@@ -128,24 +183,17 @@ def compare_model_kinetics(model1, model2):
     plt.show()
 
 
-def compare_model_species(model1, model2):
+def compare_model_species(model1, model2, nprocs=1):
     """
     This function compares two RMG models and returns a list of common species (with a nested list containing
     both species objects as elements), as well as a list of unique species for each model.
     """
-
-    common_species = []
-    unique_species1 = model1.species[:]
-    unique_species2 = []
-
-    for spec2 in model2.species:
-        for spec1 in unique_species1[:]:  # make a copy so you don't remove from the list you are iterating over
-            if spec1.is_isomorphic(spec2):
-                common_species.append([spec1, spec2])
-                unique_species1.remove(spec1)
-                break
-        else:
-            unique_species2.append(spec2)
+    matches = match_isomorphic(model2.species, model1.species, get_isomorphism_key, nprocs=nprocs)
+    common_species = [[spec1, spec2] for spec2, spec1 in matches]
+    matched1 = set(id(spec1) for spec1, spec2 in common_species)
+    matched2 = set(id(spec2) for spec1, spec2 in common_species)
+    unique_species1 = [spec for spec in model1.species if id(spec) not in matched1]
+    unique_species2 = [spec for spec in model2.species if id(spec) not in matched2]
     # Remove species in the mechanism that aren't identified (includes those called out as species
     # but not used)        
     for spec in unique_species1[:]:  # make a copy so you don't remove from the list you are iterating over
@@ -159,7 +207,7 @@ def compare_model_species(model1, model2):
     return common_species, unique_species1, unique_species2
 
 
-def compare_model_reactions(model1, model2):
+def compare_model_reactions(model1, model2, nprocs=1):
     """
     This function compares two RMG models and returns a list of common reactions (with a nested list containing
     both reaction objects as elements), as well as a list of unique reactions for each model.
@@ -181,46 +229,32 @@ def compare_model_reactions(model1, model2):
     for reactionList, reaction in to_remove:
         reactionList.remove(reaction)
 
-    common_reactions = []
-    unique_reactions1 = []
-    unique_reactions2 = []
-    for rxn1 in reaction_list1:
-        for rxn2 in reaction_list2[:]:  # make a copy so you don't remove from the list you are iterating over
-            if rxn1.is_isomorphic(rxn2):
-                common_reactions.append([rxn1, rxn2])
-                # Remove reaction 2 from being chosen a second time.
-                # Let each reaction only appear only once in the diff comparison.
-                # Otherwise this miscounts number of reactions in model 2.
-                reaction_list2.remove(rxn2)
-                break
-    for rxn1 in reaction_list1:
-        for r1, r2 in common_reactions:
-            if rxn1 is r1:
-                break
-        else:
-            unique_reactions1.append(rxn1)
-    for rxn2 in reaction_list2:
-        for r1, r2 in common_reactions:
-            if rxn2 is r2:
-                break
-        else:
-            unique_reactions2.append(rxn2)
+    # Each reaction of model 2 is matched at most once, so that each reaction only appears once
+    # in the diff comparison. Otherwise this miscounts number of reactions in model 2.
+    matches = match_isomorphic(reaction_list1, reaction_list2, generate_isomorphism_reaction_key, nprocs=nprocs)
+    common_reactions = [[rxn1, rxn2] for rxn1, rxn2 in matches]
+    matched1 = set(id(rxn1) for rxn1, rxn2 in common_reactions)
+    matched2 = set(id(rxn2) for rxn1, rxn2 in common_reactions)
+    unique_reactions1 = [rxn for rxn in reaction_list1 if id(rxn) not in matched1]
+    unique_reactions2 = [rxn for rxn in reaction_list2 if id(rxn) not in matched2]
 
     return common_reactions, unique_reactions1, unique_reactions2
 
 
 def save_compare_html(outputDir, chemkin_path1, species_dict_path1, chemkin_path2, species_dict_path2,
-                      read_comments1=True, read_comments2=True):
+                      read_comments1=True, read_comments2=True, nprocs=1):
     """
     Saves a model comparison HTML file based on two sets of chemkin and species dictionary
     files.
     """
     model1 = ReactionModel()
-    model1.species, model1.reactions = load_chemkin_file(chemkin_path1, species_dict_path1, read_comments=read_comments1)
+    model1.species, model1.reactions = load_chemkin_file(chemkin_path1, species_dict_path1,
+                                                         read_comments=read_comments1, procnum=nprocs)
     model2 = ReactionModel()
-    model2.species, model2.reactions = load_chemkin_file(chemkin_path2, species_dict_path2, read_comments=read_comments2)
-    common_reactions, unique_reactions1, unique_reactions2 = compare_model_reactions(model1, model2)
-    common_species, unique_species1, unique_species2 = compare_model_species(model1, model2)
+    model2.species, model2.reactions = load_chemkin_file(chemkin_path2, species_dict_path2,
+                                                         read_comments=read_comments2, procnum=nprocs)
+    common_reactions, unique_reactions1, unique_reactions2 = compare_model_reactions(model1, model2, nprocs=nprocs)
+    common_species, unique_species1, unique_species2 = compare_model_species(model1, model2, nprocs=nprocs)
 
     output_path = outputDir + 'diff.html'
     save_diff_html(output_path, common_species, unique_species1, unique_species2, common_reactions, unique_reactions1,
@@ -281,6 +315,9 @@ def parse_command_line_arguments():
     parser.add_argument('--diffOnly', action='store_true', help='Do not show identical species thermo or reactions')
     parser.add_argument('--commonDiffOnly', action='store_true',
                         help='Only show species and reactions present in BOTH models which have different values')
+    parser.add_argument('--nprocs', type=int, default=1,
+                        help='Number of processes used to load the species dictionaries and to check candidate species '
+                             'and reactions for isomorphism')
 
     args = parser.parse_args()
 
@@ -311,19 +348,25 @@ def main():
         'wd': os.getcwd(),
         'diffOnly': args.diffOnly,
         'commonDiffOnly': args.commonDiffOnly,
+        'nprocs': args.nprocs,
     }
 
     execute(chemkin1, species_dict1, thermo1, chemkin2, species_dict2, thermo2, **kwargs)
 
 
 def execute(chemkin1, species_dict1, thermo1, chemkin2, species_dict2, thermo2, **kwargs):
+    try:
+        nprocs = kwargs['nprocs']
+    except KeyError:
+        nprocs = 1
+
     model1 = ReactionModel()
-    model1.species, model1.reactions = load_chemkin_file(chemkin1, species_dict1, thermo_path=thermo1)
+    model1.species, model1.reactions = load_chemkin_file(chemkin1, species_dict1, thermo_path=thermo1, procnum=nprocs)
     model2 = ReactionModel()
-    model2.species, model2.reactions = load_chemkin_file(chemkin2, species_dict2, thermo_path=thermo2)
+    model2.species, model2.reactions = load_chemkin_file(chemkin2, species_dict2, thermo_path=thermo2, procnum=nprocs)
 
-    common_species, unique_species1, unique_species2 = compare_model_species(model1, model2)
-    common_reactions, unique_reactions1, unique_reactions2 = compare_model_reactions(model1, model2)
+    common_species, unique_species1, unique_species2 = compare_model_species(model1, model2, nprocs=nprocs)
+    common_reactions, unique_reactions1, unique_reactions2 = compare_model_reactions(model1, model2, nprocs=nprocs)
 
     try:
         diff_only = kwargs['diffOnly']
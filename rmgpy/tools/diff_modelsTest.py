@@ -31,7 +31,9 @@ import os.path
 import shutil
 import unittest
 
-from rmgpy.tools.diff_models import execute
+from rmgpy.chemkin import load_chemkin_file
+from rmgpy.rmg.model import ReactionModel
+from rmgpy.tools.diff_models import compare_model_reactions, compare_model_species, execute
 
 
 class DiffModelsTest(unittest.TestCase):
@@ -54,3 +56,45 @@ class DiffModelsTest(unittest.TestCase):
         shutil.rmtree(os.path.join(folder, 'species1'))
         shutil.rmtree(os.path.join(folder, 'species2'))
         os.remove(os.path.join(folder, 'diff.html'))
+
+    def test_keyed_matching(self):
+        """Test that keyed matching gives the same results as comparing every pair, in serial and parallel"""
+        folder = os.path.join(os.getcwd(), 'rmgpy/tools/data/diffmodels')
+        model1 = ReactionModel()
+        model1.species, model1.reactions = load_chemkin_file(os.path.join(folder, 'chem1.inp'),
+                                                             os.path.join(folder, 'species_dictionary1.txt'))
+        model2 = ReactionModel()
+        model2.species, model2.reactions = load_chemkin_file(os.path.join(folder, 'chem2.inp'),
+                                                             os.path.join(folder, 'species_dictionary2.txt'))
+
+        expected_species = []
+        unmatched1 = model1.species[:]
+        for spec2 in model2.species:
+            for spec1 in unmatched1:
+                if spec1.is_isomorphic(spec2):
+                    expected_species.append((spec1, spec2))
+                    unmatched1.remove(spec1)
+                    break
+        expected_reactions = []
+        unmatched2 = model2.reactions[:]
+        for rxn1 in model1.reactions:
+            for rxn2 in unmatched2:
+                if rxn1.is_isomorphic(rxn2):
+                    expected_reactions.append((rxn1, rxn2))
+                    unmatched2.remove(rxn2)
+                    break
+        self.assertTrue(len(expected_species) > 0)
+        self.assertTrue(len(expected_reactions) > 0)
+
+        for nprocs in [1, 2]:
+            common_species, unique_species1, unique_species2 = compare_model_species(model1, model2, nprocs=nprocs)
+            self.assertEqual([(id(s1), id(s2)) for s1, s2 in common_species],
+                             [(id(s1), id(s2)) for s1, s2 in expected_species])
+            self.assertLessEqual(len(unique_species1) + len(common_species), len(model1.species))
+            self.assertLessEqual(len(unique_species2) + len(common_species), len(model2.species))
+
+            common_reactions, unique_reactions1, unique_reactions2 = compare_model_reactions(model1, model2,
+                                                                                             nprocs=nprocs)
+            self.assertEqual([(id(r1), id(r2)) for r1, r2 in common_reactions],
+                             [(id(r1), id(r2)) for r1, r2 in expected_reactions])
+            self.assertEqual([id(rxn) for rxn in unique_reactions2], [id(rxn) for rxn in unmatched2])
@@ -39,6 +39,7 @@ import warnings
 
 import numpy as np
 import pydot
+import scipy.sparse
 
 from rmgpy.kinetics.diffusionLimited import diffusion_limiter
 from rmgpy.rmg.settings import SimulatorSettings
@@ -62,6 +63,7 @@ max_edge_pen_width = 10.0  # The thickness of the edge at maximum species rate
 radius = 1  # The graph radius to plot around a central species
 central_reaction_count = None  # The maximum number of reactions to draw from each central species (None draws all)
 # If radius > 1, then this is the number of reactions from every species
+max_species_rate_count = 2 ** 27  # The maximum number of species-pair rates to hold in memory before using a file
 
 # Options controlling the ODE simulations:
 initial_time = 1e-12  # The time at which to initiate the simulation, in seconds
@@ -86,7 +88,7 @@ def generate_flux_diagram(reaction_model, times, concentrations, reaction_rates,
     a movie. The individual frames and the final movie are saved on disk at
     `output_directory.`
     """
-    global max_node_count, max_edge_count, concentration_tol, species_rate_tol, max_node_pen_width, max_edge_pen_width, radius, central_reaction_count
+    global max_node_count, max_edge_count, concentration_tol, species_rate_tol, max_node_pen_width, max_edge_pen_width, radius, central_reaction_count, max_species_rate_count
     # Allow user defined settings for flux diagram generation if given
     if settings:
         max_node_count = settings.get('max_node_count', max_node_count)
@@ -97,10 +99,10 @@ def generate_flux_diagram(reaction_model, times, concentrations, reaction_rates,
         max_edge_pen_width = settings.get('max_edge_pen_width', max_edge_pen_width)
         radius = settings.get('radius', radius)
         central_reaction_count = settings.get('central_reaction_count', central_reaction_count)
+        max_species_rate_count = settings.get('max_species_rate_count', max_species_rate_count)
 
     # Get the species and reactions corresponding to the provided concentrations and reaction rates
     species_list = reaction_model.core.species[:]
-    num_species = len(species_list)
     reaction_list = reaction_model.core.reactions[:]
 
     # Search for indices of central species
@@ -114,16 +116,11 @@ def generate_flux_diagram(reaction_model, times, concentrations, reaction_rates,
             else:
                 raise Exception("Central species '{}' could not be found in species list.".format(centralSpecies))
 
-    # Compute the rates between each pair of species (big matrix warning!)
-    species_rates = np.zeros((len(times), num_species, num_species), np.float64)
-    for index, reaction in enumerate(reaction_list):
-        rate = reaction_rates[:, index]
-        if not reaction.pairs: reaction.generate_pairs()
-        for reactant, product in reaction.pairs:
-            reactant_index = species_list.index(reactant)
-            product_index = species_list.index(product)
-            species_rates[:, reactant_index, product_index] += rate
-            species_rates[:, product_index, reactant_index] -= rate
+    # Compute the rates between each pair of species connected by a reaction,
+    # using a file on disk if there are too many of them to hold in memory
+    rates_path = os.path.join(output_directory, 'species_rates.dat')
+    pairs, species_rates = compute_species_rates(species_list, reaction_list, reaction_rates, path=rates_path)
+    pair_indices = {pair: index for index, pair in enumerate(pairs)}
 
     # Determine the maximum concentration for each species and the maximum overall concentration
     max_concentrations = np.max(np.abs(concentrations), axis=0)
@@ -133,9 +130,13 @@ def generate_flux_diagram(reaction_model, times, concentrations, reaction_rates,
     max_reaction_rates = np.max(np.abs(reaction_rates), axis=0)
 
     # Determine the maximum rate for each species-species pair and the maximum overall species-species rate
-    max_species_rates = np.max(np.abs(species_rates), axis=0)
-    max_species_rate = np.max(max_species_rates)
-    species_index = max_species_rates.reshape((num_species * num_species)).argsort()
+    max_species_rates = np.zeros(len(pairs), np.float64)
+    chunk_size = _get_chunk_size(len(pairs))
+    for start in range(0, len(times), chunk_size):
+        max_species_rates = np.maximum(max_species_rates,
+                                       np.max(np.abs(species_rates[start:start + chunk_size]), axis=0))
+    max_species_rate = np.max(max_species_rates) if len(pairs) > 0 else 0.0
+    species_index = max_species_rates.argsort()
 
     # Determine the nodes and edges to keep
     nodes = []
@@ -153,13 +154,9 @@ def generate_flux_diagram(reaction_model, times, concentrations, reaction_rates,
                                reactionCount=central_reaction_count,
                                rad=radius)
     else:
-        for i in range(num_species * num_species):
-            product_index, reactant_index = divmod(species_index[-i - 1], num_species)
-            if reactant_index > product_index:
-                # Both reactant -> product and product -> reactant are in this list,
-                # so only keep one of them
-                continue
-            if max_species_rates[reactant_index, product_index] == 0:
+        for i in range(len(pairs)):
+            reactant_index, product_index = pairs[species_index[-i - 1]]
+            if max_species_rates[species_index[-i - 1]] == 0:
                 break
             if reactant_index not in nodes and len(nodes) < max_node_count: nodes.append(reactant_index)
             if product_index not in nodes and len(nodes) < max_node_count: nodes.append(product_index)
@@ -267,7 +264,12 @@ def generate_flux_diagram(reaction_model, times, concentrations, reaction_rates,
 
                 edge = graph.get_edge(reactant_string, product_string)[0]
                 # Determine direction of arrow based on sign of rate
-                species_rate = species_rates[t, reactant_index, product_index] / max_species_rate
+                if (reactant_index, product_index) in pair_indices:
+                    species_rate = species_rates[t, pair_indices[(reactant_index, product_index)]] / max_species_rate
+                elif (product_index, reactant_index) in pair_indices:
+                    species_rate = -species_rates[t, pair_indices[(product_index, reactant_index)]] / max_species_rate
+                else:
+                    species_rate = 0.0
                 if species_rate < 0:
                     edge.set_dir("back")
                     species_rate = -species_rate
@@ -297,6 +299,10 @@ def generate_flux_diagram(reaction_model, times, concentrations, reaction_rates,
             graph.write_png(os.path.join(output_directory, 'flux_diagram_{0:04d}.png'.format(frame_number)))
             frame_number += 1
 
+    if isinstance(species_rates, np.memmap):
+        del species_rates
+        os.remove(rates_path)
+
     # Use ffmpeg to stitch the PNG images together into a movie
     import subprocess
 
@@ -313,6 +319,66 @@ def generate_flux_diagram(reaction_model, times, concentrations, reaction_rates,
 
 ################################################################################
 
+def compute_species_rates(species_list, reaction_list, reaction_rates, path=None):
+    """
+    Compute the net rate between each pair of species in `species_list` that
+    is connected by a reaction in `reaction_list`, given the `reaction_rates`
+    at each time point as an array of shape (times x reactions).
+
+    Returns a list of species index pairs ``(i, j)`` with ``i < j`` and an
+    array of shape (times x pairs) containing the net rate from species ``i``
+    to species ``j`` at each time point. Only connected pairs are stored,
+    rather than all N x N combinations. If `path` is given and the rate array
+    would hold more than `max_species_rate_count` values, it is written to
+    that file in chunks of time points and returned as a memory-mapped array,
+    so that it never has to fit in memory at once.
+    """
+    species_indices = {species: index for index, species in enumerate(species_list)}
+    pair_indices = {}
+    rows, columns, signs = [], [], []
+    for index, reaction in enumerate(reaction_list):
+        if not reaction.pairs: reaction.generate_pairs()
+        for reactant, product in reaction.pairs:
+            reactant_index = species_indices[reactant]
+            product_index = species_indices[product]
+            if reactant_index == product_index:
+                # The forward and reverse contributions cancel
+                continue
+            elif reactant_index < product_index:
+                pair, sign = (reactant_index, product_index), 1.0
+            else:
+                pair, sign = (product_index, reactant_index), -1.0
+            rows.append(index)
+            columns.append(pair_indices.setdefault(pair, len(pair_indices)))
+            signs.append(sign)
+    pairs = sorted(pair_indices, key=pair_indices.get)
+
+    # Map reaction rates onto pair rates; duplicate entries are summed
+    reaction_to_pair = scipy.sparse.csr_matrix((signs, (rows, columns)), shape=(len(reaction_list), len(pairs)))
+    reaction_rates = np.asarray(reaction_rates)
+    num_times = reaction_rates.shape[0]
+    if path is None or num_times * len(pairs) <= max_species_rate_count:
+        species_rates = np.zeros((num_times, len(pairs)), np.float64)
+    else:
+        species_rates = np.memmap(path, dtype=np.float64, mode='w+', shape=(num_times, len(pairs)))
+    chunk_size = _get_chunk_size(len(pairs))
+    for start in range(0, num_times, chunk_size):
+        stop = min(start + chunk_size, num_times)
+        species_rates[start:stop] = reaction_to_pair.T.dot(reaction_rates[start:stop].T).T
+    if isinstance(species_rates, np.memmap):
+        species_rates.flush()
+
+    return pairs, species_rates
+
+
+def _get_chunk_size(num_pairs):
+    """
+    Return the number of time points to process at once for `num_pairs`
+    species pairs, keeping each chunk within `max_species_rate_count` values.
+    """
+    return max(1, max_species_rate_count // max(1, num_pairs))
+
+
 def add_adjacent_nodes(targetNodeIndex, nodes, edges, species_list, reaction_list, maxReactionRates, maxSpeciesRates,
                        reactionCount=None, rad=0, mainNodes=None):
     """
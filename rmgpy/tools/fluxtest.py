@@ -30,12 +30,70 @@
 import os
 import os.path
 import shutil
+import tempfile
 import unittest
 
+import numpy as np
 from nose.plugins.attrib import attr
 
 import rmgpy
-from rmgpy.tools.fluxdiagram import create_flux_diagram
+import rmgpy.tools.fluxdiagram
+from rmgpy.reaction import Reaction
+from rmgpy.species import Species
+from rmgpy.tools.fluxdiagram import compute_species_rates, create_flux_diagram
+
+
+class SpeciesRatesTest(unittest.TestCase):
+
+    def setUp(self):
+        self.species_list = [Species(label=label) for label in ['A', 'B', 'C', 'D']]
+        a, b, c, d = self.species_list
+        self.reaction_list = [
+            Reaction(reactants=[a], products=[b], pairs=[(a, b)]),
+            Reaction(reactants=[b, c], products=[a, d], pairs=[(b, a), (c, d)]),
+            Reaction(reactants=[d], products=[c], pairs=[(d, c)]),
+        ]
+        self.reaction_rates = np.random.RandomState(0).uniform(-1, 1, (7, len(self.reaction_list)))
+
+    def get_dense_species_rates(self):
+        """Compute the full species x species rate matrix at each time point."""
+        num_species = len(self.species_list)
+        species_rates = np.zeros((self.reaction_rates.shape[0], num_species, num_species))
+        for index, reaction in enumerate(self.reaction_list):
+            for reactant, product in reaction.pairs:
+                reactant_index = self.species_list.index(reactant)
+                product_index = self.species_list.index(product)
+                species_rates[:, reactant_index, product_index] += self.reaction_rates[:, index]
+                species_rates[:, product_index, reactant_index] -= self.reaction_rates[:, index]
+        return species_rates
+
+    def test_compute_species_rates(self):
+        """Test that the sparse species rates match the dense species rate matrix."""
+        pairs, species_rates = compute_species_rates(self.species_list, self.reaction_list, self.reaction_rates)
+        self.assertEqual(sorted(pairs), [(0, 1), (2, 3)])
+        dense = self.get_dense_species_rates()
+        for index, (i, j) in enumerate(pairs):
+            self.assertTrue(i < j)
+            np.testing.assert_allclose(species_rates[:, index], dense[:, i, j])
+
+    def test_compute_species_rates_on_disk(self):
+        """Test that species rates streamed to disk match those computed in memory."""
+        pairs, species_rates = compute_species_rates(self.species_list, self.reaction_list, self.reaction_rates)
+        folder = tempfile.mkdtemp()
+        max_species_rate_count = rmgpy.tools.fluxdiagram.max_species_rate_count
+        rmgpy.tools.fluxdiagram.max_species_rate_count = 4
+        try:
+            path = os.path.join(folder, 'species_rates.dat')
+            disk_pairs, disk_species_rates = compute_species_rates(self.species_list, self.reaction_list,
+                                                                   self.reaction_rates, path=path)
+            self.assertIsInstance(disk_species_rates, np.memmap)
+            self.assertTrue(os.path.isfile(path))
+            self.assertEqual(disk_pairs, pairs)
+            np.testing.assert_allclose(disk_species_rates, species_rates)
+            del disk_species_rates
+        finally:
+            rmgpy.tools.fluxdiagram.max_species_rate_count = max_species_rate_count
+            shutil.rmtree(folder)
 
 
 @attr('functional')
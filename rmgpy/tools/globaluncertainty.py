@@ -0,0 +1,362 @@
+#!/usr/bin/env python3
+
+###############################################################################
+#                                                                             #
+# RMG - Reaction Mechanism Generator                                          #
+#                                                                             #
+# Copyright (c) 2002-2019 Prof. William H. Green (whgreen@mit.edu),           #
+# Prof. Richard H. West (r.west@neu.edu) and the RMG Team (rmg_dev@mit.edu)   #
+#                                                                             #
+# Permission is hereby granted, free of charge, to any person obtaining a     #
+# copy of this software and associated documentation files (the 'Software'),  #
+# to deal in the Software without restriction, including without limitation   #
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,    #
+# and/or sell copies of the Software, and to permit persons to whom the       #
+# Software is furnished to do so, subject to the following conditions:        #
+#                                                                             #
+# The above copyright notice and this permission notice shall be included in  #
+# all copies or substantial portions of the Software.                         #
+#                                                                             #
+# THE SOFTWARE IS PROVIDED 'AS IS', WITHOUT WARRANTY OF ANY KIND, EXPRESS OR  #
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,    #
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE #
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER      #
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING     #
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER         #
+# DEALINGS IN THE SOFTWARE.                                                   #
+#                                                                             #
+###############################################################################
+
+"""
+This module contains a sampling-based engine for global uncertainty analysis of
+reaction mechanisms simulated with Cantera, which does not require MUQ.
+Uncertain rate coefficients and free energies are sampled by Monte Carlo or
+Latin hypercube sampling, the samples are evaluated in parallel worker
+processes, and the output distributions and first-order variance-based
+sensitivity indices are estimated from the samples.
+"""
+
+import logging
+import multiprocessing
+from time import time
+
+import cantera as ct
+import numpy as np
+
+import rmgpy.constants as constants
+
+
+class ReactorSampler(object):
+    """
+    This class propagates the uncertainties of kinetic and thermodynamic parameters through simulations of the
+    conditions of a Cantera job by sampling. The inputs follow the same conventions as
+    :class:`rmgpy.tools.muq.ReactorPCEFactory`, with the random inputs uniformly distributed in [-1, 1]:
+
+    ======================= ====================================================
+    Attribute               Description
+    ======================= ====================================================
+    `cantera`               A Cantera() object containing CanteraConditions and initialized species and reactions
+    `output_species_list`   A list of Species() objects corresponding to the desired observables for uncertainty analysis
+    `k_params`              Uncorrelated: A list of RMG indices of the reactions corresponding to the uncertain rate coefficients
+                            Correlated: A list of strings of the uncertain kinetic parameter sources, i.e. 'H_Abstraction CHO/Oa'
+    `k_uncertainty`         Uncorrelated: A list of uncertainties dlnk for all reactions in cantera.reaction_list
+                            Correlated: A list of dictionaries of each reaction's partial uncertainties with respect to
+                            various kinetic sources, as found in Uncertainty.kinetic_input_uncertainties
+    `g_params`              Uncorrelated: A list of RMG indices of the species corresponding to the uncertain free energies
+                            Correlated: A list of strings of the uncertain thermo sources, i.e. 'Group(group) C=O'
+    `g_uncertainty`         Uncorrelated: A list of uncertainties dG for all species in cantera.species_list in kcal/mol
+                            Correlated: A list of dictionaries of each species' partial uncertainties with respect to
+                            various thermo sources, as found in Uncertainty.thermo_input_uncertainties
+    `correlated`            ``True`` if the uncertainties are correlated, so that each uncertain parameter may affect
+                            several reactions and species
+    `logx`                  ``True`` to use ln(mole fraction) instead of the mole fraction as the output variable
+    ======================= ====================================================
+
+    The rate coefficients are scaled using the reaction rate multipliers of the Cantera model and the free energies
+    are shifted in the NASA polynomials of the Cantera species, so no RMG objects are copied or modified per sample.
+    The outputs are the final mole fractions of each output species for each condition, in the order
+    [condition 1 species 1, condition 1 species 2, ..., condition 2 species 1, ...].
+    """
+
+    def __init__(self, cantera, output_species_list, k_params, k_uncertainty, g_params, g_uncertainty,
+                 correlated=False, logx=True):
+        self.cantera = cantera
+        self.output_species_list = output_species_list
+        self.output_species_indices = [cantera.species_list.index(spc) for spc in output_species_list]
+        self.correlated = correlated
+        self.logx = logx
+        self.num_conditions = len(cantera.conditions)
+        self.num_output_species = len(output_species_list)
+        self.output_size = self.num_conditions * self.num_output_species
+
+        if not correlated:
+            # Convert the RMG indices into reaction and species list indices
+            rxn_indices = dict((rxn.index, i) for i, rxn in enumerate(cantera.reaction_list))
+            spc_indices = dict((spc.index, i) for i, spc in enumerate(cantera.species_list))
+            try:
+                k_params = [rxn_indices[index] for index in k_params]
+            except KeyError as e:
+                raise ValueError('Could not find requested index {0} in reaction list.'.format(e.args[0]))
+            try:
+                g_params = [spc_indices[index] for index in g_params]
+            except KeyError as e:
+                raise ValueError('Could not find requested index {0} in species list.'.format(e.args[0]))
+            # Each parameter affects a single reaction or species
+            self.k_uncertainty_factors = [[(i, k_uncertainty[i] * np.sqrt(3) / np.log(10))] for i in k_params]
+            self.g_uncertainty_factors = [[(i, g_uncertainty[i] * np.sqrt(3))] for i in g_params]
+        else:
+            # Keep track of which reactions and species each uncertain parameter affects
+            self.k_uncertainty_factors = []
+            for k_param in k_params:
+                self.k_uncertainty_factors.append([(i, uncertainty[k_param] * np.sqrt(3) / np.log(10))
+                                                   for i, uncertainty in enumerate(k_uncertainty)
+                                                   if k_param in uncertainty])
+            self.g_uncertainty_factors = []
+            for g_param in g_params:
+                self.g_uncertainty_factors.append([(i, uncertainty[g_param] * np.sqrt(3))
+                                                   for i, uncertainty in enumerate(g_uncertainty)
+                                                   if g_param in uncertainty])
+
+        # for the uncorrelated case, these are the indices of the reactions and species
+        # for the correlated case, these are the labels of the uncertain parameters
+        self.k_params = k_params
+        self.g_params = g_params
+        self.input_size = len(k_params) + len(g_params)
+
+        self.affected_reactions = sorted(set(i for factors in self.k_uncertainty_factors for i, f in factors))
+        self.affected_species = sorted(set(i for factors in self.g_uncertainty_factors for i, f in factors))
+
+        # Map each reaction to the Cantera reactions it was converted to, if it was split into several
+        if cantera.reaction_map:
+            self.reaction_map = cantera.reaction_map
+        else:
+            self.reaction_map = dict((i, [i]) for i in range(len(cantera.reaction_list)))
+
+        # Save the original NASA polynomials of the species whose free energy is perturbed
+        self.original_thermo = {}
+        for spc_index in self.affected_species:
+            thermo = cantera.model.species(spc_index).thermo
+            if not isinstance(thermo, ct.NasaPoly2):
+                raise ValueError('Only species with NASA polynomials can have uncertain free energies, but species '
+                                 '{0} has thermo of type {1}.'.format(cantera.species_list[spc_index],
+                                                                      thermo.__class__.__name__))
+            self.original_thermo[spc_index] = (thermo.min_temp, thermo.max_temp, thermo.reference_pressure,
+                                               np.array(thermo.coeffs))
+
+    def generate_samples(self, n_samples, method='lhs', seed=None):
+        """
+        Return an array of `n_samples` samples of the random inputs, each uniformly distributed in [-1, 1], with
+        one row per sample and one column per uncertain parameter. The `method` is either 'lhs' for Latin hypercube
+        sampling, which stratifies each parameter into `n_samples` equally probable intervals, or 'mc' for plain Monte
+        Carlo sampling. A `seed` can be given to make the samples reproducible.
+        """
+        random_state = np.random.RandomState(seed)
+        if method == 'mc':
+            unit_samples = random_state.rand(n_samples, self.input_size)
+        elif method == 'lhs':
+            unit_samples = np.empty((n_samples, self.input_size))
+            for j in range(self.input_size):
+                unit_samples[:, j] = (random_state.permutation(n_samples) + random_state.rand(n_samples)) / n_samples
+        else:
+            raise ValueError('Unknown sampling method "{0}". Valid options are "mc" and "lhs".'.format(method))
+        return 2.0 * unit_samples - 1.0
+
+    def evaluate_sample(self, sample):
+        """
+        Simulate all conditions with the uncertain parameters set by the random inputs in `sample`, and return the
+        array of outputs. The Cantera model is left perturbed; call `reset_model` to restore it.
+        """
+        k_rv = sample[:len(self.k_params)]
+        g_rv = sample[len(self.k_params):]
+
+        # Combine the contributions of the parameters to each reaction and species
+        reaction_scaling = dict((i, 0.0) for i in self.affected_reactions)
+        species_scaling = dict((i, 0.0) for i in self.affected_species)
+        for rv, factors in zip(k_rv, self.k_uncertainty_factors):
+            for rxn_index, uncertainty_factor in factors:
+                reaction_scaling[rxn_index] += rv * uncertainty_factor
+        for rv, factors in zip(g_rv, self.g_uncertainty_factors):
+            for spc_index, uncertainty_factor in factors:
+                species_scaling[spc_index] += rv * uncertainty_factor
+
+        # The free energy is uniform in G, shifted through the enthalpy coefficient of both polynomials
+        for spc_index, delta_g in species_scaling.items():
+            self._set_enthalpy_shift(spc_index, delta_g * 4184.0)
+
+        # The rate is loguniform in k, and the reverse rates follow from the equilibrium constants
+        for rxn_index, factor in reaction_scaling.items():
+            for ct_index in self.reaction_map[rxn_index]:
+                self.cantera.model.set_multiplier(10 ** factor, ct_index)
+
+        output = np.zeros(self.output_size)
+        for i, condition in enumerate(self.cantera.conditions):
+            species_data = self.cantera.simulate_condition(condition, self.output_species_indices)[3]
+            final = species_data[-1, :]
+            output[i * self.num_output_species:(i + 1) * self.num_output_species] = np.log(final) if self.logx else final
+        return output
+
+    def reset_model(self):
+        """
+        Restore the original rate coefficients and free energies of the Cantera model.
+        """
+        for spc_index in self.affected_species:
+            self._set_enthalpy_shift(spc_index, 0.0)
+        for rxn_index in self.affected_reactions:
+            for ct_index in self.reaction_map[rxn_index]:
+                self.cantera.model.set_multiplier(1.0, ct_index)
+
+    def _set_enthalpy_shift(self, spc_index, delta_h):
+        """
+        Set the thermo of the Cantera species with index `spc_index` to its original NASA polynomials, with the
+        enthalpy shifted by `delta_h` in J/mol.
+
+        The species is modified in place in the loaded Solution, which updates the equilibrium constants and
+        reverse rate coefficients without rebuilding the model. Cantera only recomputes these when the temperature
+        changes, which happens at the start of every simulated condition, so the reactor simulations always see
+        the current thermo.
+        """
+        t_min, t_max, p_ref, coeffs = self.original_thermo[spc_index]
+        coeffs = coeffs.copy()
+        # coeffs[0] is the midpoint temperature, followed by the high and the low temperature coefficients
+        coeffs[6] += delta_h / constants.R
+        coeffs[13] += delta_h / constants.R
+        ct_species = self.cantera.model.species(spc_index)
+        ct_species.thermo = ct.NasaPoly2(t_min, t_max, p_ref, coeffs)
+        self.cantera.model.modify_species(spc_index, ct_species)
+
+    def evaluate(self, samples, nprocs=1):
+        """
+        Evaluate the outputs of each row of random inputs in `samples`, dividing them between `nprocs` worker
+        processes if larger than one. Each worker process perturbs its own copy of the Cantera model.
+        Returns an array with one row of outputs per sample.
+        """
+        start_time = time()
+        if nprocs > 1 and len(samples) > 1:
+            # The workers are forked so that each inherits a copy of this sampler, including the loaded cantera model,
+            # which cannot be pickled
+            global _sampler
+            _sampler = self
+            try:
+                chunks = [chunk for chunk in np.array_split(np.asarray(samples), min(nprocs, len(samples)))]
+                p = multiprocessing.get_context('fork').Pool(processes=len(chunks))
+                outputs = p.map(_evaluate_samples, chunks)
+                p.close()
+                p.join()
+            finally:
+                _sampler = None
+            outputs = np.concatenate(outputs)
+        else:
+            try:
+                outputs = np.array([self.evaluate_sample(sample) for sample in samples])
+            finally:
+                self.reset_model()
+        logging.info('Evaluating {0:d} samples took {1:2f} seconds.'.format(len(samples), time() - start_time))
+        return outputs
+
+    def run(self, n_samples, method='lhs', seed=None, nprocs=1):
+        """
+        Generate `n_samples` samples of the random inputs using `method` and evaluate them in `nprocs` processes.
+        Returns a tuple of the array of samples and the array of outputs.
+        """
+        samples = self.generate_samples(n_samples, method=method, seed=seed)
+        outputs = self.evaluate(samples, nprocs=nprocs)
+        return samples, outputs
+
+    def analyze_results(self, samples, outputs, n_bins=None, log=True):
+        """
+        Obtain the statistics of the `outputs` evaluated for the random inputs in `samples`: the mean, variance,
+        covariance and 2.5, 50 and 97.5 percentiles of each output, and the first-order (main) sensitivity index of
+        each output with respect to each uncertain parameter.
+
+        The main sensitivity index Var(E[Y|X_i]) / Var(Y) is estimated from the given samples by dividing each random
+        input into `n_bins` equally probable bins, by default the square root of the number of samples, and taking
+        the variance of the mean output within each bin, so no additional simulations are needed.
+
+        The summary table is logged at the info level if `log` is ``True`` and at the debug level otherwise.
+
+        Returns a tuple containing
+        (mean outputs, variance, covariance, percentiles, main sensitivity indices)
+        """
+        samples = np.asarray(samples)
+        outputs = np.asarray(outputs)
+        n_samples = len(samples)
+        if n_bins is None:
+            n_bins = max(2, int(np.sqrt(n_samples)))
+
+        mean = np.mean(outputs, axis=0)
+        var = np.var(outputs, axis=0)
+        cov = np.atleast_2d(np.cov(outputs, rowvar=False))
+        percentiles = np.percentile(outputs, [2.5, 50, 97.5], axis=0)
+
+        main_sens = np.zeros((self.output_size, self.input_size))
+        for j in range(self.input_size):
+            bins = np.minimum(((samples[:, j] + 1.0) / 2.0 * n_bins).astype(int), n_bins - 1)
+            counts = np.bincount(bins, minlength=n_bins)
+            occupied = counts > 0
+            for i in range(self.output_size):
+                if var[i] == 0:
+                    continue
+                bin_means = np.bincount(bins, weights=outputs[:, i], minlength=n_bins)[occupied] / counts[occupied]
+                main_sens[i, j] = np.sum(counts[occupied] * (bin_means - mean[i]) ** 2) / n_samples / var[i]
+
+        output = ''
+        for i in range(self.num_conditions):
+            output += """============================================================
+Condition {0}
+------------------------------------------------------------
+{1!s}
+============================================================
+Condition {0} {2}Mole Fractions
+------------------------------------------------------------
+Species                   Mean         Stddev      2.5%-97.5%
+------------------------------------------------------------
+""".format(i + 1, self.cantera.conditions[i], 'Log ' if self.logx else '')
+
+            for j, output_species in enumerate(self.output_species_list):
+                output_index = i * self.num_output_species + j
+                output += '{0:<15}{1:>15.3e}{2:>15.3e}  {3:.3e} - {4:.3e}\n'.format(
+                    output_species.to_chemkin(), mean[output_index], np.sqrt(var[output_index]),
+                    percentiles[0, output_index], percentiles[2, output_index])
+            output += '============================================================\n\n'
+
+            for title, params, offset in [('Reaction Rate', self.k_params, 0),
+                                          ('Thermochemistry', self.g_params, len(self.k_params))]:
+                if not params:
+                    continue
+                output += """====================================================================================================
+Condition {0} {1} Sensitivity Indices
+----------------------------------------------------------------------------------------------------
+Description                                                                                sens_main
+""".format(i + 1, title)
+                for j, output_species in enumerate(self.output_species_list):
+                    output += '----------------------------------------------------------------------------------------------------\n'
+                    output_index = i * self.num_output_species + j
+                    for k, descriptor in enumerate(params):
+                        if self.correlated:
+                            label = descriptor
+                        elif offset == 0:
+                            label = self.cantera.reaction_list[descriptor].to_chemkin(kinetics=False)
+                        else:
+                            label = self.cantera.species_list[descriptor].to_chemkin()
+                        description = 'd{0}[{1}]/d{2}[{3}]'.format('ln' if self.logx else '', output_species.to_chemkin(),
+                                                                   'ln' if offset == 0 else 'G', label)
+                        output += '{0:<85}{1:>14.3f}%\n'.format(description, 100 * main_sens[output_index][offset + k])
+                output += '====================================================================================================\n\n'
+
+        if log:
+            logging.info(output)
+        else:
+            logging.debug(output)
+
+        return mean, var, cov, percentiles, main_sens
+
+
+def _evaluate_samples(samples):
+    """
+    Evaluate the given rows of random inputs with the sampler inherited by a worker process, for use with map.
+    """
+    return np.array([_sampler.evaluate_sample(sample) for sample in samples])
+
+
+# The sampler whose samples are being evaluated by worker processes
+_sampler = None
@@ -319,26 +319,63 @@ def cluster(obj_list):
 
     This method works for either species or reactions.
 
-    It is O(n^2) efficient
+    Candidates are first bucketed by their isotope-stripped key from
+    `get_isotopeless_key`, and only compared by isomorphism against the
+    clusters in the same bucket, so it is close to O(n) efficient
     """
 
     unclustered = copy(obj_list)
 
     # [[list of Species objs]]
     clusters = []
+    # {isotopeless key: [clusters with that key]}
+    buckets = {}
+    species_keys = {}
 
     while unclustered:
         candidate = unclustered.pop()
-        for cluster in clusters:
+        bucket = buckets.setdefault(get_isotopeless_key(candidate, species_keys), [])
+        for cluster in bucket:
             if compare_isotopomers(cluster[0], candidate):
                 cluster.append(candidate)
                 break
         else:
-            clusters.append([candidate])
+            bucket.append([candidate])
+            clusters.append(bucket[-1])
 
     return clusters
 
 
+def get_isotopeless_key(obj, species_keys=None):
+    """
+    Return a hashable key for a Species, Reaction or Molecule which does not
+    depend on its isotopic labeling. Objects which only differ in isotopic
+    labeling always have the same key. The key only describes the elements and
+    connectivity of the atoms, so it is also the same for all resonance
+    structures, and different objects can share a key.
+
+    The optional dictionary `species_keys` caches the keys of species by id
+    when computing keys for many reactions.
+    """
+    if isinstance(obj, Reaction):
+        reactant_keys = tuple(sorted(get_isotopeless_key(spc, species_keys) for spc in obj.reactants))
+        product_keys = tuple(sorted(get_isotopeless_key(spc, species_keys) for spc in obj.products))
+        return frozenset([reactant_keys, product_keys])
+    elif isinstance(obj, Species):
+        if species_keys is not None and id(obj) in species_keys:
+            return species_keys[id(obj)]
+        key = get_isotopeless_key(obj.molecule[0])
+        if species_keys is not None:
+            species_keys[id(obj)] = key
+        return key
+    elif isinstance(obj, Molecule):
+        atom_keys = sorted((atom.element.symbol, tuple(sorted(neighbor.element.symbol for neighbor in atom.bonds)))
+                           for atom in obj.atoms)
+        return obj.multiplicity, tuple(atom_keys)
+    else:
+        raise TypeError('Only Reaction, Species, and Molecule objects are supported')
+
+
 def remove_isotope(labeled_obj, inplace=False):
     """
     Create a deep copy of the first molecule of the species object and replace
@@ -42,7 +42,7 @@ from rmgpy.species import Species
 from rmgpy.tools.isotopes import correct_entropy, apply_kinetic_isotope_effect_simple, \
     generate_isotope_reactions, get_reduced_mass, get_labeled_reactants, \
     is_enriched, generate_isotopomers, cluster, remove_isotope, \
-    redo_isotope, ensure_reaction_direction, compare_isotopomers
+    redo_isotope, ensure_reaction_direction, compare_isotopomers, get_isotopeless_key
 
 database = None
 
@@ -189,6 +189,37 @@ class IsotopesTest(unittest.TestCase):
         self.assertEquals(len(clusters), 4)
         self.assertEquals(len(clusters[0]), 1)
 
+    def test_get_isotopeless_key(self):
+        """
+        Test that isotopomers and resonance structures share an isotopeless key.
+        """
+        ethi = Species().from_adjacency_list("""
+1 C u0 p0 c0 {2,S} {3,S} {4,S} {5,S}
+2 C u0 p0 c0 i13 {1,S} {6,S} {7,S} {8,S}
+3 H u0 p0 c0 {1,S}
+4 H u0 p0 c0 {1,S}
+5 H u0 p0 c0 {1,S}
+6 H u0 p0 c0 {2,S}
+7 H u0 p0 c0 {2,S}
+8 H u0 p0 c0 {2,S}
+""")
+        eth = Species().from_smiles('CC')
+        ethanol = Species().from_smiles('CCO')
+        dimethyl_ether = Species().from_smiles('COC')
+        allyl = Species().from_smiles('[CH2]C=C')
+        allyl.generate_resonance_structures()
+
+        self.assertEqual(get_isotopeless_key(eth), get_isotopeless_key(ethi))
+        self.assertNotEqual(get_isotopeless_key(eth), get_isotopeless_key(ethanol))
+        self.assertNotEqual(get_isotopeless_key(ethanol), get_isotopeless_key(dimethyl_ether))
+        self.assertEqual(len(allyl.molecule), 2)
+        self.assertEqual(get_isotopeless_key(allyl.molecule[0]), get_isotopeless_key(allyl.molecule[1]))
+
+        rxn0 = Reaction(reactants=[ethi, eth], products=[eth, eth])
+        rxn1 = Reaction(reactants=[eth, eth], products=[ethi, eth])
+        self.assertEqual(get_isotopeless_key(rxn0), get_isotopeless_key(rxn1))
+        self.assertEqual(get_isotopeless_key(ethi, {}), get_isotopeless_key(ethi))
+
     def test_remove_isotope_for_reactions(self):
         """
         Test that remove isotope algorithm works with Reaction objects.
@@ -43,26 +43,29 @@ from rmgpy.solver.surface import SurfaceReactor
 
 
 def load_rmg_job(input_file, chemkin_file=None, species_dict=None, generate_images=True, use_java=False,
-                 use_chemkin_names=False, check_duplicates=True):
+                 use_chemkin_names=False, check_duplicates=True, procnum=1):
     if use_java:
         # The argument is an RMG-Java input file
         warnings.warn("The RMG-Java input is no longer supported and may be" \
                       "removed in version 2.3.", DeprecationWarning)
         rmg = load_rmg_java_job(input_file, chemkin_file, species_dict, generate_images,
-                                use_chemkin_names=use_chemkin_names, check_duplicates=check_duplicates)
+                                use_chemkin_names=use_chemkin_names, check_duplicates=check_duplicates,
+                                procnum=procnum)
 
     else:
         # The argument is an RMG-Py input file
         rmg = load_rmg_py_job(input_file, chemkin_file, species_dict, generate_images,
-                              use_chemkin_names=use_chemkin_names, check_duplicates=check_duplicates)
+                              use_chemkin_names=use_chemkin_names, check_duplicates=check_duplicates,
+                              procnum=procnum)
 
     return rmg
 
 
 def load_rmg_py_job(input_file, chemkin_file=None, species_dict=None, generate_images=True,
-                    use_chemkin_names=False, check_duplicates=True):
+                    use_chemkin_names=False, check_duplicates=True, procnum=1):
     """
     Load the results of an RMG-Py job generated from the given `input_file`.
+    The species dictionary is loaded using `procnum` processes.
     """
     from rmgpy.rmg.main import RMG
 
@@ -78,7 +81,8 @@ def load_rmg_py_job(input_file, chemkin_file=None, species_dict=None, generate_i
         species_dict = os.path.join(os.path.dirname(input_file), 'chemkin', 'species_dictionary.txt')
     species_list, reaction_list = load_chemkin_file(chemkin_file, species_dict,
                                                     use_chemkin_names=use_chemkin_names,
-                                                    check_duplicates=check_duplicates)
+                                                    check_duplicates=check_duplicates,
+                                                    procnum=procnum)
 
     # Created "observed" versions of all reactive species that are not explicitly
     # identified as  "constant" species
@@ -165,9 +169,10 @@ def load_rmg_py_job(input_file, chemkin_file=None, species_dict=None, generate_i
 
 
 def load_rmg_java_job(input_file, chemkin_file=None, species_dict=None, generate_images=True,
-                      use_chemkin_names=False, check_duplicates=True):
+                      use_chemkin_names=False, check_duplicates=True, procnum=1):
     """
     Load the results of an RMG-Java job generated from the given `input_file`.
+    The species dictionary is loaded using `procnum` processes.
     """
     warnings.warn("The RMG-Java input is no longer supported and may be" \
                   "removed in version 2.3.", DeprecationWarning)
@@ -187,7 +192,8 @@ def load_rmg_java_job(input_file, chemkin_file=None, species_dict=None, generate
         species_dict = os.path.join(os.path.dirname(input_file), 'RMG_Dictionary.txt')
     species_list, reaction_list = load_chemkin_file(chemkin_file, species_dict,
                                                     use_chemkin_names=use_chemkin_names,
-                                                    check_duplicates=check_duplicates)
+                                                    check_duplicates=check_duplicates,
+                                                    procnum=procnum)
 
     # Bath gas species don't appear in RMG-Java species dictionary, so handle
     # those as a special case
@@ -36,7 +36,8 @@ command-line, e.g.
     $ python mergeModels.py --model1 /path/to/chem1.inp /path/to/species_dictionary1.txt --model2 /path/to/chem2.inp /path/to/species_dictionary2.txt
 
 The resulting merged files are placed in ``chem.inp`` and
-``species_dictionary.txt`` in the execution directory.
+``species_dictionary.txt`` in the execution directory. The ``--nprocs`` option
+sets the number of processes used to load the species dictionaries.
 """
 
 import argparse
@@ -61,6 +62,8 @@ def parse_command_line_arguments():
                         help='the Chemkin files and species dictionaries of the fourth model to merge')
     parser.add_argument('--model5', metavar='FILE', type=str, nargs='+',
                         help='the Chemkin files and species dictionaries of the fifth model to merge')
+    parser.add_argument('--nprocs', type=int, default=1,
+                        help='Number of processes used to load the species dictionaries')
 
     args = parser.parse_args()
     return args
@@ -89,6 +92,7 @@ def main():
     kwargs = {
         'wd': os.getcwd(),
         'transport': transport,
+        'nprocs': args.nprocs,
     }
 
     execute(input_model_files, **kwargs)
@@ -102,11 +106,16 @@ def execute(input_model_files, **kwargs):
 
     transport = kwargs['transport']
 
+    try:
+        nprocs = kwargs['nprocs']
+    except KeyError:
+        nprocs = 1
+
     output_chemkin_file = os.path.join(wd, 'chem.inp')
     output_species_dictionary = os.path.join(wd, 'species_dictionary.txt')
     output_transport_file = os.path.join(wd, 'tran.dat') if transport else None
 
-    models = get_models_to_merge(input_model_files)
+    models = get_models_to_merge(input_model_files, nprocs=nprocs)
 
     final_model = combine_models(models)
 
@@ -122,15 +131,17 @@ def execute(input_model_files, **kwargs):
         print('Merged transport file saved to {0}'.format(output_transport_file))
 
 
-def get_models_to_merge(input_model_files):
+def get_models_to_merge(input_model_files, nprocs=1):
     """
-    Reads input file paths and creates a list of ReactionModel
+    Reads input file paths and creates a list of ReactionModel.
+    The species dictionaries are loaded using `nprocs` processes.
     """
     models = []
     for chemkin, species_path, transport_path in input_model_files:
         print('Loading model #{0:d}...'.format(len(models) + 1))
         model = ReactionModel()
-        model.species, model.reactions = load_chemkin_file(chemkin, species_path, transport_path=transport_path)
+        model.species, model.reactions = load_chemkin_file(chemkin, species_path, transport_path=transport_path,
+                                                           procnum=nprocs)
         models.append(model)
     return models
 
@@ -81,3 +81,40 @@ class MergeModelsTest(unittest.TestCase):
                                          r.reactants[1].label == 'CH3':
                 self.assertAlmostEqual(r.kinetics.A.value_si, 8.260e+9, places=0,
                                        msg="Kinetics did not match from first input model")
+
+    def test_merge_matches_pairwise_comparison(self):
+        """Test that merging finds the same common species and reactions as comparing every pair."""
+        folder = os.path.join(os.getcwd(), 'rmgpy/tools/data/diffmodels')
+
+        chemkin3 = os.path.join(folder, 'chem3.inp')
+        species_dict3 = os.path.join(folder, 'species_dictionary3.txt')
+
+        chemkin2 = os.path.join(folder, 'chem2.inp')
+        species_dict2 = os.path.join(folder, 'species_dictionary2.txt')
+
+        model3, model2 = get_models_to_merge(((chemkin3, species_dict3, None), (chemkin2, species_dict2, None)))
+        expected_species = [spc for spc in model2.species
+                            if not any(spc.is_isomorphic(spc0) for spc0 in model3.species)]
+        expected_reactions = [rxn for rxn in model2.reactions
+                              if not any(rxn.is_isomorphic(rxn0, either_direction=True) for rxn0 in model3.reactions)]
+
+        final_model = model3.merge(model2)
+        self.assertEqual([id(spc) for spc in final_model.species],
+                         [id(spc) for spc in model3.species + expected_species])
+        self.assertEqual([id(rxn) for rxn in final_model.reactions],
+                         [id(rxn) for rxn in model3.reactions + expected_reactions])
+
+    def test_load_models_in_parallel(self):
+        """Test that loading the models to merge with several processes gives the same species."""
+        folder = os.path.join(os.getcwd(), 'rmgpy/tools/data/diffmodels')
+        input_model_files = ((os.path.join(folder, 'chem3.inp'), os.path.join(folder, 'species_dictionary3.txt'), None),
+                             (os.path.join(folder, 'chem2.inp'), os.path.join(folder, 'species_dictionary2.txt'), None))
+
+        serial_models = get_models_to_merge(input_model_files)
+        parallel_models = get_models_to_merge(input_model_files, nprocs=2)
+        for serial_model, parallel_model in zip(serial_models, parallel_models):
+            self.assertEqual([(spc.label, spc.index) for spc in parallel_model.species],
+                             [(spc.label, spc.index) for spc in serial_model.species])
+            for serial_spc, parallel_spc in zip(serial_model.species, parallel_model.species):
+                self.assertTrue(parallel_spc.is_isomorphic(serial_spc))
+            self.assertEqual(len(parallel_model.reactions), len(serial_model.reactions))
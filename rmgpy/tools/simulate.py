@@ -110,18 +110,21 @@ def simulate(rmg, diffusion_limited=True):
             rmg.run_uncertainty_analysis()
 
 
-def run_simulation(input_file, chemkin_file, dict_file, diffusion_limited=True, check_duplicates=True):
+def run_simulation(input_file, chemkin_file, dict_file, diffusion_limited=True, check_duplicates=True, procnum=1):
     """
     Runs a standalone simulation of RMG.  Runs sensitivity analysis if sensitive species are given.
     Also runs uncertainty analysis if uncertainty options block is present in input file.
 
     diffusion_limited=True implies that if it is a liquid reactor diffusion limitations will be enforced
     otherwise they will not be in a liquid reactor
+
+    The species dictionary is loaded using `procnum` processes.
     """
     output_dir = os.path.abspath(os.path.dirname(input_file))
     initialize_log(logging.INFO, os.path.join(output_dir, 'simulate.log'))
 
-    rmg = load_rmg_job(input_file, chemkin_file, dict_file, generate_images=False, check_duplicates=check_duplicates)
+    rmg = load_rmg_job(input_file, chemkin_file, dict_file, generate_images=False, check_duplicates=check_duplicates,
+                       procnum=procnum)
 
     start_time = time()
     # conduct simulation
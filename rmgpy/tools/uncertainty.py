@@ -32,6 +32,7 @@ import os
 import numpy as np
 
 import rmgpy.util as util
+from rmgpy.rmg.model import get_isomorphism_key
 from rmgpy.species import Species
 from rmgpy.tools.data import GenericData
 from rmgpy.tools.plot import parse_csv_data, plot_sensitivity, ReactionSensitivityPlot, ThermoSensitivityPlot
@@ -286,13 +287,15 @@ class Uncertainty(object):
             except:
                 raise Exception('Uncertainty output directory could not be created.')
 
-    def load_database(self, kinetics_families='all', kinetics_depositories=None, thermo_libraries=None, reaction_libraries=None):
+    def load_database(self, kinetics_families='all', kinetics_depositories=None, thermo_libraries=None, reaction_libraries=None,
+                      cache_directory=None):
         """
         This function loads a single copy of the RMGDatabase with full verbose averaging
         of the rate rule to trace kinetics sources.  
         
         By default, this function loads all the kinetics families, only the training kinetics depository,
-        the primaryThermoLibrary, and no reaction libraries.  
+        the primaryThermoLibrary, and no reaction libraries.  If `cache_directory` is given, the database
+        is loaded through the database cache in that directory.
         """
         from rmgpy.data.rmg import RMGDatabase
         from rmgpy import settings
@@ -311,6 +314,7 @@ class Uncertainty(object):
             kinetics_depositories=kinetics_depositories,
             thermo_libraries=thermo_libraries,
             reaction_libraries=reaction_libraries,
+            cache_directory=cache_directory,
         )
 
         # Prepare the database by loading training reactions but not averaging the rate rules
@@ -335,18 +339,24 @@ class Uncertainty(object):
                                                                   dictionary_path=dictionary_path,
                                                                   transport_path=transport_path)
 
-    def retrieve_saturated_species_from_list(self, species):
+    def retrieve_saturated_species_from_list(self, species, species_keys=None):
         """
         Given a radical `species`, this function retrieves the saturated species objects from a list of species objects
         and returns the saturated species object along with a boolean that indicates if the species is not part of the model
         (True->not in the model, False->in the model)
+
+        `species_keys` is an optional dictionary mapping the isomorphism keys of the species in the species list to
+        lists of those species, which is used to only compare the saturated species to potential matches.
+        It is updated if a saturated species is added to the species list.
         """
 
         molecule = species.molecule[0]
         assert molecule.is_radical(), "Method only valid for radicals."
         saturated_struct = molecule.copy(deep=True)
         saturated_struct.saturate_radicals()
-        for otherSpecies in self.species_list:
+        key = get_isomorphism_key(saturated_struct)
+        candidates = self.species_list if species_keys is None else species_keys.get(key, [])
+        for otherSpecies in candidates:
             if otherSpecies.is_isomorphic(saturated_struct):
                 return otherSpecies, False
 
@@ -357,6 +367,8 @@ class Uncertainty(object):
         if thermo is not None:
             new_spc.thermo = thermo
             self.species_list.append(new_spc)
+            if species_keys is not None:
+                species_keys.setdefault(key, []).append(new_spc)
             return new_spc, True
         else:
             raise Exception('Could not retrieve saturated species form of {0} from the species list'.format(species))
@@ -366,9 +378,18 @@ class Uncertainty(object):
         Extract the source data from the model using its comments.
         Must be done after loading model and database to work.
         """
+        # Map the species and reactions to their indices, and the species to their isomorphism keys,
+        # so that each source is found without searching the whole model
+        species_indices = {id(species): i for i, species in enumerate(self.species_list)}
+        species_keys = {}
+        for species in self.species_list:
+            species_keys.setdefault(get_isomorphism_key(species), []).append(species)
+        reaction_indices = {id(reaction): i for i, reaction in enumerate(self.reaction_list)}
+        extra_species_ids = set(id(spc) for spc in self.extra_species)
+
         self.species_sources_dict = {}
         for species in self.species_list:
-            if species not in self.extra_species:
+            if id(species) not in extra_species_ids:
                 source = self.database.thermo.extract_source_from_comments(species)
 
                 # Now prep the source data
@@ -377,22 +398,24 @@ class Uncertainty(object):
                     # The thermo came from a single source, so we know it comes from a value describing the exact species
                     if 'Library' in source:
                         # Use just the species index in self.species_list, for better shorter printouts when debugging
-                        source['Library'] = self.species_list.index(species)
+                        source['Library'] = species_indices[id(species)]
                     if 'QM' in source:
-                        source['QM'] = self.species_list.index(species)
+                        source['QM'] = species_indices[id(species)]
 
                 elif len(source) == 2:
                     # The thermo has two sources, which indicates it's an HBI correction on top of a library or QM value.
                     # We must retrieve the original saturated molecule's thermo instead of using the radical species as the source of thermo
-                    saturated_species, ignore_spc = self.retrieve_saturated_species_from_list(species)
+                    saturated_species, ignore_spc = self.retrieve_saturated_species_from_list(species, species_keys)
 
                     if ignore_spc:  # this is saturated species that isn't in the actual model
                         self.extra_species.append(saturated_species)
+                        extra_species_ids.add(id(saturated_species))
+                        species_indices[id(saturated_species)] = len(self.species_list) - 1
 
                     if 'Library' in source:
-                        source['Library'] = self.species_list.index(saturated_species)
+                        source['Library'] = species_indices[id(saturated_species)]
                     if 'QM' in source:
-                        source['QM'] = self.species_list.index(saturated_species)
+                        source['QM'] = species_indices[id(saturated_species)]
                 else:
                     raise Exception('Source of thermo should not use more than two sources out of QM, Library, or GAV.')
 
@@ -405,9 +428,9 @@ class Uncertainty(object):
             # Consider any library or PDep reaction to be an independent parameter for now
             # and assign the source to the index of the reaction within self.reaction_list
             if 'Library' in source:
-                source['Library'] = self.reaction_list.index(reaction)
+                source['Library'] = reaction_indices[id(reaction)]
             elif 'PDep' in source:
-                source['PDep'] = self.reaction_list.index(reaction)
+                source['PDep'] = reaction_indices[id(reaction)]
             elif 'Training' in source:
                 # Do nothing here because training source already saves the entry from the training reaction
                 pass
@@ -418,8 +441,7 @@ class Uncertainty(object):
                 raise Exception('Source of kinetics must be either Library, PDep, Training, or Rate Rules')
             self.reaction_sources_dict[reaction] = source
 
-        for spc in self.extra_species:
-            self.species_list.remove(spc)
+        self.species_list[:] = [spc for spc in self.species_list if id(spc) not in extra_species_ids]
 
     def compile_all_sources(self):
         """
@@ -656,6 +678,11 @@ class Uncertainty(object):
         number is the number of highest contributing uncertain parameters desired to be plotted
         fileformat can be either .png, .pdf, or .svg
         """
+        # Map the Chemkin names to the indices of the first species with each name
+        chemkin_indices = {}
+        for i, species in enumerate(self.species_list):
+            chemkin_indices.setdefault(species.to_chemkin(), i)
+
         output = {}
         for sens_species in sensitive_species:
             csvfile_path = os.path.join(self.output_directory, 'solver',
@@ -667,11 +694,9 @@ class Uncertainty(object):
             reaction_data_list = []
             for data in data_list:
                 if data.species:
-                    for species in self.species_list:
-                        if species.to_chemkin() == data.species:
-                            index = self.species_list.index(species)
-                            break
-                    else:
+                    try:
+                        index = chemkin_indices[data.species]
+                    except KeyError:
                         raise Exception('Chemkin name {} of species in the CSV file does not match anything in the '
                                         'species list.'.format(data.species))
 
@@ -737,6 +762,25 @@ class Uncertainty(object):
 
         return output
 
+    def global_analysis(self, cantera, output_species_list, k_params, g_params, correlated=False, n_samples=1000,
+                        method='lhs', seed=None, nprocs=1, logx=True, log=True):
+        """
+        Conduct global uncertainty analysis on the reaction model by sampling, using the uncertainties assigned by
+        `assign_parameter_uncertainties`. The conditions of the Cantera job `cantera` are simulated for `n_samples`
+        samples of the uncertain parameters `k_params` and `g_params`, drawn using `method` ('lhs' for Latin hypercube
+        or 'mc' for Monte Carlo sampling) and evaluated in `nprocs` processes.
+        See :class:`rmgpy.tools.globaluncertainty.ReactorSampler` for the definitions of the parameters.
+
+        Returns a tuple containing
+        (mean outputs, variance, covariance, percentiles, main sensitivity indices)
+        """
+        from rmgpy.tools.globaluncertainty import ReactorSampler
+
+        sampler = ReactorSampler(cantera, output_species_list, k_params, self.kinetic_input_uncertainties,
+                                 g_params, self.thermo_input_uncertainties, correlated=correlated, logx=logx)
+        samples, outputs = sampler.run(n_samples, method=method, seed=seed, nprocs=nprocs)
+        return sampler.analyze_results(samples, outputs, log=log)
+
 
 def process_local_results(results, sensitive_species, number=10):
     """
@@ -34,6 +34,8 @@ import numpy as np
 
 import rmgpy
 from rmgpy.data.rmg import RMGDatabase
+from rmgpy.rmg.model import get_isomorphism_key
+from rmgpy.species import Species
 from rmgpy.tools.uncertainty import Uncertainty
 
 
@@ -130,3 +132,170 @@ class TestUncertainty(unittest.TestCase):
         np.testing.assert_allclose(thermo_unc, [1.5, 1.5, 2.0, 1.9, 3.1, 1.5, 1.9, 2.0, 2.0, 1.9, 2.2, 1.9, 2.0, 1.5],
                                    rtol=1e-4)
         np.testing.assert_allclose(kinetic_unc, [0.5, 1.5, 5.806571, 0.5, 2.0], rtol=1e-4)
+
+    def test_retrieve_saturated_species_by_key(self):
+        """
+        Test that the saturated form of a radical is found among the species with the same isomorphism key
+        """
+        ethane = Species(smiles='CC')
+        species_list = [Species(smiles='C'), Species(smiles='C=C'), ethane]
+        uncertainty = Uncertainty(species_list=species_list, output_directory='chemDir')
+        species_keys = {}
+        for spc in species_list:
+            species_keys.setdefault(get_isomorphism_key(spc), []).append(spc)
+
+        saturated_species, not_in_model = uncertainty.retrieve_saturated_species_from_list(Species(smiles='C[CH2]'),
+                                                                                          species_keys)
+        self.assertIs(saturated_species, ethane)
+        self.assertFalse(not_in_model)
+        self.assertEqual(len(uncertainty.species_list), 3)
+
+
+class TestReactorSampler(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        """This method is run once before all tests in this class."""
+        from rmgpy.chemkin import load_chemkin_file
+        from rmgpy.tools.canteraModel import Cantera
+        from rmgpy.tools.globaluncertainty import ReactorSampler
+
+        folder = os.path.join(os.path.dirname(rmgpy.__file__), 'tools/data/various_kinetics')
+        species, reactions = load_chemkin_file(os.path.join(folder, 'chem_annotated.inp'),
+                                               os.path.join(folder, 'species_dictionary.txt'))
+        ethane = [spc for spc in species if spc.label == 'ethane'][0]
+        argon = [spc for spc in species if spc.label == 'Ar'][0]
+        cls.methyl = [spc for spc in species if spc.label == 'CH3'][0]
+
+        # Ethane pyrolysis, stopped before CH3 + CH3 <=> ethane equilibrates
+        cls.job = Cantera(species_list=species, reaction_list=reactions, output_directory=folder)
+        cls.job.load_model()
+        cls.job.generate_conditions(['IdealGasConstPressureTemperatureReactor'], ([1e-5], 's'),
+                                    [{ethane: 0.05, argon: 0.95}], Tlist=([1600, 1800], 'K'), Plist=([1], 'atm'))
+
+        # The uncertain parameters are CH3 + CH3 <=> ethane, H + CH4 <=> H2 + CH3 (which has no reactants here)
+        # and the free energy of CH3
+        k_uncertainty = [0.5] * len(reactions)
+        k_uncertainty[0] = 2.0
+        g_uncertainty = [1.0] * len(species)
+        cls.sampler = ReactorSampler(cls.job, [ethane, cls.methyl], [reactions[0].index, reactions[1].index],
+                                     k_uncertainty, [cls.methyl.index], g_uncertainty)
+        cls.base_output = cls.sampler.evaluate_sample(np.zeros(3))
+        cls.sampler.reset_model()
+
+    def test_evaluate_sample(self):
+        """
+        Test that the outputs of a sample respond to the perturbed rate coefficients and free energies
+        """
+        self.assertEqual(self.base_output.shape, (4,))
+        self.assertTrue(np.all(np.isfinite(self.base_output)))
+        # The outputs are the log mole fractions of ethane and CH3 at each condition, and ethane barely decomposes
+        self.assertAlmostEqual(np.exp(self.base_output[0]), 0.05, 2)
+        self.assertLess(self.base_output[1], self.base_output[3])
+
+        try:
+            # A faster CH3 + CH3 <=> ethane reaction makes more CH3 before equilibrium is reached
+            output = self.sampler.evaluate_sample(np.array([1.0, 0.0, 0.0]))
+            self.assertGreater(output[1], self.base_output[1])
+            self.assertGreater(output[3], self.base_output[3])
+            self.sampler.reset_model()
+
+            # The reaction with no reactants present has no effect
+            output = self.sampler.evaluate_sample(np.array([0.0, 1.0, 0.0]))
+            np.testing.assert_allclose(output, self.base_output, rtol=1e-6)
+            self.sampler.reset_model()
+
+            # A less stable CH3 makes less CH3
+            output = self.sampler.evaluate_sample(np.array([0.0, 0.0, 1.0]))
+            self.assertLess(output[1], self.base_output[1])
+            self.assertLess(output[3], self.base_output[3])
+        finally:
+            self.sampler.reset_model()
+
+    def test_modified_thermo(self):
+        """
+        Test that the free energy shift is applied to the loaded Cantera model in place and reflected in the
+        reverse rate coefficients, and that reset_model restores the original thermo and kinetics
+        """
+        import cantera as ct
+
+        model = self.job.model
+        spc_index = self.job.species_list.index(self.methyl)
+        h0 = model.species(spc_index).thermo.h(1500.)
+
+        try:
+            self.sampler.evaluate_sample(np.array([1.0, 0.0, 1.0]))
+            self.assertIs(self.job.model, model)
+            # Cantera uses J/kmol, and the sample is at the upper bound of the uniform distribution
+            np.testing.assert_allclose((model.species(spc_index).thermo.h(1500.) - h0) / 1000., np.sqrt(3) * 4184.,
+                                       rtol=1e-5)
+            self.assertAlmostEqual(model.multiplier(0), 10 ** (2.0 * np.sqrt(3) / np.log(10)), 6)
+
+            # The equilibrium constants match those of a model built from scratch with the shifted thermo
+            rebuilt = ct.Solution(thermo='IdealGas', kinetics='GasKinetics',
+                                  species=model.species(), reactions=model.reactions())
+            model.TPX = 1500., 101325., 'ethane:0.05, Ar:0.95'
+            rebuilt.TPX = 1500., 101325., 'ethane:0.05, Ar:0.95'
+            np.testing.assert_allclose(model.equilibrium_constants, rebuilt.equilibrium_constants, rtol=1e-10)
+        finally:
+            self.sampler.reset_model()
+
+        self.assertAlmostEqual(model.species(spc_index).thermo.h(1500.), h0, 6)
+        for i in range(model.n_reactions):
+            self.assertEqual(model.multiplier(i), 1.0)
+        np.testing.assert_allclose(self.sampler.evaluate_sample(np.zeros(3)), self.base_output, rtol=1e-10)
+        self.sampler.reset_model()
+
+    def test_parallel_evaluate(self):
+        """
+        Test that evaluating the samples in parallel gives the same outputs in the same order as in serial
+        """
+        samples = self.sampler.generate_samples(8, seed=0)
+        serial_outputs = self.sampler.evaluate(samples)
+        parallel_outputs = self.sampler.evaluate(samples, nprocs=2)
+        self.assertEqual(serial_outputs.shape, (8, 4))
+        np.testing.assert_array_equal(serial_outputs, parallel_outputs)
+        # The parent model is left unperturbed
+        np.testing.assert_allclose(self.sampler.evaluate_sample(np.zeros(3)), self.base_output, rtol=1e-10)
+        self.sampler.reset_model()
+
+    def test_analyze_results(self):
+        """
+        Test the statistics and main sensitivity indices estimated from the samples
+        """
+        samples, outputs = self.sampler.run(50, seed=0)
+        with self.assertLogs(level='DEBUG') as logs:
+            mean, var, cov, percentiles, main_sens = self.sampler.analyze_results(samples, outputs, log=False)
+        self.assertIn('Sensitivity Indices', '\n'.join(logs.output))
+
+        np.testing.assert_allclose(mean, np.mean(outputs, axis=0))
+        self.assertEqual(cov.shape, (4, 4))
+        np.testing.assert_allclose(np.diag(cov), var * 50 / 49.)
+        self.assertEqual(percentiles.shape, (3, 4))
+        self.assertTrue(np.all(percentiles[0] <= percentiles[1]) and np.all(percentiles[1] <= percentiles[2]))
+
+        self.assertEqual(main_sens.shape, (4, 3))
+        self.assertTrue(np.all(main_sens >= 0.0) and np.all(main_sens <= 1.0))
+        # CH3 + CH3 <=> ethane dominates the variance of every output
+        for i in range(4):
+            self.assertEqual(np.argmax(main_sens[i]), 0)
+            self.assertGreater(main_sens[i, 0], 0.5)
+
+    def test_latin_hypercube_samples(self):
+        """
+        Test that Latin hypercube samples stratify each uncertain parameter over [-1, 1]
+        """
+        from rmgpy.tools.globaluncertainty import ReactorSampler
+
+        sampler = ReactorSampler.__new__(ReactorSampler)
+        sampler.input_size = 3
+
+        samples = sampler.generate_samples(50, method='lhs', seed=0)
+        self.assertEqual(samples.shape, (50, 3))
+        for j in range(3):
+            # Each of the 50 equally probable intervals contains exactly one sample
+            bins = np.floor((samples[:, j] + 1.0) / 2.0 * 50).astype(int)
+            self.assertEqual(sorted(bins), list(range(50)))
+
+        np.testing.assert_array_equal(samples, sampler.generate_samples(50, method='lhs', seed=0))
+        self.assertRaises(ValueError, sampler.generate_samples, 10, method='sobol')
@@ -172,6 +172,9 @@ def parse_command_line_arguments(command_line_args=None):
                         help='run under cProfile to gather profiling statistics, and postprocess them if job completes')
     parser.add_argument('-P', '--postprocess', action='store_true',
                         help='postprocess profiling statistics from previous [failed] run; does not run the simulation')
+    parser.add_argument('--trace', action='store_true',
+                        help='record the time and memory spent in each phase of each iteration, saving them to '
+                             'trace.json (Chrome trace format) and trace_summary.csv')
 
     parser.add_argument('-t', '--walltime', type=str, nargs=1, default='00:00:00:00',
                         metavar='DD:HH:MM:SS', help='set the maximum execution time')
@@ -52,6 +52,8 @@ def parse_arguments():
                         help='Turn off diffusion-limited rates for LiquidReactor')
     parser.add_argument('-f', '--foreign', dest='checkDuplicates', action='store_true',
                         help='Not an RMG generated Chemkin file (will be checked for duplicates)')
+    parser.add_argument('-n', '--nprocs', type=int, default=1,
+                        help='Number of processes used to load the species dictionary')
     args = parser.parse_args()
 
     input_file = os.path.abspath(args.input[0])
@@ -59,14 +61,16 @@ def parse_arguments():
     dict_file = os.path.abspath(args.dictionary[0])
     dflag = args.dlim
     check_duplicates = args.checkDuplicates
+    nprocs = args.nprocs
 
-    return input_file, chemkin_file, dict_file, dflag, check_duplicates
+    return input_file, chemkin_file, dict_file, dflag, check_duplicates, nprocs
 
 
 def main():
-    input_file, chemkin_file, dict_file, dflag, check_duplicates = parse_arguments()
+    input_file, chemkin_file, dict_file, dflag, check_duplicates, nprocs = parse_arguments()
 
-    run_simulation(input_file, chemkin_file, dict_file, diffusion_limited=dflag, check_duplicates=check_duplicates)
+    run_simulation(input_file, chemkin_file, dict_file, diffusion_limited=dflag, check_duplicates=check_duplicates,
+                   procnum=nprocs)
 
 
 ################################################################################
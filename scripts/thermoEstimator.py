@@ -58,11 +58,19 @@ def run_thermo_estimator(input_file, library_flag):
     rmg.database = RMGDatabase()
     path = os.path.join(settings['database.directory'])
 
-    # forbidden structure loading
-    rmg.database.load_thermo(os.path.join(path, 'thermo'), rmg.thermo_libraries, depository=False)
+    if rmg.database_cache_directory:
+        # The database is only cached as a whole, so load it without the unused kinetics
+        rmg.database.load(path, thermo_libraries=rmg.thermo_libraries, transport_libraries=[], reaction_libraries=[],
+                          seed_mechanisms=[], kinetics_families='none', kinetics_depositories=[],
+                          statmech_libraries=[], depository=False, solvation=bool(rmg.solvent),
+                          cache_directory=rmg.database_cache_directory)
+    else:
+        # forbidden structure loading
+        rmg.database.load_thermo(os.path.join(path, 'thermo'), rmg.thermo_libraries, depository=False)
+        if rmg.solvent:
+            rmg.database.load_solvation(os.path.join(path, 'solvation'))
 
     if rmg.solvent:
-        rmg.database.load_solvation(os.path.join(path, 'solvation'))
         Species.solvent_data = rmg.database.solvation.get_solvent_data(rmg.solvent)
         Species.solvent_name = rmg.solvent
 